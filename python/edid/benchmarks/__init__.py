@@ -0,0 +1 @@
+"""Performance benchmarks for EDID Manager (asv compatible)."""
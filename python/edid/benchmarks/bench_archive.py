@@ -0,0 +1,41 @@
+"""Compressed archive benchmarks."""
+
+import tempfile
+from pathlib import Path
+
+from edid.compressed import CompressedArchive, write_compressed_archive
+
+from .corpus import make_corpus
+
+
+class TimeCompressedArchive:
+    params = [100, 1000]
+    param_names = ["corpus_size"]
+
+    def setup(self, corpus_size):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.entries = [
+            (f"unit{i}.bin", edid_data)
+            for i, edid_data in enumerate(make_corpus(corpus_size))
+        ]
+        self.path = Path(self.tmpdir.name) / "corpus.edidz"
+        write_compressed_archive(self.path, self.entries)
+        self.archive = CompressedArchive(self.path)
+
+    def teardown(self, corpus_size):
+        self.archive.close()
+        self.tmpdir.cleanup()
+
+    def time_write(self, corpus_size):
+        write_compressed_archive(Path(self.tmpdir.name) / "out.edidz", self.entries)
+
+    def time_read_all(self, corpus_size):
+        for index in range(len(self.archive)):
+            self.archive.read(index)
+
+    def time_read_one(self, corpus_size):
+        self.archive.read(corpus_size // 2)
+
+    def track_compression_ratio(self, corpus_size):
+        raw_bytes = sum(len(edid_data) for _, edid_data in self.entries)
+        return raw_bytes / self.path.stat().st_size
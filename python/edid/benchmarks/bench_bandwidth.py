@@ -0,0 +1,26 @@
+"""Link bandwidth analysis benchmarks."""
+
+from edid.bandwidth import (
+    BandwidthAnalyzer,
+    all_formats,
+    analyze_corpus,
+    summarize_corpus,
+)
+
+from .corpus import make_corpus
+
+
+class TimeBandwidth:
+    params = [100, 1000]
+    param_names = ["edids"]
+
+    def setup(self, edids):
+        self.entries = [
+            (str(index), edid_data)
+            for index, edid_data in enumerate(make_corpus(edids))
+        ]
+        self.formats = all_formats()
+
+    def time_summarize_corpus(self, edids):
+        analyzer = BandwidthAnalyzer(self.formats)
+        summarize_corpus(analyze_corpus(self.entries, analyzer), self.formats)
@@ -0,0 +1,113 @@
+"""I2C transfer benchmarks against the EEPROM simulator."""
+
+import os
+import tempfile
+
+from edid.backend import set_backend
+from edid.i2c import WAIT_FIXED, WAIT_POLL, read_edid, write_edid, write_edids
+from edid.simulator import SimulatedEEPROM, SimulatorBackend
+from edid.trace import ReplayBackend, TraceWriter, TracingBackend
+
+from .corpus import make_edid
+
+BUS = 1
+
+
+class _SimulatedBus:
+    def setup_simulator(self, edid_size, page_size=16):
+        self.edid_data = make_edid(edid_size)
+        self.eeprom = SimulatedEEPROM(
+            self.edid_data,
+            segments=max(1, edid_size // 256),
+            page_size=page_size,
+            write_cycle_time=0.005,
+        )
+        self.previous_backend = set_backend(SimulatorBackend({BUS: self.eeprom}))
+
+        # write_edid stores a backup under ~/.edid-backups
+        self.home = tempfile.TemporaryDirectory()
+        self.previous_home = os.environ.get("HOME")
+        os.environ["HOME"] = self.home.name
+
+    def teardown(self, *params):
+        set_backend(self.previous_backend)
+        if self.previous_home is None:
+            del os.environ["HOME"]
+        else:
+            os.environ["HOME"] = self.previous_home
+        self.home.cleanup()
+
+
+class TimeRead(_SimulatedBus):
+    params = [128, 256]
+    param_names = ["edid_size"]
+
+    def setup(self, edid_size):
+        self.setup_simulator(edid_size)
+
+    def time_read_edid(self, edid_size):
+        read_edid(BUS)
+
+
+class TimeWrite(_SimulatedBus):
+    params = ([8, 16, 32], [WAIT_FIXED, WAIT_POLL])
+    param_names = ["page_size", "wait_strategy"]
+    # Each write sleeps for every page; keep sample counts small
+    number = 1
+    repeat = 3
+
+    def setup(self, page_size, wait_strategy):
+        self.setup_simulator(256, page_size)
+
+    def time_write_edid(self, page_size, wait_strategy):
+        write_edid(
+            BUS, self.edid_data, page_size=page_size, wait_strategy=wait_strategy
+        )
+
+
+class TimeWriteMany(_SimulatedBus):
+    """N panels behind one mux: interleaved writes versus one after another."""
+
+    params = ([1, 4, 8], [WAIT_FIXED, WAIT_POLL])
+    param_names = ["devices", "wait_strategy"]
+    number = 1
+    repeat = 3
+
+    def setup(self, devices, wait_strategy):
+        self.setup_simulator(256)
+        self.buses = [BUS + 10 + i for i in range(devices)]
+        eeproms = {
+            bus: SimulatedEEPROM(self.edid_data, write_cycle_time=0.005)
+            for bus in self.buses
+        }
+        muxes = {bus: (BUS, channel) for channel, bus in enumerate(self.buses)}
+        set_backend(SimulatorBackend(eeproms, muxes))
+
+    def time_write_edids(self, devices, wait_strategy):
+        write_edids(
+            [(bus, self.edid_data) for bus in self.buses],
+            wait_strategy=wait_strategy,
+        )
+
+    def time_write_edid_sequential(self, devices, wait_strategy):
+        for bus in self.buses:
+            write_edid(bus, self.edid_data, wait_strategy=wait_strategy)
+
+
+class TimeReplay(_SimulatedBus):
+    """Reads served from a recorded trace, without the recorded latencies."""
+
+    params = [128, 256]
+    param_names = ["edid_size"]
+
+    def setup(self, edid_size):
+        self.setup_simulator(edid_size)
+        path = os.path.join(self.home.name, "read.trace")
+        writer = TraceWriter(path)
+        set_backend(TracingBackend(SimulatorBackend({BUS: self.eeprom}), writer))
+        read_edid(BUS)
+        writer.close()
+        set_backend(ReplayBackend(path, time_scale=0))
+
+    def time_read_edid(self, edid_size):
+        read_edid(BUS)
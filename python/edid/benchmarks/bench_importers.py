@@ -0,0 +1,41 @@
+"""Text importer benchmarks."""
+
+import io
+import time
+
+from edid.importers import iter_text_edids
+
+from .corpus import make_corpus
+
+
+def xrandr_text(edids):
+    """xrandr --verbose style text with one output per EDID."""
+    lines = []
+    for index, edid_data in enumerate(edids):
+        lines.append(f"DP-{index} connected 2560x1440+0+0 597mm x 336mm")
+        lines.append("\tEDID:")
+        lines.extend(
+            "\t\t" + edid_data[i : i + 16].hex() for i in range(0, len(edid_data), 16)
+        )
+        lines.append("\tBroadcast RGB: Automatic")
+        lines.extend(
+            f"  2560x1440 (0x{mode:x}) 241.500MHz +HSync -VSync" for mode in range(20)
+        )
+    return "\n".join(lines) + "\n"
+
+
+class TimeImportText:
+    params = [100, 1000]
+    param_names = ["outputs"]
+
+    def setup(self, outputs):
+        self.text = xrandr_text(make_corpus(outputs))
+
+    def time_import_xrandr(self, outputs):
+        for _ in iter_text_edids(io.StringIO(self.text)):
+            pass
+
+    def track_megabytes_per_second(self, outputs):
+        start = time.perf_counter()
+        self.time_import_xrandr(outputs)
+        return len(self.text) / (time.perf_counter() - start) / 1e6
@@ -0,0 +1,44 @@
+"""Decoding benchmarks."""
+
+from edid.cache import DecodeCache, set_decode_cache
+from edid.parser import decode_basic, decode_deep, decode_hex
+
+from .corpus import make_edid
+
+
+class TimeDecode:
+    params = [128, 256, 512]
+    param_names = ["edid_size"]
+
+    def setup(self, edid_size):
+        self.edid_data = make_edid(edid_size)
+        # Measure parsing and rendering, not the decode cache
+        self.previous_cache = set_decode_cache(None)
+
+    def teardown(self, edid_size):
+        set_decode_cache(self.previous_cache)
+
+    def time_decode_hex(self, edid_size):
+        decode_hex(self.edid_data)
+
+    def time_decode_basic(self, edid_size):
+        decode_basic(self.edid_data)
+
+    def time_decode_deep(self, edid_size):
+        decode_deep(self.edid_data)
+
+
+class TimeCachedDecode:
+    params = [128, 512]
+    param_names = ["edid_size"]
+
+    def setup(self, edid_size):
+        self.edid_data = make_edid(edid_size)
+        self.previous_cache = set_decode_cache(DecodeCache())
+        decode_deep(self.edid_data)
+
+    def teardown(self, edid_size):
+        set_decode_cache(self.previous_cache)
+
+    def time_decode_deep(self, edid_size):
+        decode_deep(self.edid_data)
@@ -0,0 +1,22 @@
+"""Validation benchmarks over corpora."""
+
+from edid.validator import recalculate_checksums, validate_structure
+
+from .corpus import make_corpus
+
+
+class TimeCorpusValidation:
+    params = [100, 1000]
+    param_names = ["corpus_size"]
+
+    def setup(self, corpus_size):
+        self.corpus = make_corpus(corpus_size)
+        self.mutable = [bytearray(edid_data) for edid_data in self.corpus]
+
+    def time_validate_structure(self, corpus_size):
+        for edid_data in self.corpus:
+            validate_structure(edid_data)
+
+    def time_recalculate_checksums(self, corpus_size):
+        for edid_data in self.mutable:
+            recalculate_checksums(edid_data)
@@ -0,0 +1,96 @@
+"""Synthetic EDIDs for benchmarks."""
+
+import struct
+from typing import List
+
+from edid.patch import patch_edids
+from edid.validator import EDID_HEADER, recalculate_checksums
+
+
+def _detailed_timing(
+    clock_khz: int, h_active: int, h_blank: int, v_active: int, v_blank: int
+) -> bytes:
+    descriptor = bytearray(18)
+    struct.pack_into("<H", descriptor, 0, clock_khz // 10)
+    descriptor[2] = h_active & 0xFF
+    descriptor[3] = h_blank & 0xFF
+    descriptor[4] = (h_active >> 8) << 4 | h_blank >> 8
+    descriptor[5] = v_active & 0xFF
+    descriptor[6] = v_blank & 0xFF
+    descriptor[7] = (v_active >> 8) << 4 | v_blank >> 8
+    descriptor[8:12] = bytes([48, 32, 0x35, 0x00])
+    descriptor[17] = 0x1A
+    return bytes(descriptor)
+
+
+def _text_descriptor(tag: int, text: str) -> bytes:
+    payload = text.encode("ascii")[:13]
+    if len(payload) < 13:
+        payload += b"\x0a"
+    return bytes([0, 0, 0, tag, 0]) + payload.ljust(13, b" ")
+
+
+def base_block(extensions: int = 0) -> bytearray:
+    """128-byte EDID 1.4 base block for a 2560x1440 panel."""
+    block = bytearray(128)
+    block[0:8] = EDID_HEADER
+    struct.pack_into(">H", block, 8, (4 << 10) | (5 << 5) | 12)  # "DEL"
+    struct.pack_into("<HI", block, 10, 0xA0C1, 1234567)
+    block[16:24] = bytes([42, 29, 1, 4, 0xB5, 60, 34, 120])
+    block[24] = 0x3A
+    block[35:38] = bytes([0x21, 0x08, 0x00])
+    block[38:54] = bytes([0xD1, 0xC0, 0x81, 0x00, 0xB3, 0x00, 0x71, 0x4F] + [1] * 8)
+    block[54:72] = _detailed_timing(241500, 2560, 160, 1440, 41)
+    block[72:90] = _text_descriptor(0xFF, "SN0001")
+    block[90:108] = _text_descriptor(0xFC, "BENCH PANEL")
+    block[108:126] = bytes([0, 0, 0, 0xFD, 0, 48, 144, 30, 160, 60, 0, 0x0A]) + b" " * 6
+    block[126] = extensions
+    return block
+
+
+def cea_block() -> bytearray:
+    """128-byte CEA-861 extension with video, audio, HDMI and HDR blocks."""
+    block = bytearray(128)
+    block[0:2] = bytes([0x02, 0x03])
+    block[3] = 0xF0
+    data_blocks = bytes(
+        [0x45, 0x90, 0x04, 0x03, 0x5F, 0x61]
+        + [0x23, 0x09, 0x07, 0x07]
+        + [0x83, 0x01, 0x00, 0x00]
+        + [0x67, 0x03, 0x0C, 0x00, 0x10, 0x00, 0x78, 0x3C]
+        + [0x67, 0xD8, 0x5D, 0xC4, 0x01, 0x78, 0x80, 0x33]
+        + [0xE3, 0x05, 0xC0, 0x00]
+        + [0xE6, 0x06, 0x0D, 0x01, 0x73, 0x5A, 0x30]
+    )
+    block[4 : 4 + len(data_blocks)] = data_blocks
+    block[2] = 4 + len(data_blocks)
+    for i, timing in enumerate(
+        (
+            _detailed_timing(148500, 1920, 280, 1080, 45),
+            _detailed_timing(74250, 1280, 370, 720, 30),
+        )
+    ):
+        start = block[2] + i * 18
+        block[start : start + 18] = timing
+    return block
+
+
+def make_edid(size: int = 128) -> bytes:
+    """
+    Build a valid EDID of 128, 256, 384 or 512 bytes.
+
+    Extensions are CEA-861 blocks.
+    """
+    extensions = size // 128 - 1
+    edid_data = base_block(extensions)
+    for _ in range(extensions):
+        edid_data += cea_block()
+    recalculate_checksums(edid_data)
+    return bytes(edid_data)
+
+
+def make_corpus(count: int, size: int = 256) -> List[bytes]:
+    """Build a corpus of per-unit EDIDs that differ in serial number."""
+    template = make_edid(size)
+    packed = patch_edids(template, [{"serial": i} for i in range(count)])
+    return [bytes(packed[i : i + size]) for i in range(0, len(packed), size)]
@@ -0,0 +1,124 @@
+"""
+Minimal benchmark runner.
+
+The benchmark classes follow the asv (airspeed velocity) conventions and can
+be run with ``asv run`` from the repository root. This runner covers the same
+classes without asv, for quick comparisons on a single machine:
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --filter TimeWrite
+"""
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import pkgutil
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import benchmarks
+
+
+def discover() -> Iterator[Tuple[str, type]]:
+    """Yield (qualified_name, class) for every benchmark class."""
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__ and name.startswith("Time"):
+                yield f"{module_info.name}.{name}", cls
+
+
+def _param_combinations(cls: type) -> List[Tuple[Any, ...]]:
+    params = getattr(cls, "params", None)
+    if params is None:
+        return [()]
+    if params and not isinstance(params[0], list):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def run_benchmark(
+    cls: type, method: str, params: Tuple[Any, ...], repeat: int, number: int
+) -> Dict[str, Any]:
+    """
+    Time one benchmark method for one parameter combination.
+
+    Returns:
+        Dictionary with the best and mean time per call in seconds
+    """
+    instance = cls()
+    repeat = getattr(cls, "repeat", repeat)
+    number = getattr(cls, "number", number)
+
+    if hasattr(instance, "setup"):
+        instance.setup(*params)
+    try:
+        func = getattr(instance, method)
+        times = timeit.repeat(lambda: func(*params), repeat=repeat, number=number)
+    finally:
+        if hasattr(instance, "teardown"):
+            instance.teardown(*params)
+
+    per_call = [t / number for t in times]
+    return {
+        "best": min(per_call),
+        "mean": sum(per_call) / len(per_call),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def run_all(
+    name_filter: Optional[str] = None, repeat: int = 5, number: int = 20
+) -> List[Dict[str, Any]]:
+    """Run all discovered benchmarks and return result records."""
+    results = []
+    for qualified_name, cls in discover():
+        methods = sorted(m for m in dir(cls) if m.startswith("time_"))
+        param_names = getattr(cls, "param_names", [])
+        for method in methods:
+            name = f"{qualified_name}.{method}"
+            if name_filter and name_filter not in name:
+                continue
+            for params in _param_combinations(cls):
+                result = run_benchmark(cls, method, params, repeat, number)
+                result["name"] = name
+                result["params"] = dict(zip(param_names, params))
+                results.append(result)
+
+                label = ", ".join(f"{k}={v}" for k, v in result["params"].items())
+                print(
+                    f"{name}({label}): {result['best'] * 1e6:.1f} us",
+                    file=sys.stderr,
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run EDID Manager benchmarks")
+    parser.add_argument("--output", "-o", type=Path, help="Write results as JSON")
+    parser.add_argument("--filter", "-k", help="Only run benchmarks matching NAME")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    results = run_all(args.filter, args.repeat, args.number)
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {len(results)} result(s) to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
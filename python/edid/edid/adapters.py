@@ -0,0 +1,157 @@
+"""Persistent per-adapter read profiles.
+
+I2C adapters differ in the largest read they handle reliably: many accept a
+whole 256-byte segment in one combined transaction, some fail above 32 or
+even 16 bytes. read_edid starts with the stored chunk size (the largest for
+unknown adapters) and shrinks on failure. A smaller size is stored only
+after SHRINK_AFTER_FAILURES consecutive reads had to fall back, so a single
+glitch that outlasted the transaction retries does not downgrade the
+adapter for good. Profiles are keyed by adapter name (bus numbers are not
+stable across boots) in ~/.cache/edid/adapters.json.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+# Read chunk sizes tried, largest first. Sizes above 32 bytes need combined
+# (i2c_rdwr) transactions; SMBus block reads are limited to 32 bytes.
+CHUNK_SIZES = (256, 128, 64, 32, 16, 8)
+
+# Consecutive reads that fell back from the stored chunk size before the
+# smaller size is stored
+SHRINK_AFTER_FAILURES = 3
+
+
+def cache_dir() -> Path:
+    """Per-user cache directory (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "edid"
+
+
+def profiles_path() -> Path:
+    """File holding the adapter profiles."""
+    return cache_dir() / "adapters.json"
+
+
+def load_profiles() -> Dict[str, Dict[str, Any]]:
+    """
+    Load all adapter profiles.
+
+    Returns:
+        Mapping of adapter name to profile; empty if none are stored or the
+        file is unreadable
+    """
+    try:
+        return json.loads(profiles_path().read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def get_profile(adapter: str) -> Optional[Dict[str, Any]]:
+    """
+    Stored profile of an adapter.
+
+    Returns:
+        Dictionary with chunk_size, shrinks, failures (consecutive reads
+        that fell back from chunk_size) and updated, or None if unknown
+    """
+    return load_profiles().get(adapter)
+
+
+def chunk_size_for(profile: Optional[Dict[str, Any]]) -> int:
+    """Chunk size to start reading with, given an adapter's profile."""
+    if profile and profile.get("chunk_size") in CHUNK_SIZES:
+        return profile["chunk_size"]
+    return CHUNK_SIZES[0]
+
+
+def smaller_chunk_size(chunk_size: int) -> Optional[int]:
+    """Next chunk size to try after a failure, or None at the minimum."""
+    smaller = [size for size in CHUNK_SIZES if size < chunk_size]
+    return smaller[0] if smaller else None
+
+
+def _save_profiles(profiles: Dict[str, Dict[str, Any]]) -> None:
+    # Written atomically; failures to write the cache are ignored, since
+    # the profiles only save time
+    path = profiles_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(profiles, indent=2, sort_keys=True) + "\n")
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
+
+def save_chunk_size(adapter: str, chunk_size: int, failures: int = 0) -> None:
+    """
+    Store the chunk size of an adapter.
+
+    Args:
+        adapter: Adapter name
+        chunk_size: Chunk size to start reading with
+        failures: Consecutive reads that fell back from chunk_size
+    """
+    profiles = load_profiles()
+    previous = profiles.get(adapter, {})
+    shrinks = previous.get("shrinks", 0)
+    if chunk_size < previous.get("chunk_size", CHUNK_SIZES[0]):
+        shrinks += 1
+    profiles[adapter] = {
+        "chunk_size": chunk_size,
+        "shrinks": shrinks,
+        "failures": failures,
+        "updated": datetime.now().isoformat(timespec="seconds"),
+    }
+    _save_profiles(profiles)
+
+
+def record_read(adapter: str, initial_size: int, chunk_size: int) -> None:
+    """
+    Update an adapter's profile after a read.
+
+    A read that needed a smaller chunk size than it started with counts as
+    a failure of the starting size; after SHRINK_AFTER_FAILURES in a row,
+    the smaller size is stored. A read that worked at the starting size
+    clears the count.
+
+    Args:
+        adapter: Adapter name
+        initial_size: Chunk size the read started with (see chunk_size_for)
+        chunk_size: Chunk size the read ended with
+    """
+    profile = get_profile(adapter)
+    failures = profile.get("failures", 0) if profile else 0
+
+    if chunk_size >= initial_size:
+        if profile is None or failures:
+            save_chunk_size(adapter, initial_size)
+        return
+
+    failures += 1
+    if failures >= SHRINK_AFTER_FAILURES:
+        save_chunk_size(adapter, chunk_size)
+    else:
+        save_chunk_size(adapter, initial_size, failures)
+
+
+def reset_profiles(adapters: Optional[Iterable[str]] = None) -> int:
+    """
+    Forget learned chunk sizes, so adapters start from the largest again.
+
+    Args:
+        adapters: Adapter names, or None for every adapter
+
+    Returns:
+        Number of profiles removed
+    """
+    profiles = load_profiles()
+    names = list(profiles) if adapters is None else list(adapters)
+    removed = [name for name in names if profiles.pop(name, None) is not None]
+    if removed:
+        _save_profiles(profiles)
+    return len(removed)
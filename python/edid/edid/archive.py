@@ -0,0 +1,157 @@
+"""Packed EDID archives.
+
+A packed archive is a plain concatenation of complete EDIDs. Each entry is
+self-delimiting: the extension count at byte 126 of its base block gives the
+entry size, so no index or separator is needed. Compressed archives (see
+compressed.py) and text captures (see importers.py) are read transparently
+by iter_edid_files.
+"""
+
+import io
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .compressed import MAGIC as COMPRESSED_MAGIC
+from .compressed import CompressedArchive, is_compressed_archive
+from .importers import SNIFF_SIZE, is_text_file, iter_text_edids
+
+# File patterns collected from directories
+ARCHIVE_PATTERNS = ("*.bin", "*.edidz", "*.txt")
+
+
+def iter_packed_edids(data: bytes) -> Iterator[Tuple[int, bytes]]:
+    """
+    Iterate over the EDIDs stored in a packed archive.
+
+    Args:
+        data: Packed archive contents
+
+    Yields:
+        Tuples of (byte_offset, edid_data)
+
+    Raises:
+        ValueError: If the archive is truncated
+    """
+    offset = 0
+    while offset < len(data):
+        if offset + 128 > len(data):
+            raise ValueError(
+                f"Truncated archive: {len(data) - offset} trailing byte(s) "
+                f"at offset 0x{offset:X}"
+            )
+        size = 128 * (1 + data[offset + 126])
+        if offset + size > len(data):
+            raise ValueError(
+                f"Truncated archive: entry at offset 0x{offset:X} needs {size} bytes"
+            )
+        yield offset, data[offset : offset + size]
+        offset += size
+
+
+def write_packed_archive(path: Path, edids: Iterable[bytes]) -> int:
+    """
+    Write EDIDs to a packed archive.
+
+    Args:
+        path: Output archive path
+        edids: Complete EDIDs to store
+
+    Returns:
+        Number of EDIDs written
+    """
+    count = 0
+    with open(path, "wb") as f:
+        for edid_data in edids:
+            f.write(edid_data)
+            count += 1
+    return count
+
+
+def iter_edid_files(
+    paths: Iterable[Path], errors: Optional[List[str]] = None
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Iterate over EDIDs stored in files, packed archives and directories.
+
+    Directories are searched recursively for ``*.bin``, ``*.edidz`` and
+    ``*.txt`` files. Every binary file is read as a packed or compressed
+    archive, so single EDID files yield one entry; text files are parsed
+    with the importers (xrandr, edid-decode, hex dumps).
+
+    Args:
+        paths: Files or directories
+        errors: List to append messages about unreadable, truncated or
+            corrupt files to (iteration continues with the next file); if
+            None, they raise instead
+
+    Yields:
+        Tuples of (label, edid_data); the label is the file path, with
+        ``#<index>`` appended for entries of multi-EDID archives, or the
+        importer label ("<path>:<line>...") for text files
+
+    Raises:
+        OSError: If a file cannot be read and errors is None
+        ValueError: If a file is truncated or corrupt and errors is None
+    """
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files = sorted(f for p in ARCHIVE_PATTERNS for f in path.rglob(p))
+        else:
+            files = [path]
+
+        for file_path in files:
+            try:
+                yield from _iter_file(file_path)
+            except (OSError, ValueError) as e:
+                if errors is None:
+                    raise
+                errors.append(f"{file_path}: {e}")
+
+
+def _iter_file(file_path: Path) -> Iterator[Tuple[str, bytes]]:
+    if not file_path.is_file():
+        # Pipes and devices (e.g. /dev/stdin) can only be read once
+        yield from _iter_stream(file_path)
+        return
+
+    if is_compressed_archive(file_path):
+        with CompressedArchive(file_path) as archive:
+            for index, (_, edid_data) in enumerate(archive):
+                yield f"{file_path}#{index}", edid_data
+        return
+
+    if is_text_file(file_path):
+        with open(file_path, encoding="utf-8", errors="replace") as f:
+            yield from _iter_text(f, file_path)
+        return
+
+    yield from _iter_packed(file_path, file_path.read_bytes())
+
+
+def _iter_text(stream: TextIO, path: Path) -> Iterator[Tuple[str, bytes]]:
+    # Incomplete EDIDs in collected text are skipped, not fatal
+    errors: List[str] = []
+    yield from iter_text_edids(stream, str(path), errors)
+    for message in errors:
+        print(f"Warning: {message}", file=sys.stderr)
+
+
+def _iter_packed(path: Path, data: bytes) -> Iterator[Tuple[str, bytes]]:
+    entries = [edid_data for _, edid_data in iter_packed_edids(data)]
+    if len(entries) == 1:
+        yield str(path), entries[0]
+    else:
+        for index, edid_data in enumerate(entries):
+            yield f"{path}#{index}", edid_data
+
+
+def _iter_stream(path: Path) -> Iterator[Tuple[str, bytes]]:
+    data = path.read_bytes()
+    if data.startswith(COMPRESSED_MAGIC):
+        raise ValueError(f"{path}: compressed archives must be regular files")
+    if data and b"\x00" not in data[:SNIFF_SIZE]:
+        yield from _iter_text(io.StringIO(data.decode("utf-8", "replace")), path)
+    else:
+        yield from _iter_packed(path, data)
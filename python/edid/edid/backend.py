@@ -0,0 +1,261 @@
+"""Pluggable I2C bus backends.
+
+All bus access in i2c.py goes through the active backend. A backend opens
+bus objects that implement the subset of the smbus2.SMBus API used here:
+``read_byte_data``, ``write_byte_data``, ``read_i2c_block_data``,
+``write_i2c_block_data``, ``write_byte``, ``i2c_rdwr``, ``close`` and the
+context manager protocol.
+"""
+
+import glob
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from smbus2 import SMBus, i2c_msg
+
+    SMBUS_AVAILABLE = True
+except ImportError:
+    SMBUS_AVAILABLE = False
+
+
+# E-DDC segment pointer address
+SEGMENT_POINTER_ADDRESS = 0x30
+
+# i2c_msg flag for read messages
+I2C_M_RD = 0x0001
+
+# Adapters and I2C client devices in sysfs
+SYSFS_I2C_DEVICES = Path("/sys/bus/i2c/devices")
+ADAPTER_DIR = re.compile(r"i2c-(\d+)$")
+CLIENT_DIR = re.compile(r"\d+-[0-9a-f]{4}$")
+
+
+class I2CMessage:
+    """
+    Plain i2c_rdwr message with the smbus2 i2c_msg interface.
+
+    Args:
+        addr: 7-bit device address
+        flags: I2C_M_RD for reads, 0 for writes
+        data: Write payload, or None for a read
+        length: Read length
+    """
+
+    def __init__(
+        self, addr: int, flags: int, data: Optional[List[int]] = None, length: int = 0
+    ):
+        self.addr = addr
+        self.flags = flags
+        self.buf = [0] * length if data is None else list(data)
+        self.len = len(self.buf)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.buf)
+
+
+class BusBackend:
+    """Base class for I2C bus backends."""
+
+    name = "base"
+
+    def check_available(self) -> None:
+        """Raise ImportError if the backend cannot be used."""
+
+    def list_buses(self) -> List[int]:
+        """Return the available bus numbers."""
+        raise NotImplementedError
+
+    def open(self, bus_num: int) -> Any:
+        """
+        Open a bus.
+
+        Args:
+            bus_num: I2C bus number
+
+        Returns:
+            SMBus-compatible bus object
+
+        Raises:
+            OSError: If the bus cannot be opened
+        """
+        raise NotImplementedError
+
+    def adapter_name(self, bus_num: int) -> str:
+        """Stable name of the adapter behind a bus."""
+        return f"i2c-{bus_num}"
+
+    def adapter_parent(self, bus_num: int) -> Optional[Dict[str, Any]]:
+        """
+        Mux position of a bus.
+
+        Args:
+            bus_num: I2C bus number
+
+        Returns:
+            Dictionary with parent (bus number), mux (mux device name, e.g.
+            "3-0070") and channel (or None if unknown), or None for a root
+            adapter
+        """
+        return None
+
+    def read_messages(
+        self, address: int, segment: int, offset: int, length: int
+    ) -> List[Any]:
+        """
+        Build the messages of an E-DDC combined read for ``i2c_rdwr``.
+
+        Args:
+            address: Device address
+            segment: E-DDC segment (0 skips the segment pointer write)
+            offset: Word offset within the segment
+            length: Number of bytes to read
+
+        Returns:
+            Messages; the last one receives the data
+        """
+        messages = []
+        if segment:
+            messages.append(I2CMessage(SEGMENT_POINTER_ADDRESS, 0, [segment]))
+        messages.append(I2CMessage(address, 0, [offset]))
+        messages.append(I2CMessage(address, I2C_M_RD, length=length))
+        return messages
+
+    def write_messages(
+        self, address: int, segment: int, offset: int, data: List[int]
+    ) -> List[Any]:
+        """
+        Build the messages of an E-DDC segment write for ``i2c_rdwr``.
+
+        Args:
+            address: Device address
+            segment: E-DDC segment (0 skips the segment pointer write)
+            offset: Word offset within the segment
+            data: Bytes to write
+
+        Returns:
+            Messages
+        """
+        messages = []
+        if segment:
+            messages.append(I2CMessage(SEGMENT_POINTER_ADDRESS, 0, [segment]))
+        messages.append(I2CMessage(address, 0, [offset] + list(data)))
+        return messages
+
+
+class SMBusBackend(BusBackend):
+    """Real hardware access through smbus2 and /dev/i2c-*."""
+
+    name = "smbus"
+
+    def check_available(self) -> None:
+        if not SMBUS_AVAILABLE:
+            raise ImportError(
+                "smbus2 is required for I2C operations. "
+                "Install it with: pip install smbus2"
+            )
+
+    def list_buses(self) -> List[int]:
+        return sorted(int(device.split("-")[-1]) for device in glob.glob("/dev/i2c-*"))
+
+    def open(self, bus_num: int) -> Any:
+        return SMBus(bus_num)
+
+    def adapter_name(self, bus_num: int) -> str:
+        try:
+            name = Path(f"/sys/class/i2c-dev/i2c-{bus_num}/name").read_text().strip()
+        except OSError:
+            name = ""
+        return name or super().adapter_name(bus_num)
+
+    def adapter_parent(self, bus_num: int) -> Optional[Dict[str, Any]]:
+        return sysfs_adapter_parent(bus_num)
+
+    def read_messages(
+        self, address: int, segment: int, offset: int, length: int
+    ) -> List[Any]:
+        messages = []
+        if segment:
+            messages.append(i2c_msg.write(SEGMENT_POINTER_ADDRESS, [segment]))
+        messages.append(i2c_msg.write(address, [offset]))
+        messages.append(i2c_msg.read(address, length))
+        return messages
+
+    def write_messages(
+        self, address: int, segment: int, offset: int, data: List[int]
+    ) -> List[Any]:
+        messages = []
+        if segment:
+            messages.append(i2c_msg.write(SEGMENT_POINTER_ADDRESS, [segment]))
+        messages.append(i2c_msg.write(address, [offset] + list(data)))
+        return messages
+
+
+def sysfs_adapter_parent(
+    bus_num: int, devices_dir: Path = SYSFS_I2C_DEVICES
+) -> Optional[Dict[str, Any]]:
+    """
+    Find the mux position of an adapter in sysfs.
+
+    Mux channels are child adapters below the mux's client device, e.g.
+    ``.../i2c-3/3-0070/i2c-12``; the mux device directory links each
+    ``channel-N`` to its adapter.
+
+    Args:
+        bus_num: I2C bus number
+        devices_dir: The /sys/bus/i2c/devices directory
+
+    Returns:
+        Mux position as described in BusBackend.adapter_parent, or None
+    """
+    try:
+        adapter_path = (devices_dir / f"i2c-{bus_num}").resolve(strict=True)
+    except (OSError, RuntimeError):
+        return None
+
+    mux_path = adapter_path.parent
+    if not CLIENT_DIR.match(mux_path.name):
+        return None
+    parent_match = ADAPTER_DIR.match(mux_path.parent.name)
+    if not parent_match:
+        return None
+
+    channel = None
+    for link in mux_path.glob("channel-*"):
+        try:
+            if link.resolve() == adapter_path:
+                channel = int(link.name.split("-")[1])
+                break
+        except (OSError, RuntimeError, ValueError):
+            continue
+
+    return {
+        "parent": int(parent_match.group(1)),
+        "mux": mux_path.name,
+        "channel": channel,
+    }
+
+
+_backend: BusBackend = SMBusBackend()
+
+
+def get_backend() -> BusBackend:
+    """Return the active bus backend."""
+    return _backend
+
+
+def set_backend(backend: BusBackend) -> BusBackend:
+    """
+    Replace the active bus backend.
+
+    Args:
+        backend: New backend
+
+    Returns:
+        The previously active backend
+    """
+    global _backend
+    previous = _backend
+    _backend = backend
+    return previous
@@ -0,0 +1,390 @@
+"""Link bandwidth feasibility of video modes.
+
+A mode needs pixel_clock x bits_per_pixel of link payload. Bits per pixel
+depend on the color format: 3 x bpc for RGB and YCbCr 4:4:4, 2 x bpc for
+4:2:2 and 1.5 x bpc for 4:2:0. HDMI TMDS is the exception for 4:2:2,
+which always travels in a 24-bit container (up to 12 bpc).
+
+Link payload is the raw rate less line coding: 8b/10b for TMDS and DP 1.x
+(RBR-HBR3), 16b/18b for HDMI FRL and 128b/132b for DP UHBR. FEC, packet
+and MST overheads are ignored and DSC is not considered, so results are
+slightly optimistic near the limits.
+
+The analysis is batched: the highest pixel clock every link carries in
+every format is computed once as a table, each link family's column is
+sorted, and every distinct pixel clock of a corpus (a fleet has few) is
+then resolved with a binary search per format and family.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .fingerprint import masked_edid
+from .modes import list_modes
+
+FAMILY_TMDS = "HDMI TMDS"
+FAMILY_FRL = "HDMI FRL"
+FAMILY_DP = "DisplayPort"
+FAMILIES = (FAMILY_TMDS, FAMILY_FRL, FAMILY_DP)
+
+# Chroma formats: RGB (or YCbCr 4:4:4), YCbCr 4:2:2 and 4:2:0
+CHROMA_FORMATS = ("rgb", "422", "420")
+BIT_DEPTHS = (8, 10, 12)
+
+# Components per pixel of each chroma format
+COMPONENTS = {"rgb": 3.0, "422": 2.0, "420": 1.5}
+
+# HDMI TMDS carries 4:2:2 in a fixed 24-bit container
+TMDS_422_BITS = 24
+
+# TMDS carries 24 payload bits (3 channels x 8 bits) per character clock
+TMDS_BITS_PER_CLOCK = 24
+
+DEFAULT_FORMATS = ("rgb-8", "rgb-10")
+
+
+def _link(family: str, name: str, payload_bps: float) -> Dict[str, Any]:
+    return {"family": family, "name": name, "payload_bps": payload_bps}
+
+
+def _dp_links() -> List[Dict[str, Any]]:
+    rates = (
+        ("RBR", 1.62e9, 8 / 10),
+        ("HBR", 2.7e9, 8 / 10),
+        ("HBR2", 5.4e9, 8 / 10),
+        ("HBR3", 8.1e9, 8 / 10),
+        ("UHBR10", 10e9, 128 / 132),
+        ("UHBR13.5", 13.5e9, 128 / 132),
+        ("UHBR20", 20e9, 128 / 132),
+    )
+    return [
+        _link(FAMILY_DP, f"{name} x{lanes}", rate * efficiency * lanes)
+        for name, rate, efficiency in rates
+        for lanes in (1, 2, 4)
+    ]
+
+
+LINKS: Tuple[Dict[str, Any], ...] = tuple(
+    [
+        _link(
+            FAMILY_TMDS,
+            f"HDMI {version} ({clock_mhz} MHz)",
+            clock_mhz * 1e6 * TMDS_BITS_PER_CLOCK,
+        )
+        for version, clock_mhz in (("1.0", 165), ("1.4", 340), ("2.0", 600))
+    ]
+    + [
+        _link(FAMILY_FRL, f"FRL {lanes}x{gbps}G", lanes * gbps * 1e9 * 16 / 18)
+        for lanes, gbps in ((3, 3), (3, 6), (4, 6), (4, 8), (4, 10), (4, 12))
+    ]
+    + _dp_links()
+)
+
+
+def parse_format(spec: str) -> Tuple[str, int]:
+    """
+    Parse a color format such as ``rgb-10`` or ``420-8``.
+
+    Args:
+        spec: CHROMA-BPC with chroma rgb (or 444), 422 or 420
+
+    Returns:
+        Tuple of (chroma, bits per component)
+
+    Raises:
+        ValueError: If the format is malformed
+    """
+    chroma, _, bpc = spec.strip().lower().partition("-")
+    if chroma == "444":
+        chroma = "rgb"
+    if chroma not in CHROMA_FORMATS or not bpc.isdigit() or int(bpc) not in BIT_DEPTHS:
+        raise ValueError(
+            f"Invalid format '{spec}' (expected CHROMA-BPC with chroma in "
+            f"{', '.join(CHROMA_FORMATS)} and bpc in "
+            f"{', '.join(str(b) for b in BIT_DEPTHS)})"
+        )
+    return chroma, int(bpc)
+
+
+def all_formats() -> List[str]:
+    """Every chroma format at every bit depth, e.g. ["rgb-8", ...]."""
+    return [f"{chroma}-{bpc}" for chroma in CHROMA_FORMATS for bpc in BIT_DEPTHS]
+
+
+def bits_per_pixel(chroma: str, bpc: int, family: Optional[str] = None) -> float:
+    """
+    Link payload bits per pixel.
+
+    Args:
+        chroma: "rgb", "422" or "420"
+        bpc: Bits per component
+        family: Link family (only HDMI TMDS differs, for 4:2:2)
+
+    Returns:
+        Bits per pixel
+    """
+    if family == FAMILY_TMDS and chroma == "422":
+        return TMDS_422_BITS
+    return COMPONENTS[chroma] * bpc
+
+
+def find_links(names: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Look up links by name (case-insensitive substring, e.g. "hbr2 x4").
+
+    Args:
+        names: Link names or name fragments
+
+    Returns:
+        Matching links, in table order
+
+    Raises:
+        ValueError: If a name matches no link
+    """
+    selected = []
+    for name in names:
+        matches = [link for link in LINKS if name.lower() in link["name"].lower()]
+        if not matches:
+            raise ValueError(f"Unknown link '{name}'")
+        selected.extend(link for link in matches if link not in selected)
+    return [link for link in LINKS if link in selected]
+
+
+def clock_limits(
+    formats: Sequence[str], links: Sequence[Dict[str, Any]] = LINKS
+) -> Dict[str, Dict[str, float]]:
+    """
+    Highest pixel clock every link carries in every format.
+
+    Args:
+        formats: Format names (see parse_format)
+        links: Links to include
+
+    Returns:
+        format -> link name -> pixel clock in Hz
+    """
+    table = {}
+    for spec in formats:
+        chroma, bpc = parse_format(spec)
+        table[spec] = {
+            link["name"]: link["payload_bps"]
+            / bits_per_pixel(chroma, bpc, link["family"])
+            for link in links
+        }
+    return table
+
+
+class BandwidthAnalyzer:
+    """
+    Resolve pixel clocks against a link table in batches.
+
+    Args:
+        formats: Format names to analyze
+        links: Links to consider (default: all)
+
+    Attributes:
+        limits: Result of clock_limits
+    """
+
+    def __init__(self, formats: Sequence[str], links: Sequence[Dict[str, Any]] = LINKS):
+        self.formats = list(formats)
+        self.links = list(links)
+        self.limits = clock_limits(self.formats, self.links)
+
+        # Per format and family: links sorted by the clock they carry (equal
+        # capacities by name, so HBR x4 comes before HBR2 x2)
+        self._columns: Dict[Tuple[str, str], Tuple[List[float], List[str]]] = {}
+        for spec in self.formats:
+            for family in FAMILIES:
+                column = sorted(
+                    (self.limits[spec][link["name"]], link["name"])
+                    for link in self.links
+                    if link["family"] == family
+                )
+                if column:
+                    self._columns[(spec, family)] = (
+                        [clock for clock, _ in column],
+                        [name for _, name in column],
+                    )
+
+        self._resolved: Dict[int, Dict[str, Any]] = {}
+
+    def resolve(self, pixel_clock_hz: int) -> Dict[str, Any]:
+        """
+        Bandwidth needs of one pixel clock (memoized).
+
+        Args:
+            pixel_clock_hz: Pixel clock in Hz
+
+        Returns:
+            format -> dictionary with gbps (payload at 3/2/1.5 components
+            per pixel), min_links (family -> slowest link that carries the
+            mode, or None) and fits (link name -> bool)
+        """
+        resolved = self._resolved.get(pixel_clock_hz)
+        if resolved is not None:
+            return resolved
+
+        resolved = {}
+        for spec in self.formats:
+            chroma, bpc = parse_format(spec)
+            min_links = {}
+            for family in FAMILIES:
+                column = self._columns.get((spec, family))
+                if column is None:
+                    continue
+                clocks, names = column
+                index = bisect_left(clocks, pixel_clock_hz)
+                min_links[family] = names[index] if index < len(names) else None
+            resolved[spec] = {
+                "gbps": pixel_clock_hz * bits_per_pixel(chroma, bpc) / 1e9,
+                "min_links": min_links,
+                "fits": {
+                    name: pixel_clock_hz <= limit
+                    for name, limit in self.limits[spec].items()
+                },
+            }
+
+        self._resolved[pixel_clock_hz] = resolved
+        return resolved
+
+    def analyze_modes(self, modes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add bandwidth needs to a mode list.
+
+        Args:
+            modes: Result of list_modes
+
+        Returns:
+            Copies of the modes with a formats entry (see resolve); modes
+            without a known pixel clock are left out
+        """
+        return [
+            {**mode, "formats": self.resolve(mode["pixel_clock_hz"])}
+            for mode in modes
+            if mode["pixel_clock_hz"]
+        ]
+
+
+def analyze_corpus(
+    entries: Iterable[Tuple[str, bytes]], analyzer: BandwidthAnalyzer
+) -> Iterable[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Analyze every EDID of a corpus.
+
+    Units of one model share their modes, so modes are listed once per
+    model (EDID with per-unit fields masked) and pixel clocks are resolved
+    once per corpus.
+
+    Args:
+        entries: (label, edid_data) tuples, e.g. from iter_edid_files
+        analyzer: Analyzer with the formats and links of interest
+
+    Yields:
+        (label, analyzed modes) tuples
+    """
+    models: Dict[bytes, List[Dict[str, Any]]] = {}
+    for label, edid_data in entries:
+        key = masked_edid(edid_data)
+        modes = models.get(key)
+        if modes is None:
+            modes = models[key] = analyzer.analyze_modes(list_modes(edid_data))
+        yield label, modes
+
+
+def demanding_mode(modes: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """The analyzed mode with the highest pixel clock (None if no modes)."""
+    return max(modes, key=lambda mode: mode["pixel_clock_hz"], default=None)
+
+
+def summarize_corpus(
+    results: Iterable[Tuple[str, List[Dict[str, Any]]]], formats: Sequence[str]
+) -> Dict[str, Any]:
+    """
+    Tally the links a corpus needs for its most demanding modes.
+
+    Args:
+        results: Output of analyze_corpus
+        formats: Formats to tally
+
+    Returns:
+        Dictionary with edids (count) and links: format -> family ->
+        link name (or "none") -> number of EDIDs whose most demanding mode
+        needs at least that link
+    """
+    # analyze_corpus shares one mode list between the units of a model, so
+    # units are counted per list and each model is tallied once
+    models: Dict[int, List[Any]] = {}
+    count = 0
+    for _, modes in results:
+        count += 1
+        entry = models.get(id(modes))
+        if entry is None:
+            entry = models[id(modes)] = [modes, 0]
+        entry[1] += 1
+
+    links: Dict[str, Dict[str, Dict[str, int]]] = {
+        spec: {family: {} for family in FAMILIES} for spec in formats
+    }
+    for modes, units in models.values():
+        mode = demanding_mode(modes)
+        if mode is None:
+            continue
+        for spec in formats:
+            for family, name in mode["formats"][spec]["min_links"].items():
+                tally = links[spec][family]
+                key = name or "none"
+                tally[key] = tally.get(key, 0) + units
+
+    # Slowest link first, "none" last
+    payload = {link["name"]: link["payload_bps"] for link in LINKS}
+    for families in links.values():
+        for family, tally in families.items():
+            families[family] = dict(
+                sorted(tally.items(), key=lambda item: payload.get(item[0], 1e18))
+            )
+    return {"edids": count, "links": links}
+
+
+def format_requirement(spec: str, need: Dict[str, Any], fits: bool = False) -> str:
+    """
+    Format the bandwidth needs of a mode in one format as one line.
+
+    Args:
+        spec: Format name
+        need: Entry of a resolved mode's formats
+        fits: List whether each link carries the mode instead of the
+            slowest link per family
+
+    Returns:
+        "format  Gbit/s  family: link, ..." or "... link: yes/no, ..." line
+    """
+    if fits:
+        links = ", ".join(
+            f"{name}: {'yes' if ok else 'no'}" for name, ok in need["fits"].items()
+        )
+    else:
+        links = ", ".join(
+            f"{family}: {name or '-'}" for family, name in need["min_links"].items()
+        )
+    return f"{spec:<7} {need['gbps']:6.2f} Gbit/s  {links}"
+
+
+def format_summary(summary: Dict[str, Any]) -> List[str]:
+    """
+    Format a corpus summary as text lines.
+
+    Args:
+        summary: Result of summarize_corpus
+
+    Returns:
+        A line per format and family listing link: count, slowest first
+    """
+    lines = [f"{summary['edids']} EDID(s), links needed by the most demanding mode:"]
+    for spec, families in summary["links"].items():
+        for family, tally in families.items():
+            if not tally:
+                continue
+            counts = ", ".join(f"{name}: {count}" for name, count in tally.items())
+            lines.append(f"  {spec:<7} {family:<12} {counts}")
+    return lines
@@ -0,0 +1,245 @@
+"""Memoization of rendered EDID decodes.
+
+Fleets contain thousands of identical panels, so the same EDID bytes are
+decoded over and over. decode_hex, decode_basic and decode_deep are wrapped
+with ``memoized_decode``: results are kept in a bounded in-memory LRU keyed
+by a BLAKE2b hash of the EDID bytes, the decoder and its options. An
+optional persistent tier under ~/.cache/edid/decode (``edid
+--persistent-decode-cache``) lets repeated decodes skip parsing and
+rendering across invocations too.
+
+The key also covers the package version and the modification times of the
+package's modules (the decoders, the hex dump renderer and everything they
+use), so cached renderings are never served for different code. The
+persistent tier is capped at DEFAULT_DISK_ENTRIES renderings; beyond that
+the least recently used ones are deleted.
+"""
+
+import functools
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from . import __version__
+from .adapters import cache_dir
+
+# Default number of renderings kept in memory
+DEFAULT_CACHE_SIZE = 256
+
+# Default number of renderings kept on disk
+DEFAULT_DISK_ENTRIES = 4096
+
+# Eviction trims the persistent tier to this fraction of its cap, so it does
+# not run on every put once the cap is reached
+DISK_TRIM_RATIO = 0.9
+
+
+def _decoder_fingerprint() -> bytes:
+    # Every module counts: renderings depend on parser.py, cea861.py,
+    # displayid.py, hexdump.py and whatever they import, and listing them
+    # by hand goes stale
+    package_dir = Path(__file__).parent
+    parts = [__version__]
+    for module in sorted(package_dir.glob("*.py")):
+        try:
+            parts.append(f"{module.name}:{module.stat().st_mtime_ns}")
+        except OSError:
+            parts.append(f"{module.name}:-")
+    return "|".join(parts).encode()
+
+
+class DecodeCache:
+    """
+    Two-tier cache of decoded EDID text.
+
+    Args:
+        maxsize: Maximum number of in-memory entries (0 disables the tier)
+        disk_dir: Directory of the persistent tier, or None for memory only
+        max_disk_entries: Maximum number of renderings kept on disk
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        disk_dir: Optional[Path] = None,
+        max_disk_entries: int = DEFAULT_DISK_ENTRIES,
+    ):
+        self.maxsize = maxsize
+        self.disk_dir = disk_dir
+        self.max_disk_entries = max_disk_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        # Files in the persistent tier, counted on the first put
+        self._disk_count: Optional[int] = None
+        self._fingerprint = _decoder_fingerprint()
+
+        # Statistics
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def key(self, edid_data: bytes, decoder: str, options: str = "") -> str:
+        """
+        Cache key for decoding EDID bytes with a decoder and options.
+
+        Returns:
+            32-character hex BLAKE2b digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self._fingerprint)
+        digest.update(f"|{decoder}|{options}|".encode())
+        digest.update(edid_data)
+        return digest.hexdigest()
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a rendering; None on a miss."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+        if self.disk_dir is not None:
+            path = self._disk_path(key)
+            try:
+                value = path.read_text(encoding="utf-8")
+                # Eviction goes by modification time, so mark it as used
+                os.utime(path)
+            except OSError:
+                value = None
+            if value is not None:
+                self.disk_hits += 1
+                self._remember(key, value)
+                return value
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: str) -> None:
+        """Store a rendering in both tiers."""
+        self._remember(key, value)
+        if self.disk_dir is not None:
+            path = self._disk_path(key)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(value, encoding="utf-8")
+                tmp_path.replace(path)
+            except OSError:
+                return
+            self._count_disk_entry()
+
+    def _disk_files(self) -> List[Path]:
+        return list(self.disk_dir.glob("*/*.txt"))
+
+    def _count_disk_entry(self) -> None:
+        if self._disk_count is None:
+            self._disk_count = len(self._disk_files())
+        else:
+            self._disk_count += 1
+        if self._disk_count > self.max_disk_entries:
+            self._disk_count = self.trim_disk(
+                int(self.max_disk_entries * DISK_TRIM_RATIO)
+            )
+
+    def trim_disk(self, keep: int) -> int:
+        """
+        Delete the least recently used renderings of the persistent tier.
+
+        Args:
+            keep: Number of renderings to keep
+
+        Returns:
+            Number of renderings left
+        """
+        if self.disk_dir is None:
+            return 0
+        files = []
+        for path in self._disk_files():
+            try:
+                files.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        files.sort()
+        excess = max(0, len(files) - keep)
+        for _, path in files[:excess]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        return len(files) - excess
+
+    def _remember(self, key: str, value: str) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (the disk tier is kept)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss statistics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+
+_cache: Optional[DecodeCache] = DecodeCache()
+
+
+def default_disk_dir() -> Path:
+    """Default location of the persistent tier."""
+    return cache_dir() / "decode"
+
+
+def get_decode_cache() -> Optional[DecodeCache]:
+    """Return the active decode cache, or None if caching is disabled."""
+    return _cache
+
+
+def set_decode_cache(cache: Optional[DecodeCache]) -> Optional[DecodeCache]:
+    """
+    Replace the active decode cache.
+
+    Args:
+        cache: New cache, or None to disable caching
+
+    Returns:
+        The previously active cache
+    """
+    global _cache
+    previous = _cache
+    _cache = cache
+    return previous
+
+
+def memoized_decode(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    Decorator caching a decoder ``func(edid_data, verbose=False) -> str``.
+    """
+
+    @functools.wraps(func)
+    def wrapper(edid_data: bytes, verbose: bool = False) -> str:
+        cache = _cache
+        if cache is None:
+            return func(edid_data, verbose)
+
+        key = cache.key(bytes(edid_data), func.__name__, f"verbose={verbose}")
+        value = cache.get(key)
+        if value is None:
+            value = func(edid_data, verbose)
+            cache.put(key, value)
+        return value
+
+    return wrapper
@@ -0,0 +1,249 @@
+"""Carve EDIDs out of arbitrary files.
+
+Firmware images, GPU register dumps and memory dumps hold EDIDs as raw
+bytes; kernel and Xorg logs and ``xrandr --verbose`` print them as hex text,
+16 or 32 bytes per line behind a per-line prefix (timestamps, log tags,
+offsets). Both forms are found by searching for the EDID header: raw
+headers with bytes.find, hex headers with a regular expression. Only the
+neighbourhood of a header is parsed, and a candidate is kept only if every
+block checksum is valid for the size given by its extension count.
+
+Regular files are memory-mapped, so multi-gigabyte dumps are scanned
+without being read into memory; other inputs (pipes, /proc files) are read
+in overlapping chunks.
+"""
+
+import mmap
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .profiling import profiled
+from .validator import EDID_HEADER
+
+FORM_BINARY = "binary"
+FORM_HEX = "hex"
+
+BLOCK_SIZE = 128
+MAX_EDID_SIZE = BLOCK_SIZE * 256
+
+# Hex text of the largest EDID: up to "0xNN, " per byte plus line prefixes
+MAX_HEX_SPAN = MAX_EDID_SIZE * 8
+
+# Chunk size for inputs that cannot be memory-mapped
+CHUNK_SIZE = 16 * 1024 * 1024
+
+# Separators between hex bytes: spaces, tabs, commas, colons, optional 0x
+_HEX_SEPARATOR = rb"[ \t,:]*(?:0[xX])?"
+HEX_HEADER = re.compile(
+    rb"(?:0[xX])?00" + (_HEX_SEPARATOR + rb"[fF]{2}") * 6 + _HEX_SEPARATOR + rb"00"
+)
+
+# HEX_HEADER has no literal prefix, so the regex engine would try it at
+# every position. These start with one and are searched for first (about
+# 50x faster); HEX_HEADER is then only matched around their hits.
+HEX_PREFILTERS = tuple(
+    re.compile(ff + (_HEX_SEPARATOR + ff) * 5) for ff in (rb"ff", rb"FF")
+)
+
+# Longest text before the first "ff" of a header: "0x00" and separators
+HEX_LEAD = 16
+_HEX_WORD = re.compile(rb"(?:0[xX])?((?:[0-9a-fA-F]{2})+)$")
+_WORD_SEPARATOR = re.compile(rb"[\s,:;]+")
+
+
+def validate_candidate(data: bytes) -> Optional[bytes]:
+    """
+    Check whether data starts with a complete, valid EDID.
+
+    Args:
+        data: Bytes starting at an EDID header (may run past the EDID)
+
+    Returns:
+        The EDID (base block plus the extensions its count announces), or
+        None if it is truncated or a block checksum is wrong
+    """
+    if len(data) < BLOCK_SIZE or data[:8] != EDID_HEADER:
+        return None
+    size = BLOCK_SIZE * (1 + data[126])
+    if len(data) < size:
+        return None
+    for offset in range(0, size, BLOCK_SIZE):
+        if sum(data[offset : offset + BLOCK_SIZE]) % 256:
+            return None
+    return bytes(data[:size])
+
+
+def _hex_line_bytes(text: bytes) -> bytes:
+    """Leading hex bytes of a line: stops at the first word that is not hex."""
+    data = bytearray()
+    for word in _WORD_SEPARATOR.split(text.strip()):
+        match = _HEX_WORD.match(word)
+        if match is None:
+            break
+        data.extend(bytes.fromhex(match.group(1).decode("ascii")))
+    return bytes(data)
+
+
+def parse_hex_at(buffer: Any, start: int, limit: Optional[int] = None) -> bytes:
+    """
+    Read hex bytes printed from a position onwards, across lines.
+
+    The column of the first byte is taken as the start of the data on every
+    following line, which drops per-line prefixes such as log timestamps or
+    dump offsets. Reading stops at a line without hex data at that column or
+    once a complete EDID has been read.
+
+    Args:
+        buffer: Text (bytes-like, e.g. an mmap)
+        start: Offset of the first hex byte
+        limit: Offset to stop reading at (default: end of buffer)
+
+    Returns:
+        The bytes read (possibly fewer than an EDID)
+    """
+    end = len(buffer) if limit is None else limit
+    column = start - (buffer.rfind(b"\n", 0, start) + 1)
+    data = bytearray()
+    position = start
+    size = MAX_EDID_SIZE
+
+    while position < end and len(data) < size:
+        line_end = buffer.find(b"\n", position, end)
+        if line_end < 0:
+            line_end = end
+        line = _hex_line_bytes(bytes(buffer[position:line_end]))
+        if not line:
+            break
+        data.extend(line)
+        if len(data) >= BLOCK_SIZE:
+            size = BLOCK_SIZE * (1 + data[126])
+
+        line_start = line_end + 1
+        position = line_start + column
+        if position > end or b"\n" in buffer[line_start:position]:
+            break
+
+    return bytes(data[:size])
+
+
+def _scan(
+    buffer: Any, base: int, limit: int, end: int
+) -> List[Tuple[int, str, Optional[bytes]]]:
+    """
+    Find EDID candidates whose header starts before limit.
+
+    Returns:
+        (offset, form, edid or None if invalid) tuples, offsets relative to
+        the start of the input (base is the input offset of buffer[0])
+    """
+    found = []
+
+    # Headers may end past limit, but must start before it
+    position = 0
+    while True:
+        hit = buffer.find(EDID_HEADER, position, end)
+        if hit < 0 or hit >= limit:
+            break
+        edid = validate_candidate(buffer[hit : min(hit + MAX_EDID_SIZE, end)])
+        found.append((base + hit, FORM_BINARY, edid))
+        position = hit + (len(edid) if edid else 1)
+
+    for prefilter in HEX_PREFILTERS:
+        for run in prefilter.finditer(buffer, 0, end):
+            match = HEX_HEADER.search(
+                buffer, max(0, run.start() - HEX_LEAD), min(end, run.end() + HEX_LEAD)
+            )
+            if match is None or match.start() >= limit or match.end() < run.end():
+                continue
+            data = parse_hex_at(
+                buffer, match.start(), min(end, match.start() + MAX_HEX_SPAN)
+            )
+            found.append((base + match.start(), FORM_HEX, validate_candidate(data)))
+
+    return found
+
+
+def _iter_chunked(f: Any) -> Iterator[Tuple[int, str, Optional[bytes]]]:
+    """Scan a stream in chunks that overlap by the longest possible EDID."""
+    buffer = b""
+    base = 0
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        buffer += chunk
+        final = not chunk
+        limit = len(buffer) if final else max(0, len(buffer) - MAX_HEX_SPAN)
+        for candidate in _scan(buffer, base, limit, len(buffer)):
+            yield candidate
+        if final:
+            return
+        buffer = buffer[limit:]
+        base += limit
+
+
+@profiled("carve.file")
+def carve_file(path: Path) -> List[Dict[str, Any]]:
+    """
+    Find the EDIDs in a file.
+
+    Args:
+        path: Any file: binary dump, log, xrandr output, ...
+
+    Returns:
+        Candidates sorted by offset: dictionaries with offset, form
+        ("binary" or "hex") and edid (None if the header was not followed
+        by a valid EDID)
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files, pipes and special files cannot be mapped
+            candidates = list(_iter_chunked(f))
+        else:
+            with mapped:
+                candidates = _scan(mapped, 0, len(mapped), len(mapped))
+
+    candidates.sort(key=lambda candidate: candidate[0])
+    return [
+        {"offset": offset, "form": form, "edid": edid}
+        for offset, form, edid in candidates
+    ]
+
+
+def carve_files(
+    paths: List[Path], unique: bool = False
+) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+    """
+    Find the EDIDs in several files.
+
+    Args:
+        paths: Files to scan
+        unique: Yield each distinct EDID only once (at its first occurrence)
+
+    Yields:
+        (path, candidate) tuples; see carve_file
+    """
+    seen = set()
+    for path in paths:
+        for candidate in carve_file(path):
+            edid = candidate["edid"]
+            if unique and edid is not None:
+                if edid in seen:
+                    continue
+                seen.add(edid)
+            yield path, candidate
+
+
+def carve_name(path: Path, candidate: Dict[str, Any]) -> str:
+    """
+    File name for a carved EDID.
+
+    Args:
+        path: Scanned file
+        candidate: Candidate from carve_file
+
+    Returns:
+        "<file stem>_<offset in hex>.bin"
+    """
+    return f"{path.stem}_{candidate['offset']:08x}.bin"
@@ -0,0 +1,588 @@
+"""CEA-861 (CTA-861) data block decoders and lookup tables."""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+
+# Short Video Descriptor timings:
+# VIC -> (h_active, v_active, refresh_hz, interlaced, aspect, pixel_clock_khz)
+# Refresh rates are nominal (the 59.94/60 Hz families are listed as 60).
+VIC_TIMINGS: Dict[int, Tuple[int, int, int, bool, str, int]] = {
+    1: (640, 480, 60, False, "4:3", 25175),
+    2: (720, 480, 60, False, "4:3", 27000),
+    3: (720, 480, 60, False, "16:9", 27000),
+    4: (1280, 720, 60, False, "16:9", 74250),
+    5: (1920, 1080, 60, True, "16:9", 74250),
+    6: (1440, 480, 60, True, "4:3", 27000),
+    7: (1440, 480, 60, True, "16:9", 27000),
+    8: (1440, 240, 60, False, "4:3", 27000),
+    9: (1440, 240, 60, False, "16:9", 27000),
+    10: (2880, 480, 60, True, "4:3", 54000),
+    11: (2880, 480, 60, True, "16:9", 54000),
+    12: (2880, 240, 60, False, "4:3", 54000),
+    13: (2880, 240, 60, False, "16:9", 54000),
+    14: (1440, 480, 60, False, "4:3", 54000),
+    15: (1440, 480, 60, False, "16:9", 54000),
+    16: (1920, 1080, 60, False, "16:9", 148500),
+    17: (720, 576, 50, False, "4:3", 27000),
+    18: (720, 576, 50, False, "16:9", 27000),
+    19: (1280, 720, 50, False, "16:9", 74250),
+    20: (1920, 1080, 50, True, "16:9", 74250),
+    21: (1440, 576, 50, True, "4:3", 27000),
+    22: (1440, 576, 50, True, "16:9", 27000),
+    23: (1440, 288, 50, False, "4:3", 27000),
+    24: (1440, 288, 50, False, "16:9", 27000),
+    25: (2880, 576, 50, True, "4:3", 54000),
+    26: (2880, 576, 50, True, "16:9", 54000),
+    27: (2880, 288, 50, False, "4:3", 54000),
+    28: (2880, 288, 50, False, "16:9", 54000),
+    29: (1440, 576, 50, False, "4:3", 54000),
+    30: (1440, 576, 50, False, "16:9", 54000),
+    31: (1920, 1080, 50, False, "16:9", 148500),
+    32: (1920, 1080, 24, False, "16:9", 74250),
+    33: (1920, 1080, 25, False, "16:9", 74250),
+    34: (1920, 1080, 30, False, "16:9", 74250),
+    35: (2880, 480, 60, False, "4:3", 108000),
+    36: (2880, 480, 60, False, "16:9", 108000),
+    37: (2880, 576, 50, False, "4:3", 108000),
+    38: (2880, 576, 50, False, "16:9", 108000),
+    39: (1920, 1080, 50, True, "16:9", 72000),
+    40: (1920, 1080, 100, True, "16:9", 148500),
+    41: (1280, 720, 100, False, "16:9", 148500),
+    42: (720, 576, 100, False, "4:3", 54000),
+    43: (720, 576, 100, False, "16:9", 54000),
+    44: (1440, 576, 100, True, "4:3", 54000),
+    45: (1440, 576, 100, True, "16:9", 54000),
+    46: (1920, 1080, 120, True, "16:9", 148500),
+    47: (1280, 720, 120, False, "16:9", 148500),
+    48: (720, 480, 120, False, "4:3", 54000),
+    49: (720, 480, 120, False, "16:9", 54000),
+    50: (1440, 480, 120, True, "4:3", 54000),
+    51: (1440, 480, 120, True, "16:9", 54000),
+    52: (720, 576, 200, False, "4:3", 108000),
+    53: (720, 576, 200, False, "16:9", 108000),
+    54: (1440, 576, 200, True, "4:3", 108000),
+    55: (1440, 576, 200, True, "16:9", 108000),
+    56: (720, 480, 240, False, "4:3", 108000),
+    57: (720, 480, 240, False, "16:9", 108000),
+    58: (1440, 480, 240, True, "4:3", 108000),
+    59: (1440, 480, 240, True, "16:9", 108000),
+    60: (1280, 720, 24, False, "16:9", 59400),
+    61: (1280, 720, 25, False, "16:9", 74250),
+    62: (1280, 720, 30, False, "16:9", 74250),
+    63: (1920, 1080, 120, False, "16:9", 297000),
+    64: (1920, 1080, 100, False, "16:9", 297000),
+    65: (1280, 720, 24, False, "64:27", 59400),
+    66: (1280, 720, 25, False, "64:27", 74250),
+    67: (1280, 720, 30, False, "64:27", 74250),
+    68: (1280, 720, 50, False, "64:27", 74250),
+    69: (1280, 720, 60, False, "64:27", 74250),
+    70: (1280, 720, 100, False, "64:27", 148500),
+    71: (1280, 720, 120, False, "64:27", 148500),
+    72: (1920, 1080, 24, False, "64:27", 74250),
+    73: (1920, 1080, 25, False, "64:27", 74250),
+    74: (1920, 1080, 30, False, "64:27", 74250),
+    75: (1920, 1080, 50, False, "64:27", 148500),
+    76: (1920, 1080, 60, False, "64:27", 148500),
+    77: (1920, 1080, 100, False, "64:27", 297000),
+    78: (1920, 1080, 120, False, "64:27", 297000),
+    79: (1680, 720, 24, False, "64:27", 59400),
+    80: (1680, 720, 25, False, "64:27", 59400),
+    81: (1680, 720, 30, False, "64:27", 59400),
+    82: (1680, 720, 50, False, "64:27", 82500),
+    83: (1680, 720, 60, False, "64:27", 99000),
+    84: (1680, 720, 100, False, "64:27", 165000),
+    85: (1680, 720, 120, False, "64:27", 198000),
+    86: (2560, 1080, 24, False, "64:27", 99000),
+    87: (2560, 1080, 25, False, "64:27", 90000),
+    88: (2560, 1080, 30, False, "64:27", 118800),
+    89: (2560, 1080, 50, False, "64:27", 185625),
+    90: (2560, 1080, 60, False, "64:27", 198000),
+    91: (2560, 1080, 100, False, "64:27", 371250),
+    92: (2560, 1080, 120, False, "64:27", 495000),
+    93: (3840, 2160, 24, False, "16:9", 297000),
+    94: (3840, 2160, 25, False, "16:9", 297000),
+    95: (3840, 2160, 30, False, "16:9", 297000),
+    96: (3840, 2160, 50, False, "16:9", 594000),
+    97: (3840, 2160, 60, False, "16:9", 594000),
+    98: (4096, 2160, 24, False, "256:135", 297000),
+    99: (4096, 2160, 25, False, "256:135", 297000),
+    100: (4096, 2160, 30, False, "256:135", 297000),
+    101: (4096, 2160, 50, False, "256:135", 594000),
+    102: (4096, 2160, 60, False, "256:135", 594000),
+    103: (3840, 2160, 24, False, "64:27", 297000),
+    104: (3840, 2160, 25, False, "64:27", 297000),
+    105: (3840, 2160, 30, False, "64:27", 297000),
+    106: (3840, 2160, 50, False, "64:27", 594000),
+    107: (3840, 2160, 60, False, "64:27", 594000),
+    108: (1280, 720, 48, False, "16:9", 90000),
+    109: (1280, 720, 48, False, "64:27", 90000),
+    110: (1680, 720, 48, False, "64:27", 99000),
+    111: (1920, 1080, 48, False, "16:9", 148500),
+    112: (1920, 1080, 48, False, "64:27", 148500),
+    113: (2560, 1080, 48, False, "64:27", 198000),
+    114: (3840, 2160, 48, False, "16:9", 594000),
+    115: (4096, 2160, 48, False, "256:135", 594000),
+    116: (3840, 2160, 48, False, "64:27", 594000),
+    117: (3840, 2160, 100, False, "16:9", 1188000),
+    118: (3840, 2160, 120, False, "16:9", 1188000),
+    119: (3840, 2160, 100, False, "64:27", 1188000),
+    120: (3840, 2160, 120, False, "64:27", 1188000),
+    121: (5120, 2160, 24, False, "64:27", 396000),
+    122: (5120, 2160, 25, False, "64:27", 396000),
+    123: (5120, 2160, 30, False, "64:27", 396000),
+    124: (5120, 2160, 48, False, "64:27", 742500),
+    125: (5120, 2160, 50, False, "64:27", 742500),
+    126: (5120, 2160, 60, False, "64:27", 742500),
+    127: (5120, 2160, 100, False, "64:27", 1485000),
+    193: (5120, 2160, 120, False, "64:27", 1485000),
+    194: (7680, 4320, 24, False, "16:9", 1188000),
+    195: (7680, 4320, 25, False, "16:9", 1188000),
+    196: (7680, 4320, 30, False, "16:9", 1188000),
+    197: (7680, 4320, 48, False, "16:9", 2376000),
+    198: (7680, 4320, 50, False, "16:9", 2376000),
+    199: (7680, 4320, 60, False, "16:9", 2376000),
+    200: (7680, 4320, 100, False, "16:9", 4752000),
+    201: (7680, 4320, 120, False, "16:9", 4752000),
+    202: (7680, 4320, 24, False, "64:27", 1188000),
+    203: (7680, 4320, 25, False, "64:27", 1188000),
+    204: (7680, 4320, 30, False, "64:27", 1188000),
+    205: (7680, 4320, 48, False, "64:27", 2376000),
+    206: (7680, 4320, 50, False, "64:27", 2376000),
+    207: (7680, 4320, 60, False, "64:27", 2376000),
+    208: (7680, 4320, 100, False, "64:27", 4752000),
+    209: (7680, 4320, 120, False, "64:27", 4752000),
+    210: (10240, 4320, 24, False, "64:27", 1485000),
+    211: (10240, 4320, 25, False, "64:27", 1485000),
+    212: (10240, 4320, 30, False, "64:27", 1485000),
+    213: (10240, 4320, 48, False, "64:27", 2970000),
+    214: (10240, 4320, 50, False, "64:27", 2970000),
+    215: (10240, 4320, 60, False, "64:27", 2970000),
+    216: (10240, 4320, 100, False, "64:27", 5940000),
+    217: (10240, 4320, 120, False, "64:27", 5940000),
+    218: (4096, 2160, 100, False, "256:135", 1188000),
+    219: (4096, 2160, 120, False, "256:135", 1188000),
+}
+
+# Short Audio Descriptor format codes
+AUDIO_FORMATS = {
+    1: "LPCM",
+    2: "AC-3",
+    3: "MPEG-1",
+    4: "MP3",
+    5: "MPEG-2",
+    6: "AAC LC",
+    7: "DTS",
+    8: "ATRAC",
+    9: "DSD",
+    10: "E-AC-3",
+    11: "DTS-HD",
+    12: "MAT (Dolby TrueHD)",
+    13: "DST",
+    14: "WMA Pro",
+    15: "Extension",
+}
+
+# SAD byte 2, bits 0-6
+AUDIO_SAMPLE_RATES_KHZ = (32, 44.1, 48, 88.2, 96, 176.4, 192)
+
+# SAD byte 3 for LPCM, bits 0-2
+LPCM_BIT_DEPTHS = (16, 20, 24)
+
+# Speaker allocation payload bits (byte 0 bits 0-7, byte 1 bits 0-2)
+SPEAKERS = (
+    "FL/FR",
+    "LFE",
+    "FC",
+    "RL/RR",
+    "RC",
+    "FLC/FRC",
+    "RLC/RRC",
+    "FLW/FRW",
+    "TpFL/TpFR",
+    "TpC",
+    "TpFC",
+)
+
+# Colorimetry data block, byte 1 bits 0-7 then byte 2 bit 7
+COLORIMETRY_FLAGS = (
+    "xvYCC601",
+    "xvYCC709",
+    "sYCC601",
+    "opYCC601",
+    "opRGB",
+    "BT2020cYCC",
+    "BT2020YCC",
+    "BT2020RGB",
+)
+
+# HDR static metadata EOTF bits 0-3
+HDR_EOTFS = ("SDR", "HDR (traditional gamma)", "SMPTE ST 2084 (PQ)", "HLG")
+
+# Vendor-specific data block IEEE OUIs
+HDMI_OUI = 0x000C03
+HDMI_FORUM_OUI = 0xC45DD8
+
+# HDMI Forum Max_FRL_Rate -> (gbps_per_lane, lanes)
+FRL_RATES = {
+    1: (3, 3),
+    2: (6, 3),
+    3: (6, 4),
+    4: (8, 4),
+    5: (10, 4),
+    6: (12, 4),
+}
+
+# Extended tag names for blocks without a payload decoder
+EXTENDED_TAG_NAMES = {
+    0: "Video Capability",
+    1: "Vendor-Specific Video",
+    2: "VESA Display Device",
+    3: "VESA Video Timing",
+    5: "Colorimetry",
+    6: "HDR Static Metadata",
+    7: "HDR Dynamic Metadata",
+    13: "Video Format Preference",
+    14: "YCbCr 4:2:0 Video",
+    15: "YCbCr 4:2:0 Capability Map",
+    17: "Vendor-Specific Audio",
+    18: "HDMI Audio",
+    19: "Room Configuration",
+    20: "Speaker Location",
+    32: "InfoFrame",
+    120: "HDMI Forum EEODB",
+    121: "HDMI Forum SCDB",
+}
+
+
+def _build_svd(svd_byte: int) -> Dict[str, Any]:
+    # VICs 1-64 use bit 7 as the native flag; 65-127 and 193-255 do not
+    if 129 <= svd_byte <= 192:
+        vic, native = svd_byte & 0x7F, True
+    else:
+        vic, native = svd_byte, False
+
+    svd = {"vic": vic, "native": native}
+    timing = VIC_TIMINGS.get(vic)
+    if timing:
+        h_active, v_active, refresh, interlaced, aspect, clock_khz = timing
+        svd.update(
+            {
+                "h_active": h_active,
+                "v_active": v_active,
+                "refresh_hz": refresh,
+                "interlaced": interlaced,
+                "aspect": aspect,
+                "pixel_clock_hz": clock_khz * 1000,
+            }
+        )
+    return svd
+
+
+# Every possible SVD byte decoded once at import time
+SVD_TABLE = tuple(_build_svd(b) for b in range(256))
+
+
+def decode_svds(payload: bytes) -> List[Dict[str, Any]]:
+    """
+    Decode Short Video Descriptors.
+
+    Args:
+        payload: SVD bytes
+
+    Returns:
+        List of SVD dictionaries (VIC, native flag and timing when known)
+    """
+    return [dict(SVD_TABLE[b]) for b in payload]
+
+
+def decode_video_block(payload: bytes) -> Dict[str, Any]:
+    """Decode a Video Data Block (tag 2)."""
+    return {"type": "Video", "svds": decode_svds(payload)}
+
+
+def decode_audio_block(payload: bytes) -> Dict[str, Any]:
+    """Decode an Audio Data Block (tag 1) into Short Audio Descriptors."""
+    sads = []
+    for i in range(0, len(payload) - 2, 3):
+        b0, b1, b2 = payload[i], payload[i + 1], payload[i + 2]
+        format_code = (b0 >> 3) & 0x0F
+        sad = {
+            "format": AUDIO_FORMATS.get(format_code, f"Reserved ({format_code})"),
+            "format_code": format_code,
+            "max_channels": (b0 & 0x07) + 1,
+            "sample_rates_khz": [
+                rate for bit, rate in enumerate(AUDIO_SAMPLE_RATES_KHZ) if b1 >> bit & 1
+            ],
+        }
+        if format_code == 1:
+            sad["bit_depths"] = [
+                depth for bit, depth in enumerate(LPCM_BIT_DEPTHS) if b2 >> bit & 1
+            ]
+        elif 2 <= format_code <= 8:
+            sad["max_bitrate_kbps"] = b2 * 8
+        sads.append(sad)
+
+    return {"type": "Audio", "sads": sads}
+
+
+def decode_speaker_block(payload: bytes) -> Dict[str, Any]:
+    """Decode a Speaker Allocation Data Block (tag 4)."""
+    bits = int.from_bytes(payload[:2].ljust(2, b"\x00"), "little")
+    return {
+        "type": "Speaker Allocation",
+        "speakers": [name for bit, name in enumerate(SPEAKERS) if bits >> bit & 1],
+    }
+
+
+def _decode_hdmi_forum_fields(payload: bytes) -> Dict[str, Any]:
+    # Shared by HF-VSDB and HF-SCDB, starting at the version byte
+    info: Dict[str, Any] = {}
+    if len(payload) > 0:
+        info["version"] = payload[0]
+    if len(payload) > 1:
+        info["max_tmds_character_rate_mhz"] = payload[1] * 5
+    if len(payload) > 2:
+        flags = payload[2]
+        info["scdc_present"] = bool(flags & 0x80)
+        info["rr_capable"] = bool(flags & 0x40)
+        info["lte_340mcsc_scramble"] = bool(flags & 0x08)
+    if len(payload) > 3:
+        frl = payload[3] >> 4
+        info["max_frl_rate"] = FRL_RATES.get(frl)
+        info["dc_420"] = [
+            depth for bit, depth in enumerate((30, 36, 48)) if payload[3] >> bit & 1
+        ]
+    return info
+
+
+def decode_vendor_block(payload: bytes) -> Dict[str, Any]:
+    """Decode a Vendor-Specific Data Block (tag 3), including HDMI VSDBs."""
+    if len(payload) < 3:
+        return {"type": "Vendor Specific"}
+
+    oui = payload[0] | (payload[1] << 8) | (payload[2] << 16)
+    info: Dict[str, Any] = {"type": "Vendor Specific", "oui": oui}
+
+    if oui == HDMI_OUI:
+        info["vendor"] = "HDMI"
+        if len(payload) >= 5:
+            a, b = payload[3] >> 4, payload[3] & 0x0F
+            c, d = payload[4] >> 4, payload[4] & 0x0F
+            info["physical_address"] = f"{a}.{b}.{c}.{d}"
+        if len(payload) > 5:
+            flags = payload[5]
+            info["supports_ai"] = bool(flags & 0x80)
+            info["deep_color"] = [
+                depth
+                for mask, depth in ((0x10, 30), (0x20, 36), (0x40, 48))
+                if flags & mask
+            ]
+            info["deep_color_y444"] = bool(flags & 0x08)
+            info["dvi_dual"] = bool(flags & 0x01)
+        if len(payload) > 6 and payload[6]:
+            info["max_tmds_clock_mhz"] = payload[6] * 5
+    elif oui == HDMI_FORUM_OUI:
+        info["vendor"] = "HDMI Forum"
+        info.update(_decode_hdmi_forum_fields(payload[3:]))
+
+    return info
+
+
+def decode_video_capability_block(payload: bytes) -> Dict[str, Any]:
+    """Decode a Video Capability Data Block (extended tag 0)."""
+    flags = payload[0] if payload else 0
+    return {
+        "quantization_ycc_selectable": bool(flags & 0x80),
+        "quantization_rgb_selectable": bool(flags & 0x40),
+    }
+
+
+def decode_colorimetry_block(payload: bytes) -> Dict[str, Any]:
+    """Decode a Colorimetry Data Block (extended tag 5)."""
+    flags = payload[0] if payload else 0
+    colorimetry = [
+        name for bit, name in enumerate(COLORIMETRY_FLAGS) if flags >> bit & 1
+    ]
+    if len(payload) > 1 and payload[1] & 0x80:
+        colorimetry.append("DCI-P3")
+    return {"colorimetry": colorimetry}
+
+
+def decode_hdr_static_block(payload: bytes) -> Dict[str, Any]:
+    """Decode an HDR Static Metadata Data Block (extended tag 6)."""
+    eotf_bits = payload[0] if payload else 0
+    info: Dict[str, Any] = {
+        "eotfs": [name for bit, name in enumerate(HDR_EOTFS) if eotf_bits >> bit & 1],
+        "static_metadata_type1": bool(len(payload) > 1 and payload[1] & 0x01),
+    }
+    # Luminance code values: 50 * 2^(CV/32) cd/m2
+    if len(payload) > 2 and payload[2]:
+        info["max_luminance"] = 50 * 2 ** (payload[2] / 32)
+    if len(payload) > 3 and payload[3]:
+        info["max_frame_avg_luminance"] = 50 * 2 ** (payload[3] / 32)
+    if len(payload) > 4 and "max_luminance" in info:
+        info["min_luminance"] = info["max_luminance"] * (payload[4] / 255) ** 2 / 100
+    return info
+
+
+def decode_ycbcr420_video_block(payload: bytes) -> Dict[str, Any]:
+    """Decode a YCbCr 4:2:0 Video Data Block (extended tag 14)."""
+    return {"svds": decode_svds(payload)}
+
+
+def decode_ycbcr420_capability_block(payload: bytes) -> Dict[str, Any]:
+    """Decode a YCbCr 4:2:0 Capability Map Data Block (extended tag 15)."""
+    # Bit N set means the Nth SVD of the Video Data Block also supports 4:2:0
+    bits = int.from_bytes(payload, "little")
+    return {"svd_indices": [i for i in range(len(payload) * 8) if bits >> i & 1]}
+
+
+def decode_hdmi_forum_scdb(payload: bytes) -> Dict[str, Any]:
+    """Decode an HDMI Forum SCDB (extended tag 121)."""
+    # Two reserved bytes precede the HF-VSDB compatible fields
+    return _decode_hdmi_forum_fields(payload[2:])
+
+
+EXTENDED_TAG_DECODERS: Dict[int, Callable[[bytes], Dict[str, Any]]] = {
+    0: decode_video_capability_block,
+    5: decode_colorimetry_block,
+    6: decode_hdr_static_block,
+    14: decode_ycbcr420_video_block,
+    15: decode_ycbcr420_capability_block,
+    121: decode_hdmi_forum_scdb,
+}
+
+
+def decode_extended_block(payload: bytes) -> Dict[str, Any]:
+    """Decode an extended tag data block (tag 7)."""
+    if not payload:
+        return {"type": "Extended (empty)"}
+
+    extended_tag = payload[0]
+    info: Dict[str, Any] = {
+        "type": EXTENDED_TAG_NAMES.get(
+            extended_tag, f"Unknown Extended (0x{extended_tag:02X})"
+        ),
+        "extended_tag": extended_tag,
+    }
+    decoder = EXTENDED_TAG_DECODERS.get(extended_tag)
+    if decoder:
+        info.update(decoder(payload[1:]))
+    return info
+
+
+DATA_BLOCK_DECODERS: Dict[int, Callable[[bytes], Dict[str, Any]]] = {
+    1: decode_audio_block,
+    2: decode_video_block,
+    3: decode_vendor_block,
+    4: decode_speaker_block,
+    7: decode_extended_block,
+}
+
+
+def decode_data_block(tag: int, payload: bytes) -> Dict[str, Any]:
+    """
+    Decode a CEA-861 data block payload through the tag dispatch table.
+
+    Args:
+        tag: Data block tag code (bits 7-5 of the block header)
+        payload: Block payload (header byte excluded)
+
+    Returns:
+        Dictionary with at least a "type" key
+    """
+    decoder = DATA_BLOCK_DECODERS.get(tag)
+    if decoder is None:
+        return {"type": f"Unknown (0x{tag:02X})"}
+    return decoder(payload)
+
+
+def _format_svd(svd: Dict[str, Any]) -> str:
+    native = " (native)" if svd["native"] else ""
+    if "h_active" not in svd:
+        return f"VIC {svd['vic']}: Unknown{native}"
+    scan = "i" if svd["interlaced"] else "p"
+    return (
+        f"VIC {svd['vic']}: {svd['h_active']}x{svd['v_active']}{scan}"
+        f"@{svd['refresh_hz']} {svd['aspect']}{native}"
+    )
+
+
+def format_data_block(block: Dict[str, Any]) -> List[str]:
+    """
+    Render the decoded payload of a data block as text lines.
+
+    Args:
+        block: Decoded data block (from decode_data_block)
+
+    Returns:
+        Lines without indentation
+    """
+    lines = []
+
+    for svd in block.get("svds", []):
+        lines.append(_format_svd(svd))
+
+    for sad in block.get("sads", []):
+        rates = ", ".join(f"{r:g}" for r in sad["sample_rates_khz"])
+        line = f"{sad['format']}: {sad['max_channels']} ch, {rates} kHz"
+        if "bit_depths" in sad:
+            line += ", " + "/".join(str(d) for d in sad["bit_depths"]) + " bit"
+        if "max_bitrate_kbps" in sad:
+            line += f", max {sad['max_bitrate_kbps']} kbps"
+        lines.append(line)
+
+    if "speakers" in block:
+        lines.append("Speakers: " + (", ".join(block["speakers"]) or "None"))
+
+    if "vendor" in block:
+        lines.append(f"Vendor: {block['vendor']} (OUI 0x{block['oui']:06X})")
+    elif "oui" in block:
+        lines.append(f"OUI: 0x{block['oui']:06X}")
+    if "physical_address" in block:
+        lines.append(f"Physical Address: {block['physical_address']}")
+    if block.get("deep_color"):
+        lines.append(
+            "Deep Color: " + ", ".join(f"{d}-bit" for d in block["deep_color"])
+        )
+    if "max_tmds_clock_mhz" in block:
+        lines.append(f"Max TMDS Clock: {block['max_tmds_clock_mhz']} MHz")
+    if block.get("max_tmds_character_rate_mhz"):
+        lines.append(
+            f"Max TMDS Character Rate: {block['max_tmds_character_rate_mhz']} MHz"
+        )
+    if "scdc_present" in block:
+        lines.append(f"SCDC Present: {block['scdc_present']}")
+    if "max_frl_rate" in block:
+        frl = block["max_frl_rate"]
+        lines.append(
+            f"Max FRL Rate: {frl[0]} Gbps x {frl[1]} lanes"
+            if frl
+            else "Max FRL Rate: None"
+        )
+    if block.get("dc_420"):
+        lines.append(
+            "Deep Color 4:2:0: " + ", ".join(f"{d}-bit" for d in block["dc_420"])
+        )
+
+    if "colorimetry" in block:
+        lines.append("Colorimetry: " + (", ".join(block["colorimetry"]) or "None"))
+    if "eotfs" in block:
+        lines.append("EOTFs: " + (", ".join(block["eotfs"]) or "None"))
+    for key, label in (
+        ("max_luminance", "Max Luminance"),
+        ("max_frame_avg_luminance", "Max Frame-Avg Luminance"),
+        ("min_luminance", "Min Luminance"),
+    ):
+        if key in block:
+            lines.append(f"{label}: {block[key]:.4g} cd/m2")
+    if "vics" in block:
+        lines.append(
+            "4:2:0 VICs: " + (", ".join(str(v) for v in block["vics"]) or "None")
+        )
+    if "quantization_rgb_selectable" in block:
+        lines.append(
+            f"RGB Quantization Selectable: {block['quantization_rgb_selectable']}"
+        )
+
+    return lines
@@ -1,25 +1,177 @@
 """CLI interface for EDID Manager."""
 
+import itertools
+import json
 import sys
+import time
 import click
 from pathlib import Path
 
 from . import __version__
 from .i2c import (
+    PAGE_SIZE,
+    WAIT_STRATEGIES,
     discover_buses,
     read_edid,
     write_edid,
+    write_edids,
     test_writable,
     validate_device_matches_file,
 )
 from .parser import decode_hex, decode_basic, decode_deep
 from .validator import validate_structure, recalculate_checksums
+from .archive import write_packed_archive, iter_edid_files
+from .compressed import (
+    CODECS,
+    DEFAULT_LEVEL,
+    CompressedArchive,
+    write_compressed_archive,
+)
+from .patch import load_patch_records, patch_edids, output_names
+from .modes import list_modes, parse_mode_spec, supports_mode, format_mode
+from .index import DEFAULT_INDEX_PATH, open_index, ingest, query_index
+from .backend import get_backend, set_backend
+from .adapters import get_profile, reset_profiles
+from .simulator import SimulatorBackend, parse_mux_spec, parse_simulator_spec
+from . import profiling
+from .retry import RetryPolicy, format_bus_stats, set_retry_policy
+from .locking import DEFAULT_LOCK_TIMEOUT, set_lock_timeout
+from .topology import discover_topology, format_tree
+from .trace import (
+    ReplayBackend,
+    TraceWriter,
+    TracingBackend,
+    format_record,
+    format_trace_summary,
+    iter_trace,
+    summarize_trace,
+)
+from .watch import watch_buses, format_event
+from .cache import DecodeCache, default_disk_dir, set_decode_cache
+from .diff import (
+    diff_against,
+    diff_edids,
+    format_change,
+    significant_changes,
+    summarize_changes,
+)
+from .carve import carve_files, carve_name
+from .importers import iter_text_edids, load_edid
+from .fingerprint import cluster_edids, describe_model, format_cluster
+from .bandwidth import (
+    DEFAULT_FORMATS,
+    LINKS,
+    BandwidthAnalyzer,
+    all_formats,
+    analyze_corpus,
+    demanding_mode,
+    find_links,
+    format_requirement,
+    format_summary,
+    parse_format,
+    summarize_corpus,
+)
+from .hexdump import iter_archive_dump, iter_hex_diff, write_lines
+from .lint import (
+    ERROR,
+    INFO,
+    RULES,
+    WARNING,
+    count_findings,
+    format_finding,
+    lint_corpus,
+)
 
 
 @click.group()
 @click.version_option(version=__version__)
+@click.option(
+    "--simulate",
+    multiple=True,
+    metavar="BUS=FILE",
+    help="Use an in-memory EEPROM simulator on BUS loaded from FILE "
+    "instead of real I2C hardware (repeatable)",
+)
+@click.option(
+    "--simulate-mux",
+    multiple=True,
+    metavar="CHILD=PARENT:CHANNEL",
+    help="Place simulated bus CHILD behind channel CHANNEL of a mux on bus "
+    "PARENT (repeatable)",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print a timing breakdown (phases, bus transactions, sleeps) on exit",
+)
+@click.option(
+    "--profile-trace",
+    type=click.Path(dir_okay=False),
+    help="Write profiling spans as Chrome trace-event JSON (implies --profile)",
+)
+@click.option(
+    "--profile-metrics",
+    type=click.Path(dir_okay=False),
+    help="Write profiling totals as OpenMetrics text (implies --profile)",
+)
+@click.option(
+    "--retries",
+    type=click.IntRange(0, 20),
+    default=3,
+    show_default=True,
+    help="Retries per I2C transaction on transient errors (NACKs, timeouts)",
+)
+@click.option(
+    "--lock-timeout",
+    type=float,
+    default=DEFAULT_LOCK_TIMEOUT,
+    show_default=True,
+    help="Seconds to wait for a bus used by another process (0 fails at once)",
+)
+@click.option(
+    "--trace-record",
+    type=click.Path(dir_okay=False),
+    help="Record every bus transaction (with data, latency and errors) to a trace",
+)
+@click.option(
+    "--trace-replay",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Serve bus transactions from a recorded trace instead of hardware",
+)
+@click.option(
+    "--replay-scale",
+    type=click.FloatRange(min=0),
+    default=1.0,
+    show_default=True,
+    help="With --trace-replay: multiply recorded latencies (0 replays instantly)",
+)
+@click.option(
+    "--decode-cache/--no-decode-cache",
+    default=True,
+    show_default=True,
+    help="Reuse decodes of EDIDs already decoded in this run",
+)
+@click.option(
+    "--persistent-decode-cache",
+    is_flag=True,
+    help="Also keep decodes across runs in ~/.cache/edid/decode",
+)
 @click.pass_context
-def cli(ctx):
+def cli(
+    ctx,
+    simulate,
+    simulate_mux,
+    profile,
+    profile_trace,
+    profile_metrics,
+    retries,
+    lock_timeout,
+    trace_record,
+    trace_replay,
+    replay_scale,
+    decode_cache,
+    persistent_decode_cache,
+):
     """EDID Manager - CLI tool for managing EDID data via I2C devices.
 
     This tool allows you to read, decode, write, and validate EDID data
@@ -30,16 +182,108 @@ def cli(ctx):
     # Store context for subcommands
     ctx.ensure_object(dict)
 
+    if simulate or simulate_mux:
+        eeproms = {}
+        muxes = {}
+        try:
+            for spec in simulate:
+                eeproms.update(parse_simulator_spec(spec))
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint="--simulate")
+        try:
+            for spec in simulate_mux:
+                muxes.update(parse_mux_spec(spec))
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--simulate-mux")
+        set_backend(SimulatorBackend(eeproms, muxes))
+
+    if trace_replay:
+        if simulate or simulate_mux:
+            raise click.BadParameter(
+                "cannot be combined with --simulate", param_hint="--trace-replay"
+            )
+        try:
+            set_backend(ReplayBackend(trace_replay, time_scale=replay_scale))
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint="--trace-replay")
+
+    if trace_record:
+        try:
+            writer = TraceWriter(trace_record)
+        except OSError as e:
+            raise click.BadParameter(str(e), param_hint="--trace-record")
+        set_backend(TracingBackend(get_backend(), writer))
+        ctx.call_on_close(lambda: _finish_trace(writer))
+
+    set_retry_policy(RetryPolicy(attempts=retries + 1))
+    set_lock_timeout(lock_timeout)
+    if persistent_decode_cache and not decode_cache:
+        raise click.BadParameter(
+            "cannot be combined with --no-decode-cache",
+            param_hint="--persistent-decode-cache",
+        )
+    set_decode_cache(
+        DecodeCache(disk_dir=default_disk_dir() if persistent_decode_cache else None)
+        if decode_cache
+        else None
+    )
+
+    if profile or profile_trace or profile_metrics:
+        profiling.enable()
+        ctx.call_on_close(
+            lambda: _finish_profile(profile, profile_trace, profile_metrics)
+        )
+
+
+def _finish_trace(writer):
+    """Close a trace recorded during a command."""
+    writer.close()
+    click.echo(
+        f"Trace of {writer.transactions} transaction(s) written to: {writer.path}",
+        err=True,
+    )
+
+
+def _finish_profile(show_report, trace_path, metrics_path):
+    """Print and export the profile collected during a command."""
+    profiler = profiling.disable()
+    if profiler is None:
+        return
+    if show_report:
+        click.echo(profiler.format_report(), err=True)
+    if trace_path:
+        profiler.write_chrome_trace(trace_path)
+        click.echo(f"Profile trace written to: {trace_path}", err=True)
+    if metrics_path:
+        profiler.write_openmetrics(metrics_path)
+        click.echo(f"Profile metrics written to: {metrics_path}", err=True)
+
 
 @cli.command()
 @click.option(
     "--verbose", "-v", is_flag=True, help="Show detailed scanning information"
 )
-def list(verbose):
+@click.option(
+    "--tree",
+    "-t",
+    is_flag=True,
+    help="Show buses behind I2C muxes as a tree (probes root adapters in parallel)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="With --tree: probe at most this many root adapters at once",
+)
+def list(verbose, tree, jobs):
     """List available I2C buses and detect EDID presence.
 
     Scans /dev/i2c-* devices and probes for EDID at address 0x50.
     """
+    if tree:
+        _list_tree(verbose, jobs)
+        return
+
     try:
         buses = discover_buses(verbose=verbose)
 
@@ -60,6 +304,21 @@ def list(verbose):
             click.echo(f"  Bus {bus_num}: {status}")
             if has_edid:
                 edid_found = True
+            if verbose:
+                adapter = get_backend().adapter_name(bus_num)
+                profile = get_profile(adapter)
+                if profile:
+                    chunking = (
+                        f"read chunk {profile['chunk_size']} bytes "
+                        f"(learned {profile['updated']})"
+                    )
+                    if profile.get("failures"):
+                        chunking += (
+                            f", fell back on {profile['failures']} recent read(s)"
+                        )
+                else:
+                    chunking = "read chunk not learned yet"
+                click.echo(f"      Adapter: {adapter}, {chunking}")
 
         click.echo("=" * 50)
 
@@ -73,6 +332,57 @@ def list(verbose):
         sys.exit(1)
 
 
+def _list_tree(verbose, jobs):
+    """Print the mux topology with EDID presence (list --tree)."""
+    try:
+        topology = discover_topology(workers=jobs, verbose=verbose)
+
+        if not topology["nodes"]:
+            click.echo("No I2C buses found.")
+            return
+
+        click.echo("\nI2C Topology:")
+        click.echo("=" * 50)
+        for line in format_tree(topology, show_adapters=verbose):
+            click.echo(line)
+        click.echo("=" * 50)
+
+        if verbose:
+            stats = topology["stats"]
+            click.echo(
+                f"{stats['buses']} bus(es) under {stats['roots']} root adapter(s), "
+                f"{stats['workers']} worker(s), {stats['mux_selections']} mux "
+                f"channel selection(s), {stats['seconds'] * 1000:.1f} ms"
+            )
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("adapters", nargs=-1)
+def relearn(adapters):
+    """Forget learned read chunk sizes.
+
+    The adapters start again with 256-byte reads and learn their chunk size
+    anew, e.g. after a flaky cable was replaced.
+
+    ADAPTERS: Bus numbers or adapter names as shown by 'edid list -v'
+    (default: all adapters)
+    """
+    try:
+        names = [
+            get_backend().adapter_name(int(adapter)) if adapter.isdigit() else adapter
+            for adapter in adapters
+        ]
+        removed = reset_profiles(names or None)
+        click.echo(f"Forgot the read chunk size of {removed} adapter(s)")
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("bus", type=int)
 @click.argument("output", type=click.Path())
@@ -96,6 +406,8 @@ def read(bus, output, verbose):
 
         if not verbose:
             click.echo(f"Read {len(edid_data)} bytes from bus {bus}")
+        else:
+            click.echo(format_bus_stats(bus))
         click.echo(f"Saved to: {output_path}")
 
     except Exception as e:
@@ -114,16 +426,15 @@ def read(bus, output, verbose):
 )
 @click.option("--verbose", "-v", is_flag=True, help="Show verbose output")
 def decode(input, level, verbose):
-    """Decode EDID from binary file.
+    """Decode EDID from binary or text file.
 
     Parses and displays EDID information in human-readable format.
 
-    INPUT: Path to binary EDID file
+    INPUT: Path to binary EDID file, or xrandr/edid-decode/hex text
     """
     try:
         # Read EDID file
-        input_path = Path(input)
-        edid_data = input_path.read_bytes()
+        edid_data = load_edid(Path(input))
 
         # Validate structure
         is_valid, message = validate_structure(edid_data)
@@ -150,15 +461,154 @@ def decode(input, level, verbose):
         sys.exit(1)
 
 
+@cli.command()
+@click.argument("inputs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    help="Write the dump to a file instead of stdout",
+)
+@click.option(
+    "--diff",
+    "side_by_side",
+    is_flag=True,
+    help="Side-by-side diff of the first two EDIDs found in INPUTS",
+)
+def hexdump(inputs, output, side_by_side):
+    """Hex dump EDID files, packed archives and directories.
+
+    Output is streamed entry by entry, so large archives can be dumped
+    without loading the whole rendering into memory.
+
+    INPUTS: EDID files, packed archives, or directories of .bin files
+    """
+    try:
+        entries = iter_edid_files(Path(p) for p in inputs)
+        if side_by_side:
+            pair = [edid_data for _, edid_data in itertools.islice(entries, 2)]
+            if len(pair) != 2:
+                click.echo("Error: --diff needs two EDIDs", err=True)
+                sys.exit(1)
+            lines = iter_hex_diff(*pair)
+        else:
+            lines = iter_archive_dump(entries)
+
+        if output:
+            with open(output, "w") as f:
+                write_lines(lines, f)
+        else:
+            write_lines(lines, click.get_text_stream("stdout"))
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("inputs", nargs=-1, type=click.Path(exists=True))
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Worker processes (default: one per CPU; 1 lints in-process)",
+)
+@click.option("--json", "as_json", is_flag=True, help="One JSON object per EDID")
+@click.option("--list-rules", is_flag=True, help="List the lint rules and exit")
+@click.option(
+    "--verbose", "-v", is_flag=True, help="Show info findings and clean EDIDs"
+)
+def lint(inputs, jobs, as_json, list_rules, verbose):
+    """Check EDIDs against the EDID and CEA-861 conformance rules.
+
+    Unlike validate, every rule runs and all findings are reported. Exits
+    with status 1 if any EDID has errors.
+
+    INPUTS: EDID files, packed archives, or directories of .bin files
+    """
+    if list_rules:
+        for entry in RULES:
+            click.echo(
+                f"{entry['id']:<28} {entry['severity']:<8} {entry['description']}"
+            )
+        return
+
+    if not inputs:
+        click.echo("Error: no INPUTS given", err=True)
+        sys.exit(1)
+
+    try:
+        totals = {"edids": 0, "errors": 0, "warnings": 0, "clean": 0}
+
+        for label, findings in lint_corpus(iter_edid_files(inputs), workers=jobs):
+            counts = count_findings(findings)
+            totals["edids"] += 1
+            if counts[ERROR]:
+                totals["errors"] += 1
+            elif len(findings) > counts[INFO]:
+                totals["warnings"] += 1
+            else:
+                totals["clean"] += 1
+
+            if as_json:
+                click.echo(json.dumps({"label": label, "findings": findings}))
+                continue
+
+            shown = [f for f in findings if verbose or f["severity"] != INFO]
+            if not shown and not verbose:
+                continue
+            click.echo(
+                f"{label}: {counts[ERROR]} error(s), {counts[WARNING]} warning(s), "
+                f"{counts[INFO]} info"
+            )
+            for finding in shown:
+                click.echo(f"  {format_finding(finding)}")
+
+        click.echo(
+            f"Linted {totals['edids']} EDID(s): {totals['errors']} with errors, "
+            f"{totals['warnings']} with warnings only, {totals['clean']} clean",
+            err=True,
+        )
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    if totals["errors"]:
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("bus", type=int)
 @click.argument("input", type=click.Path(exists=True))
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed write information")
-def write(bus, input, verbose):
+@click.option(
+    "--page-size",
+    type=click.Choice(["8", "16", "32"]),
+    default=str(PAGE_SIZE),
+    show_default=True,
+    help="EEPROM page size in bytes",
+)
+@click.option(
+    "--wait",
+    "wait_strategy",
+    type=click.Choice(WAIT_STRATEGIES),
+    default=WAIT_STRATEGIES[0],
+    show_default=True,
+    help="Write-cycle wait: fixed delay or acknowledge polling",
+)
+@click.option(
+    "--no-resume",
+    is_flag=True,
+    help="Discard the journal of an interrupted write and start over",
+)
+def write(bus, input, verbose, page_size, wait_strategy, no_resume):
     """Write EDID from file to I2C device.
 
     Writes binary EDID data to the specified I2C bus device.
     Automatically creates a backup before writing and verifies the write.
+    If a previous write of the same file to BUS was interrupted, only the
+    remaining pages are written.
 
     WARNING: Writing invalid EDID data can make your display unusable!
 
@@ -189,17 +639,114 @@ def write(bus, input, verbose):
             click.echo("Checksums recalculated")
 
         # Write to device (includes automatic backup)
-        write_edid(bus, edid_data, verbose=verbose)
+        write_edid(
+            bus,
+            edid_data,
+            verbose=verbose,
+            page_size=int(page_size),
+            wait_strategy=wait_strategy,
+            resume=not no_resume,
+        )
 
         if not verbose:
             click.echo(f"Successfully wrote {len(edid_data)} bytes to bus {bus}")
             click.echo("Backup created in ~/.edid-backups/")
+        else:
+            click.echo(format_bus_stats(bus))
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
 
+@cli.command()
+@click.argument("targets", nargs=-1, required=True, metavar="BUS=FILE...")
+@click.option("--verbose", "-v", is_flag=True, help="Show detailed write information")
+@click.option(
+    "--page-size",
+    type=click.Choice(["8", "16", "32"]),
+    default=str(PAGE_SIZE),
+    show_default=True,
+    help="EEPROM page size in bytes",
+)
+@click.option(
+    "--wait",
+    "wait_strategy",
+    type=click.Choice(WAIT_STRATEGIES),
+    default=WAIT_STRATEGIES[0],
+    show_default=True,
+    help="Write-cycle wait: fixed delay or acknowledge polling",
+)
+@click.option(
+    "--no-resume",
+    is_flag=True,
+    help="Discard the journals of interrupted writes and start over",
+)
+def provision(targets, verbose, page_size, wait_strategy, no_resume):
+    """Write EDIDs to several devices at once.
+
+    Page writes are interleaved across the devices, so each EEPROM's write
+    cycle overlaps with writes to the others: N displays (on separate buses
+    or behind channels of one mux) take about as long as one. Every device
+    is backed up, journaled and verified as with 'write'.
+
+    WARNING: Writing invalid EDID data can make your display unusable!
+
+    BUS=FILE: I2C bus number and binary EDID file, e.g. 12=panel.bin
+    """
+    try:
+        jobs = []
+        for spec in targets:
+            bus, sep, file_name = spec.partition("=")
+            if not sep or not bus.strip().isdigit():
+                raise ValueError(f"Invalid target '{spec}' (expected BUS=FILE)")
+            edid_data = Path(file_name).read_bytes()
+
+            is_valid, message = validate_structure(edid_data)
+            if not is_valid:
+                raise ValueError(f"Invalid EDID file {file_name} - {message}")
+
+            edid_array = bytearray(edid_data)
+            recalculate_checksums(edid_array)
+            jobs.append((int(bus), bytes(edid_array)))
+
+        start = time.perf_counter()
+        results = write_edids(
+            jobs,
+            verbose=verbose,
+            page_size=int(page_size),
+            wait_strategy=wait_strategy,
+            resume=not no_resume,
+        )
+        elapsed = time.perf_counter() - start
+
+        click.echo("\nProvisioning results:")
+        for result, (_, edid_data) in zip(results, jobs):
+            if result["verified"]:
+                click.echo(
+                    f"  Bus {result['bus']}: ✓ wrote {len(edid_data)} bytes "
+                    f"({result['pages']} page(s)), backup {result['backup']}"
+                )
+            else:
+                click.echo(f"  Bus {result['bus']}: ✗ {result['error']}")
+
+        failed = sum(1 for result in results if not result["verified"])
+        click.echo(
+            f"{len(results) - failed}/{len(results)} device(s) written in "
+            f"{elapsed:.2f}s"
+        )
+        if verbose:
+            for result in results:
+                click.echo(format_bus_stats(result["bus"]))
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    if failed:
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("bus", type=int)
 @click.argument("file", type=click.Path(exists=True))
@@ -212,12 +759,12 @@ def validate(bus, file, verbose):
 
     BUS: I2C bus number (e.g., 5 for /dev/i2c-5)
 
-    FILE: Path to binary EDID file for comparison
+    FILE: Path to binary EDID file (or xrandr/edid-decode/hex text) for
+    comparison
     """
     try:
         # Read file
-        file_path = Path(file)
-        file_data = file_path.read_bytes()
+        file_data = load_edid(Path(file))
 
         # Validate file structure
         is_valid, message = validate_structure(file_data)
@@ -225,9 +772,19 @@ def validate(bus, file, verbose):
             click.echo(f"Warning: File EDID invalid - {message}", err=True)
 
         # Compare with device
+        if verbose:
+            click.echo(f"Reading EDID from bus {bus}...")
+        try:
+            device_data = read_edid(bus)
+        except Exception as e:
+            click.echo(f"✗ Failed to read device: {e}", err=True)
+            sys.exit(1)
         matches, result_message = validate_device_matches_file(
-            bus, file_data, verbose=verbose
+            bus, file_data, verbose=verbose, device_data=device_data
         )
+        if verbose and not matches and len(device_data) == len(file_data):
+            changes = diff_edids(file_data, device_data)
+            click.echo(f"Changed fields: {summarize_changes(changes)}")
 
         if matches:
             click.echo(f"✓ {result_message}")
@@ -241,6 +798,88 @@ def validate(bus, file, verbose):
         sys.exit(1)
 
 
+def _iter_diff_sources(specs):
+    """Yield (label, edid_data) for files, archive entries (FILE#N) and bus:N."""
+    for spec in specs:
+        if spec.startswith("bus:"):
+            bus_num = int(spec[4:])
+            yield spec, read_edid(bus_num)
+            continue
+
+        path, _, entry = spec.rpartition("#")
+        if path and entry.isdigit() and not Path(spec).exists():
+            entries = [data for _, data in iter_edid_files([Path(path)])]
+            index = int(entry)
+            if index >= len(entries):
+                raise ValueError(f"{path} has only {len(entries)} EDID(s)")
+            yield spec, entries[index]
+            continue
+
+        if not Path(spec).exists():
+            raise ValueError(f"No such file, archive entry or bus: {spec}")
+        yield from iter_edid_files([Path(spec)])
+
+
+@cli.command()
+@click.argument("reference")
+@click.argument("targets", nargs=-1, required=True)
+@click.option("--json", "as_json", is_flag=True, help="One JSON object per EDID")
+@click.option(
+    "--verbose", "-v", is_flag=True, help="Show old and new values of each field"
+)
+def diff(reference, targets, as_json, verbose):
+    """Show which EDID fields differ from a reference.
+
+    Byte differences are mapped to fields (product info, descriptors,
+    CEA-861 and DisplayID blocks). Every EDID in TARGETS is compared
+    against REFERENCE, which is parsed only once. Exits with status 1 if
+    any EDID differs.
+
+    REFERENCE, TARGETS: EDID files, packed archives, directories of .bin
+    files, archive entries (FILE#N) or I2C buses (bus:N)
+    """
+    try:
+        references = [data for _, data in _iter_diff_sources([reference])]
+        if len(references) != 1:
+            click.echo(
+                f"Error: {reference} holds {len(references)} EDIDs; "
+                "pick one with FILE#N",
+                err=True,
+            )
+            sys.exit(1)
+
+        compared = 0
+        differing = 0
+        field_counts = {}
+        for label, changes in diff_against(references[0], _iter_diff_sources(targets)):
+            compared += 1
+            if changes:
+                differing += 1
+            for change in significant_changes(changes):
+                field_counts[change["field"]] = field_counts.get(change["field"], 0) + 1
+
+            if as_json:
+                click.echo(json.dumps({"label": label, "changes": changes}))
+                continue
+
+            click.echo(f"{label}: {summarize_changes(changes)}")
+            if verbose:
+                for change in changes:
+                    click.echo(f"  {format_change(change)}")
+
+        if compared > 1:
+            click.echo(f"{differing} of {compared} EDID(s) differ", err=True)
+            for field, count in sorted(field_counts.items(), key=lambda i: -i[1]):
+                click.echo(f"  {field}: {count}", err=True)
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    if differing:
+        sys.exit(1)
+
+
 @cli.command("test-write")
 @click.argument("bus", type=int)
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed test information")
@@ -274,6 +913,692 @@ def test_write(bus, verbose):
         sys.exit(1)
 
 
+@cli.command()
+@click.argument("inputs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--output",
+    "-o",
+    required=True,
+    type=click.Path(dir_okay=False),
+    help="Compressed archive to write (.edidz)",
+)
+@click.option(
+    "--codec",
+    type=click.Choice(sorted(CODECS)),
+    default="zlib",
+    show_default=True,
+    help="Compression codec (zstd needs the zstandard package)",
+)
+@click.option(
+    "--level",
+    type=int,
+    default=DEFAULT_LEVEL,
+    show_default=True,
+    help="Compression level",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Show compression statistics")
+def compress(inputs, output, codec, level, verbose):
+    """Store EDIDs in a dictionary-compressed archive.
+
+    A dictionary built from the corpus is shared by all entries, so EDIDs
+    of the same model cost only the bytes in which they differ. Entries
+    keep their source labels and can be read individually.
+
+    INPUTS: EDID files, packed archives or directories (e.g. ~/.edid-backups)
+    """
+    try:
+        stats = write_compressed_archive(
+            Path(output), iter_edid_files(inputs), codec=codec, level=level
+        )
+        ratio = stats["raw_bytes"] / stats["archive_bytes"]
+        click.echo(
+            f"Compressed {stats['entries']} EDID(s) into {output}: "
+            f"{stats['raw_bytes']} -> {stats['archive_bytes']} bytes ({ratio:.1f}x)"
+        )
+        if verbose:
+            click.echo(f"  Distinct EDIDs: {stats['unique']}")
+            click.echo(f"  Dictionary: {stats['dictionary_bytes']} bytes ({codec})")
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("archive", type=click.Path(exists=True, dir_okay=False))
+@click.argument("output_dir", type=click.Path(file_okay=False))
+@click.option(
+    "--entry",
+    "-e",
+    "entry_numbers",
+    type=int,
+    multiple=True,
+    help="Extract only this entry number (repeatable)",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Show each extracted file")
+def extract(archive, output_dir, entry_numbers, verbose):
+    """Extract EDIDs from a compressed archive.
+
+    Each entry is written as a .bin file named after its stored label.
+
+    ARCHIVE: Compressed archive (.edidz)
+
+    OUTPUT_DIR: Directory for the extracted files
+    """
+    try:
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        used_names = set()
+
+        with CompressedArchive(Path(archive)) as reader:
+            for number in entry_numbers or range(len(reader)):
+                edid_data = reader.read(number)
+                name = Path(reader.labels[number].replace("#", "_")).name
+                if not name.endswith(".bin"):
+                    name += ".bin"
+                if name in used_names:
+                    name = f"{name[:-4]}_{number}.bin"
+                used_names.add(name)
+
+                (out_dir / name).write_bytes(edid_data)
+                if verbose:
+                    click.echo(f"  {name} ({len(edid_data)} bytes)")
+
+        click.echo(f"Extracted {len(used_names)} EDID(s) to {out_dir}")
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("template", type=click.Path(exists=True))
+@click.argument("values", type=click.Path(exists=True))
+@click.argument("output", type=click.Path())
+@click.option(
+    "--archive",
+    "-a",
+    is_flag=True,
+    help="Write a single packed archive instead of one file per unit",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Show each generated file")
+def patch(template, values, output, archive, verbose):
+    """Generate per-unit EDIDs from a template.
+
+    Patches the serial number, display name and preferred timing of the
+    template for every record in VALUES and recalculates checksums.
+
+    TEMPLATE: Path to a valid binary EDID file
+
+    VALUES: CSV or JSONL file with per-unit fields (serial, name,
+    pixel_clock_hz, h_active, h_blank, v_active, v_blank, file)
+
+    OUTPUT: Output directory, or archive file with --archive
+    """
+    try:
+        template_data = Path(template).read_bytes()
+        records = load_patch_records(Path(values))
+
+        packed = patch_edids(template_data, records)
+        size = len(template_data)
+        output_path = Path(output)
+
+        if archive:
+            write_packed_archive(
+                output_path,
+                (packed[i : i + size] for i in range(0, len(packed), size)),
+            )
+            click.echo(f"Wrote {len(records)} EDID(s) to archive {output_path}")
+            return
+
+        # Check all names before writing, so a clash leaves no partial output
+        names = output_names(records)
+        output_path.mkdir(parents=True, exist_ok=True)
+        for index, name in enumerate(names):
+            unit_path = output_path / name
+            unit_path.write_bytes(packed[index * size : (index + 1) * size])
+            if verbose:
+                click.echo(f"  {unit_path}")
+
+        click.echo(f"Wrote {len(records)} EDID(s) to {output_path}")
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("inputs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--match",
+    "-m",
+    "mode_spec",
+    help="Only list EDIDs supporting a mode, e.g. 2560x1440@144 or 1920x1080@60i",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Show modes of matching EDIDs")
+def modes(inputs, mode_spec, verbose):
+    """List every video mode supported by EDIDs.
+
+    Includes detailed, established and standard timings from the base block
+    plus CEA-861 and DisplayID extension timings.
+
+    INPUTS: EDID files, packed archives or directories of .bin files
+    """
+    try:
+        wanted = parse_mode_spec(mode_spec) if mode_spec else None
+        matches = 0
+
+        for label, edid_data in iter_edid_files(inputs):
+            edid_modes = list_modes(edid_data)
+
+            if wanted:
+                if not supports_mode(edid_modes, *wanted):
+                    continue
+                matches += 1
+                click.echo(label)
+                if not verbose:
+                    continue
+            else:
+                click.echo(f"\n{label}: {len(edid_modes)} mode(s)")
+
+            for mode in edid_modes:
+                click.echo(f"  {format_mode(mode)}")
+
+        if wanted:
+            click.echo(f"{matches} EDID(s) support {mode_spec}", err=True)
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("inputs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--min-count",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Only show models with at least this many units",
+)
+@click.option("--json", "as_json", is_flag=True, help="Emit clusters as JSON lines")
+@click.option("--verbose", "-v", is_flag=True, help="List the members of each model")
+def cluster(inputs, min_count, as_json, verbose):
+    """Group EDIDs by model.
+
+    EDIDs are grouped by a fingerprint that ignores per-unit fields (serial
+    numbers, manufacture dates, serial strings and checksums), so every
+    unit of a panel model lands in one cluster.
+
+    INPUTS: EDID files, packed archives or directories of .bin files
+    """
+    try:
+        clusters = cluster_edids(iter_edid_files(inputs), keep_labels=verbose)
+        total = sum(c["count"] for c in clusters)
+
+        for entry in clusters:
+            if entry["count"] < min_count:
+                continue
+            if as_json:
+                click.echo(json.dumps(entry))
+                continue
+            click.echo(format_cluster(entry))
+            if verbose:
+                for label in entry["labels"]:
+                    click.echo(f"    {label}")
+
+        click.echo(f"{total} EDID(s) in {len(clusters)} model(s)", err=True)
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("inputs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--format",
+    "-f",
+    "formats",
+    multiple=True,
+    help="Color format CHROMA-BPC, e.g. rgb-10 or 420-8, or 'all' "
+    f"(repeatable; default: {', '.join(DEFAULT_FORMATS)})",
+)
+@click.option(
+    "--link",
+    "-l",
+    "link_names",
+    multiple=True,
+    help="Check these links only, e.g. 'HDMI 2.0' or 'HBR3 x4' (repeatable)",
+)
+@click.option("--summary", "-s", is_flag=True, help="Tally the links the corpus needs")
+@click.option("--json", "as_json", is_flag=True, help="Emit results as JSON lines")
+@click.option(
+    "--verbose", "-v", is_flag=True, help="Show every mode, not just the fastest"
+)
+def bandwidth(inputs, formats, link_names, summary, as_json, verbose):
+    """Check which HDMI and DisplayPort links carry EDID modes.
+
+    For each EDID, shows the data rate its most demanding mode needs in
+    each color format and the slowest link of each family (HDMI TMDS,
+    HDMI FRL, DisplayPort) that carries it. With --link, shows whether
+    each given link does instead. DSC and protocol overheads beyond line
+    coding are not considered.
+
+    INPUTS: EDID files, packed archives or directories of .bin files
+    """
+    try:
+        if "all" in formats:
+            formats = all_formats()
+        formats = formats or DEFAULT_FORMATS
+        for spec in formats:
+            parse_format(spec)
+        links = find_links(link_names) if link_names else LINKS
+        analyzer = BandwidthAnalyzer(formats, links)
+        results = analyze_corpus(iter_edid_files(inputs), analyzer)
+
+        if summary:
+            totals = summarize_corpus(results, formats)
+            if as_json:
+                click.echo(json.dumps(totals))
+            else:
+                for line in format_summary(totals):
+                    click.echo(line)
+            return
+
+        count = 0
+        for label, edid_modes in results:
+            count += 1
+            if as_json:
+                click.echo(json.dumps({"label": label, "modes": edid_modes}))
+                continue
+            shown = edid_modes if verbose else [demanding_mode(edid_modes)]
+            click.echo(f"\n{label}: {len(edid_modes)} mode(s)")
+            for mode in shown:
+                if mode is None:
+                    continue
+                click.echo(f"  {format_mode(mode)}")
+                for spec in formats:
+                    line = format_requirement(
+                        spec, mode["formats"][spec], fits=bool(link_names)
+                    )
+                    click.echo(f"    {line}")
+
+        click.echo(f"{count} EDID(s) analyzed", err=True)
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+def _iter_import_sources(inputs, errors):
+    """Yield (label, edid_data) from text files and stdin ("-")."""
+    for name in inputs:
+        if name == "-":
+            yield from iter_text_edids(sys.stdin, "-", errors)
+            continue
+        with open(name, encoding="utf-8", errors="replace") as f:
+            yield from iter_text_edids(f, name, errors)
+
+
+@cli.command("import")
+@click.argument("inputs", nargs=-1, required=True, type=click.Path(allow_dash=True))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, allow_dash=True),
+    default="-",
+    show_default=True,
+    help="Packed archive to write (- for stdout)",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    help="Save each EDID as a separate .bin file instead",
+)
+@click.option(
+    "--strict", is_flag=True, help="Fail on an incomplete EDID instead of skipping it"
+)
+@click.option("--verbose", "-v", is_flag=True, help="List imported EDIDs on stderr")
+def import_text(inputs, output, output_dir, strict, verbose):
+    """Convert xrandr, edid-decode and hex text to binary EDIDs.
+
+    Streams 'xrandr --verbose' output, 'edid-decode' hex dumps and plain
+    hex (e.g. 'xxd -p' of a sysfs edid file) in constant memory, so it can
+    run as a pipeline stage over large aggregated logs:
+
+        cat hosts/*.log | edid import - > fleet.bin
+
+    INPUTS: Text files, or - for stdin
+    """
+    try:
+        errors = None if strict else []
+        count = 0
+
+        if output_dir:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            sink = None
+        elif output == "-":
+            if sys.stdout.isatty():
+                raise ValueError(
+                    "Refusing to write binary EDIDs to a terminal; "
+                    "use -o FILE, --output-dir or a pipe"
+                )
+            sink = sys.stdout.buffer
+        else:
+            sink = open(output, "wb")
+
+        try:
+            for label, edid_data in _iter_import_sources(inputs, errors):
+                count += 1
+                if sink is not None:
+                    sink.write(edid_data)
+                else:
+                    name = Path(label.split(":")[0]).stem or "stdin"
+                    (Path(output_dir) / f"{name}_{count:06d}.bin").write_bytes(
+                        edid_data
+                    )
+                if verbose:
+                    click.echo(f"{label}: {len(edid_data)} bytes", err=True)
+        finally:
+            if sink is not None and sink is not sys.stdout.buffer:
+                sink.close()
+
+        for message in errors or ():
+            click.echo(f"Warning: {message}", err=True)
+        click.echo(
+            f"Imported {count} EDID(s)"
+            + (f", skipped {len(errors)} incomplete" if errors else ""),
+            err=True,
+        )
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("inputs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False),
+    help="Save each EDID found as <file>_<offset>.bin in this directory",
+)
+@click.option(
+    "--pack",
+    type=click.Path(dir_okay=False),
+    help="Save the EDIDs found to a packed archive",
+)
+@click.option(
+    "--unique", "-u", is_flag=True, help="Report each distinct EDID only once"
+)
+@click.option("--json", "as_json", is_flag=True, help="Emit results as JSON lines")
+@click.option(
+    "--verbose", "-v", is_flag=True, help="Also report headers without a valid EDID"
+)
+def carve(inputs, output_dir, pack, unique, as_json, verbose):
+    """Extract EDIDs from binary dumps, logs and xrandr output.
+
+    Finds raw EDIDs (firmware images, register or memory dumps) and EDIDs
+    printed as hex text (dmesg, Xorg logs, xrandr --verbose, hexdump/xxd
+    output, C arrays). Only EDIDs whose block checksums are all valid are
+    reported.
+
+    INPUTS: Files to scan
+    """
+    try:
+        if output_dir:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+        carved = []
+        rejected = 0
+        for path, candidate in carve_files([Path(p) for p in inputs], unique):
+            edid_data = candidate["edid"]
+            location = f"{path}@0x{candidate['offset']:X}"
+
+            if edid_data is None:
+                rejected += 1
+                if verbose and not as_json:
+                    click.echo(
+                        f"{location}: {candidate['form']} EDID header without a "
+                        "valid EDID (bad checksum or truncated)"
+                    )
+                continue
+
+            carved.append(edid_data)
+            saved = None
+            if output_dir:
+                saved = Path(output_dir) / carve_name(path, candidate)
+                saved.write_bytes(edid_data)
+
+            model = describe_model(edid_data)
+            if as_json:
+                click.echo(
+                    json.dumps(
+                        {
+                            "file": str(path),
+                            "offset": candidate["offset"],
+                            "form": candidate["form"],
+                            "size": len(edid_data),
+                            **model,
+                            "saved": str(saved) if saved else None,
+                        }
+                    )
+                )
+                continue
+
+            name = f' "{model["name"]}"' if model["name"] else ""
+            click.echo(
+                f"{location}: {candidate['form']}, {len(edid_data)} bytes, "
+                f"{model['manufacturer']} 0x{model['product_code']:04X}{name}"
+                + (f" -> {saved}" if saved else "")
+            )
+
+        if pack:
+            write_packed_archive(Path(pack), carved)
+
+        click.echo(
+            f"{len(carved)} EDID(s) found in {len(inputs)} file(s)"
+            + (f", {rejected} invalid candidate(s)" if rejected else "")
+            + (f", packed to {pack}" if pack else ""),
+            err=True,
+        )
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("inputs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--db",
+    type=click.Path(),
+    default=str(DEFAULT_INDEX_PATH),
+    show_default=True,
+    help="Index database path",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Show each indexed source")
+def index(inputs, db, verbose):
+    """Add EDIDs to the inventory database.
+
+    EDIDs already in the index (by content hash) are not decoded again.
+
+    INPUTS: EDID files, packed archives or directories (e.g. ~/.edid-backups)
+    """
+    try:
+        conn = open_index(Path(db))
+        errors = []
+        try:
+            result = ingest(conn, iter_edid_files(inputs, errors), verbose=verbose)
+        finally:
+            conn.close()
+
+        for message in errors + result["problems"]:
+            click.echo(f"Warning: {message}", err=True)
+        click.echo(
+            f"Indexed {result['added']} new EDID(s), {result['known']} already "
+            f"known, {result['too_short']} too short, {result['invalid']} invalid, "
+            f"{len(errors)} unreadable file(s) ({db})"
+        )
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--db",
+    type=click.Path(exists=True),
+    default=str(DEFAULT_INDEX_PATH),
+    show_default=True,
+    help="Index database path",
+)
+@click.option("--manufacturer", "-m", help="3-letter manufacturer ID (e.g. DEL)")
+@click.option(
+    "--product",
+    "-p",
+    type=lambda value: int(value, 0),
+    help="Product code (decimal or 0x hex)",
+)
+@click.option("--year", "-y", type=int, help="Manufacture year")
+@click.option("--hdr/--no-hdr", default=None, help="Require or exclude HDR support")
+@click.option(
+    "--mode", "mode_spec", help="Supported mode, e.g. 2560x1440@144 or 1920x1080@60i"
+)
+@click.option("--name", "-n", help="Display name substring")
+@click.option("--verbose", "-v", is_flag=True, help="Show source files")
+def query(db, manufacturer, product, year, hdr, mode_spec, name, verbose):
+    """Query the EDID inventory database.
+
+    Example: all Dell panels from 2019 with HDR
+
+        edid query -m DEL -y 2019 --hdr
+    """
+    try:
+        mode = parse_mode_spec(mode_spec) if mode_spec else None
+
+        conn = open_index(Path(db))
+        try:
+            rows = query_index(
+                conn,
+                manufacturer=manufacturer,
+                product_code=product,
+                year=year,
+                hdr=hdr,
+                mode=mode,
+                name=name,
+            )
+        finally:
+            conn.close()
+
+        for row in rows:
+            size = (
+                f"{row['width_cm']}x{row['height_cm']} cm"
+                if row["width_cm"] and row["height_cm"]
+                else "-"
+            )
+            preferred = (
+                f"{row['preferred_width']}x{row['preferred_height']}"
+                f"@{row['preferred_refresh']:g}"
+                if row["preferred_width"]
+                else "-"
+            )
+            click.echo(
+                f"{row['hash'][:12]}  {row['manufacturer']} 0x{row['product_code']:04X}"
+                f"  {row['name'] or '-':<13}  {row['year']}  {size:<12}  {preferred}"
+                f"{'  HDR' if row['hdr'] else ''}"
+            )
+            if verbose:
+                for label in row["sources"]:
+                    click.echo(f"    {label}")
+
+        click.echo(f"{len(rows)} EDID(s) found", err=True)
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("buses", nargs=-1, required=True, type=int)
+@click.option(
+    "--interval",
+    "-i",
+    type=click.FloatRange(min=0),
+    default=1.0,
+    show_default=True,
+    help="Seconds between polls",
+)
+@click.option(
+    "--count", "-c", type=click.IntRange(min=1), help="Stop after this many polls"
+)
+@click.option("--json", "as_json", is_flag=True, help="Emit events as JSON lines")
+@click.option("--verbose", "-v", is_flag=True, help="Show bus traffic on exit")
+def watch(buses, interval, count, as_json, verbose):
+    """Watch buses and report display changes.
+
+    Polls only the EDID header, vendor/product/serial bytes and base
+    checksum of each bus, and reads the full EDID only when they change.
+    Displays present at start are reported as attached. Stop with Ctrl-C.
+
+    BUSES: I2C bus numbers to watch
+    """
+    stats = {}
+    try:
+        for event in watch_buses(buses, interval, count, stats):
+            if as_json:
+                click.echo(json.dumps(event))
+            else:
+                click.echo(format_event(event))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    if verbose:
+        full_equivalent = stats["polls"] * 128
+        click.echo(
+            f"{stats['polls']} poll(s), {stats['poll_bytes']} bytes polled, "
+            f"{stats['full_reads']} full read(s) ({stats['full_read_bytes']} bytes); "
+            f"full reads on every poll would move at least {full_equivalent} bytes",
+            err=True,
+        )
+
+
+@cli.command("trace")
+@click.argument("trace_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--json", "as_json", is_flag=True, help="Emit the summary as JSON")
+@click.option("--verbose", "-v", is_flag=True, help="List every transaction")
+def show_trace(trace_file, as_json, verbose):
+    """Summarize a bus trace recorded with --trace-record.
+
+    Shows per-bus, per-operation counts, bytes moved, latencies and errors.
+    Replay a trace with --trace-replay, e.g.
+    'edid --trace-replay station.trace read 3'.
+
+    TRACE_FILE: Trace file
+    """
+    try:
+        if verbose:
+            for entry in iter_trace(trace_file):
+                click.echo(format_record(entry))
+
+        summary = summarize_trace(trace_file)
+        if as_json:
+            click.echo(json.dumps(summary))
+        else:
+            for line in format_trace_summary(summary):
+                click.echo(line)
+
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
 def main():
     """Main entry point for CLI."""
     cli(obj={})
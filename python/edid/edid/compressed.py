@@ -0,0 +1,327 @@
+"""Dictionary-compressed EDID archives.
+
+EDIDs of one model differ in a handful of bytes, but compressing each EDID
+on its own gains little: 128-512 bytes is too short for a compressor to
+find repetition. A compressed archive therefore stores a shared dictionary
+built from the corpus, one representative EDID per model fingerprint, and
+compresses every entry against it, so an entry costs roughly the bytes in
+which it differs from its model. Identical EDIDs (repeated backups of the
+same display) are stored once.
+
+Layout (little-endian)::
+
+    header      magic "EDIDZ", version, codec, reserved, entry count,
+                dictionary size, directory size
+    dictionary  shared dictionary
+    directory   zlib-compressed index (per entry: payload offset, compressed
+                size, size, label size) followed by the UTF-8 labels
+    payloads    compressed entries
+
+The directory gives random access: reading entry N decompresses only
+entry N.
+zlib (raw deflate with a preset dictionary) is always available; zstd with
+a trained dictionary is used when the zstandard package is installed.
+"""
+
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from .fingerprint import cluster_edids
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+MAGIC = b"EDIDZ"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<5sBBBIII")
+INDEX_ENTRY = struct.Struct("<IHHH")
+
+# Codec IDs stored in the header
+CODECS = {"zlib": 0, "zstd": 1}
+CODEC_NAMES = {codec_id: name for name, codec_id in CODECS.items()}
+
+# Deflate only looks back 32 KiB, so a larger zlib dictionary is wasted
+DICTIONARY_SIZE = 32 * 1024
+
+DEFAULT_LEVEL = 9
+
+# Raw deflate streams: no zlib header or Adler-32 trailer per entry
+DEFLATE_WBITS = -15
+
+DECOMPRESSION_ERRORS = (zlib.error,) + (
+    (zstandard.ZstdError,) if ZSTD_AVAILABLE else ()
+)
+
+
+def is_compressed_archive(path: Path) -> bool:
+    """Check whether a file starts with the compressed archive magic."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def build_dictionary(edids: List[bytes], size: int = DICTIONARY_SIZE) -> bytes:
+    """
+    Build a shared dictionary from a corpus.
+
+    The dictionary concatenates one EDID per model fingerprint, most common
+    model last: deflate finds matches at short distances most cheaply, and
+    the end of the dictionary is closest to the compressed data.
+
+    Args:
+        edids: Corpus of complete EDIDs
+        size: Maximum dictionary size in bytes
+
+    Returns:
+        Dictionary bytes (the most common models if the corpus has more
+        models than fit)
+    """
+    clusters = cluster_edids((str(i), edid) for i, edid in enumerate(edids))
+    dictionary = b""
+    for cluster in clusters:
+        representative = edids[int(cluster["example"])]
+        if len(dictionary) + len(representative) > size:
+            break
+        dictionary = representative + dictionary
+    return dictionary
+
+
+def _train_zstd_dictionary(edids: List[bytes], size: int) -> bytes:
+    try:
+        return zstandard.train_dictionary(size, edids).as_bytes()
+    except zstandard.ZstdError:
+        # Too few or too similar samples to train; use raw content instead
+        return build_dictionary(edids, size)
+
+
+def _compressor(codec: str, dictionary: bytes, level: int) -> Any:
+    if codec == "zstd":
+        compressor = zstandard.ZstdCompressor(
+            level=level,
+            dict_data=zstandard.ZstdCompressionDict(dictionary),
+            write_content_size=False,
+            write_dict_id=False,
+        )
+        return compressor.compress
+
+    def compress(data: bytes) -> bytes:
+        compressor = zlib.compressobj(
+            level, zlib.DEFLATED, DEFLATE_WBITS, zdict=dictionary
+        )
+        return compressor.compress(data) + compressor.flush()
+
+    return compress
+
+
+def _check_codec(codec: str) -> None:
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec {codec!r} (expected one of {list(CODECS)})")
+    if codec == "zstd" and not ZSTD_AVAILABLE:
+        raise RuntimeError("zstd codec requires the zstandard package")
+
+
+def write_compressed_archive(
+    path: Path,
+    entries: Iterable[Tuple[str, bytes]],
+    codec: str = "zlib",
+    level: int = DEFAULT_LEVEL,
+) -> Dict[str, int]:
+    """
+    Write EDIDs to a dictionary-compressed archive.
+
+    Args:
+        path: Output archive path
+        entries: (label, edid_data) tuples, e.g. from iter_edid_files
+        codec: "zlib" or "zstd"
+        level: Compression level of the codec
+
+    Returns:
+        Dictionary with entries, unique, raw_bytes, dictionary_bytes and
+        archive_bytes
+
+    Raises:
+        ValueError: If the codec is unknown or an entry is too large
+        RuntimeError: If zstd is requested but zstandard is not installed
+    """
+    _check_codec(codec)
+    entries = [(label, bytes(edid_data)) for label, edid_data in entries]
+    edids = [edid_data for _, edid_data in entries]
+
+    if codec == "zstd":
+        dictionary = _train_zstd_dictionary(edids, DICTIONARY_SIZE)
+    else:
+        dictionary = build_dictionary(edids)
+    compress = _compressor(codec, dictionary, level)
+
+    index = []
+    labels = []
+    payloads = []
+    payload_offsets: Dict[bytes, Tuple[int, int]] = {}
+    payload_size = 0
+
+    for label, edid_data in entries:
+        if len(edid_data) > 0xFFFF:
+            raise ValueError(f"{label}: entry of {len(edid_data)} bytes is too large")
+
+        # Identical EDIDs share one payload
+        stored = payload_offsets.get(edid_data)
+        if stored is None:
+            payload = compress(edid_data)
+            stored = (payload_size, len(payload))
+            payload_offsets[edid_data] = stored
+            payloads.append(payload)
+            payload_size += len(payload)
+
+        label_bytes = label.encode("utf-8")
+        labels.append(label_bytes)
+        index.append(INDEX_ENTRY.pack(*stored, len(edid_data), len(label_bytes)))
+
+    # Labels of backup histories are long and repetitive; compress them
+    # together with the index
+    directory = zlib.compress(b"".join(index) + b"".join(labels), 9)
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        CODECS[codec],
+        0,
+        len(entries),
+        len(dictionary),
+        len(directory),
+    )
+
+    with open(path, "wb") as f:
+        for part in (header, dictionary, directory, *payloads):
+            f.write(part)
+        archive_bytes = f.tell()
+
+    return {
+        "entries": len(entries),
+        "unique": len(payloads),
+        "raw_bytes": sum(len(edid_data) for edid_data in edids),
+        "dictionary_bytes": len(dictionary),
+        "archive_bytes": archive_bytes,
+    }
+
+
+class CompressedArchive:
+    """
+    Random-access reader for dictionary-compressed archives.
+
+    The header, dictionary, index and labels are read when the archive is
+    opened; entries are read and decompressed on demand.
+
+    Args:
+        path: Archive path
+
+    Raises:
+        ValueError: If the file is not a compressed archive or is truncated
+        RuntimeError: If the archive uses zstd and zstandard is not installed
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._read_header()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_exact(self, size: int) -> bytes:
+        data = self._file.read(size)
+        if len(data) != size:
+            raise ValueError(f"Truncated compressed archive: {self.path}")
+        return data
+
+    def _read_header(self) -> None:
+        magic, version, codec_id, _, count, dict_size, directory_size = HEADER.unpack(
+            self._read_exact(HEADER.size)
+        )
+        if magic != MAGIC:
+            raise ValueError(f"Not a compressed EDID archive: {self.path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported compressed archive version {version}")
+        if codec_id not in CODEC_NAMES:
+            raise ValueError(f"Unknown codec ID {codec_id} in {self.path}")
+
+        self.codec = CODEC_NAMES[codec_id]
+        _check_codec(self.codec)
+        self.dictionary = self._read_exact(dict_size)
+
+        try:
+            directory = zlib.decompress(self._read_exact(directory_size))
+        except zlib.error as e:
+            raise ValueError(f"Corrupt directory in {self.path}: {e}") from e
+        index_size = count * INDEX_ENTRY.size
+        if len(directory) < index_size:
+            raise ValueError(f"Truncated directory in {self.path}")
+        self._index = [
+            INDEX_ENTRY.unpack_from(directory, i * INDEX_ENTRY.size)
+            for i in range(count)
+        ]
+
+        self.labels: List[str] = []
+        position = index_size
+        for _, _, _, label_size in self._index:
+            label = directory[position : position + label_size]
+            self.labels.append(label.decode("utf-8", errors="replace"))
+            position += label_size
+
+        self._payload_start = self._file.tell()
+        if self.codec == "zstd":
+            self._zstd = zstandard.ZstdDecompressor(
+                dict_data=zstandard.ZstdCompressionDict(self.dictionary)
+            )
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def read(self, index: int) -> bytes:
+        """
+        Read one entry.
+
+        Args:
+            index: Entry number
+
+        Returns:
+            The entry's EDID data
+
+        Raises:
+            IndexError: If there is no such entry
+            ValueError: If the entry is corrupt
+        """
+        offset, compressed_size, size, _ = self._index[index]
+        self._file.seek(self._payload_start + offset)
+        payload = self._read_exact(compressed_size)
+
+        try:
+            if self.codec == "zstd":
+                data = self._zstd.decompress(payload, max_output_size=size)
+            else:
+                decompressor = zlib.decompressobj(DEFLATE_WBITS, zdict=self.dictionary)
+                data = decompressor.decompress(payload) + decompressor.flush()
+        except DECOMPRESSION_ERRORS as e:
+            raise ValueError(f"Corrupt entry {index} in {self.path}: {e}") from e
+
+        if len(data) != size:
+            raise ValueError(f"Corrupt entry {index} in {self.path}: size mismatch")
+        return data
+
+    def __iter__(self) -> Iterator[Tuple[str, bytes]]:
+        for index, label in enumerate(self.labels):
+            yield label, self.read(index)
+
+    def close(self) -> None:
+        """Close the archive file."""
+        self._file.close()
+
+    def __enter__(self) -> "CompressedArchive":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,422 @@
+"""Field-level differences between EDIDs.
+
+Byte offsets alone say little about what changed between two EDIDs. A
+field map, built from the parser layouts, names every byte range of an
+EDID: product info, base block parameters, each descriptor by its type,
+and the CEA-861 / DisplayID data blocks and timings of the extensions.
+Differences are reported per field, with both values decoded.
+
+The field map of a reference EDID is built once and reused to compare any
+number of EDIDs against it, so fleet drift reports over thousands of
+units parse the reference only once.
+"""
+
+import struct
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from .displayid import decode_displayid_block
+from .parser import (
+    DESCRIPTOR_OFFSETS,
+    DESCRIPTOR_SIZE,
+    EXTENSION_TYPES,
+    decode_cea861_block,
+    decode_descriptor_name,
+    decode_detailed_timing,
+    decode_manufacturer_id,
+    decode_range_limits,
+)
+
+Field = Dict[str, Any]
+Change = Dict[str, Any]
+
+# Base block fields: (name, start, end, kind)
+BASE_FIELDS = (
+    ("header", 0, 8, "hex"),
+    ("manufacturer", 8, 10, "manufacturer"),
+    ("product code", 10, 12, "u16"),
+    ("serial number", 12, 16, "u32"),
+    ("manufacture week", 16, 17, "week"),
+    ("manufacture year", 17, 18, "year"),
+    ("EDID version", 18, 20, "version"),
+    ("video input", 20, 21, "hex"),
+    ("screen size", 21, 23, "screen_size"),
+    ("gamma", 23, 24, "gamma"),
+    ("features", 24, 25, "hex"),
+    ("chromaticity", 25, 35, "hex"),
+    ("established timings", 35, 38, "hex"),
+    ("standard timings", 38, 54, "hex"),
+    ("extension count", 126, 127, "int"),
+    ("checksum", 127, 128, "hex"),
+)
+
+# Display descriptor names, by tag (byte 3)
+DESCRIPTOR_NAMES = {
+    0xFF: "serial string",
+    0xFE: "text string",
+    0xFD: "range limits",
+    0xFC: "display name",
+    0xFB: "white point",
+    0xFA: "standard timings descriptor",
+    0xF9: "color management",
+    0xF8: "CVT timing codes",
+    0xF7: "established timings III",
+    0x10: "dummy descriptor",
+}
+
+# Longest hex value shown before truncating
+MAX_HEX_BYTES = 16
+
+
+def _descriptor_name(slot: int, descriptor: bytes) -> str:
+    if descriptor[0] or descriptor[1]:
+        return "preferred timing" if slot == 0 else f"detailed timing {slot + 1}"
+    return DESCRIPTOR_NAMES.get(descriptor[3], f"descriptor {slot + 1}")
+
+
+def _field(name: str, start: int, end: int, kind: str = "hex") -> Field:
+    return {"name": name, "start": start, "end": end, "kind": kind}
+
+
+def _cea_fields(prefix: str, base: int, block: bytes) -> List[Field]:
+    info = decode_cea861_block(block)
+    fields = [
+        _field(f"{prefix} CEA revision", base + 1, base + 2, "int"),
+        _field(f"{prefix} CEA DTD offset", base + 2, base + 3, "int"),
+        _field(f"{prefix} CEA flags", base + 3, base + 4),
+    ]
+    seen: Counter = Counter()
+    for data_block in info.get("data_blocks", []):
+        name = data_block.get("vendor", data_block["type"])
+        seen[name] += 1
+        if seen[name] > 1:
+            name = f"{name} #{seen[name]}"
+        start = base + data_block["offset"]
+        fields.append(
+            _field(
+                f"{prefix} CEA {name} block", start, start + 1 + data_block["length"]
+            )
+        )
+    for number, timing in enumerate(info.get("detailed_timings", []), 1):
+        start = base + timing["offset"]
+        fields.append(
+            _field(f"{prefix} timing {number}", start, start + DESCRIPTOR_SIZE, "dtd")
+        )
+    return fields
+
+
+def _displayid_fields(prefix: str, base: int, block: bytes) -> List[Field]:
+    fields = [_field(f"{prefix} DisplayID header", base + 1, base + 5)]
+    for data_block in decode_displayid_block(block).get("data_blocks", []):
+        start = base + data_block["offset"]
+        end = start + 3 + data_block["length"]
+        fields.append(
+            _field(f"{prefix} DisplayID {data_block['type']} block", start, end)
+        )
+    return fields
+
+
+# Extension field builders, keyed by extension tag
+EXTENSION_FIELDS: Dict[int, Callable[[str, int, bytes], List[Field]]] = {
+    0x02: _cea_fields,
+    0x70: _displayid_fields,
+}
+
+
+def field_map(edid_data: bytes) -> List[Field]:
+    """
+    Name every byte range of an EDID.
+
+    Args:
+        edid_data: Complete EDID data
+
+    Returns:
+        Fields (name, start, end, kind, block) sorted by offset and covering
+        every byte; bytes not claimed by a known layout are grouped into
+        "bytes 0xSSS-0xEEE" fields
+    """
+    data = bytes(edid_data)
+    fields: List[Field] = []
+
+    if len(data) >= 128:
+        fields.extend(_field(*spec) for spec in BASE_FIELDS)
+        for slot, offset in enumerate(DESCRIPTOR_OFFSETS):
+            descriptor = data[offset : offset + DESCRIPTOR_SIZE]
+            name = _descriptor_name(slot, descriptor)
+            fields.append(_field(name, offset, offset + DESCRIPTOR_SIZE, "descriptor"))
+
+    for base in range(128, len(data) - 127, 128):
+        block = data[base : base + 128]
+        prefix = f"extension {base // 128}"
+        fields.append(_field(f"{prefix} tag", base, base + 1, "extension_tag"))
+        builder = EXTENSION_FIELDS.get(block[0])
+        if builder:
+            fields.extend(builder(prefix, base, block))
+        fields.append(_field(f"{prefix} checksum", base + 127, base + 128))
+
+    # Claim the gaps so that every byte belongs to a field
+    fields.sort(key=lambda f: f["start"])
+    complete: List[Field] = []
+    position = 0
+    for field in fields:
+        if field["start"] > position:
+            complete.append(_gap_field(position, field["start"]))
+        complete.append(field)
+        position = max(position, field["end"])
+    if position < len(data):
+        complete.append(_gap_field(position, len(data)))
+
+    for field in complete:
+        field["block"] = field["start"] // 128
+    return complete
+
+
+def _gap_field(start: int, end: int) -> Field:
+    return _field(f"bytes 0x{start:03X}-0x{end - 1:03X}", start, end)
+
+
+def _format_hex(value: bytes) -> str:
+    if len(value) <= MAX_HEX_BYTES:
+        return value.hex(" ").upper()
+    return f"{value[:MAX_HEX_BYTES].hex(' ').upper()} ... ({len(value)} bytes)"
+
+
+def _format_dtd(descriptor: bytes) -> str:
+    timing = decode_detailed_timing(descriptor)
+    if timing.get("type") != "timing":
+        return _format_hex(descriptor)
+    total = timing["h_total"] * timing["v_total"]
+    refresh = timing["pixel_clock_hz"] / total if total else 0.0
+    return (
+        f"{timing['h_active']}x{timing['v_active']}@{refresh:.2f}Hz "
+        f"({timing['pixel_clock_hz'] / 1e6:.2f} MHz)"
+    )
+
+
+def _format_descriptor(descriptor: bytes) -> str:
+    if descriptor[0] or descriptor[1]:
+        return _format_dtd(descriptor)
+    tag = descriptor[3]
+    if tag == 0xFC:
+        return f'"{decode_descriptor_name(descriptor)}"'
+    if tag in (0xFE, 0xFF):
+        text = descriptor[5:].split(b"\x0a")[0]
+        return f'"{text.decode("ascii", errors="replace").strip()}"'
+    if tag == 0xFD:
+        limits = decode_range_limits(descriptor)
+        return (
+            f"{limits['min_v_hz']}-{limits['max_v_hz']} Hz, "
+            f"{limits['min_h_khz']}-{limits['max_h_khz']} kHz, "
+            f"{limits['max_pixel_clock_mhz']} MHz"
+        )
+    name = DESCRIPTOR_NAMES.get(tag, f"tag 0x{tag:02X}")
+    return f"{name}: {_format_hex(descriptor[5:])}"
+
+
+def _format_week(value: bytes) -> str:
+    if value[0] == 0xFF:
+        return "model year"
+    return str(value[0]) if value[0] else "unspecified"
+
+
+# Value renderers, keyed by field kind
+FORMATTERS: Dict[str, Callable[[bytes], str]] = {
+    "hex": _format_hex,
+    "int": lambda value: str(value[0]),
+    "u16": lambda value: f"0x{struct.unpack('<H', value)[0]:04X}",
+    "u32": lambda value: str(struct.unpack("<I", value)[0]),
+    "manufacturer": lambda value: decode_manufacturer_id(bytes(8) + value),
+    "week": _format_week,
+    "year": lambda value: str(1990 + value[0]),
+    "version": lambda value: f"{value[0]}.{value[1]}",
+    "screen_size": lambda value: f"{value[0]}x{value[1]} cm",
+    "gamma": lambda value: f"{(value[0] + 100) / 100:.2f}",
+    "descriptor": _format_descriptor,
+    "dtd": _format_dtd,
+    "extension_tag": lambda value: EXTENSION_TYPES.get(
+        value[0], f"Unknown (0x{value[0]:02X})"
+    ),
+}
+
+
+def format_value(kind: str, value: bytes) -> str:
+    """
+    Render a field's bytes for display.
+
+    Args:
+        kind: Field kind from field_map
+        value: The field's bytes
+
+    Returns:
+        Decoded value, or hex if the bytes cannot be decoded as the kind
+    """
+    try:
+        return FORMATTERS.get(kind, _format_hex)(value)
+    except (IndexError, KeyError, struct.error, ZeroDivisionError):
+        return _format_hex(value)
+
+
+def diff_fields(reference: bytes, fields: List[Field], other: bytes) -> List[Change]:
+    """
+    Compare an EDID against a reference using the reference's field map.
+
+    Blocks that are byte-identical are skipped without looking at their
+    fields.
+
+    Args:
+        reference: Reference EDID
+        fields: field_map(reference)
+        other: EDID to compare
+
+    Returns:
+        Changes with field, start, end, old and new values; blocks present
+        in only one EDID are reported as single "extension N" changes with
+        an old or new value of None
+    """
+    reference = bytes(reference)
+    other = bytes(other)
+    if reference == other:
+        return []
+
+    changes: List[Change] = []
+    common_blocks = min(len(reference), len(other)) // 128
+    changed_blocks = {
+        block
+        for block in range(common_blocks)
+        if reference[block * 128 : block * 128 + 128]
+        != other[block * 128 : block * 128 + 128]
+    }
+
+    for field in fields:
+        if field["block"] not in changed_blocks:
+            continue
+        start, end = field["start"], field["end"]
+        old, new = reference[start:end], other[start:end]
+        if old != new:
+            changes.append(
+                {
+                    "field": field["name"],
+                    "start": start,
+                    "end": end,
+                    "old": format_value(field["kind"], old),
+                    "new": format_value(field["kind"], new),
+                }
+            )
+
+    # Extension blocks present on one side only
+    longer = reference if len(reference) > len(other) else other
+    removed = longer is reference
+    for block in range(common_blocks, len(longer) // 128):
+        start = block * 128
+        tag = format_value("extension_tag", longer[start : start + 1])
+        changes.append(
+            {
+                "field": f"extension {block}",
+                "start": start,
+                "end": start + 128,
+                "old": tag if removed else None,
+                "new": None if removed else tag,
+            }
+        )
+
+    return changes
+
+
+def diff_edids(a: bytes, b: bytes) -> List[Change]:
+    """
+    Field-level differences between two EDIDs.
+
+    Args:
+        a: Reference EDID
+        b: EDID to compare
+
+    Returns:
+        Changes as returned by diff_fields
+    """
+    return diff_fields(a, field_map(a), b)
+
+
+def diff_against(
+    reference: bytes, others: Iterable[Tuple[str, bytes]]
+) -> Iterator[Tuple[str, List[Change]]]:
+    """
+    Compare many EDIDs against one reference, parsing the reference once.
+
+    Args:
+        reference: Reference EDID
+        others: (label, edid_data) tuples, e.g. from iter_edid_files
+
+    Yields:
+        (label, changes) tuples
+    """
+    fields = field_map(reference)
+    for label, edid_data in others:
+        yield label, diff_fields(reference, fields, edid_data)
+
+
+def significant_changes(changes: List[Change]) -> List[Change]:
+    """
+    Drop checksum changes that follow from other changes.
+
+    A checksum change is only significant when nothing else in its block
+    changed.
+
+    Args:
+        changes: Changes from diff_fields
+
+    Returns:
+        Changes in offset order
+    """
+    blocks_with_content_changes = {
+        change["start"] // 128
+        for change in changes
+        if not change["field"].endswith("checksum")
+    }
+    return [
+        change
+        for change in changes
+        if not change["field"].endswith("checksum")
+        or change["start"] // 128 not in blocks_with_content_changes
+    ]
+
+
+def summarize_changes(changes: List[Change]) -> str:
+    """
+    One-line summary, e.g. "serial number changed, preferred timing changed".
+
+    Args:
+        changes: Changes from diff_fields
+
+    Returns:
+        Summary line ("identical" if there are no changes)
+    """
+    if not changes:
+        return "identical"
+
+    parts = []
+    for change in significant_changes(changes):
+        if change["old"] is None:
+            parts.append(f"{change['field']} added")
+        elif change["new"] is None:
+            parts.append(f"{change['field']} removed")
+        else:
+            parts.append(f"{change['field']} changed")
+    return ", ".join(parts)
+
+
+def format_change(change: Change) -> str:
+    """
+    Format a change as one line of text.
+
+    Args:
+        change: Change from diff_fields
+
+    Returns:
+        "field [0xSSS-0xEEE]: old -> new" line
+    """
+    span = f"0x{change['start']:03X}"
+    if change["end"] - change["start"] > 1:
+        span += f"-0x{change['end'] - 1:03X}"
+    old = "(none)" if change["old"] is None else change["old"]
+    new = "(none)" if change["new"] is None else change["new"]
+    return f"{change['field']} [{span}]: {old} -> {new}"
@@ -0,0 +1,241 @@
+"""DisplayID 1.3 / 2.0 extension block decoders."""
+
+import struct
+from typing import Any, Callable, Dict, List
+
+
+# Precompiled layouts (all little-endian)
+SECTION_HEADER = struct.Struct("<BBBB")  # version, bytes, product type, ext count
+DATA_BLOCK_HEADER = struct.Struct("<BBB")  # tag, revision, payload length
+# Pixel clock (24-bit, split 16 + 8), flags, then eight 16-bit fields (value - 1)
+TIMING_DESCRIPTOR = struct.Struct("<HBB8H")
+# Vendor/OUI, product code, serial, week, year - 2000, product string length
+PRODUCT_ID = struct.Struct("<3sHIBBB")
+# Capabilities, tile counts, tile location, high bits, tile size, pixel
+# multiplier, bezels (top, bottom, right, left), vendor, product, serial
+TILED_TOPOLOGY = struct.Struct("<4BHH5B3sHI")
+
+# Timing descriptor aspect ratio codes (flags bits 3-0)
+ASPECT_RATIOS = {
+    0: "1:1",
+    1: "5:4",
+    2: "4:3",
+    3: "15:9",
+    4: "16:9",
+    5: "16:10",
+    6: "64:27",
+    7: "256:135",
+}
+
+# Data block names for tags without a payload decoder
+DATA_BLOCK_NAMES = {
+    0x00: "Product Identification",
+    0x01: "Display Parameters",
+    0x02: "Color Characteristics",
+    0x03: "Type I Timing",
+    0x04: "Type II Timing",
+    0x05: "Type III Timing",
+    0x06: "Type IV Timing",
+    0x07: "VESA Timing Standard",
+    0x08: "CEA Timing Standard",
+    0x09: "Video Timing Range",
+    0x0A: "Product Serial Number",
+    0x0B: "GP ASCII String",
+    0x0C: "Display Device Data",
+    0x0D: "Interface Power Sequencing",
+    0x0E: "Transfer Characteristics",
+    0x0F: "Display Interface",
+    0x10: "Stereo Display Interface",
+    0x11: "Type V Timing",
+    0x12: "Tiled Display Topology",
+    0x13: "Type VI Timing",
+    0x20: "Product Identification",
+    0x21: "Display Parameters",
+    0x22: "Type VII Timing",
+    0x23: "Type VIII Timing",
+    0x24: "Type IX Timing",
+    0x25: "Dynamic Video Timing Range",
+    0x26: "Display Interface Features",
+    0x27: "Stereo Display Interface",
+    0x28: "Tiled Display Topology",
+    0x29: "ContainerID",
+    0x7E: "Vendor Specific",
+    0x7F: "Vendor Specific",
+    0x81: "CTA DisplayID",
+}
+
+# Type I timings count in 10 kHz units, Type VII in 1 kHz units
+PIXEL_CLOCK_UNITS_HZ = {0x03: 10000, 0x22: 1000}
+
+
+def _decode_timings(tag: int, payload: bytes) -> Dict[str, Any]:
+    unit = PIXEL_CLOCK_UNITS_HZ[tag]
+    timings = []
+    for fields in TIMING_DESCRIPTOR.iter_unpack(
+        payload[: len(payload) - len(payload) % TIMING_DESCRIPTOR.size]
+    ):
+        clock_lo, clock_hi, flags = fields[:3]
+        h_active, h_blank, h_offset, h_sync, v_active, v_blank, v_offset, v_sync = (
+            fields[3:]
+        )
+        # All fields are stored as value - 1; bit 15 of the sync offsets
+        # carries the sync polarity
+        timings.append(
+            {
+                "type": "timing",
+                "pixel_clock_hz": ((clock_hi << 16 | clock_lo) + 1) * unit,
+                "h_active": h_active + 1,
+                "h_blank": h_blank + 1,
+                "v_active": v_active + 1,
+                "v_blank": v_blank + 1,
+                "h_total": h_active + h_blank + 2,
+                "v_total": v_active + v_blank + 2,
+                "h_front_porch": (h_offset & 0x7FFF) + 1,
+                "h_sync_width": h_sync + 1,
+                "v_front_porch": (v_offset & 0x7FFF) + 1,
+                "v_sync_width": v_sync + 1,
+                "preferred": bool(flags & 0x80),
+                "interlaced": bool(flags & 0x10),
+                "aspect": ASPECT_RATIOS.get(flags & 0x0F),
+            }
+        )
+    return {"timings": timings}
+
+
+def _decode_product_id(tag: int, payload: bytes) -> Dict[str, Any]:
+    if len(payload) < PRODUCT_ID.size:
+        return {}
+
+    vendor, product_code, serial, week, year, name_length = PRODUCT_ID.unpack_from(
+        payload
+    )
+    if tag == 0x20:
+        # DisplayID 2.0 stores a binary IEEE OUI
+        vendor_id = f"{vendor[0] << 16 | vendor[1] << 8 | vendor[2]:06X}"
+    else:
+        vendor_id = vendor.decode("ascii", errors="replace")
+
+    start = PRODUCT_ID.size
+    return {
+        "vendor": vendor_id,
+        "product_code": product_code,
+        "serial_number": serial,
+        "manufacture_week": week if 0 < week <= 54 else None,
+        "manufacture_year": 2000 + year,
+        "product_name": payload[start : start + name_length]
+        .decode("ascii", errors="ignore")
+        .strip(),
+    }
+
+
+def _decode_tiled_topology(tag: int, payload: bytes) -> Dict[str, Any]:
+    if len(payload) < TILED_TOPOLOGY.size:
+        return {}
+
+    (
+        capabilities,
+        counts,
+        location,
+        high,
+        tile_width,
+        tile_height,
+        _pixel_multiplier,
+        bezel_top,
+        bezel_bottom,
+        bezel_right,
+        bezel_left,
+        vendor,
+        product_code,
+        serial,
+    ) = TILED_TOPOLOGY.unpack_from(payload)
+
+    return {
+        "single_enclosure": bool(capabilities & 0x80),
+        "h_tiles": ((high >> 6 & 0x03) << 4 | counts >> 4) + 1,
+        "v_tiles": ((high >> 4 & 0x03) << 4 | counts & 0x0F) + 1,
+        "h_location": (high >> 2 & 0x03) << 4 | location >> 4,
+        "v_location": (high & 0x03) << 4 | location & 0x0F,
+        "tile_width": tile_width + 1,
+        "tile_height": tile_height + 1,
+        "bezels": (bezel_top, bezel_bottom, bezel_right, bezel_left),
+        "tile_vendor": vendor.decode("ascii", errors="replace"),
+        "tile_product_code": product_code,
+        "tile_serial": serial,
+    }
+
+
+DATA_BLOCK_DECODERS: Dict[int, Callable[[int, bytes], Dict[str, Any]]] = {
+    0x00: _decode_product_id,
+    0x03: _decode_timings,
+    0x12: _decode_tiled_topology,
+    0x20: _decode_product_id,
+    0x22: _decode_timings,
+    0x28: _decode_tiled_topology,
+}
+
+
+def decode_displayid_block(extension_data: bytes) -> Dict[str, Any]:
+    """
+    Decode DisplayID extension block.
+
+    Args:
+        extension_data: 128-byte DisplayID extension (tag 0x70)
+
+    Returns:
+        Dictionary with DisplayID version and decoded data blocks
+    """
+    if len(extension_data) != 128 or extension_data[0] != 0x70:
+        return {}
+
+    version, section_bytes, product_type, _ = SECTION_HEADER.unpack_from(
+        extension_data, 1
+    )
+    info: Dict[str, Any] = {
+        "version": f"{version >> 4}.{version & 0x0F}",
+        "product_type": product_type,
+        "data_blocks": [],
+    }
+
+    # Data blocks start after the 5-byte header; the section checksum follows
+    offset = 1 + SECTION_HEADER.size
+    end = min(offset + section_bytes, 127)
+    while offset + DATA_BLOCK_HEADER.size <= end:
+        tag, revision, length = DATA_BLOCK_HEADER.unpack_from(extension_data, offset)
+        if tag == 0 and length == 0:
+            break  # Padding
+
+        payload_start = offset + DATA_BLOCK_HEADER.size
+        if payload_start + length > end:
+            break
+
+        payload = extension_data[payload_start : payload_start + length]
+        block = {
+            "tag": tag,
+            "revision": revision,
+            "length": length,
+            "offset": offset,
+            "type": DATA_BLOCK_NAMES.get(tag, f"Unknown (0x{tag:02X})"),
+        }
+        decoder = DATA_BLOCK_DECODERS.get(tag)
+        if decoder:
+            block.update(decoder(tag, payload))
+
+        info["data_blocks"].append(block)
+        offset = payload_start + length
+
+    return info
+
+
+def displayid_timings(info: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Collect all Type I / Type VII timings from a decoded DisplayID block.
+
+    Args:
+        info: Result of decode_displayid_block
+
+    Returns:
+        List of timing dictionaries
+    """
+    return [
+        t for block in info.get("data_blocks", []) for t in block.get("timings", [])
+    ]
@@ -0,0 +1,202 @@
+"""Model fingerprints and fleet clustering.
+
+Units of the same panel model carry identical EDIDs except for per-unit
+fields: the serial number and manufacture week/year (bytes 12-17), serial
+string descriptors (0xFF), the DisplayID serial fields and, as a
+consequence, the checksums. A fingerprint hashes the EDID with those fields
+masked out, so all units of a model share one fingerprint while content
+hashes (edid_hash) stay unique per unit.
+"""
+
+import hashlib
+from typing import Any, Dict, Iterable, List, Tuple
+
+from .displayid import decode_displayid_block
+from .parser import (
+    DESCRIPTOR_OFFSETS,
+    DESCRIPTOR_SIZE,
+    decode_descriptor_name,
+    decode_product_info,
+)
+
+# Serial number, manufacture week and year
+UNIT_FIELDS = (12, 18)
+
+# Serial string display descriptor
+SERIAL_STRING_TAG = 0xFF
+
+# Per-unit byte ranges of DisplayID data blocks, relative to the payload:
+# product identification serial/week/year, the serial number block, and
+# the tiled topology serial number
+DISPLAYID_UNIT_FIELDS = {
+    0x00: (5, 11),
+    0x20: (5, 11),
+    0x0A: (0, None),
+    0x12: (18, 22),
+    0x28: (18, 22),
+}
+
+# Hex digits of the fingerprint shown in listings
+SHORT_FINGERPRINT = 16
+
+
+def _mask_displayid(block: bytearray, base: int) -> None:
+    info = decode_displayid_block(bytes(block[base : base + 128]))
+    for data_block in info.get("data_blocks", []):
+        span = DISPLAYID_UNIT_FIELDS.get(data_block["tag"])
+        if span is None:
+            continue
+        payload = base + data_block["offset"] + 3
+        start = payload + span[0]
+        end = payload + (data_block["length"] if span[1] is None else span[1])
+        block[start:end] = bytes(end - start)
+
+    # The section checksum follows the section's data blocks
+    section_checksum = base + 5 + block[base + 2]
+    if section_checksum < base + 127:
+        block[section_checksum] = 0
+
+
+def masked_edid(edid_data: bytes) -> bytes:
+    """
+    Zero the per-unit fields of an EDID.
+
+    Args:
+        edid_data: Complete EDID data
+
+    Returns:
+        Copy of the EDID with serial number, manufacture date, serial
+        string descriptors, DisplayID serial fields and all checksums zeroed
+    """
+    masked = bytearray(edid_data)
+    if len(masked) < 128:
+        return bytes(masked)
+
+    start, end = UNIT_FIELDS
+    masked[start:end] = bytes(end - start)
+
+    for offset in DESCRIPTOR_OFFSETS:
+        descriptor = masked[offset : offset + DESCRIPTOR_SIZE]
+        if descriptor[:3] == b"\x00\x00\x00" and descriptor[3] == SERIAL_STRING_TAG:
+            masked[offset + 5 : offset + DESCRIPTOR_SIZE] = bytes(DESCRIPTOR_SIZE - 5)
+
+    for base in range(0, len(masked) - 127, 128):
+        if base and masked[base] == 0x70:
+            _mask_displayid(masked, base)
+        masked[base + 127] = 0
+
+    return bytes(masked)
+
+
+def fingerprint(edid_data: bytes) -> str:
+    """
+    Model fingerprint of an EDID.
+
+    Args:
+        edid_data: Complete EDID data
+
+    Returns:
+        Hex SHA-256 digest of the EDID with per-unit fields masked
+    """
+    return hashlib.sha256(masked_edid(edid_data)).hexdigest()
+
+
+def describe_model(edid_data: bytes) -> Dict[str, Any]:
+    """
+    Identify the model of an EDID.
+
+    Args:
+        edid_data: Complete EDID data
+
+    Returns:
+        Dictionary with manufacturer, product_code and name (None if the
+        EDID has no display name)
+    """
+    product = decode_product_info(edid_data)
+    name = ""
+    for offset in DESCRIPTOR_OFFSETS:
+        name = decode_descriptor_name(edid_data[offset : offset + DESCRIPTOR_SIZE])
+        if name:
+            break
+    return {
+        "manufacturer": product.get("manufacturer"),
+        "product_code": product.get("product_code"),
+        "name": name or None,
+    }
+
+
+def cluster_edids(
+    entries: Iterable[Tuple[str, bytes]], keep_labels: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Group EDIDs by model fingerprint in a single streaming pass.
+
+    Only the first EDID of each model is decoded; the others are hashed.
+
+    Args:
+        entries: (label, edid_data) tuples, e.g. from iter_edid_files
+        keep_labels: Collect the labels of every member (memory grows with
+            the corpus; otherwise only the first label is kept)
+
+    Returns:
+        Clusters sorted by size, largest first: dictionaries with
+        fingerprint, count, unique (distinct EDIDs), first_year, last_year,
+        example (first label), labels (if kept) and the describe_model()
+        fields
+    """
+    clusters: Dict[str, Dict[str, Any]] = {}
+    contents: Dict[str, set] = {}
+
+    for label, edid_data in entries:
+        key = fingerprint(edid_data)
+        year = decode_product_info(edid_data).get("manufacture_year")
+
+        cluster = clusters.get(key)
+        if cluster is None:
+            cluster = {
+                "fingerprint": key,
+                "count": 0,
+                "first_year": year,
+                "last_year": year,
+                "example": label,
+                **describe_model(edid_data),
+            }
+            if keep_labels:
+                cluster["labels"] = []
+            clusters[key] = cluster
+            contents[key] = set()
+
+        cluster["count"] += 1
+        contents[key].add(hashlib.sha256(edid_data).digest())
+        if year is not None:
+            cluster["first_year"] = min(cluster["first_year"] or year, year)
+            cluster["last_year"] = max(cluster["last_year"] or year, year)
+        if keep_labels:
+            cluster["labels"].append(label)
+
+    for key, cluster in clusters.items():
+        cluster["unique"] = len(contents[key])
+
+    return sorted(clusters.values(), key=lambda c: (-c["count"], c["fingerprint"]))
+
+
+def format_cluster(cluster: Dict[str, Any]) -> str:
+    """
+    Format a cluster as one line of text.
+
+    Args:
+        cluster: Cluster from cluster_edids
+
+    Returns:
+        "fingerprint  count  model (years)" line
+    """
+    model = f"{cluster['manufacturer']} 0x{cluster['product_code']:04X}"
+    if cluster["name"]:
+        model += f' "{cluster["name"]}"'
+    years = cluster["first_year"]
+    if cluster["last_year"] != cluster["first_year"]:
+        years = f"{cluster['first_year']}-{cluster['last_year']}"
+    return (
+        f"{cluster['fingerprint'][:SHORT_FINGERPRINT]}  {cluster['count']:>6}  "
+        f"{model} ({years}, {cluster['unique']} distinct)"
+    )
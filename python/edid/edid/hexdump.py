@@ -0,0 +1,152 @@
+"""Streaming hex dump rendering.
+
+Lines are generated one 16-byte row at a time, using ``bytes.hex(" ")`` for
+the hex column and a precomputed translation table for the ASCII column, so
+dumps of large packed archives can be written straight to a file or stdout
+without building the whole text in memory.
+"""
+
+from typing import Iterable, Iterator, TextIO, Tuple
+
+ROW_SIZE = 16
+BLOCK_SIZE = 128
+RULE_WIDTH = 70
+
+# Printable ASCII maps to itself, everything else to "."
+PRINTABLE = bytes(b if 32 <= b < 127 else ord(".") for b in range(256))
+
+
+def format_row(offset: int, row: bytes) -> str:
+    """
+    Format one row of a hex dump.
+
+    Args:
+        offset: Offset of the row's first byte
+        row: Up to 16 bytes
+
+    Returns:
+        "OOOO: XX XX ...  ascii" line
+    """
+    hex_part = row.hex(" ").upper()
+    return f"{offset:04X}: {hex_part:<48}  {row.translate(PRINTABLE).decode('ascii')}"
+
+
+def iter_hex_dump(edid_data: bytes) -> Iterator[str]:
+    """
+    Generate the lines of an EDID hex dump, block by block.
+
+    Args:
+        edid_data: EDID data (trailing bytes beyond the last full 128-byte
+            block are not shown)
+
+    Yields:
+        Output lines without newlines
+    """
+    data = bytes(edid_data)
+    yield "=" * RULE_WIDTH
+    yield "EDID HEX DUMP"
+    yield "=" * RULE_WIDTH
+
+    for block_num in range(len(data) // BLOCK_SIZE):
+        offset = block_num * BLOCK_SIZE
+        if block_num == 0:
+            yield "\nBase Block (128 bytes):"
+        else:
+            yield f"\nExtension Block {block_num} (128 bytes):"
+        yield "-" * RULE_WIDTH
+
+        for row_offset in range(offset, offset + BLOCK_SIZE, ROW_SIZE):
+            yield format_row(row_offset, data[row_offset : row_offset + ROW_SIZE])
+
+    yield "=" * RULE_WIDTH
+
+
+def iter_hex_diff(a: bytes, b: bytes) -> Iterator[str]:
+    """
+    Generate a side-by-side hex diff of two EDIDs.
+
+    Rows that differ are marked with "*" and followed by a line of "^^"
+    markers under the differing bytes of the second EDID. A shorter EDID is
+    padded with blanks.
+
+    Args:
+        a: First EDID
+        b: Second EDID
+
+    Yields:
+        Output lines without newlines
+    """
+    a = bytes(a)
+    b = bytes(b)
+    differing_rows = 0
+    differing_bytes = 0
+    length = max(len(a), len(b))
+
+    for offset in range(0, length, ROW_SIZE):
+        if offset % BLOCK_SIZE == 0:
+            block_num = offset // BLOCK_SIZE
+            title = "Base Block" if block_num == 0 else f"Extension Block {block_num}"
+            yield f"-- {title} " + "-" * (2 * 48 + 9 - len(title))
+
+        row_a = a[offset : offset + ROW_SIZE]
+        row_b = b[offset : offset + ROW_SIZE]
+        hex_a = row_a.hex(" ").upper()
+        hex_b = row_b.hex(" ").upper()
+
+        if row_a == row_b:
+            yield f"  {offset:04X}: {hex_a:<48} | {hex_b}"
+            continue
+
+        differing_rows += 1
+        markers = []
+        for i in range(ROW_SIZE):
+            byte_a = row_a[i : i + 1]
+            byte_b = row_b[i : i + 1]
+            if byte_a == byte_b:
+                markers.append("  ")
+            else:
+                markers.append("^^")
+                differing_bytes += 1
+        yield f"* {offset:04X}: {hex_a:<48} | {hex_b}"
+        yield " " * 59 + " ".join(markers).rstrip()
+
+    yield (
+        f"{differing_bytes} byte(s) differ in {differing_rows} row(s)"
+        if differing_bytes
+        else "Identical"
+    )
+
+
+def write_lines(lines: Iterable[str], out: TextIO) -> int:
+    """
+    Write generated lines to a stream.
+
+    Args:
+        lines: Lines without newlines
+        out: Text stream (file or stdout)
+
+    Returns:
+        Number of lines written
+    """
+    count = 0
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+        count += 1
+    return count
+
+
+def iter_archive_dump(entries: Iterable[Tuple[str, bytes]]) -> Iterator[str]:
+    """
+    Generate hex dumps of many EDIDs, each preceded by its label.
+
+    Args:
+        entries: (label, edid_data) tuples, e.g. from iter_edid_files
+
+    Yields:
+        Output lines without newlines
+    """
+    for label, edid_data in entries:
+        yield f"# {label} ({len(edid_data)} bytes)"
+        yield from iter_hex_dump(edid_data)
+        yield ""
@@ -1,35 +1,83 @@
 """I2C operations for EDID devices."""
 
+import errno
 import time
-import glob
+from collections import deque
+from contextlib import ExitStack
 from pathlib import Path
 from datetime import datetime
-from typing import List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-try:
-    from smbus2 import SMBus
-
-    SMBUS_AVAILABLE = True
-except ImportError:
-    SMBUS_AVAILABLE = False
+from .adapters import (
+    chunk_size_for,
+    get_profile,
+    record_read,
+    smaller_chunk_size,
+)
+from .backend import SMBUS_AVAILABLE, get_backend  # noqa: F401
+from .journal import WriteJournal, content_hash, load_journal, start_journal
+from .locking import bus_lock, locks_bus
+from .profiling import instrument_bus, phase, profiled, sleep
+from .retry import get_retry_policy
 
 
 # Standard EDID I2C address
 EDID_ADDRESS = 0x50
 
+# SMBus block transfers are limited to 32 bytes
+SMBUS_BLOCK_MAX = 32
+
 # Write timing
 PAGE_SIZE = 16  # Typical EEPROM page size
 PAGE_WRITE_DELAY = 0.01  # 10ms delay after page write
 
+# Write-cycle wait strategies
+WAIT_FIXED = "fixed"  # Sleep PAGE_WRITE_DELAY after every page
+WAIT_POLL = "poll"  # Acknowledge polling: retry until the EEPROM answers
+WAIT_STRATEGIES = (WAIT_FIXED, WAIT_POLL)
+ACK_POLL_INTERVAL = 0.0005
+ACK_POLL_TIMEOUT = 0.05
+
+# Bus discovery does not wait for buses that are busy writing
+DISCOVER_LOCK_TIMEOUT = 1.0
+
 
 def check_smbus_available() -> None:
-    """Check if smbus2 is available."""
-    if not SMBUS_AVAILABLE:
-        raise ImportError(
-            "smbus2 is required for I2C operations. Install it with: pip install smbus2"
-        )
+    """Check if the active bus backend (smbus2 by default) is available."""
+    get_backend().check_available()
+
+
+def open_bus(bus_num: int) -> Any:
+    """
+    Open an I2C bus through the active backend.
+
+    Args:
+        bus_num: I2C bus number
+
+    Returns:
+        SMBus-compatible bus object (usable as a context manager)
+    """
+    return instrument_bus(get_backend().open(bus_num), bus_num)
+
+
+def transfer(bus_num: int, func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run one bus transaction under the active retry policy.
+
+    Only this transaction is repeated on a transient error (e.g. a NACK).
+
+    Args:
+        bus_num: I2C bus number
+        func: Bus method, e.g. bus.read_i2c_block_data
+        args: Arguments for func
+
+    Returns:
+        Result of func
+    """
+    return get_retry_policy().call(bus_num, func, *args)
 
 
+@profiled("i2c.discover")
 def discover_buses(verbose: bool = False) -> List[Tuple[int, bool]]:
     """
     Discover available I2C buses and check for EDID presence.
@@ -45,27 +93,18 @@ def discover_buses(verbose: bool = False) -> List[Tuple[int, bool]]:
     check_smbus_available()
 
     buses = []
-    i2c_devices = sorted(glob.glob("/dev/i2c-*"))
+    bus_numbers = get_backend().list_buses()
 
     if verbose:
-        print(f"Scanning {len(i2c_devices)} I2C device(s)...")
-
-    for device in i2c_devices:
-        # Extract bus number from device path
-        bus_num = int(device.split("-")[-1])
+        print(f"Scanning {len(bus_numbers)} I2C device(s)...")
 
+    for bus_num in bus_numbers:
         has_edid = False
         try:
-            with SMBus(bus_num) as bus:
-                # Try to read first byte of EDID
-                # This will fail if no device at address 0x50
-                data = bus.read_byte_data(EDID_ADDRESS, 0x00)
-                # Check if it looks like EDID header (first byte should be 0x00)
-                has_edid = data == 0x00
-
-                if verbose:
-                    status = "EDID detected" if has_edid else "No EDID"
-                    print(f"  Bus {bus_num}: {status}")
+            has_edid = probe_bus(bus_num)
+            if verbose:
+                status = "EDID detected" if has_edid else "No EDID"
+                print(f"  Bus {bus_num}: {status}")
         except (OSError, IOError) as e:
             if verbose:
                 print(f"  Bus {bus_num}: Not accessible ({e})")
@@ -76,6 +115,31 @@ def discover_buses(verbose: bool = False) -> List[Tuple[int, bool]]:
     return buses
 
 
+def probe_bus(bus_num: int) -> bool:
+    """
+    Probe a bus for an EDID EEPROM.
+
+    Args:
+        bus_num: I2C bus number
+
+    Returns:
+        True if a device answers at 0x50 with the first EDID header byte
+
+    Raises:
+        OSError: If the bus cannot be opened, is busy with a write, or no
+            device answers at 0x50
+    """
+    # A TimeoutError (an OSError) reports buses busy with a write
+    with bus_lock(bus_num, timeout=DISCOVER_LOCK_TIMEOUT):
+        with open_bus(bus_num) as bus:
+            # Fails if there is no device at address 0x50
+            data = bus.read_byte_data(EDID_ADDRESS, 0x00)
+            # The first EDID header byte is 0x00
+            return data == 0x00
+
+
+@profiled("i2c.read")
+@locks_bus(exclusive=False)
 def read_edid(bus_num: int, verbose: bool = False) -> bytes:
     """
     Read complete EDID from I2C device.
@@ -99,17 +163,12 @@ def read_edid(bus_num: int, verbose: bool = False) -> bytes:
         print(f"Opening I2C bus {bus_num}...")
 
     try:
-        with SMBus(bus_num) as bus:
+        with open_bus(bus_num) as bus:
             if verbose:
                 print(f"Reading base block from address 0x{EDID_ADDRESS:02X}...")
 
             # Read base block (128 bytes)
-            base_block = bytearray()
-            for offset in range(0, 128, 32):
-                chunk = bus.read_i2c_block_data(
-                    EDID_ADDRESS, offset, min(32, 128 - offset)
-                )
-                base_block.extend(chunk)
+            base_block = read_bytes(bus, bus_num, 0, 128)
 
             if len(base_block) != 128:
                 raise ValueError(
@@ -130,29 +189,18 @@ def read_edid(bus_num: int, verbose: bool = False) -> bytes:
             if verbose:
                 print(f"Reading {extension_count} extension block(s)...")
 
-            # Read extension blocks
-            full_edid = bytearray(base_block)
-            for ext_num in range(extension_count):
-                ext_block = bytearray()
-                base_offset = (ext_num + 1) * 128
-
-                # For extensions, we may need to read in smaller chunks
-                # Some displays have issues with large reads from extension blocks
-                for offset in range(0, 128, 32):
-                    addr = (
-                        base_offset + offset
-                    ) % 256  # Wrap around for 8-bit addressing
-                    chunk = bus.read_i2c_block_data(
-                        EDID_ADDRESS, addr, min(32, 128 - offset)
-                    )
-                    ext_block.extend(chunk)
-
-                if len(ext_block) != 128:
-                    raise ValueError(f"Failed to read extension block {ext_num + 1}")
-
-                full_edid.extend(ext_block)
+            # Read all extension blocks at once; read_bytes splits the range
+            # into the largest chunks the adapter handles
+            full_edid = base_block + read_bytes(
+                bus, bus_num, 128, 128 * extension_count
+            )
+            if len(full_edid) != 128 * (1 + extension_count):
+                raise ValueError(
+                    f"Failed to read extension blocks (got {len(full_edid)} bytes)"
+                )
 
-                if verbose:
+            if verbose:
+                for ext_num in range(extension_count):
                     print(f"  Extension {ext_num + 1}: 128 bytes")
 
             if verbose:
@@ -174,6 +222,7 @@ def read_edid(bus_num: int, verbose: bool = False) -> bytes:
             raise
 
 
+@profiled("i2c.backup")
 def backup_edid(bus_num: int, verbose: bool = False) -> Path:
     """
     Create a backup of EDID from device.
@@ -197,9 +246,15 @@ def backup_edid(bus_num: int, verbose: bool = False) -> Path:
     # Create timestamped filename
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_path = backup_dir / f"edid_bus{bus_num}_{timestamp}.bin"
+    # Never replace an earlier backup taken within the same second
+    suffix = 1
+    while backup_path.exists():
+        backup_path = backup_dir / f"edid_bus{bus_num}_{timestamp}_{suffix}.bin"
+        suffix += 1
 
     # Write backup
-    backup_path.write_bytes(edid_data)
+    with phase("i2c.backup_io"):
+        backup_path.write_bytes(edid_data)
 
     if verbose:
         print(f"Backup saved: {backup_path}")
@@ -208,81 +263,559 @@ def backup_edid(bus_num: int, verbose: bool = False) -> Path:
     return backup_path
 
 
-def write_edid(bus_num: int, edid_data: bytes, verbose: bool = False) -> None:
+@profiled("i2c.wait")
+def wait_write_cycle(bus: Any, offset: int, strategy: str = WAIT_FIXED) -> None:
+    """
+    Wait for the EEPROM's internal write cycle to finish.
+
+    Args:
+        bus: Open bus object
+        offset: Offset of the page just written (used for ACK polling)
+        strategy: WAIT_FIXED to sleep PAGE_WRITE_DELAY, or WAIT_POLL to
+            retry a one-byte read until the device acknowledges
+
+    Raises:
+        OSError: If the device does not answer within ACK_POLL_TIMEOUT
+    """
+    if strategy == WAIT_FIXED:
+        sleep(PAGE_WRITE_DELAY)
+        return
+
+    deadline = time.monotonic() + ACK_POLL_TIMEOUT
+    while True:
+        try:
+            bus.read_byte_data(EDID_ADDRESS, offset % 256)
+            return
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            sleep(ACK_POLL_INTERVAL)
+
+
+def _check_write_args(edid_data: bytes, page_size: int, wait_strategy: str) -> None:
+    # Validate data size
+    if len(edid_data) % 128 != 0:
+        raise ValueError(
+            f"EDID data size must be multiple of 128 bytes (got {len(edid_data)})"
+        )
+
+    if not 0 < page_size <= 32 or 128 % page_size:
+        raise ValueError(
+            f"Page size must divide 128 and be at most 32 (got {page_size})"
+        )
+
+    if wait_strategy not in WAIT_STRATEGIES:
+        raise ValueError(f"Unknown wait strategy: {wait_strategy}")
+
+
+def _start_write(
+    bus_num: int, edid_data: bytes, page_size: int, resume: bool, verbose: bool
+) -> Tuple[WriteJournal, Path, List[int]]:
+    """
+    Back up the device and journal a write, or pick up an interrupted one.
+
+    Returns:
+        The write journal, the backup path and the pages still to write
+    """
+    total_pages = (len(edid_data) + page_size - 1) // page_size
+    journal = _load_resumable_journal(bus_num, edid_data, page_size, resume)
+
+    pages = list(range(total_pages))
+    if journal is not None:
+        try:
+            with open_bus(bus_num) as bus:
+                pages = _pages_to_resume(bus, bus_num, edid_data, journal)
+        except ResumeRefused as e:
+            if journal.completed:
+                raise
+            # Nothing was journaled, so the device was never knowingly
+            # modified: back up what is attached now rather than trusting
+            # the stale backup (the display may have been swapped)
+            print(
+                f"Warning: bus {bus_num} no longer holds the display of an "
+                f"interrupted write ({e.args[0].split(';')[0]}); taking a fresh "
+                f"backup (previous backup: {journal.backup_path})"
+            )
+            journal.finish()
+            journal = None
+            pages = list(range(total_pages))
+
+    if journal is None:
+        # Create backup first
+        if verbose:
+            print("Creating backup before write...")
+        backup_path = backup_edid(bus_num, verbose=verbose)
+        journal = start_journal(
+            bus_num, edid_data, backup_path.read_bytes(), page_size, backup_path
+        )
+    else:
+        # The device is partially written; its original contents are in the
+        # backup made by the interrupted write
+        backup_path = journal.backup_path
+        if verbose:
+            print(
+                f"Resuming interrupted write ({len(journal.completed)}/"
+                f"{total_pages} page(s) journaled), backup: {backup_path}"
+            )
+    return journal, backup_path, pages
+
+
+def _write_page(
+    bus: Any, bus_num: int, edid_data: bytes, page_num: int, page_size: int
+) -> None:
+    offset = page_num * page_size
+    chunk = list(edid_data[offset : offset + page_size])
+    if offset < 256:
+        transfer(bus_num, bus.write_i2c_block_data, EDID_ADDRESS, offset, chunk)
+        return
+
+    # The segment pointer resets at every STOP, so it is set in the same
+    # combined transaction as the page write
+    messages = get_backend().write_messages(
+        EDID_ADDRESS, offset // 256, offset % 256, chunk
+    )
+    transfer(bus_num, bus.i2c_rdwr, *messages)
+
+
+def _verify_write(
+    bus: Any, bus_num: int, edid_data: bytes, pages: List[int], page_size: int
+) -> bool:
+    # A resumed write only needs to check the pages it wrote, the others
+    # were checked while planning
+    with phase("i2c.verify"):
+        if len(pages) * page_size >= len(edid_data):
+            return read_edid(bus_num, verbose=False) == edid_data
+        return all(
+            read_bytes(bus, bus_num, page * page_size, page_size)
+            == edid_data[page * page_size : (page + 1) * page_size]
+            for page in pages
+        )
+
+
+@profiled("i2c.write")
+@locks_bus(exclusive=True)
+def write_edid(
+    bus_num: int,
+    edid_data: bytes,
+    verbose: bool = False,
+    page_size: int = PAGE_SIZE,
+    wait_strategy: str = WAIT_FIXED,
+    resume: bool = True,
+) -> None:
     """
     Write EDID data to I2C device.
 
     Uses page-aligned writes with appropriate delays.
     Automatically creates backup before writing.
 
+    Progress is journaled per page. If a previous write of the same EDID to
+    this bus was interrupted, only the pages that do not hold the target data
+    yet are written and verified.
+
     Args:
         bus_num: I2C bus number
         edid_data: Complete EDID data to write
         verbose: Print detailed operation information
+        page_size: EEPROM page size in bytes (at most 32)
+        wait_strategy: Write-cycle wait strategy (WAIT_FIXED or WAIT_POLL)
+        resume: Resume an interrupted write from its journal (False discards
+            the journal and starts over)
 
     Raises:
         ValueError: If EDID data is invalid
         OSError: If device cannot be accessed or write fails
     """
     check_smbus_available()
-
-    # Validate data size
-    if len(edid_data) % 128 != 0:
-        raise ValueError(
-            f"EDID data size must be multiple of 128 bytes (got {len(edid_data)})"
-        )
+    _check_write_args(edid_data, page_size, wait_strategy)
 
     if verbose:
         print(f"Writing {len(edid_data)} bytes to I2C bus {bus_num}...")
 
-    # Create backup first
-    if verbose:
-        print("Creating backup before write...")
-    backup_path = backup_edid(bus_num, verbose=verbose)
+    total_pages = (len(edid_data) + page_size - 1) // page_size
+    journal, backup_path, pages = _start_write(
+        bus_num, edid_data, page_size, resume, verbose
+    )
 
     try:
-        with SMBus(bus_num) as bus:
-            # Write in page-sized chunks
-            total_pages = (len(edid_data) + PAGE_SIZE - 1) // PAGE_SIZE
-
-            for page_num in range(total_pages):
-                offset = page_num * PAGE_SIZE
-                end_offset = min(offset + PAGE_SIZE, len(edid_data))
-                chunk = edid_data[offset:end_offset]
-
-                if verbose:
-                    print(
-                        f"  Writing page {page_num + 1}/{total_pages} "
-                        f"(offset 0x{offset:02X}, {len(chunk)} bytes)..."
-                    )
-
-                # Write the chunk
-                bus.write_i2c_block_data(EDID_ADDRESS, offset % 256, list(chunk))
-
-                # Wait for page write to complete
-                time.sleep(PAGE_WRITE_DELAY)
+        with open_bus(bus_num) as bus:
+            with phase("i2c.write_pages"):
+                # Write in page-sized chunks
+                for page_num in pages:
+                    offset = page_num * page_size
+
+                    if verbose:
+                        chunk_size = min(page_size, len(edid_data) - offset)
+                        print(
+                            f"  Writing page {page_num + 1}/{total_pages} "
+                            f"(offset 0x{offset:02X}, {chunk_size} bytes)..."
+                        )
+
+                    # Write the chunk
+                    _write_page(bus, bus_num, edid_data, page_num, page_size)
+
+                    # Wait for page write to complete
+                    wait_write_cycle(bus, offset, wait_strategy)
+                    journal.record_page(page_num)
 
             if verbose:
                 print("Write complete, verifying...")
 
             # Verify write by reading back
-            read_back = read_edid(bus_num, verbose=False)
-
-            if read_back != edid_data:
+            if not _verify_write(bus, bus_num, edid_data, pages, page_size):
                 raise IOError(
                     "Write verification failed! Data read back does not match. "
                     f"Backup saved at: {backup_path}"
                 )
 
+            journal.finish()
             if verbose:
                 print("Write verified successfully!")
 
     except Exception as e:
         print(f"\nWRITE FAILED: {e}")
         print(f"Backup available at: {backup_path}")
+        if journal.path.exists():
+            print("Run the same write again to resume from the write journal.")
         raise
 
 
+def _write_cycle_done(device: Dict[str, Any], now: float, wait_strategy: str) -> bool:
+    """Check (without blocking) whether a device finished its write cycle."""
+    if now < device["ready_at"]:
+        return False
+    if wait_strategy == WAIT_FIXED:
+        return True
+
+    offset = device["in_flight"] * device["page_size"]
+    try:
+        device["bus"].read_byte_data(EDID_ADDRESS, offset % 256)
+        return True
+    except OSError:
+        if now >= device["deadline"]:
+            raise
+        device["ready_at"] = now + ACK_POLL_INTERVAL
+        return False
+
+
+@profiled("i2c.write_many")
+def write_edids(
+    targets: List[Tuple[int, bytes]],
+    verbose: bool = False,
+    page_size: int = PAGE_SIZE,
+    wait_strategy: str = WAIT_FIXED,
+    resume: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Write EDIDs to several devices, interleaving their page writes.
+
+    write_edid leaves the bus idle during every page's write cycle. Here a
+    page is written to each device in turn (round robin) while the others
+    are busy, so the write cycles overlap and N devices take little longer
+    than one. Devices behind different channels of one mux share the bus
+    wire, which is fine: only one transaction is in flight at a time, and
+    the mux switches channel between transactions while the EEPROMs finish
+    their write cycles on their own.
+
+    Each device gets the same safety as write_edid: backup, per-page
+    journal (resumable) and verification. A device that fails is reported
+    and dropped; the others carry on.
+
+    Args:
+        targets: (bus_num, edid_data) tuples, one per bus
+        verbose: Print detailed operation information
+        page_size: EEPROM page size in bytes (at most 32)
+        wait_strategy: Write-cycle wait strategy (WAIT_FIXED or WAIT_POLL)
+        resume: Resume interrupted writes from their journals
+
+    Returns:
+        One dictionary per target, in order, with bus, pages (written),
+        backup (path or None), verified and error (None on success)
+
+    Raises:
+        ValueError: If EDID data is invalid or a bus appears twice
+    """
+    check_smbus_available()
+    bus_nums = [bus_num for bus_num, _ in targets]
+    if len(set(bus_nums)) != len(bus_nums):
+        raise ValueError("Each bus can only be written once")
+    for _, edid_data in targets:
+        _check_write_args(edid_data, page_size, wait_strategy)
+
+    results = [
+        {"bus": bus_num, "pages": 0, "backup": None, "verified": False, "error": None}
+        for bus_num in bus_nums
+    ]
+    devices: List[Dict[str, Any]] = []
+
+    def fail(device: Dict[str, Any], error: Exception) -> None:
+        device["result"]["error"] = str(error)
+        print(f"\nWRITE FAILED on bus {device['bus_num']}: {error}")
+        if device.get("backup_path"):
+            print(f"Backup available at: {device['backup_path']}")
+        if device.get("journal") and device["journal"].path.exists():
+            print("Run the same write again to resume from the write journal.")
+
+    with ExitStack() as stack:
+        # Lock in bus order so concurrent writers cannot deadlock
+        for bus_num in sorted(bus_nums):
+            stack.enter_context(bus_lock(bus_num, exclusive=True))
+
+        for (bus_num, edid_data), result in zip(targets, results):
+            device = {"bus_num": bus_num, "data": edid_data, "result": result}
+            try:
+                if verbose:
+                    print(f"Preparing {len(edid_data)}-byte write to bus {bus_num}...")
+                journal, backup_path, pages = _start_write(
+                    bus_num, edid_data, page_size, resume, verbose
+                )
+                device.update(
+                    journal=journal,
+                    backup_path=backup_path,
+                    pages=pages,
+                    queue=deque(pages),
+                    in_flight=None,
+                    ready_at=0.0,
+                    page_size=page_size,
+                    bus=stack.enter_context(open_bus(bus_num)),
+                )
+                result["backup"] = backup_path
+            except Exception as e:
+                fail(device, e)
+                continue
+            devices.append(device)
+
+        if verbose:
+            pages_total = sum(len(device["pages"]) for device in devices)
+            print(
+                f"Writing {pages_total} page(s) to {len(devices)} device(s), "
+                "interleaved..."
+            )
+
+        pending = devices[:]
+        with phase("i2c.write_pages"):
+            while pending:
+                progressed = False
+                for device in pending[:]:
+                    now = time.monotonic()
+                    try:
+                        if device["in_flight"] is not None:
+                            if not _write_cycle_done(device, now, wait_strategy):
+                                continue
+                            device["journal"].record_page(device["in_flight"])
+                            device["result"]["pages"] += 1
+                            device["in_flight"] = None
+                            progressed = True
+
+                        if not device["queue"]:
+                            pending.remove(device)
+                            continue
+
+                        page_num = device["queue"].popleft()
+                        _write_page(
+                            device["bus"],
+                            device["bus_num"],
+                            device["data"],
+                            page_num,
+                            page_size,
+                        )
+                        now = time.monotonic()
+                        device["in_flight"] = page_num
+                        device["deadline"] = now + ACK_POLL_TIMEOUT
+                        device["ready_at"] = now + (
+                            PAGE_WRITE_DELAY
+                            if wait_strategy == WAIT_FIXED
+                            else ACK_POLL_INTERVAL
+                        )
+                        progressed = True
+                    except Exception as e:
+                        pending.remove(device)
+                        fail(device, e)
+
+                if pending and not progressed:
+                    # Every device is in its write cycle
+                    next_ready = min(device["ready_at"] for device in pending)
+                    sleep(max(0.0, next_ready - time.monotonic()))
+
+        for device in devices:
+            if device["result"]["error"]:
+                continue
+            try:
+                if not _verify_write(
+                    device["bus"],
+                    device["bus_num"],
+                    device["data"],
+                    device["pages"],
+                    page_size,
+                ):
+                    raise IOError(
+                        "Write verification failed! Data read back does not "
+                        f"match. Backup saved at: {device['backup_path']}"
+                    )
+                device["journal"].finish()
+                device["result"]["verified"] = True
+                if verbose:
+                    print(f"  Bus {device['bus_num']}: write verified successfully")
+            except Exception as e:
+                fail(device, e)
+
+    return results
+
+
+def read_chunk(bus: Any, bus_num: int, offset: int, length: int) -> List[int]:
+    """
+    Read one chunk from the EDID EEPROM in a single transaction.
+
+    Chunks of up to 32 bytes in segment 0 use SMBus block reads, whose
+    8-bit offset wraps at 256. Longer chunks, and every chunk at offset 256
+    or beyond, use a combined i2c_rdwr transaction that also sets the E-DDC
+    segment pointer.
+
+    Args:
+        bus: Open bus object
+        bus_num: I2C bus number
+        offset: Start offset (must not cross a 256-byte segment for long chunks)
+        length: Number of bytes
+
+    Returns:
+        The bytes read
+    """
+    if length <= SMBUS_BLOCK_MAX and offset < 256:
+        return transfer(
+            bus_num, bus.read_i2c_block_data, EDID_ADDRESS, offset % 256, length
+        )
+
+    messages = get_backend().read_messages(
+        EDID_ADDRESS, offset // 256, offset % 256, length
+    )
+    transfer(bus_num, bus.i2c_rdwr, *messages)
+    return list(messages[-1])
+
+
+def read_bytes(bus: Any, bus_num: int, offset: int, length: int) -> bytes:
+    """
+    Read a byte range from the EDID EEPROM in adaptive chunks.
+
+    Starts with the chunk size stored in the adapter's profile (the largest
+    size for unknown adapters). When a chunk fails, it is read again with the
+    next smaller size. Once the range has been read, the outcome is recorded
+    in the profile (see adapters.record_read): repeated fallbacks make later
+    reads start at the smaller size.
+
+    Args:
+        bus: Open bus object
+        bus_num: I2C bus number
+        offset: Start offset
+        length: Number of bytes
+
+    Returns:
+        The bytes read
+
+    Raises:
+        OSError: If a chunk fails even at the smallest chunk size
+    """
+    adapter = get_backend().adapter_name(bus_num)
+    profile = get_profile(adapter)
+    initial_size = chunk_size = chunk_size_for(profile)
+
+    data = bytearray()
+    position = offset
+    end = offset + length
+    while position < end:
+        size = min(chunk_size, end - position, 256 - position % 256)
+        try:
+            chunk = read_chunk(bus, bus_num, position, size)
+            if len(chunk) != size:
+                raise OSError(errno.EIO, f"Short read ({len(chunk)}/{size} bytes)")
+        except OSError:
+            chunk_size = smaller_chunk_size(chunk_size)
+            if chunk_size is None:
+                raise
+            continue
+        data.extend(chunk)
+        position += size
+
+    record_read(adapter, initial_size, chunk_size)
+    return bytes(data)
+
+
+def _load_resumable_journal(
+    bus_num: int, edid_data: bytes, page_size: int, resume: bool
+) -> Optional[WriteJournal]:
+    journal = load_journal(bus_num)
+    if journal is None:
+        return None
+
+    if not resume:
+        journal.finish()
+        return None
+
+    if journal.target != content_hash(edid_data):
+        print(
+            f"Warning: discarding journal of an interrupted write of a different "
+            f"EDID on bus {bus_num} (original contents: {journal.backup_path})"
+        )
+        journal.finish()
+        return None
+
+    if journal.size != len(edid_data) or journal.page_size != page_size:
+        raise ValueError(
+            f"Interrupted write on bus {bus_num} used {journal.page_size}-byte "
+            f"pages; resume with --page-size {journal.page_size} or use --no-resume"
+        )
+    return journal
+
+
+class ResumeRefused(IOError):
+    """The device does not hold what an interrupted write left behind."""
+
+
+def _pages_to_resume(
+    bus: Any, bus_num: int, edid_data: bytes, journal: WriteJournal
+) -> List[int]:
+    """
+    Work out which pages an interrupted write still has to write.
+
+    Every page on the device must hold either the target data or the
+    original data from the backup; anything else means a different display
+    is attached and ResumeRefused is raised.
+    """
+    try:
+        original = journal.backup_path.read_bytes()
+    except OSError as e:
+        raise ResumeRefused(
+            f"Cannot resume: backup {journal.backup_path} is unreadable ({e}); "
+            "use --no-resume"
+        ) from e
+    if content_hash(original) != journal.device:
+        raise ResumeRefused(
+            f"Cannot resume: backup {journal.backup_path} does not match the "
+            "journal; use --no-resume"
+        )
+
+    page_size = journal.page_size
+    device = read_bytes(bus, bus_num, 0, len(edid_data))
+    pages = []
+    for page_num in range(len(edid_data) // page_size):
+        page = slice(page_num * page_size, (page_num + 1) * page_size)
+        if device[page] == edid_data[page]:
+            continue
+        if page_num in journal.completed:
+            raise ResumeRefused(
+                f"Cannot resume: journaled page {page_num + 1} does not match "
+                "the target; use --no-resume"
+            )
+        if page.start < len(original) and device[page] != original[page]:
+            raise ResumeRefused(
+                "Cannot resume: device contents match neither the original nor "
+                f"the target EDID at offset 0x{page.start:02X} (different "
+                "display?); use --no-resume"
+            )
+        pages.append(page_num)
+    return pages
+
+
+@profiled("i2c.test_write")
+@locks_bus(exclusive=True)
 def test_writable(bus_num: int, verbose: bool = False) -> Tuple[bool, str]:
     """
     Test if EDID device is writable.
@@ -343,13 +876,17 @@ def test_writable(bus_num: int, verbose: bool = False) -> Tuple[bool, str]:
             print(f"Test value: 0x{test_value:02X}")
             print("\nAttempting write...")
 
-        with SMBus(bus_num) as bus:
+        with open_bus(bus_num) as bus:
             # Write test value
-            bus.write_byte_data(EDID_ADDRESS, test_offset, test_value)
-            time.sleep(PAGE_WRITE_DELAY)
+            transfer(
+                bus_num, bus.write_byte_data, EDID_ADDRESS, test_offset, test_value
+            )
+            sleep(PAGE_WRITE_DELAY)
 
             # Read back
-            read_value = bus.read_byte_data(EDID_ADDRESS, test_offset)
+            read_value = transfer(
+                bus_num, bus.read_byte_data, EDID_ADDRESS, test_offset
+            )
 
             if verbose:
                 print(f"Read back value: 0x{read_value:02X}")
@@ -360,11 +897,15 @@ def test_writable(bus_num: int, verbose: bool = False) -> Tuple[bool, str]:
             # Restore original value
             if verbose:
                 print("Restoring original value...")
-            bus.write_byte_data(EDID_ADDRESS, test_offset, original_value)
-            time.sleep(PAGE_WRITE_DELAY)
+            transfer(
+                bus_num, bus.write_byte_data, EDID_ADDRESS, test_offset, original_value
+            )
+            sleep(PAGE_WRITE_DELAY)
 
             # Verify restoration
-            restored_value = bus.read_byte_data(EDID_ADDRESS, test_offset)
+            restored_value = transfer(
+                bus_num, bus.read_byte_data, EDID_ADDRESS, test_offset
+            )
 
             if restored_value != original_value:
                 return False, (
@@ -393,7 +934,10 @@ def test_writable(bus_num: int, verbose: bool = False) -> Tuple[bool, str]:
 
 
 def validate_device_matches_file(
-    bus_num: int, file_data: bytes, verbose: bool = False
+    bus_num: int,
+    file_data: bytes,
+    verbose: bool = False,
+    device_data: Optional[bytes] = None,
 ) -> Tuple[bool, str]:
     """
     Validate that EDID device matches a binary file.
@@ -402,17 +946,19 @@ def validate_device_matches_file(
         bus_num: I2C bus number
         file_data: EDID data from file
         verbose: Print comparison details
+        device_data: EDID already read from the device (read here if None)
 
     Returns:
         Tuple of (matches, message)
     """
-    if verbose:
-        print(f"Reading EDID from bus {bus_num}...")
+    if device_data is None:
+        if verbose:
+            print(f"Reading EDID from bus {bus_num}...")
 
-    try:
-        device_data = read_edid(bus_num, verbose=False)
-    except Exception as e:
-        return False, f"Failed to read device: {e}"
+        try:
+            device_data = read_edid(bus_num, verbose=False)
+        except Exception as e:
+            return False, f"Failed to read device: {e}"
 
     if len(device_data) != len(file_data):
         return False, (
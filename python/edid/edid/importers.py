@@ -0,0 +1,316 @@
+"""Importers for EDIDs in text form.
+
+Fleet data is often collected as text rather than binary EDIDs:
+
+- ``xrandr --verbose``: an ``EDID:`` line per output followed by lines of
+  32 hex digits
+- ``edid-decode``: an ``edid-decode (hex):`` line followed by rows of 16
+  space-separated hex bytes, a blank line between blocks
+- plain hex dumps such as ``xxd -p /sys/class/drm/card0-DP-1/edid``: lines
+  of hex, starting with the EDID header
+
+Text is read in fixed-size chunks, so memory use is constant and very
+large aggregated logs (e.g. the output of many hosts concatenated) stream
+through. Lines are never looked at one by one: the markers above are found
+with str.find, the end of a hex block with a single character-class match
+(no backtracking), and the whole block is converted by one bytes.fromhex
+call, which skips the newlines and indentation between rows.
+
+Unlike carve.py, which finds EDIDs anywhere in arbitrary files, the
+importer only recognises these formats and keeps the context they carry
+(e.g. the xrandr output name) in the labels.
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Tuple
+
+from .validator import EDID_HEADER
+
+FORMAT_XRANDR = "xrandr"
+FORMAT_EDID_DECODE = "edid-decode"
+FORMAT_HEX = "hex"
+
+XRANDR_EDID_LINE = "EDID:"
+EDID_DECODE_HEX_LINE = "edid-decode (hex):"
+
+# EDID headers that start a plain hex dump
+HEX_HEADERS = (
+    "00ffffffffffff00",
+    "00FFFFFFFFFFFF00",
+    "00 ff ff ff ff ff ff 00",
+    "00 FF FF FF FF FF FF 00",
+)
+
+MARKERS = (
+    (XRANDR_EDID_LINE, FORMAT_XRANDR),
+    (EDID_DECODE_HEX_LINE, FORMAT_EDID_DECODE),
+) + tuple((header, FORMAT_HEX) for header in HEX_HEADERS)
+
+# Bytes sniffed to tell text files from binary ones
+SNIFF_SIZE = 512
+
+# Characters read per chunk
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# A hex block still open at the end of a chunk is carried over to the next
+# one, up to the hex text of the largest EDID with generous formatting
+MAX_BLOCK_TEXT = 256 * 1024
+
+BLOCK_SIZE = 128
+
+# A run of hex digits and whitespace: one character class, so matching is
+# linear with no backtracking
+_HEX_RUN = re.compile(r"[0-9a-fA-F\s]*")
+
+
+def is_text_file(path: Path) -> bool:
+    """
+    Check whether a file looks like text rather than a binary EDID.
+
+    Args:
+        path: File to check
+
+    Returns:
+        True if the start of the file is non-empty and free of NUL bytes
+        (binary EDIDs start with one)
+    """
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_SIZE)
+    return bool(head) and b"\x00" not in head
+
+
+def _last_output(text: str, start: int, end: int) -> Optional[str]:
+    """Name of the last xrandr output line ("DP-1 connected ...") in a range."""
+    while True:
+        position = max(
+            text.rfind(" connected", start, end),
+            text.rfind(" disconnected", start, end),
+        )
+        if position < 0:
+            return None
+        name = text[text.rfind("\n", start, position) + 1 : position]
+        if name and name[0] not in " \t" and " " not in name:
+            return name
+        end = position
+
+
+def _split_block(
+    data: bytes, label: str, form: str, errors: Optional[List[str]]
+) -> Iterator[Tuple[str, bytes]]:
+    """Split the bytes of a hex block into EDIDs by their extension counts."""
+    offset = 0
+    index = 0
+    while offset < len(data):
+        remaining = len(data) - offset
+        size = BLOCK_SIZE
+        problem = None
+        if data[offset : offset + 8] != EDID_HEADER:
+            problem = "does not start with an EDID header"
+        else:
+            if remaining >= BLOCK_SIZE:
+                size = BLOCK_SIZE * (1 + data[offset + 126])
+            if remaining < size:
+                problem = f"ends after {remaining} of {size} bytes"
+
+        if problem is not None:
+            # Trailing hex after a complete EDID is not an error
+            if index == 0:
+                message = f"{label}: {form} EDID {problem}"
+                if errors is None:
+                    raise ValueError(message)
+                errors.append(message)
+            return
+
+        yield (f"{label}#{index}" if index else label), data[offset : offset + size]
+        offset += size
+        index += 1
+
+
+def _find_markers(
+    text: str, hits: List[Tuple[int, str, str]], position: int, limit: int
+) -> List[Tuple[int, str, str]]:
+    """Refresh the next occurrence of every marker at or after position.
+
+    Positions are -1 for markers that do not occur again; any other
+    position before the current one is searched for anew.
+    """
+    return [
+        (
+            hit if hit == -1 or hit >= position else text.find(marker, position, limit),
+            marker,
+            form,
+        )
+        for hit, marker, form in hits
+    ]
+
+
+def iter_text_edids(
+    stream: IO[str], source: str = "-", errors: Optional[List[str]] = None
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Parse EDIDs from xrandr, edid-decode or plain hex text.
+
+    Args:
+        stream: Text stream (e.g. an open file or sys.stdin)
+        source: Name of the input, used in labels
+        errors: List to append messages about incomplete or malformed EDIDs
+            to; if None, they raise ValueError instead
+
+    Yields:
+        Tuples of (label, edid_data); the label is "<source>:<line>" of the
+        first hex line, plus ":<output>" for xrandr outputs and "#<n>" for
+        further EDIDs in the same block
+
+    Raises:
+        ValueError: If an EDID is incomplete and errors is None
+    """
+    carry = ""
+    line_base = 1  # Line number at the start of carry
+    output = None
+    eof = False
+
+    while not eof:
+        chunk = stream.read(CHUNK_SIZE)
+        eof = not chunk
+        text = carry + chunk
+
+        # Only complete lines are parsed; the rest waits for the next chunk
+        limit = len(text) if eof else text.rfind("\n") + 1
+        if limit == 0:
+            carry = text
+            continue
+
+        resume = limit
+        position = 0
+        counted = 0  # Lines are counted up to here
+        line = line_base
+        output_scanned = 0
+        hits = [(-2, marker, form) for marker, form in MARKERS]
+
+        while True:
+            hits = _find_markers(text, hits, position, limit)
+            found = [entry for entry in hits if entry[0] >= 0]
+            if not found:
+                break
+            hit, marker, form = min(found)
+
+            line_start = text.rfind("\n", 0, hit) + 1
+            line_end = text.find("\n", hit, limit)
+            if line_end < 0:
+                line_end = limit
+            if form == FORMAT_HEX:
+                valid = not text[line_start:hit].strip()
+                start = line_start
+            else:
+                marker_line = text[line_start:line_end].strip()
+                valid = (
+                    marker_line == marker
+                    if form == FORMAT_XRANDR
+                    else marker_line.startswith(marker)
+                )
+                start = line_end + 1
+            if not valid:
+                position = hit + 1
+                continue
+
+            run_end = _HEX_RUN.match(text, start, limit).end()
+            if run_end < limit:
+                # The block ends with the line holding the first non-hex text
+                end = text.rfind("\n", start, run_end) + 1 or start
+            elif eof:
+                end = limit
+            elif limit - start < MAX_BLOCK_TEXT:
+                # The block may continue in the next chunk
+                resume = line_start
+                break
+            else:
+                # Hex-only text this long holds several EDIDs; stop before
+                # the last header and carry the rest over
+                last = max(text.rfind(h, start + 1, limit) for h in HEX_HEADERS)
+                end = text.rfind("\n", start, last) + 1 if last > start else 0
+                if end > start:
+                    resume = end
+                else:
+                    end = limit
+
+            if form == FORMAT_XRANDR:
+                output = _last_output(text, output_scanned, line_start) or output
+                output_scanned = line_start
+
+            # Label with the first hex line (edid-decode has a blank line
+            # after its marker)
+            first = start
+            while first < end and text[first] in " \t\r\n":
+                first += 1
+            line += text.count("\n", counted, first)
+            counted = first
+            label = f"{source}:{line}"
+            if form == FORMAT_XRANDR and output:
+                label += f":{output}"
+
+            try:
+                data = bytes.fromhex(text[start:end])
+            except ValueError:
+                message = f"{label}: {form} EDID has malformed hex"
+                if errors is None:
+                    raise ValueError(message) from None
+                errors.append(message)
+                data = b""
+            yield from _split_block(data, label, form, errors)
+
+            position = max(end, hit + 1)
+            if position >= resume:
+                break
+
+        output = _last_output(text, output_scanned, resume) or output
+        line_base = line + text.count("\n", counted, resume)
+        carry = text[resume:]
+
+
+def iter_text_file(
+    path: Path, errors: Optional[List[str]] = None
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Parse EDIDs from a text file.
+
+    Args:
+        path: Text file
+        errors: See iter_text_edids
+
+    Yields:
+        Tuples of (label, edid_data)
+    """
+    with open(path, encoding="utf-8", errors="replace") as f:
+        yield from iter_text_edids(f, str(path), errors)
+
+
+def load_edid(path: Path) -> bytes:
+    """
+    Read one EDID from a binary or text file.
+
+    Args:
+        path: Binary EDID file, or text in a format iter_text_edids reads
+
+    Returns:
+        The binary file contents, or the first EDID of a text file (a
+        warning is printed if it holds more)
+
+    Raises:
+        ValueError: If a text file holds no complete EDID
+    """
+    path = Path(path)
+    if not is_text_file(path):
+        return path.read_bytes()
+
+    edids = iter_text_file(path)
+    first = next(edids, None)
+    if first is None:
+        raise ValueError(f"No EDID found in text file {path}")
+    if next(edids, None) is not None:
+        print(
+            f"Warning: {path} holds several EDIDs; using the first ({first[0]})",
+            file=sys.stderr,
+        )
+    return first[1]
@@ -0,0 +1,314 @@
+"""SQLite inventory of decoded EDIDs."""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .modes import list_modes
+from .validator import validate_structure
+from .parser import (
+    DESCRIPTOR_OFFSETS,
+    DESCRIPTOR_SIZE,
+    decode_descriptor_name,
+    decode_display_params,
+    decode_extensions,
+    decode_product_info,
+    decode_version,
+)
+
+
+# Default index location
+DEFAULT_INDEX_PATH = Path.home() / ".edid-index.db"
+
+# EOTFs that count as HDR support
+HDR_EOTFS = {"SMPTE ST 2084 (PQ)", "HLG"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS edids (
+    hash TEXT PRIMARY KEY,
+    manufacturer TEXT,
+    product_code INTEGER,
+    serial INTEGER,
+    name TEXT,
+    week INTEGER,
+    year INTEGER,
+    version TEXT,
+    width_cm INTEGER,
+    height_cm INTEGER,
+    preferred_width INTEGER,
+    preferred_height INTEGER,
+    preferred_refresh REAL,
+    hdr INTEGER NOT NULL,
+    extensions INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS modes (
+    hash TEXT NOT NULL REFERENCES edids(hash),
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    refresh REAL NOT NULL,
+    interlaced INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    pixel_clock_hz INTEGER
+);
+CREATE TABLE IF NOT EXISTS sources (
+    label TEXT PRIMARY KEY,
+    hash TEXT NOT NULL REFERENCES edids(hash)
+);
+CREATE INDEX IF NOT EXISTS idx_edids_manufacturer_year ON edids (manufacturer, year);
+CREATE INDEX IF NOT EXISTS idx_edids_product ON edids (manufacturer, product_code);
+CREATE INDEX IF NOT EXISTS idx_edids_year ON edids (year);
+CREATE INDEX IF NOT EXISTS idx_edids_hdr ON edids (hdr);
+CREATE INDEX IF NOT EXISTS idx_modes_resolution ON modes (width, height, refresh);
+CREATE INDEX IF NOT EXISTS idx_modes_hash ON modes (hash);
+CREATE INDEX IF NOT EXISTS idx_sources_hash ON sources (hash);
+"""
+
+
+def edid_hash(edid_data: bytes) -> str:
+    """
+    Content hash used as the index key.
+
+    Args:
+        edid_data: Complete EDID data
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(edid_data).hexdigest()
+
+
+def open_index(path: Path = DEFAULT_INDEX_PATH) -> sqlite3.Connection:
+    """
+    Open (and create if needed) an EDID index database.
+
+    Args:
+        path: Database file path
+
+    Returns:
+        SQLite connection with rows accessible by column name
+    """
+    conn = sqlite3.connect(str(path))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def has_hdr(edid_data: bytes) -> bool:
+    """
+    Check whether an EDID advertises an HDR transfer function (PQ or HLG).
+
+    Args:
+        edid_data: Complete EDID data
+
+    Returns:
+        True if a CEA-861 HDR static metadata block lists PQ or HLG
+    """
+    for extension in decode_extensions(edid_data):
+        for block in extension["info"].get("data_blocks", []):
+            if HDR_EOTFS.intersection(block.get("eotfs", [])):
+                return True
+    return False
+
+
+def _edid_row(
+    digest: str, edid_data: bytes
+) -> Tuple[Tuple[Any, ...], List[Tuple[Any, ...]]]:
+    product = decode_product_info(edid_data)
+    display = decode_display_params(edid_data)
+
+    name = None
+    for desc_offset in DESCRIPTOR_OFFSETS:
+        name = decode_descriptor_name(
+            edid_data[desc_offset : desc_offset + DESCRIPTOR_SIZE]
+        )
+        if name:
+            break
+
+    modes = list_modes(edid_data)
+    # list_modes puts detailed timings first; the first one is preferred
+    preferred = modes[0] if modes and modes[0]["source"] == "detailed" else None
+
+    return (
+        digest,
+        product.get("manufacturer"),
+        product.get("product_code"),
+        product.get("serial_number"),
+        name or None,
+        product.get("manufacture_week"),
+        product.get("manufacture_year"),
+        decode_version(edid_data),
+        display.get("max_h_size_cm"),
+        display.get("max_v_size_cm"),
+        preferred["width"] if preferred else None,
+        preferred["height"] if preferred else None,
+        preferred["refresh_hz"] if preferred else None,
+        int(has_hdr(edid_data)),
+        edid_data[126],
+        sqlite3.Binary(edid_data),
+    ), [
+        (
+            digest,
+            mode["width"],
+            mode["height"],
+            mode["refresh_hz"],
+            int(mode["interlaced"]),
+            mode["source"],
+            mode["pixel_clock_hz"],
+        )
+        for mode in modes
+    ]
+
+
+def ingest(
+    conn: sqlite3.Connection,
+    edids: Iterable[Tuple[str, bytes]],
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """
+    Add EDIDs to the index.
+
+    EDIDs whose content hash is already indexed are not decoded again;
+    only their source label is recorded. EDIDs that are too short, fail
+    structure validation (header, checksums, extension count) or cannot be
+    decoded are left out and reported.
+
+    Args:
+        conn: Index connection (from open_index)
+        edids: Iterable of (label, edid_data)
+        verbose: Print each ingested source
+
+    Returns:
+        Dictionary with added, known, too_short and invalid counts and
+        problems (a "<label>: <reason>" message per EDID left out)
+    """
+    known = {row[0] for row in conn.execute("SELECT hash FROM edids")}
+    result: Dict[str, Any] = {
+        "added": 0,
+        "known": 0,
+        "too_short": 0,
+        "invalid": 0,
+        "problems": [],
+    }
+
+    def reject(label: str, kind: str, reason: str) -> None:
+        result[kind] += 1
+        result["problems"].append(f"{label}: {reason}")
+        if verbose:
+            print(f"  {label}: skipped ({reason})")
+
+    with conn:
+        for label, edid_data in edids:
+            if len(edid_data) < 128:
+                reject(label, "too_short", f"too short ({len(edid_data)} bytes)")
+                continue
+            valid, message = validate_structure(edid_data)
+            if not valid:
+                reject(label, "invalid", message)
+                continue
+
+            digest = edid_hash(edid_data)
+            if digest in known:
+                result["known"] += 1
+            else:
+                try:
+                    edid_row, mode_rows = _edid_row(digest, edid_data)
+                except Exception as e:
+                    reject(label, "invalid", f"cannot be decoded ({e})")
+                    continue
+                conn.execute(
+                    f"INSERT INTO edids VALUES ({', '.join('?' * len(edid_row))})",
+                    edid_row,
+                )
+                conn.executemany(
+                    "INSERT INTO modes VALUES (?, ?, ?, ?, ?, ?, ?)", mode_rows
+                )
+                known.add(digest)
+                result["added"] += 1
+                if verbose:
+                    print(f"  {label}: indexed {digest[:12]}")
+
+            conn.execute(
+                "INSERT OR REPLACE INTO sources (label, hash) VALUES (?, ?)",
+                (label, digest),
+            )
+
+    return result
+
+
+def query_index(
+    conn: sqlite3.Connection,
+    manufacturer: Optional[str] = None,
+    product_code: Optional[int] = None,
+    year: Optional[int] = None,
+    hdr: Optional[bool] = None,
+    mode: Optional[Tuple[int, int, Optional[float], bool]] = None,
+    name: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Query indexed EDIDs.
+
+    All filters are optional and combined with AND.
+
+    Args:
+        conn: Index connection (from open_index)
+        manufacturer: 3-letter PNP manufacturer ID (e.g. "DEL")
+        product_code: Product code
+        year: Manufacture year
+        hdr: Require (True) or exclude (False) HDR support
+        mode: (width, height, refresh_hz or None, interlaced) that must be
+            supported, as returned by parse_mode_spec
+        name: Substring of the display name (case-insensitive)
+
+    Returns:
+        List of row dictionaries (without raw data), with a "sources" list
+    """
+    clauses = []
+    params: List[Any] = []
+
+    if manufacturer:
+        clauses.append("e.manufacturer = ?")
+        params.append(manufacturer.upper())
+    if product_code is not None:
+        clauses.append("e.product_code = ?")
+        params.append(product_code)
+    if year is not None:
+        clauses.append("e.year = ?")
+        params.append(year)
+    if hdr is not None:
+        clauses.append("e.hdr = ?")
+        params.append(int(hdr))
+    if name:
+        clauses.append("e.name LIKE ?")
+        params.append(f"%{name}%")
+    if mode:
+        width, height, refresh, interlaced = mode
+        mode_clause = (
+            "m.hash = e.hash AND m.width = ? AND m.height = ? AND m.interlaced = ?"
+        )
+        params.extend([width, height, int(interlaced)])
+        if refresh is not None:
+            mode_clause += " AND m.refresh BETWEEN ? AND ?"
+            params.extend([refresh - 0.5, refresh + 0.5])
+        clauses.append(f"EXISTS (SELECT 1 FROM modes m WHERE {mode_clause})")
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = conn.execute(
+        f"""
+        SELECT e.*, group_concat(s.label, '\n') AS source_labels
+        FROM edids e LEFT JOIN sources s ON s.hash = e.hash
+        {where}
+        GROUP BY e.hash
+        ORDER BY e.manufacturer, e.product_code, e.year
+        """,
+        params,
+    ).fetchall()
+
+    results = []
+    for row in rows:
+        result = {key: row[key] for key in row.keys() if key not in ("data",)}
+        labels = result.pop("source_labels")
+        result["sources"] = labels.split("\n") if labels else []
+        results.append(result)
+    return results
@@ -0,0 +1,139 @@
+"""Write journal for resumable EDID writes.
+
+write_edid keeps one append-only journal per bus in ~/.edid-journal/. The
+first line records the target EDID hash, the hash of the original device
+contents (the pre-write backup) and the page layout; each following line
+marks a page whose write cycle completed. The journal is deleted once the
+write is verified, so a journal left behind means the write was interrupted.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+JOURNAL_VERSION = 1
+
+
+def content_hash(data: bytes) -> str:
+    """Hex SHA-256 digest used to identify EDID contents."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def journal_path(bus_num: int) -> Path:
+    """Journal file for a bus."""
+    return Path.home() / ".edid-journal" / f"bus{bus_num}.jsonl"
+
+
+class WriteJournal:
+    """
+    Journal of one in-progress EDID write.
+
+    Args:
+        path: Journal file
+        header: Header record (target, device, size, page_size, backup)
+        completed: Page numbers already written
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any], completed: Set[int]):
+        self.path = path
+        self.header = header
+        self.completed = completed
+
+    @property
+    def target(self) -> str:
+        return self.header["target"]
+
+    @property
+    def device(self) -> str:
+        return self.header["device"]
+
+    @property
+    def size(self) -> int:
+        return self.header["size"]
+
+    @property
+    def page_size(self) -> int:
+        return self.header["page_size"]
+
+    @property
+    def backup_path(self) -> Path:
+        return Path(self.header["backup"])
+
+    def record_page(self, page_num: int) -> None:
+        """Mark a page as written (after its write cycle completed)."""
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"page": page_num}) + "\n")
+        self.completed.add(page_num)
+
+    def finish(self) -> None:
+        """Remove the journal after a verified write."""
+        self.path.unlink(missing_ok=True)
+
+
+def start_journal(
+    bus_num: int,
+    target: bytes,
+    device: bytes,
+    page_size: int,
+    backup_path: Path,
+) -> WriteJournal:
+    """
+    Create a journal for a new write, replacing any previous one.
+
+    Args:
+        bus_num: I2C bus number
+        target: EDID being written
+        device: Original device contents (as backed up)
+        page_size: Page size used for the write
+        backup_path: Backup of the original device contents
+
+    Returns:
+        New journal with no completed pages
+    """
+    path = journal_path(bus_num)
+    path.parent.mkdir(exist_ok=True)
+    header = {
+        "version": JOURNAL_VERSION,
+        "target": content_hash(target),
+        "device": content_hash(device),
+        "size": len(target),
+        "page_size": page_size,
+        "backup": str(backup_path),
+    }
+    path.write_text(json.dumps(header) + "\n")
+    return WriteJournal(path, header, set())
+
+
+def load_journal(bus_num: int) -> Optional[WriteJournal]:
+    """
+    Load the journal of an interrupted write on a bus.
+
+    A truncated last line (process killed mid-append) is ignored.
+
+    Args:
+        bus_num: I2C bus number
+
+    Returns:
+        The journal, or None if there is no usable journal
+    """
+    path = journal_path(bus_num)
+    try:
+        lines = path.read_text().splitlines()
+    except FileNotFoundError:
+        return None
+
+    try:
+        header = json.loads(lines[0])
+    except (IndexError, ValueError):
+        return None
+    if header.get("version") != JOURNAL_VERSION:
+        return None
+
+    completed = set()
+    for line in lines[1:]:
+        try:
+            completed.add(json.loads(line)["page"])
+        except (ValueError, KeyError, TypeError):
+            break
+    return WriteJournal(path, header, completed)
@@ -0,0 +1,569 @@
+"""EDID conformance linting.
+
+validate_structure answers "is this EDID usable" and stops at the first
+problem. The linter instead runs every registered rule over a single parse
+of the EDID and reports all findings, so a QA run over a shipment of panels
+shows everything that is wrong with each EDID at once.
+
+Rules are plain functions registered with the ``rule`` decorator. They
+receive a LintContext (the EDID parsed once) and yield
+``(severity, offset, message)`` tuples; the engine adds the rule ID.
+"""
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .parser import (
+    DESCRIPTOR_OFFSETS,
+    DESCRIPTOR_SIZE,
+    decode_cea861_block,
+    decode_detailed_timing,
+    decode_range_limits,
+)
+from .profiling import profiled
+from .validator import EDID_HEADER, validate_checksum
+
+# Severities, most severe first
+ERROR = "error"
+WARNING = "warning"
+INFO = "info"
+SEVERITIES = (ERROR, WARNING, INFO)
+
+# Display descriptor tags that may appear only once
+UNIQUE_DESCRIPTORS = {0xFC: "display name", 0xFD: "range limits", 0xFF: "serial"}
+
+# Lowest pixel clock of any real display mode (VGA 640x480 is 25.175 MHz)
+MIN_PLAUSIBLE_PIXEL_CLOCK_HZ = 10_000_000
+
+# Entries per worker task when linting a corpus in parallel; at most one
+# task per worker is in flight, so a large corpus is not read into memory
+# ahead of the results
+CORPUS_CHUNK_SIZE = 64
+
+Finding = Dict[str, Any]
+RuleResult = Iterator[Tuple[str, Optional[int], str]]
+
+
+class LintContext:
+    """
+    An EDID parsed once for all rules.
+
+    Only ``data`` and ``complete`` are set when the EDID is shorter than a
+    base block.
+
+    Attributes:
+        data: Raw EDID bytes
+        complete: True if a complete base block is present
+        version: (version, revision) tuple from bytes 18-19
+        descriptors: (offset, tag, descriptor) for the four base block
+            descriptors; tag is None for detailed timings
+        timings: (offset, timing) for every detailed timing in the base
+            block and CEA-861 extensions, offsets absolute
+        range_limits: (offset, decoded limits) of the first range limits
+            descriptor, or None
+        extensions: (offset, block) for every extension block present
+    """
+
+    def __init__(self, data: bytes):
+        self.data = bytes(data)
+        self.complete = len(self.data) >= 128
+        if not self.complete:
+            return
+
+        self.version = (self.data[18], self.data[19])
+        self.descriptors: List[Tuple[int, Optional[int], bytes]] = []
+        self.timings: List[Tuple[int, Dict[str, Any]]] = []
+        self.range_limits: Optional[Tuple[int, Dict[str, Any]]] = None
+        self.extensions: List[Tuple[int, bytes]] = []
+
+        for offset in DESCRIPTOR_OFFSETS:
+            descriptor = self.data[offset : offset + DESCRIPTOR_SIZE]
+            if descriptor[0] or descriptor[1]:
+                self.descriptors.append((offset, None, descriptor))
+                self.timings.append((offset, decode_detailed_timing(descriptor)))
+                continue
+            self.descriptors.append((offset, descriptor[3], descriptor))
+            if descriptor[3] == 0xFD and self.range_limits is None:
+                self.range_limits = (offset, decode_range_limits(descriptor))
+
+        for offset in range(128, len(self.data) - 127, 128):
+            block = self.data[offset : offset + 128]
+            self.extensions.append((offset, block))
+            if block[0] == 0x02:
+                for timing in decode_cea861_block(block).get("detailed_timings", []):
+                    self.timings.append((offset + timing["offset"], timing))
+
+    @property
+    def is_14(self) -> bool:
+        """True for EDID 1.4 and later."""
+        return self.version >= (1, 4)
+
+
+# Registered rules: dictionaries with id, severity, description, func
+RULES: List[Dict[str, Any]] = []
+
+
+def rule(
+    rule_id: str, severity: str, description: str, needs_base: bool = True
+) -> Callable:
+    """
+    Decorator registering a lint rule.
+
+    Args:
+        rule_id: Dotted rule identifier, e.g. "dtd.blanking"
+        severity: Default severity, shown in rule listings
+        description: One-line description of what the rule checks
+        needs_base: Skip the rule unless a complete base block is present
+
+    Returns:
+        Decorator that registers ``func(ctx) -> iterator of findings``
+    """
+
+    def decorator(func: Callable[[LintContext], RuleResult]) -> Callable:
+        RULES.append(
+            {
+                "id": rule_id,
+                "severity": severity,
+                "description": description,
+                "needs_base": needs_base,
+                "func": func,
+            }
+        )
+        return func
+
+    return decorator
+
+
+# Structure
+
+
+@rule("structure.size", ERROR, "Size is a non-zero multiple of 128", False)
+def check_size(ctx: LintContext) -> RuleResult:
+    if len(ctx.data) < 128:
+        yield ERROR, None, f"EDID is {len(ctx.data)} bytes (minimum 128)"
+    elif len(ctx.data) % 128:
+        yield ERROR, None, f"EDID size {len(ctx.data)} is not a multiple of 128"
+
+
+@rule("structure.header", ERROR, "Fixed header 00 FF FF FF FF FF FF 00")
+def check_header(ctx: LintContext) -> RuleResult:
+    if ctx.data[:8] != EDID_HEADER:
+        yield ERROR, 0, f"Invalid header {ctx.data[:8].hex(' ').upper()}"
+
+
+@rule("structure.checksum", ERROR, "Every block sums to zero modulo 256")
+def check_checksums(ctx: LintContext) -> RuleResult:
+    for offset in range(0, len(ctx.data) - 127, 128):
+        if not validate_checksum(ctx.data[offset : offset + 128]):
+            block = "base block" if offset == 0 else f"extension {offset // 128}"
+            yield ERROR, offset + 127, f"Invalid checksum in {block}"
+
+
+@rule("structure.extension-count", ERROR, "Byte 126 matches the blocks present")
+def check_extension_count(ctx: LintContext) -> RuleResult:
+    present = len(ctx.data) // 128 - 1
+    if ctx.data[126] != present:
+        yield ERROR, 126, (
+            f"Byte 126 declares {ctx.data[126]} extension(s), {present} present"
+        )
+
+
+# Version-specific fields
+
+
+@rule("version.supported", ERROR, "EDID version 1.3 or 1.4")
+def check_version(ctx: LintContext) -> RuleResult:
+    version, revision = ctx.version
+    if version != 1 or revision > 4:
+        yield ERROR, 18, f"Unknown EDID version {version}.{revision}"
+    elif revision < 3:
+        yield WARNING, 18, f"EDID {version}.{revision} is obsolete (use 1.3 or 1.4)"
+
+
+@rule("version.manufacture-date", ERROR, "Week and year in the allowed ranges")
+def check_manufacture_date(ctx: LintContext) -> RuleResult:
+    week, year_byte = ctx.data[16], ctx.data[17]
+    year = 1990 + year_byte
+    model_year = week == 0xFF
+
+    if model_year and not ctx.is_14:
+        yield ERROR, 16, "Week 0xFF (model year) requires EDID 1.4"
+    elif not model_year and week > 54:
+        yield ERROR, 16, f"Manufacture week {week} out of range (0-54)"
+
+    if ctx.is_14 and year_byte < 0x10:
+        yield ERROR, 17, f"Year {year} before 2006 is invalid in EDID 1.4"
+    if year > date.today().year + 1:
+        yield WARNING, 17, f"Year {year} is in the future"
+
+
+@rule("version.display-params", WARNING, "Basic display parameters are consistent")
+def check_display_params(ctx: LintContext) -> RuleResult:
+    video_input = ctx.data[20]
+    if ctx.is_14 and video_input & 0x80:
+        if (video_input >> 4) & 0x07 == 0x07:
+            yield ERROR, 20, "Reserved digital color depth 0b111"
+        if video_input & 0x0F > 0x05:
+            yield ERROR, 20, f"Reserved digital interface type {video_input & 0x0F}"
+    # A single non-zero dimension encodes an aspect ratio, new in EDID 1.4
+    if bool(ctx.data[21]) != bool(ctx.data[22]) and not ctx.is_14:
+        yield WARNING, 21, (
+            f"Screen size {ctx.data[21]}x{ctx.data[22]} cm has only one dimension"
+        )
+
+
+# Descriptors
+
+
+@rule("descriptor.preferred", ERROR, "First descriptor is the preferred timing")
+def check_preferred_timing(ctx: LintContext) -> RuleResult:
+    if ctx.descriptors[0][1] is not None:
+        yield ERROR, DESCRIPTOR_OFFSETS[0], (
+            "First descriptor is not a detailed timing (preferred timing missing)"
+        )
+
+
+@rule("descriptor.ordering", WARNING, "Detailed timings precede display descriptors")
+def check_descriptor_ordering(ctx: LintContext) -> RuleResult:
+    seen_display = False
+    for offset, tag, _ in ctx.descriptors:
+        if tag is not None:
+            seen_display = True
+        elif seen_display:
+            yield WARNING, offset, "Detailed timing after a display descriptor"
+
+
+@rule("descriptor.header", WARNING, "Display descriptor reserved bytes are zero")
+def check_descriptor_headers(ctx: LintContext) -> RuleResult:
+    for offset, tag, descriptor in ctx.descriptors:
+        if tag is None:
+            continue
+        if descriptor[2]:
+            yield WARNING, offset + 2, f"Descriptor 0x{tag:02X}: byte 2 must be 0"
+        if descriptor[4] and not (tag == 0xFD and ctx.is_14):
+            yield WARNING, offset + 4, f"Descriptor 0x{tag:02X}: byte 4 must be 0"
+
+
+@rule("descriptor.duplicate", WARNING, "Name, range limits and serial appear once")
+def check_duplicate_descriptors(ctx: LintContext) -> RuleResult:
+    seen: Dict[int, int] = {}
+    for offset, tag, _ in ctx.descriptors:
+        if tag in UNIQUE_DESCRIPTORS:
+            if tag in seen:
+                yield WARNING, offset, (
+                    f"Duplicate {UNIQUE_DESCRIPTORS[tag]} descriptor "
+                    f"(first at 0x{seen[tag]:02X})"
+                )
+            else:
+                seen[tag] = offset
+
+
+@rule("descriptor.required", ERROR, "Version-mandated descriptors are present")
+def check_required_descriptors(ctx: LintContext) -> RuleResult:
+    tags = {tag for _, tag, _ in ctx.descriptors}
+    continuous = bool(ctx.data[24] & 0x01)
+
+    if ctx.version == (1, 3):
+        if 0xFC not in tags:
+            yield ERROR, None, "EDID 1.3 requires a display name descriptor"
+        if 0xFD not in tags:
+            yield ERROR, None, "EDID 1.3 requires a range limits descriptor"
+    elif ctx.is_14 and continuous and 0xFD not in tags:
+        yield ERROR, 24, (
+            "Continuous frequency flag set without a range limits descriptor"
+        )
+
+
+# Detailed timings
+
+
+@rule("dtd.active", ERROR, "Detailed timings have a non-zero active area")
+def check_dtd_active(ctx: LintContext) -> RuleResult:
+    for offset, timing in ctx.timings:
+        if not timing["h_active"] or not timing["v_active"]:
+            yield ERROR, offset, (
+                f"Active area {timing['h_active']}x{timing['v_active']} is empty"
+            )
+
+
+@rule("dtd.blanking", ERROR, "Sync pulses fit inside the blanking interval")
+def check_dtd_blanking(ctx: LintContext) -> RuleResult:
+    for offset, timing in ctx.timings:
+        for axis, unit in (("h", "pixel"), ("v", "line")):
+            sync_end = timing[f"{axis}_sync_offset"] + timing[f"{axis}_sync_width"]
+            blank = timing[f"{axis}_blank"]
+            if sync_end > blank:
+                yield ERROR, offset, (
+                    f"{axis.upper()} sync ends at {sync_end}, past the "
+                    f"{blank}-{unit} blanking interval"
+                )
+            if not timing[f"{axis}_sync_width"]:
+                yield WARNING, offset, f"{axis.upper()} sync width is zero"
+
+
+@rule("dtd.pixel-clock", WARNING, "Pixel clock is plausible for the timing")
+def check_dtd_pixel_clock(ctx: LintContext) -> RuleResult:
+    for offset, timing in ctx.timings:
+        clock = timing["pixel_clock_hz"]
+        if clock < MIN_PLAUSIBLE_PIXEL_CLOCK_HZ:
+            yield WARNING, offset, f"Pixel clock {clock / 1e6:.2f} MHz is implausibly low"
+            continue
+        refresh = _refresh_hz(timing)
+        if refresh is not None and not 23 <= refresh <= 500:
+            yield WARNING, offset, f"{_timing_name(timing)} refreshes at {refresh:.2f} Hz"
+
+
+@rule("dtd.image-size", INFO, "Image size agrees with the screen size")
+def check_dtd_image_size(ctx: LintContext) -> RuleResult:
+    width_cm, height_cm = ctx.data[21], ctx.data[22]
+    if not width_cm or not height_cm:
+        return
+    for offset, timing in ctx.timings:
+        if offset >= 128:
+            continue
+        width_mm, height_mm = timing["h_image_mm"], timing["v_image_mm"]
+        # Screen size is rounded to centimetres
+        if width_mm > width_cm * 10 + 10 or height_mm > height_cm * 10 + 10:
+            yield INFO, offset + 12, (
+                f"Image size {width_mm}x{height_mm} mm exceeds the "
+                f"{width_cm}x{height_cm} cm screen"
+            )
+
+
+# Range limits
+
+
+@rule("range.order", ERROR, "Range limit minimums do not exceed maximums")
+def check_range_order(ctx: LintContext) -> RuleResult:
+    if ctx.range_limits is None:
+        return
+    offset, limits = ctx.range_limits
+    if limits["min_v_hz"] > limits["max_v_hz"]:
+        yield ERROR, offset + 5, (
+            f"Vertical range {limits['min_v_hz']}-{limits['max_v_hz']} Hz is inverted"
+        )
+    if limits["min_h_khz"] > limits["max_h_khz"]:
+        yield ERROR, offset + 7, (
+            f"Horizontal range {limits['min_h_khz']}-{limits['max_h_khz']} kHz "
+            "is inverted"
+        )
+    if not limits["max_v_hz"] or not limits["max_h_khz"]:
+        yield ERROR, offset + 5, "Range limits have a zero maximum rate"
+    if ctx.data[offset + 4] & 0x01 and not ctx.data[offset + 4] & 0x02:
+        yield ERROR, offset + 4, "Minimum vertical offset set without maximum"
+    if ctx.data[offset + 4] & 0x04 and not ctx.data[offset + 4] & 0x08:
+        yield ERROR, offset + 4, "Minimum horizontal offset set without maximum"
+
+
+@rule("range.timings", WARNING, "Detailed timings lie within the range limits")
+def check_range_timings(ctx: LintContext) -> RuleResult:
+    if ctx.range_limits is None:
+        return
+    _, limits = ctx.range_limits
+    max_clock_hz = limits["max_pixel_clock_mhz"] * 1_000_000
+
+    for offset, timing in ctx.timings:
+        name = _timing_name(timing)
+        refresh = _refresh_hz(timing)
+        if refresh is None:
+            continue
+        h_khz = timing["pixel_clock_hz"] / timing["h_total"] / 1000
+
+        if not limits["min_v_hz"] - 0.5 <= refresh <= limits["max_v_hz"] + 0.5:
+            yield WARNING, offset, (
+                f"{name} at {refresh:.2f} Hz is outside the "
+                f"{limits['min_v_hz']}-{limits['max_v_hz']} Hz range"
+            )
+        if not limits["min_h_khz"] - 0.5 <= h_khz <= limits["max_h_khz"] + 0.5:
+            yield WARNING, offset, (
+                f"{name} horizontal rate {h_khz:.2f} kHz is outside the "
+                f"{limits['min_h_khz']}-{limits['max_h_khz']} kHz range"
+            )
+        if max_clock_hz and timing["pixel_clock_hz"] > max_clock_hz:
+            yield WARNING, offset, (
+                f"{name} pixel clock {timing['pixel_clock_hz'] / 1e6:.2f} MHz "
+                f"exceeds the {limits['max_pixel_clock_mhz']} MHz limit"
+            )
+
+
+# CEA-861 extensions
+
+
+@rule("cea.revision", WARNING, "CEA-861 extension revision is 1-3")
+def check_cea_revision(ctx: LintContext) -> RuleResult:
+    for offset, block in _cea_blocks(ctx):
+        if not 1 <= block[1] <= 3:
+            yield WARNING, offset + 1, f"Unknown CEA-861 revision {block[1]}"
+
+
+@rule("cea.bounds", ERROR, "CEA-861 data blocks and timings stay in bounds")
+def check_cea_bounds(ctx: LintContext) -> RuleResult:
+    for offset, block in _cea_blocks(ctx):
+        dtd_offset = block[2]
+        if dtd_offset == 0:
+            continue
+        if dtd_offset < 4:
+            yield ERROR, offset + 2, f"DTD offset {dtd_offset} points into the header"
+            continue
+
+        if dtd_offset > 127:
+            yield ERROR, offset + 2, f"DTD offset {dtd_offset} is past the checksum"
+            continue
+
+        # The data block collection must end exactly at the DTD offset
+        position = 4
+        while position < dtd_offset:
+            length = block[position] & 0x1F
+            end = position + 1 + length
+            if end > dtd_offset:
+                yield ERROR, offset + position, (
+                    f"Data block at byte {position} ({length} bytes) runs past "
+                    f"the DTD offset {dtd_offset}"
+                )
+                break
+            position = end
+
+        # After the last DTD only zero padding may precede the checksum
+        position = dtd_offset
+        while position + DESCRIPTOR_SIZE <= 127 and any(block[position : position + 2]):
+            position += DESCRIPTOR_SIZE
+        if any(block[position:127]):
+            yield WARNING, offset + position, (
+                f"Non-zero padding after the last DTD (bytes {position}-126)"
+            )
+
+
+def _cea_blocks(ctx: LintContext) -> Iterator[Tuple[int, bytes]]:
+    return ((offset, block) for offset, block in ctx.extensions if block[0] == 0x02)
+
+
+def _refresh_hz(timing: Dict[str, Any]) -> Optional[float]:
+    # Interlaced DTDs describe one field, so this is the field rate, which is
+    # also what range limits are given in
+    total = timing["h_total"] * timing["v_total"]
+    if not total:
+        return None
+    return timing["pixel_clock_hz"] / total
+
+
+def _timing_name(timing: Dict[str, Any]) -> str:
+    """WIDTHxHEIGHT of a DTD, with the frame height and "i" if interlaced."""
+    if timing["interlaced"]:
+        return f"{timing['h_active']}x{timing['v_active'] * 2}i"
+    return f"{timing['h_active']}x{timing['v_active']}"
+
+
+@profiled("lint.lint_edid")
+def lint_edid(edid_data: bytes) -> List[Finding]:
+    """
+    Run every registered rule over an EDID.
+
+    Args:
+        edid_data: Complete EDID data
+
+    Returns:
+        List of findings (rule, severity, offset, message), ordered by
+        severity, then offset; offset is None for findings that do not
+        concern a single byte
+    """
+    ctx = LintContext(edid_data)
+    findings: List[Finding] = []
+
+    for entry in RULES:
+        if entry["needs_base"] and not ctx.complete:
+            continue
+        try:
+            results = list(entry["func"](ctx))
+        except (IndexError, KeyError, ValueError, ZeroDivisionError) as e:
+            results = [(ERROR, None, f"Rule failed on malformed data: {e}")]
+        for severity, offset, message in results:
+            findings.append(
+                {
+                    "rule": entry["id"],
+                    "severity": severity,
+                    "offset": offset,
+                    "message": message,
+                }
+            )
+
+    findings.sort(
+        key=lambda f: (SEVERITIES.index(f["severity"]), f["offset"] or 0, f["rule"])
+    )
+    return findings
+
+
+def _lint_entry(entry: Tuple[str, bytes]) -> Tuple[str, List[Finding]]:
+    label, edid_data = entry
+    return label, lint_edid(edid_data)
+
+
+def _lint_chunk(chunk: List[Tuple[str, bytes]]) -> List[Tuple[str, List[Finding]]]:
+    return [_lint_entry(entry) for entry in chunk]
+
+
+def lint_corpus(
+    entries: Iterable[Tuple[str, bytes]], workers: Optional[int] = None
+) -> Iterator[Tuple[str, List[Finding]]]:
+    """
+    Lint many EDIDs, in parallel across processes.
+
+    Results are yielded in input order as they complete. Entries are
+    consumed lazily: at most ``workers * CORPUS_CHUNK_SIZE`` of them are
+    submitted but not yet yielded at any time.
+
+    Args:
+        entries: (label, edid_data) tuples, e.g. from iter_edid_files
+        workers: Worker processes (None uses one per CPU, 1 lints in this
+            process)
+
+    Yields:
+        (label, findings) tuples
+    """
+    if workers == 1:
+        for entry in entries:
+            yield _lint_entry(entry)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    entries = iter(entries)
+    chunks = iter(lambda: list(itertools.islice(entries, CORPUS_CHUNK_SIZE)), [])
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque(
+            executor.submit(_lint_chunk, chunk)
+            for chunk in itertools.islice(chunks, workers)
+        )
+        while pending:
+            results = pending.popleft().result()
+            for chunk in itertools.islice(chunks, 1):
+                pending.append(executor.submit(_lint_chunk, chunk))
+            yield from results
+
+
+def count_findings(findings: List[Finding]) -> Dict[str, int]:
+    """Number of findings per severity."""
+    counts = {severity: 0 for severity in SEVERITIES}
+    for finding in findings:
+        counts[finding["severity"]] += 1
+    return counts
+
+
+def format_finding(finding: Finding) -> str:
+    """
+    Format a finding as one line of text.
+
+    Args:
+        finding: Finding from lint_edid
+
+    Returns:
+        "severity  0xOOO  rule: message" line
+    """
+    offset = "-" if finding["offset"] is None else f"0x{finding['offset']:03X}"
+    return (
+        f"{finding['severity']:<7}  {offset:>5}  {finding['rule']}: "
+        f"{finding['message']}"
+    )
@@ -0,0 +1,244 @@
+"""Per-bus advisory locking for multi-process I2C access.
+
+Every bus has a lock file in the system temp directory. Reads take a shared
+``flock`` and writes and write tests take an exclusive one, so different
+buses run fully in parallel and readers of the same bus never block each
+other, while a write excludes everything else on its bus.
+
+Within one process the lock is reentrant (write_edid reads a backup while
+holding the exclusive lock), and threads using the same bus are serialized.
+On platforms without fcntl, locking degrades to the in-process part only.
+"""
+
+import functools
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .profiling import phase
+
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+# Seconds to wait for a bus lock before giving up (None waits forever)
+DEFAULT_LOCK_TIMEOUT: Optional[float] = 30.0
+
+# Polling interval bounds while waiting for a contended lock
+LOCK_POLL_MIN = 0.001
+LOCK_POLL_MAX = 0.05
+
+_lock_timeout = DEFAULT_LOCK_TIMEOUT
+_registry_lock = threading.Lock()
+_bus_locks: Dict[int, "BusLock"] = {}
+
+
+def lock_dir() -> Path:
+    """Directory holding the per-bus lock files."""
+    return Path(tempfile.gettempdir()) / "edid-locks"
+
+
+class BusLock:
+    """
+    Reentrant shared/exclusive lock for one bus.
+
+    Args:
+        bus_num: I2C bus number
+    """
+
+    def __init__(self, bus_num: int):
+        self.bus_num = bus_num
+        self.path = lock_dir() / f"i2c-{bus_num}.lock"
+        self._mutex = threading.RLock()
+        self._fd: Optional[int] = None
+        self._depth = 0
+        self._exclusive = False
+
+        # Statistics
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+    def _open(self) -> int:
+        directory = self.path.parent
+        if not directory.is_dir():
+            directory.mkdir(exist_ok=True)
+            # Shared between users, like /tmp
+            try:
+                directory.chmod(0o1777)
+            except OSError:
+                pass
+        # flock works on read-only descriptors, so lock files created by
+        # another user can still be locked
+        return os.open(str(self.path), os.O_RDONLY | os.O_CREAT, 0o644)
+
+    def _flock(self, exclusive: bool, deadline: Optional[float]) -> bool:
+        """Take the file lock; returns True if it had to wait."""
+        if not FCNTL_AVAILABLE:
+            return False
+        operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        interval = LOCK_POLL_MIN
+        waited = False
+        while True:
+            try:
+                fcntl.flock(self._fd, operation | fcntl.LOCK_NB)
+                return waited
+            except BlockingIOError:
+                waited = True
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+                time.sleep(interval)
+                interval = min(interval * 2, LOCK_POLL_MAX)
+
+    def acquire(self, exclusive: bool, timeout: Optional[float] = None) -> None:
+        """
+        Acquire the lock.
+
+        Args:
+            exclusive: Exclusive (write) instead of shared (read) access
+            timeout: Seconds to wait, or None to wait forever
+
+        Raises:
+            TimeoutError: If the lock is not acquired in time
+        """
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        mode = "exclusive" if exclusive else "shared"
+
+        with phase(f"lock.{mode}"):
+            waited = not self._mutex.acquire(blocking=False)
+            if waited and not self._mutex.acquire(
+                timeout=-1 if timeout is None else timeout
+            ):
+                raise TimeoutError(
+                    f"Timed out after {timeout}s waiting for bus {self.bus_num} "
+                    "(in use by another thread)"
+                )
+            try:
+                if self._depth == 0:
+                    self._fd = self._open()
+                    waited = self._flock(exclusive, deadline) or waited
+                    self._exclusive = exclusive
+                elif exclusive and not self._exclusive:
+                    # Upgrade a shared lock held by this thread (not atomic:
+                    # another process may take the lock in between)
+                    waited = self._flock(True, deadline) or waited
+                    self._exclusive = True
+            except BlockingIOError:
+                if self._depth == 0:
+                    os.close(self._fd)
+                    self._fd = None
+                self._mutex.release()
+                raise TimeoutError(
+                    f"Timed out after {timeout}s waiting for {mode} lock on bus "
+                    f"{self.bus_num} (in use by another process)"
+                ) from None
+            except BaseException:
+                self._mutex.release()
+                raise
+
+        self._depth += 1
+        wait = time.monotonic() - start
+        self.acquisitions += 1
+        if waited:
+            self.contended += 1
+        self.wait_time += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def release(self) -> None:
+        """Release one level of the lock."""
+        self._depth -= 1
+        if self._depth == 0:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+            self._exclusive = False
+        self._mutex.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Lock-wait statistics."""
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "wait_time": self.wait_time,
+            "max_wait": self.max_wait,
+        }
+
+
+def get_bus_lock(bus_num: int) -> BusLock:
+    """Return the process-wide lock object for a bus."""
+    with _registry_lock:
+        lock = _bus_locks.get(bus_num)
+        if lock is None:
+            lock = _bus_locks[bus_num] = BusLock(bus_num)
+        return lock
+
+
+def set_lock_timeout(timeout: Optional[float]) -> None:
+    """
+    Set the default lock timeout.
+
+    Args:
+        timeout: Seconds, or None to wait forever
+    """
+    global _lock_timeout
+    _lock_timeout = timeout
+
+
+@contextmanager
+def bus_lock(
+    bus_num: int, exclusive: bool = False, timeout: Optional[float] = -1
+) -> Iterator[None]:
+    """
+    Hold the lock of a bus for the duration of a block.
+
+    Args:
+        bus_num: I2C bus number
+        exclusive: Exclusive (write) instead of shared (read) access
+        timeout: Seconds to wait; None waits forever, -1 uses the default
+            (see set_lock_timeout)
+
+    Raises:
+        TimeoutError: If the lock is not acquired in time
+    """
+    lock = get_bus_lock(bus_num)
+    lock.acquire(exclusive, _lock_timeout if timeout == -1 else timeout)
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def locks_bus(exclusive: bool = False) -> Callable[[Callable[..., Any]], Callable]:
+    """
+    Decorator holding the bus lock for a function's first argument (bus_num).
+
+    Args:
+        exclusive: Exclusive (write) instead of shared (read) access
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(bus_num: int, *args: Any, **kwargs: Any) -> Any:
+            with bus_lock(bus_num, exclusive):
+                return func(bus_num, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def lock_stats() -> Dict[int, Dict[str, Any]]:
+    """Lock-wait statistics for every bus locked by this process."""
+    with _registry_lock:
+        return {bus_num: lock.stats() for bus_num, lock in _bus_locks.items()}
@@ -0,0 +1,459 @@
+"""Video mode enumeration across all EDID timing sources."""
+
+import math
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .cea861 import VIC_TIMINGS
+from .parser import (
+    DESCRIPTOR_OFFSETS,
+    DESCRIPTOR_SIZE,
+    decode_detailed_timing,
+    decode_extensions,
+)
+from .displayid import displayid_timings
+
+
+# Established timings bitmap (bytes 35-37) as (mode, byte offset, bit), where
+# mode is (width, height, refresh_hz, interlaced, pixel_clock_khz)
+ESTABLISHED_TIMINGS = (
+    # Byte 35
+    ((720, 400, 70, False, 28322), 0x23, 7),
+    ((720, 400, 88, False, 35500), 0x23, 6),
+    ((640, 480, 60, False, 25175), 0x23, 5),
+    ((640, 480, 67, False, 30240), 0x23, 4),
+    ((640, 480, 72, False, 31500), 0x23, 3),
+    ((640, 480, 75, False, 31500), 0x23, 2),
+    ((800, 600, 56, False, 36000), 0x23, 1),
+    ((800, 600, 60, False, 40000), 0x23, 0),
+    # Byte 36
+    ((800, 600, 72, False, 50000), 0x24, 7),
+    ((800, 600, 75, False, 49500), 0x24, 6),
+    ((832, 624, 75, False, 57284), 0x24, 5),
+    ((1024, 768, 87, True, 44900), 0x24, 4),
+    ((1024, 768, 60, False, 65000), 0x24, 3),
+    ((1024, 768, 70, False, 75000), 0x24, 2),
+    ((1024, 768, 75, False, 78750), 0x24, 1),
+    ((1280, 1024, 75, False, 135000), 0x24, 0),
+    # Byte 37
+    ((1152, 870, 75, False, 100000), 0x25, 7),
+)
+
+ESTABLISHED_OFFSET = 0x23
+
+
+def _build_established_table(byte_offset: int) -> Tuple[Tuple[Any, ...], ...]:
+    entries = [
+        (mode, bit)
+        for mode, offset, bit in ESTABLISHED_TIMINGS
+        if offset == byte_offset
+    ]
+    return tuple(
+        tuple(mode for mode, bit in entries if value >> bit & 1) for value in range(256)
+    )
+
+
+# For each of bytes 35-37: byte value -> tuple of modes whose bits are set
+ESTABLISHED_TABLES = tuple(
+    _build_established_table(ESTABLISHED_OFFSET + i) for i in range(3)
+)
+
+# VESA DMT pixel clocks: (width, height, refresh_hz) -> pixel_clock_khz
+DMT_TIMINGS = {
+    (640, 350, 85): 31500,
+    (640, 400, 85): 31500,
+    (720, 400, 85): 35500,
+    (640, 480, 60): 25175,
+    (640, 480, 72): 31500,
+    (640, 480, 75): 31500,
+    (640, 480, 85): 36000,
+    (800, 600, 56): 36000,
+    (800, 600, 60): 40000,
+    (800, 600, 72): 50000,
+    (800, 600, 75): 49500,
+    (800, 600, 85): 56250,
+    (848, 480, 60): 33750,
+    (1024, 768, 60): 65000,
+    (1024, 768, 70): 75000,
+    (1024, 768, 75): 78750,
+    (1024, 768, 85): 94500,
+    (1152, 864, 75): 108000,
+    (1280, 720, 60): 74250,
+    (1280, 768, 60): 79500,
+    (1280, 768, 75): 102250,
+    (1280, 768, 85): 117500,
+    (1280, 800, 60): 83500,
+    (1280, 800, 75): 106500,
+    (1280, 800, 85): 122500,
+    (1280, 960, 60): 108000,
+    (1280, 960, 85): 148500,
+    (1280, 1024, 60): 108000,
+    (1280, 1024, 75): 135000,
+    (1280, 1024, 85): 157500,
+    (1360, 768, 60): 85500,
+    (1366, 768, 60): 85500,
+    (1400, 1050, 60): 121750,
+    (1400, 1050, 75): 156000,
+    (1440, 900, 60): 106500,
+    (1440, 900, 75): 136750,
+    (1600, 900, 60): 108000,
+    (1600, 1200, 60): 162000,
+    (1600, 1200, 65): 175500,
+    (1600, 1200, 70): 189000,
+    (1600, 1200, 75): 202500,
+    (1600, 1200, 85): 229500,
+    (1680, 1050, 60): 146250,
+    (1680, 1050, 75): 187000,
+    (1792, 1344, 60): 204750,
+    (1792, 1344, 75): 261000,
+    (1856, 1392, 60): 218250,
+    (1856, 1392, 75): 288000,
+    (1920, 1080, 60): 148500,
+    (1920, 1200, 60): 193250,
+    (1920, 1200, 75): 245250,
+    (1920, 1440, 60): 234000,
+    (1920, 1440, 75): 297000,
+    (2048, 1152, 60): 162000,
+    (2560, 1600, 60): 348500,
+}
+
+# Standard timing aspect ratio codes (byte 2 bits 7-6) as (h, v) ratios;
+# code 0 is 16:10 from EDID 1.3 on and 1:1 before that
+STANDARD_ASPECTS = ((16, 10), (4, 3), (5, 4), (16, 9))
+
+# CVT vertical sync width by aspect ratio, keyed by the ratio in lowest
+# terms (16:10 is 8:5, 15:9 is 5:3)
+CVT_VSYNC_LINES = {(4, 3): 4, (16, 9): 5, (8, 5): 6, (5, 4): 7, (5, 3): 7}
+
+# Unused standard timing slot markers
+UNUSED_STANDARD_TIMINGS = {(0x01, 0x01), (0x00, 0x00), (0x20, 0x20)}
+
+STANDARD_TIMINGS_TAG = 0xFA
+
+MODE_SPEC_RE = re.compile(r"^(\d+)x(\d+)(?:@(\d+(?:\.\d+)?))?(i?)$")
+
+
+@lru_cache(maxsize=None)
+def cvt_rb_pixel_clock(width: int, height: int, refresh: int) -> int:
+    """
+    Pixel clock for a mode under CVT reduced blanking (v1).
+
+    Results are memoised, so each distinct mode is computed once per
+    process.
+
+    Args:
+        width: Horizontal active pixels
+        height: Vertical active lines
+        refresh: Refresh rate in Hz
+
+    Returns:
+        Pixel clock in Hz
+    """
+    divisor = math.gcd(width, height)
+    vsync = CVT_VSYNC_LINES.get((width // divisor, height // divisor), 10)
+    h_period_est = (1_000_000 / refresh - 460) / height
+    vbi_lines = max(int(460 / h_period_est) + 1, 3 + vsync + 6)
+    total_pixels = width + 160
+    clock_mhz = refresh * (height + vbi_lines) * total_pixels / 1_000_000
+    return int(clock_mhz // 0.25 * 250_000)
+
+
+def lookup_pixel_clock(width: int, height: int, refresh: int) -> int:
+    """
+    Pixel clock for a mode without a timing descriptor.
+
+    Uses the DMT table, falling back to CVT reduced blanking.
+
+    Args:
+        width: Horizontal active pixels
+        height: Vertical active lines
+        refresh: Refresh rate in Hz
+
+    Returns:
+        Pixel clock in Hz
+    """
+    clock_khz = DMT_TIMINGS.get((width, height, refresh))
+    if clock_khz is not None:
+        return clock_khz * 1000
+    return cvt_rb_pixel_clock(width, height, refresh)
+
+
+def _mode(
+    width: int,
+    height: int,
+    refresh: float,
+    interlaced: bool,
+    source: str,
+    pixel_clock_hz: Optional[int],
+) -> Dict[str, Any]:
+    return {
+        "width": width,
+        "height": height,
+        "refresh_hz": refresh,
+        "interlaced": interlaced,
+        "source": source,
+        "pixel_clock_hz": pixel_clock_hz,
+    }
+
+
+def _timing_mode(
+    timing: Dict[str, Any], source: str, per_field: bool = True
+) -> Optional[Dict[str, Any]]:
+    # EDID DTDs give interlaced vertical values per field (so the refresh
+    # below is the field rate); DisplayID timings give them per frame.
+    # Corrupt timings without blanking totals have no refresh rate.
+    total = timing["h_total"] * timing["v_total"]
+    if not total:
+        return None
+    refresh = timing["pixel_clock_hz"] / total
+    interlaced = timing.get("interlaced", False)
+    height = timing["v_active"]
+    if interlaced and per_field:
+        height *= 2
+    return _mode(
+        timing["h_active"],
+        height,
+        round(refresh, 2),
+        interlaced,
+        source,
+        timing["pixel_clock_hz"],
+    )
+
+
+def decode_standard_timing(
+    b1: int, b2: int, version_minor: int
+) -> Optional[Tuple[int, int, int]]:
+    """
+    Decode a 2-byte standard timing.
+
+    Args:
+        b1: First byte ((width / 8) - 31)
+        b2: Second byte (aspect bits 7-6, refresh - 60 bits 5-0)
+        version_minor: EDID minor version (aspect code 0 is 1:1 before 1.3)
+
+    Returns:
+        Tuple of (width, height, refresh_hz), or None for unused slots
+    """
+    if (b1, b2) in UNUSED_STANDARD_TIMINGS:
+        return None
+
+    width = (b1 + 31) * 8
+    aspect_code = b2 >> 6
+    if aspect_code == 0 and version_minor < 3:
+        h_ratio, v_ratio = 1, 1
+    else:
+        h_ratio, v_ratio = STANDARD_ASPECTS[aspect_code]
+    return width, width * v_ratio // h_ratio, (b2 & 0x3F) + 60
+
+
+def _standard_timing_bytes(edid_data: bytes) -> Iterator[Tuple[int, int]]:
+    for offset in range(38, 54, 2):
+        yield edid_data[offset], edid_data[offset + 1]
+
+    # Descriptor 0xFA carries six more standard timings
+    for desc_offset in DESCRIPTOR_OFFSETS:
+        descriptor = edid_data[desc_offset : desc_offset + DESCRIPTOR_SIZE]
+        if descriptor[0:2] == b"\x00\x00" and descriptor[3] == STANDARD_TIMINGS_TAG:
+            for offset in range(5, 17, 2):
+                yield descriptor[offset], descriptor[offset + 1]
+
+
+def list_modes(edid_data: bytes) -> List[Dict[str, Any]]:
+    """
+    List every video mode an EDID advertises.
+
+    Collects detailed timings, established timings (bytes 35-37), standard
+    timings (bytes 38-53 and 0xFA descriptors), CEA-861 SVDs and DTDs, and
+    DisplayID timings. Duplicate modes are reported once, from the first
+    source that lists them (detailed timings first, so the preferred mode
+    leads the list). Timings with zero totals have no refresh rate and are
+    left out.
+
+    Args:
+        edid_data: Complete EDID data
+
+    Returns:
+        List of mode dictionaries with width, height, refresh_hz,
+        interlaced, source and pixel_clock_hz
+    """
+    if len(edid_data) < 128:
+        return []
+
+    modes = []
+
+    for desc_offset in DESCRIPTOR_OFFSETS:
+        timing = decode_detailed_timing(
+            edid_data[desc_offset : desc_offset + DESCRIPTOR_SIZE]
+        )
+        if timing.get("type") == "timing":
+            modes.append(_timing_mode(timing, "detailed"))
+
+    for i, table in enumerate(ESTABLISHED_TABLES):
+        for width, height, refresh, interlaced, clock_khz in table[
+            edid_data[ESTABLISHED_OFFSET + i]
+        ]:
+            modes.append(
+                _mode(
+                    width, height, refresh, interlaced, "established", clock_khz * 1000
+                )
+            )
+
+    for b1, b2 in _standard_timing_bytes(edid_data):
+        standard = decode_standard_timing(b1, b2, edid_data[19])
+        if standard:
+            width, height, refresh = standard
+            modes.append(
+                _mode(
+                    width,
+                    height,
+                    refresh,
+                    False,
+                    "standard",
+                    lookup_pixel_clock(width, height, refresh),
+                )
+            )
+
+    for extension in decode_extensions(edid_data):
+        info = extension["info"]
+        if extension["tag"] == 0x02 and info:
+            for block in info["data_blocks"]:
+                for svd in block.get("svds", []):
+                    timing = VIC_TIMINGS.get(svd["vic"])
+                    if timing:
+                        width, height, refresh, interlaced, _, clock_khz = timing
+                        modes.append(
+                            _mode(
+                                width,
+                                height,
+                                refresh,
+                                interlaced,
+                                "cea-vic",
+                                clock_khz * 1000,
+                            )
+                        )
+            for timing in info["detailed_timings"]:
+                modes.append(_timing_mode(timing, "cea-dtd"))
+        elif extension["tag"] == 0x70 and info:
+            for timing in displayid_timings(info):
+                modes.append(_timing_mode(timing, "displayid", per_field=False))
+
+    unique = []
+    seen = set()
+    for mode in modes:
+        if mode is None:
+            continue
+        key = (
+            mode["width"],
+            mode["height"],
+            round(mode["refresh_hz"]),
+            mode["interlaced"],
+        )
+        if key not in seen:
+            seen.add(key)
+            unique.append(mode)
+    return unique
+
+
+def parse_mode_spec(spec: str) -> Tuple[int, int, Optional[float], bool]:
+    """
+    Parse a mode specification such as ``2560x1440@144`` or ``1920x1080i``.
+
+    Args:
+        spec: WIDTHxHEIGHT[@REFRESH][i]
+
+    Returns:
+        Tuple of (width, height, refresh_hz or None, interlaced)
+
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    match = MODE_SPEC_RE.match(spec.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid mode '{spec}' (expected WIDTHxHEIGHT[@REFRESH][i])")
+    width, height, refresh, interlaced = match.groups()
+    return (
+        int(width),
+        int(height),
+        float(refresh) if refresh else None,
+        interlaced == "i",
+    )
+
+
+def supports_mode(
+    modes: List[Dict[str, Any]],
+    width: int,
+    height: int,
+    refresh: Optional[float] = None,
+    interlaced: bool = False,
+    tolerance: float = 0.5,
+) -> bool:
+    """
+    Check whether a mode list contains a resolution (and refresh rate).
+
+    Args:
+        modes: Result of list_modes
+        width: Horizontal active pixels
+        height: Vertical active lines (per frame)
+        refresh: Refresh rate in Hz (the field rate for interlaced modes),
+            or None for any
+        interlaced: Look for an interlaced instead of a progressive mode
+        tolerance: Allowed refresh rate difference in Hz
+
+    Returns:
+        True if a matching mode is present
+    """
+    return any(
+        mode["width"] == width
+        and mode["height"] == height
+        and mode["interlaced"] == interlaced
+        and (refresh is None or abs(mode["refresh_hz"] - refresh) <= tolerance)
+        for mode in modes
+    )
+
+
+def find_edids_with_mode(
+    edids: Iterable[Tuple[str, bytes]],
+    width: int,
+    height: int,
+    refresh: Optional[float] = None,
+    interlaced: bool = False,
+) -> Iterator[str]:
+    """
+    Find the EDIDs in a corpus that support a mode.
+
+    Args:
+        edids: Iterable of (label, edid_data)
+        width: Horizontal active pixels
+        height: Vertical active lines (per frame)
+        refresh: Refresh rate in Hz, or None for any
+        interlaced: Look for an interlaced instead of a progressive mode
+
+    Yields:
+        Labels of matching EDIDs
+    """
+    for label, edid_data in edids:
+        if supports_mode(list_modes(edid_data), width, height, refresh, interlaced):
+            yield label
+
+
+def format_mode(mode: Dict[str, Any]) -> str:
+    """
+    Render a mode as a single line.
+
+    Args:
+        mode: Mode dictionary (from list_modes)
+
+    Returns:
+        Text such as ``2560x1440p@59.95 (detailed, 241.50 MHz)``
+    """
+    scan = "i" if mode["interlaced"] else "p"
+    clock = (
+        f", {mode['pixel_clock_hz'] / 1_000_000:.2f} MHz"
+        if mode["pixel_clock_hz"]
+        else ""
+    )
+    return (
+        f"{mode['width']}x{mode['height']}{scan}@{mode['refresh_hz']:g}"
+        f" ({mode['source']}{clock})"
+    )
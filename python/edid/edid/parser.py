@@ -1,9 +1,21 @@
 """EDID parsing and decoding functions."""
 
 import struct
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List
 
+from .cea861 import decode_data_block, format_data_block
+from .cache import memoized_decode
+from .displayid import decode_displayid_block
+from .hexdump import iter_hex_dump
+from .profiling import profiled
 
+# Offsets of the four 18-byte descriptors in the base block
+DESCRIPTOR_OFFSETS = (54, 72, 90, 108)
+DESCRIPTOR_SIZE = 18
+
+
+@profiled("parser.decode_hex")
+@memoized_decode
 def decode_hex(edid_data: bytes, verbose: bool = False) -> str:
     """
     Decode EDID as hexadecimal dump.
@@ -15,31 +27,7 @@ def decode_hex(edid_data: bytes, verbose: bool = False) -> str:
     Returns:
         Formatted hex dump string
     """
-    lines = []
-    lines.append("=" * 70)
-    lines.append("EDID HEX DUMP")
-    lines.append("=" * 70)
-
-    for block_num in range(len(edid_data) // 128):
-        offset = block_num * 128
-        block = edid_data[offset : offset + 128]
-
-        if block_num == 0:
-            lines.append("\nBase Block (128 bytes):")
-        else:
-            lines.append(f"\nExtension Block {block_num} (128 bytes):")
-
-        lines.append("-" * 70)
-
-        for i in range(0, 128, 16):
-            hex_part = " ".join(f"{b:02X}" for b in block[i : i + 16])
-            ascii_part = "".join(
-                chr(b) if 32 <= b < 127 else "." for b in block[i : i + 16]
-            )
-            lines.append(f"{offset + i:04X}: {hex_part:<48}  {ascii_part}")
-
-    lines.append("=" * 70)
-    return "\n".join(lines)
+    return "\n".join(iter_hex_dump(edid_data))
 
 
 def decode_manufacturer_id(data: bytes) -> str:
@@ -170,6 +158,16 @@ def decode_detailed_timing(descriptor: bytes) -> Dict[str, Any]:
     v_active = descriptor[5] | ((descriptor[7] & 0xF0) << 4)
     v_blank = descriptor[6] | ((descriptor[7] & 0x0F) << 8)
 
+    # Sync offsets/widths: low bits in bytes 8-10, high bits packed in byte 11
+    sync_high = descriptor[11]
+    h_sync_offset = descriptor[8] | ((sync_high & 0xC0) << 2)
+    h_sync_width = descriptor[9] | ((sync_high & 0x30) << 4)
+    v_sync_offset = (descriptor[10] >> 4) | ((sync_high & 0x0C) << 2)
+    v_sync_width = (descriptor[10] & 0x0F) | ((sync_high & 0x03) << 4)
+
+    h_image_mm = descriptor[12] | ((descriptor[14] & 0xF0) << 4)
+    v_image_mm = descriptor[13] | ((descriptor[14] & 0x0F) << 8)
+
     return {
         "type": "timing",
         "pixel_clock_hz": pixel_clock,
@@ -179,6 +177,13 @@ def decode_detailed_timing(descriptor: bytes) -> Dict[str, Any]:
         "v_blank": v_blank,
         "h_total": h_active + h_blank,
         "v_total": v_active + v_blank,
+        "h_sync_offset": h_sync_offset,
+        "h_sync_width": h_sync_width,
+        "v_sync_offset": v_sync_offset,
+        "v_sync_width": v_sync_width,
+        "h_image_mm": h_image_mm,
+        "v_image_mm": v_image_mm,
+        "interlaced": bool(descriptor[17] & 0x80),
     }
 
 
@@ -204,6 +209,37 @@ def decode_descriptor_name(descriptor: bytes) -> str:
     return ""
 
 
+def decode_range_limits(descriptor: bytes) -> Dict[str, Any]:
+    """
+    Decode a display range limits descriptor (type 0xFD).
+
+    Args:
+        descriptor: 18-byte descriptor
+
+    Returns:
+        Dictionary with min/max vertical rate (Hz), min/max horizontal rate
+        (kHz), max pixel clock (MHz) and the timing support byte; empty if
+        the descriptor is not a range limits descriptor
+    """
+    if len(descriptor) != 18 or descriptor[:3] != b"\x00\x00\x00":
+        return {}
+    if descriptor[3] != 0xFD:
+        return {}
+
+    # EDID 1.4 rate offsets: each flag adds 255 to the corresponding rate
+    offsets = descriptor[4]
+    return {
+        "min_v_hz": descriptor[5] + (255 if offsets & 0x01 else 0),
+        "max_v_hz": descriptor[6] + (255 if offsets & 0x02 else 0),
+        "min_h_khz": descriptor[7] + (255 if offsets & 0x04 else 0),
+        "max_h_khz": descriptor[8] + (255 if offsets & 0x08 else 0),
+        "max_pixel_clock_mhz": descriptor[9] * 10,
+        "timing_support": descriptor[10],
+    }
+
+
+@profiled("parser.decode_basic")
+@memoized_decode
 def decode_basic(edid_data: bytes, verbose: bool = False) -> str:
     """
     Decode EDID with basic information.
@@ -259,7 +295,7 @@ def decode_basic(edid_data: bytes, verbose: bool = False) -> str:
 
     # Find display name in descriptors
     display_name = None
-    for desc_offset in [54, 72, 90, 108]:
+    for desc_offset in DESCRIPTOR_OFFSETS:
         if desc_offset + 18 <= len(edid_data):
             name = decode_descriptor_name(edid_data[desc_offset : desc_offset + 18])
             if name:
@@ -272,7 +308,7 @@ def decode_basic(edid_data: bytes, verbose: bool = False) -> str:
     # Detailed timing descriptors
     lines.append("\nPreferred Timing (Detailed Descriptor):")
     timings = []
-    for desc_offset in [54, 72, 90, 108]:
+    for desc_offset in DESCRIPTOR_OFFSETS:
         if desc_offset + 18 <= len(edid_data):
             timing = decode_detailed_timing(edid_data[desc_offset : desc_offset + 18])
             if timing.get("type") == "timing":
@@ -341,25 +377,171 @@ def decode_cea861_block(extension_data: bytes) -> Dict[str, Any]:
 
         block_data = extension_data[offset + 1 : offset + 1 + length]
 
-        block_info = {"tag": tag, "length": length}
-
-        if tag == 1:  # Audio data block
-            block_info["type"] = "Audio"
-        elif tag == 2:  # Video data block
-            block_info["type"] = "Video"
-        elif tag == 3:  # Vendor specific
-            block_info["type"] = "Vendor Specific"
-        elif tag == 4:  # Speaker allocation
-            block_info["type"] = "Speaker Allocation"
-        else:
-            block_info["type"] = f"Unknown (0x{tag:02X})"
+        block_info = {"tag": tag, "length": length, "offset": offset}
+        block_info.update(decode_data_block(tag, block_data))
 
         info["data_blocks"].append(block_info)
         offset += length + 1
 
+    # Resolve the 4:2:0 capability map against the Video Data Block SVDs
+    svds = next((b["svds"] for b in info["data_blocks"] if b["type"] == "Video"), [])
+    for block in info["data_blocks"]:
+        if "svd_indices" in block:
+            block["vics"] = [
+                svds[i]["vic"] for i in block["svd_indices"] if i < len(svds)
+            ]
+
+    # Detailed timing descriptors follow the data blocks up to the checksum
+    info["detailed_timings"] = []
+    if dtd_offset >= 4:
+        for desc_offset in range(dtd_offset, 128 - DESCRIPTOR_SIZE, DESCRIPTOR_SIZE):
+            descriptor = extension_data[desc_offset : desc_offset + DESCRIPTOR_SIZE]
+            timing = decode_detailed_timing(descriptor)
+            if timing.get("type") != "timing":
+                break
+            timing["offset"] = desc_offset
+            info["detailed_timings"].append(timing)
+
     return info
 
 
+# Extension block decoders, keyed by extension tag (byte 0)
+EXTENSION_DECODERS: Dict[int, Callable[[bytes], Dict[str, Any]]] = {
+    0x02: decode_cea861_block,
+    0x70: decode_displayid_block,
+}
+
+EXTENSION_TYPES = {
+    0x02: "CEA-861 (HDMI/Consumer Electronics)",
+    0x70: "DisplayID",
+    0xF0: "Block Map",
+}
+
+
+@profiled("parser.decode_extensions")
+def decode_extensions(edid_data: bytes) -> List[Dict[str, Any]]:
+    """
+    Decode all extension blocks into structured data.
+
+    Args:
+        edid_data: Complete EDID data
+
+    Returns:
+        List of dictionaries with index, tag, type and decoded info
+        (empty dict when no decoder is registered for the tag)
+    """
+    extensions = []
+    extension_count = edid_data[126] if len(edid_data) >= 127 else 0
+
+    for i in range(extension_count):
+        offset = 128 * (i + 1)
+        if offset + 128 > len(edid_data):
+            break
+
+        extension = edid_data[offset : offset + 128]
+        tag = extension[0]
+        decoder = EXTENSION_DECODERS.get(tag)
+
+        extensions.append(
+            {
+                "index": i + 1,
+                "tag": tag,
+                "type": EXTENSION_TYPES.get(tag, f"Unknown (0x{tag:02X})"),
+                "info": decoder(extension) if decoder else {},
+            }
+        )
+
+    return extensions
+
+
+def format_timing(timing: Dict[str, Any]) -> List[str]:
+    """
+    Render a decoded detailed timing as text lines.
+
+    Args:
+        timing: Timing dictionary (from decode_detailed_timing)
+
+    Returns:
+        Lines without indentation
+    """
+    t = timing
+    refresh = t["pixel_clock_hz"] / (t["h_total"] * t["v_total"])
+    return [
+        f"Resolution: {t['h_active']} x {t['v_active']}",
+        f"Refresh Rate: {refresh:.2f} Hz",
+        f"Pixel Clock: {t['pixel_clock_hz'] / 1_000_000:.2f} MHz",
+        f"Horizontal: {t['h_active']} active, {t['h_blank']} blank, {t['h_total']} total",
+        f"Vertical: {t['v_active']} active, {t['v_blank']} blank, {t['v_total']} total",
+    ]
+
+
+def _format_cea861(cea_info: Dict[str, Any]) -> List[str]:
+    lines = [
+        f"Revision: {cea_info['revision']}",
+        f"Underscan: {cea_info['underscan_support']}",
+        f"Basic Audio: {cea_info['basic_audio_support']}",
+        f"YCbCr 4:4:4: {cea_info['ycbcr444_support']}",
+        f"YCbCr 4:2:2: {cea_info['ycbcr422_support']}",
+    ]
+
+    if cea_info["data_blocks"]:
+        lines.append(f"Data Blocks: {len(cea_info['data_blocks'])}")
+        for block in cea_info["data_blocks"]:
+            lines.append(f"  - {block['type']} ({block['length']} bytes)")
+            lines.extend(f"      {line}" for line in format_data_block(block))
+
+    for i, timing in enumerate(cea_info["detailed_timings"], 1):
+        lines.append(f"Detailed Timing {i}:")
+        lines.extend(f"  {line}" for line in format_timing(timing))
+
+    return lines
+
+
+def _format_displayid(displayid_info: Dict[str, Any]) -> List[str]:
+    lines = [f"Version: {displayid_info['version']}"]
+
+    if displayid_info["data_blocks"]:
+        lines.append(f"Data Blocks: {len(displayid_info['data_blocks'])}")
+
+    for block in displayid_info["data_blocks"]:
+        lines.append(f"  - {block['type']} ({block['length']} bytes)")
+
+        if "product_code" in block:
+            lines.append(f"      Vendor: {block['vendor']}")
+            lines.append(f"      Product Code: 0x{block['product_code']:04X}")
+            if block["serial_number"]:
+                lines.append(f"      Serial Number: {block['serial_number']}")
+            if block["product_name"]:
+                lines.append(f"      Name: {block['product_name']}")
+
+        for timing in block.get("timings", []):
+            flags = [flag for flag in ("preferred", "interlaced") if timing[flag]]
+            suffix = f" ({', '.join(flags)})" if flags else ""
+            lines.append(f"      Timing{suffix}:")
+            lines.extend(f"        {line}" for line in format_timing(timing))
+
+        if "h_tiles" in block:
+            lines.append(
+                f"      Tiles: {block['h_tiles']} x {block['v_tiles']}, "
+                f"this tile at ({block['h_location']}, {block['v_location']})"
+            )
+            lines.append(
+                f"      Tile Size: {block['tile_width']} x {block['tile_height']}"
+            )
+            lines.append(f"      Single Enclosure: {block['single_enclosure']}")
+
+    return lines
+
+
+# Extension renderers for decode_deep, keyed by extension tag
+EXTENSION_FORMATTERS: Dict[int, Callable[[Dict[str, Any]], List[str]]] = {
+    0x02: _format_cea861,
+    0x70: _format_displayid,
+}
+
+
+@profiled("parser.decode_deep")
+@memoized_decode
 def decode_deep(edid_data: bytes, verbose: bool = False) -> str:
     """
     Decode EDID with detailed information.
@@ -389,7 +571,7 @@ def decode_deep(edid_data: bytes, verbose: bool = False) -> str:
     lines.append("DETAILED TIMING DESCRIPTORS")
     lines.append("-" * 70)
 
-    for i, desc_offset in enumerate([54, 72, 90, 108], 1):
+    for i, desc_offset in enumerate(DESCRIPTOR_OFFSETS, 1):
         if desc_offset + 18 <= len(edid_data):
             descriptor = edid_data[desc_offset : desc_offset + 18]
 
@@ -403,64 +585,25 @@ def decode_deep(edid_data: bytes, verbose: bool = False) -> str:
             # Parse timing
             timing = decode_detailed_timing(descriptor)
             if timing.get("type") == "timing":
-                t = timing
-                refresh = t["pixel_clock_hz"] / (t["h_total"] * t["v_total"])
                 lines.append(f"\nDescriptor {i}: Detailed Timing")
-                lines.append(f"  Resolution: {t['h_active']} x {t['v_active']}")
-                lines.append(f"  Refresh Rate: {refresh:.2f} Hz")
-                lines.append(
-                    f"  Pixel Clock: {t['pixel_clock_hz'] / 1_000_000:.2f} MHz"
-                )
-                lines.append(
-                    f"  Horizontal: {t['h_active']} active, {t['h_blank']} blank, {t['h_total']} total"
-                )
-                lines.append(
-                    f"  Vertical: {t['v_active']} active, {t['v_blank']} blank, {t['v_total']} total"
-                )
+                lines.extend(f"  {line}" for line in format_timing(timing))
             elif timing.get("type") == "dummy":
                 lines.append(f"\nDescriptor {i}: Dummy/Unused")
 
     # Extension blocks
-    extension_count = edid_data[126] if len(edid_data) >= 127 else 0
-    if extension_count > 0:
+    extensions = decode_extensions(edid_data)
+    if extensions:
         lines.append("\n" + "-" * 70)
         lines.append("EXTENSION BLOCKS")
         lines.append("-" * 70)
 
-        for i in range(extension_count):
-            offset = 128 * (i + 1)
-            if offset + 128 <= len(edid_data):
-                extension = edid_data[offset : offset + 128]
-                tag = extension[0]
-
-                lines.append(f"\nExtension {i + 1}:")
-
-                if tag == 0x02:  # CEA-861
-                    lines.append("  Type: CEA-861 (HDMI/Consumer Electronics)")
-                    cea_info = decode_cea861_block(extension)
-                    if cea_info:
-                        lines.append(f"  Revision: {cea_info['revision']}")
-                        lines.append(f"  Underscan: {cea_info['underscan_support']}")
-                        lines.append(
-                            f"  Basic Audio: {cea_info['basic_audio_support']}"
-                        )
-                        lines.append(f"  YCbCr 4:4:4: {cea_info['ycbcr444_support']}")
-                        lines.append(f"  YCbCr 4:2:2: {cea_info['ycbcr422_support']}")
-
-                        if cea_info["data_blocks"]:
-                            lines.append(
-                                f"  Data Blocks: {len(cea_info['data_blocks'])}"
-                            )
-                            for block in cea_info["data_blocks"]:
-                                lines.append(
-                                    f"    - {block['type']} ({block['length']} bytes)"
-                                )
-                elif tag == 0x70:  # DisplayID
-                    lines.append("  Type: DisplayID")
-                elif tag == 0xF0:  # Block Map
-                    lines.append("  Type: Block Map")
-                else:
-                    lines.append(f"  Type: Unknown (0x{tag:02X})")
+        for extension in extensions:
+            lines.append(f"\nExtension {extension['index']}:")
+            lines.append(f"  Type: {extension['type']}")
+
+            formatter = EXTENSION_FORMATTERS.get(extension["tag"])
+            if formatter and extension["info"]:
+                lines.extend(f"  {line}" for line in formatter(extension["info"]))
 
     lines.append("=" * 70)
     return "\n".join(lines)
@@ -0,0 +1,315 @@
+"""Bulk EDID patching for per-unit serials, names and timings."""
+
+import csv
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .parser import DESCRIPTOR_OFFSETS, DESCRIPTOR_SIZE, decode_detailed_timing
+from .validator import validate_structure, calculate_checksum
+
+
+# Serial number field (bytes 12-15, see decode_product_info)
+SERIAL_OFFSET = 12
+SERIAL_STRUCT = struct.Struct("<I")
+
+# Display name descriptor (see decode_descriptor_name)
+DISPLAY_NAME_TAG = 0xFC
+DISPLAY_NAME_LENGTH = 13
+
+# Detailed timing fields that can be patched (see decode_detailed_timing)
+TIMING_FIELDS = ("pixel_clock_hz", "h_active", "h_blank", "v_active", "v_blank")
+
+INTEGER_FIELDS = ("serial",) + TIMING_FIELDS
+
+
+def load_patch_records(path: Path) -> List[Dict[str, Any]]:
+    """
+    Load per-unit patch values from a CSV or JSONL file.
+
+    Recognised fields are ``serial``, ``name``, the detailed timing fields
+    (``pixel_clock_hz``, ``h_active``, ``h_blank``, ``v_active``,
+    ``v_blank``) and ``file`` (output file name, without directories).
+    Empty values are ignored.
+    Integers may be given in decimal or with a 0x prefix.
+
+    Args:
+        path: Path to a .csv or .jsonl file
+
+    Returns:
+        List of record dictionaries
+
+    Raises:
+        ValueError: If a record contains an invalid value
+    """
+    path = Path(path)
+    with open(path, newline="") as f:
+        if path.suffix.lower() == ".csv":
+            raw_records = [dict(row) for row in csv.DictReader(f)]
+        else:
+            raw_records = [json.loads(line) for line in f if line.strip()]
+
+    records = []
+    for line_num, raw in enumerate(raw_records, 1):
+        record = {}
+        for key, value in raw.items():
+            if value is None or value == "":
+                continue
+            if key in INTEGER_FIELDS:
+                if isinstance(value, str):
+                    try:
+                        value = int(value, 0)
+                    except ValueError:
+                        raise ValueError(
+                            f"Record {line_num}: invalid integer for '{key}': "
+                            f"{value!r}"
+                        ) from None
+                # JSON may hold floats or booleans, which struct cannot pack
+                if not isinstance(value, int) or isinstance(value, bool):
+                    raise ValueError(
+                        f"Record {line_num}: invalid integer for '{key}': {value!r}"
+                    )
+            elif key == "file":
+                value = str(value)
+                if not _is_plain_file_name(value):
+                    raise ValueError(
+                        f"Record {line_num}: 'file' must be a plain file name: "
+                        f"{value!r}"
+                    )
+            record[key] = value
+        records.append(record)
+
+    return records
+
+
+def _is_plain_file_name(name: str) -> bool:
+    """Check that a name stays inside the output directory."""
+    return name not in ("", ".", "..") and not any(sep in name for sep in "/\\")
+
+
+def encode_display_name(name: str) -> bytes:
+    """
+    Encode a display name as a 13-byte descriptor payload.
+
+    Names shorter than 13 characters are terminated with 0x0A and padded
+    with spaces, matching what decode_descriptor_name expects.
+
+    Args:
+        name: Display name (ASCII, at most 13 characters)
+
+    Returns:
+        13-byte descriptor payload
+
+    Raises:
+        ValueError: If the name is too long or not ASCII
+    """
+    try:
+        encoded = name.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError(f"Display name must be ASCII: {name!r}") from None
+
+    if len(encoded) > DISPLAY_NAME_LENGTH:
+        raise ValueError(
+            f"Display name too long ({len(encoded)} > {DISPLAY_NAME_LENGTH}): {name!r}"
+        )
+
+    if len(encoded) < DISPLAY_NAME_LENGTH:
+        encoded += b"\x0a"
+    return encoded.ljust(DISPLAY_NAME_LENGTH, b" ")
+
+
+def pack_timing_fields(buffer: bytearray, offset: int, timing: Dict[str, int]) -> None:
+    """
+    Patch detailed timing fields into an 18-byte descriptor in place.
+
+    Only the fields present in ``timing`` are changed; sync, image size and
+    flag bytes of the descriptor are preserved.
+
+    Args:
+        buffer: Buffer holding the descriptor (will be modified)
+        offset: Offset of the descriptor within buffer
+        timing: Subset of TIMING_FIELDS to apply
+
+    Raises:
+        ValueError: If a field is out of range for the descriptor layout
+    """
+    if "pixel_clock_hz" in timing:
+        clock = timing["pixel_clock_hz"]
+        if clock % 10000 or not 0 < clock <= 0xFFFF * 10000:
+            raise ValueError(
+                f"Pixel clock must be a multiple of 10 kHz up to 655.35 MHz: {clock}"
+            )
+        struct.pack_into("<H", buffer, offset, clock // 10000)
+
+    for field in TIMING_FIELDS[1:]:
+        if field in timing and not 0 <= timing[field] <= 0xFFF:
+            raise ValueError(f"{field} must be 0-4095: {timing[field]}")
+
+    # 12-bit values: low byte in its own field, high nibble in bytes 4 / 7
+    for low, high, shift, field in (
+        (2, 4, 4, "h_active"),
+        (3, 4, 0, "h_blank"),
+        (5, 7, 4, "v_active"),
+        (6, 7, 0, "v_blank"),
+    ):
+        if field in timing:
+            value = timing[field]
+            buffer[offset + low] = value & 0xFF
+            mask = 0x0F << shift
+            buffer[offset + high] = (buffer[offset + high] & ~mask & 0xFF) | (
+                ((value >> 8) & 0x0F) << shift
+            )
+
+
+def find_name_descriptor(edid_data: bytes) -> Optional[int]:
+    """
+    Find the display name descriptor (0xFC) in the base block.
+
+    Args:
+        edid_data: EDID data (at least 128 bytes)
+
+    Returns:
+        Offset of the descriptor, or None if absent
+    """
+    for desc_offset in DESCRIPTOR_OFFSETS:
+        if (
+            edid_data[desc_offset] == 0
+            and edid_data[desc_offset + 1] == 0
+            and edid_data[desc_offset + 3] == DISPLAY_NAME_TAG
+        ):
+            return desc_offset
+    return None
+
+
+def find_preferred_timing(edid_data: bytes) -> Optional[int]:
+    """
+    Find the preferred (first) detailed timing descriptor in the base block.
+
+    Args:
+        edid_data: EDID data (at least 128 bytes)
+
+    Returns:
+        Offset of the descriptor, or None if absent
+    """
+    for desc_offset in DESCRIPTOR_OFFSETS:
+        descriptor = edid_data[desc_offset : desc_offset + DESCRIPTOR_SIZE]
+        if decode_detailed_timing(descriptor).get("type") == "timing":
+            return desc_offset
+    return None
+
+
+def patch_edids(template: bytes, records: List[Dict[str, Any]]) -> bytearray:
+    """
+    Produce one patched EDID per record in a single pass.
+
+    The template is validated once and replicated into a single packed
+    buffer; each unit then only has its patched fields and base block
+    checksum rewritten. Extension blocks are copied verbatim, so their
+    checksums stay valid.
+
+    Args:
+        template: Valid template EDID
+        records: Per-unit values (see load_patch_records)
+
+    Returns:
+        Packed buffer of len(records) EDIDs, each len(template) bytes
+
+    Raises:
+        ValueError: If the template is invalid or a record cannot be applied
+    """
+    is_valid, message = validate_structure(template)
+    if not is_valid:
+        raise ValueError(f"Invalid template EDID - {message}")
+
+    name_offset = find_name_descriptor(template)
+    timing_offset = find_preferred_timing(template)
+
+    size = len(template)
+    packed = bytearray(template) * len(records)
+
+    for index, record in enumerate(records):
+        base = index * size
+
+        if "serial" in record:
+            serial = record["serial"]
+            if not 0 <= serial <= 0xFFFFFFFF:
+                raise ValueError(f"Record {index + 1}: serial out of range: {serial}")
+            SERIAL_STRUCT.pack_into(packed, base + SERIAL_OFFSET, serial)
+
+        if "name" in record:
+            if name_offset is None:
+                raise ValueError("Template has no display name descriptor (0xFC)")
+            start = base + name_offset + 5
+            packed[start : start + DISPLAY_NAME_LENGTH] = encode_display_name(
+                str(record["name"])
+            )
+
+        timing = {field: record[field] for field in TIMING_FIELDS if field in record}
+        if timing:
+            if timing_offset is None:
+                raise ValueError("Template has no detailed timing descriptor")
+            try:
+                pack_timing_fields(packed, base + timing_offset, timing)
+            except ValueError as e:
+                raise ValueError(f"Record {index + 1}: {e}") from None
+
+        packed[base + 127] = calculate_checksum(packed[base : base + 128])
+
+    return packed
+
+
+def output_name(record: Dict[str, Any], index: int) -> str:
+    """
+    Choose the output file name for a patched unit.
+
+    Args:
+        record: Patch record
+        index: Zero-based record index
+
+    Returns:
+        File name from the record's ``file`` field, else derived from the
+        serial number, else from the record index
+
+    Raises:
+        ValueError: If the ``file`` field is not a plain file name
+    """
+    if "file" in record:
+        name = str(record["file"])
+        if not _is_plain_file_name(name):
+            raise ValueError(f"Output file must be a plain file name: {name!r}")
+        return name
+    if "serial" in record:
+        return f"edid_{record['serial']}.bin"
+    return f"edid_{index + 1:05d}.bin"
+
+
+def output_names(records: List[Dict[str, Any]]) -> List[str]:
+    """
+    Choose the output file names of all patched units.
+
+    Names are compared case-insensitively, since two names differing only
+    in case overwrite each other on macOS and Windows.
+
+    Args:
+        records: Patch records
+
+    Returns:
+        File names, one per record (see output_name)
+
+    Raises:
+        ValueError: If a name is not a plain file name or two records would
+            be written to the same file
+    """
+    names = []
+    first_use: Dict[str, int] = {}
+    for index, record in enumerate(records):
+        name = output_name(record, index)
+        previous = first_use.setdefault(name.lower(), index)
+        if previous != index:
+            raise ValueError(
+                f"Records {previous + 1} and {index + 1} would both be written "
+                f"to {name!r}; give them distinct 'file' or 'serial' values"
+            )
+        names.append(name)
+    return names
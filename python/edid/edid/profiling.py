@@ -0,0 +1,406 @@
+"""Lightweight instrumentation for the I2C, parser and validator hot paths.
+
+Profiling is off by default and costs one global lookup per instrumented
+call. When enabled (``edid --profile``), the active Profiler records:
+
+- wall time per phase (calls, total and self time), from ``phase()`` blocks
+  and ``@profiled`` functions
+- bus transactions and bytes transferred, per bus and SMBus method, through
+  buses wrapped by ``instrument_bus()``
+- time spent sleeping in ``sleep()``
+
+Results can be printed as a breakdown, or exported as Chrome trace-event
+JSON (chrome://tracing, Perfetto) or OpenMetrics text.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# i2c_msg flag for read messages
+I2C_M_RD = 0x0001
+
+# Bytes moved by each SMBus method: (direction, size function)
+_TRANSFER_SIZES: Dict[str, Callable[..., Dict[str, int]]] = {
+    "read_byte_data": lambda addr, reg: {"read": 1},
+    "write_byte_data": lambda addr, reg, value: {"written": 1},
+    "write_byte": lambda addr, value: {"written": 1},
+    "read_i2c_block_data": lambda addr, reg, length: {"read": length},
+    "write_i2c_block_data": lambda addr, reg, data: {"written": len(data)},
+}
+
+
+def _rdwr_sizes(*messages: Any) -> Dict[str, int]:
+    sizes = {"read": 0, "written": 0}
+    for message in messages:
+        direction = "read" if message.flags & I2C_M_RD else "written"
+        sizes[direction] += message.len
+    return sizes
+
+
+_TRANSFER_SIZES["i2c_rdwr"] = _rdwr_sizes
+
+
+class Profiler:
+    """Collects phase timings, bus statistics and sleep time."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.buses: Dict[int, Dict[str, Any]] = {}
+        self.sleep_time = 0.0
+        self.sleep_count = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[List[float]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _span(
+        self, name: str, category: str, start: float, duration: float, **args: Any
+    ) -> None:
+        span = {
+            "name": name,
+            "cat": category,
+            "start": start - self.origin,
+            "duration": duration,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            span["args"] = args
+        self.spans.append(span)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block of code as phase NAME."""
+        stack = self._stack()
+        # [child time] accumulates time spent in nested phases
+        frame = [0.0]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += duration
+            with self._lock:
+                stats = self.phases.setdefault(
+                    name, {"calls": 0, "total": 0.0, "self": 0.0}
+                )
+                stats["calls"] += 1
+                stats["total"] += duration
+                stats["self"] += duration - frame[0]
+                self._span(name, "phase", start, duration)
+
+    def record_transaction(
+        self,
+        bus_num: int,
+        method: str,
+        sizes: Dict[str, int],
+        start: float,
+        duration: float,
+        failed: bool,
+    ) -> None:
+        """Record one bus transaction."""
+        with self._lock:
+            stats = self.buses.setdefault(
+                bus_num,
+                {
+                    "transactions": {},
+                    "bytes_read": 0,
+                    "bytes_written": 0,
+                    "errors": 0,
+                    "time": 0.0,
+                },
+            )
+            stats["transactions"][method] = stats["transactions"].get(method, 0) + 1
+            stats["time"] += duration
+            if failed:
+                stats["errors"] += 1
+            else:
+                stats["bytes_read"] += sizes.get("read", 0)
+                stats["bytes_written"] += sizes.get("written", 0)
+            self._span(
+                method, "bus", start, duration, bus=bus_num, failed=failed, **sizes
+            )
+
+    def record_sleep(self, start: float, duration: float) -> None:
+        """Record time spent sleeping."""
+        with self._lock:
+            self.sleep_time += duration
+            self.sleep_count += 1
+            self._span("sleep", "sleep", start, duration)
+
+    def elapsed(self) -> float:
+        """Seconds since profiling started."""
+        return time.perf_counter() - self.origin
+
+    def format_report(self) -> str:
+        """
+        Format a human-readable breakdown.
+
+        Returns:
+            Multi-line report
+        """
+        lines = [f"Profile ({self.elapsed() * 1000:.1f} ms wall time)"]
+
+        if self.phases:
+            lines.append(
+                f"  {'Phase':<32} {'Calls':>6} {'Total ms':>10} {'Self ms':>10}"
+            )
+            ordered = sorted(
+                self.phases.items(), key=lambda item: item[1]["total"], reverse=True
+            )
+            for name, stats in ordered:
+                lines.append(
+                    f"  {name:<32} {stats['calls']:>6} "
+                    f"{stats['total'] * 1000:>10.2f} {stats['self'] * 1000:>10.2f}"
+                )
+
+        for bus_num, stats in sorted(self.buses.items()):
+            count = sum(stats["transactions"].values())
+            lines.append(
+                f"  Bus {bus_num}: {count} transaction(s) in "
+                f"{stats['time'] * 1000:.2f} ms, {stats['bytes_read']} B read, "
+                f"{stats['bytes_written']} B written, {stats['errors']} error(s)"
+            )
+            for method, method_count in sorted(stats["transactions"].items()):
+                lines.append(f"    {method}: {method_count}")
+
+        lines.append(
+            f"  Sleep: {self.sleep_time * 1000:.2f} ms in {self.sleep_count} call(s)"
+        )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Export recorded spans in the Chrome trace-event format.
+
+        Returns:
+            JSON-serializable trace with complete ("X") events
+        """
+        pid = os.getpid()
+        events = []
+        for span in self.spans:
+            event = {
+                "name": span["name"],
+                "cat": span["cat"],
+                "ph": "X",
+                "ts": span["start"] * 1e6,
+                "dur": span["duration"] * 1e6,
+                "pid": pid,
+                "tid": span["tid"],
+            }
+            if "args" in span:
+                event["args"] = span["args"]
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def openmetrics(self) -> str:
+        """
+        Export aggregate statistics in the OpenMetrics text format.
+
+        Returns:
+            OpenMetrics exposition, terminated by "# EOF"
+        """
+        lines = [
+            "# TYPE edid_phase_calls counter",
+            "# HELP edid_phase_calls Number of times a phase ran.",
+        ]
+        for name, stats in sorted(self.phases.items()):
+            lines.append(f'edid_phase_calls_total{{phase="{name}"}} {stats["calls"]}')
+
+        lines += [
+            "# TYPE edid_phase_seconds counter",
+            "# UNIT edid_phase_seconds seconds",
+            "# HELP edid_phase_seconds Wall time spent in a phase.",
+        ]
+        for name, stats in sorted(self.phases.items()):
+            lines.append(f'edid_phase_seconds_total{{phase="{name}"}} {stats["total"]}')
+
+        lines += [
+            "# TYPE edid_bus_transactions counter",
+            "# HELP edid_bus_transactions I2C bus transactions.",
+        ]
+        for bus_num, stats in sorted(self.buses.items()):
+            for method, count in sorted(stats["transactions"].items()):
+                lines.append(
+                    f'edid_bus_transactions_total{{bus="{bus_num}",method="{method}"}}'
+                    f" {count}"
+                )
+
+        lines += [
+            "# TYPE edid_bus_bytes counter",
+            "# UNIT edid_bus_bytes bytes",
+            "# HELP edid_bus_bytes Bytes transferred over the I2C bus.",
+        ]
+        for bus_num, stats in sorted(self.buses.items()):
+            for direction in ("read", "written"):
+                lines.append(
+                    f'edid_bus_bytes_total{{bus="{bus_num}",direction="{direction}"}}'
+                    f" {stats['bytes_' + direction]}"
+                )
+
+        lines += [
+            "# TYPE edid_bus_errors counter",
+            "# HELP edid_bus_errors Failed I2C bus transactions.",
+        ]
+        for bus_num, stats in sorted(self.buses.items()):
+            lines.append(f'edid_bus_errors_total{{bus="{bus_num}"}} {stats["errors"]}')
+
+        lines += [
+            "# TYPE edid_sleep_seconds counter",
+            "# UNIT edid_sleep_seconds seconds",
+            "# HELP edid_sleep_seconds Time spent sleeping between transfers.",
+            f"edid_sleep_seconds_total {self.sleep_time}",
+            "# EOF",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write the Chrome trace-event JSON to PATH."""
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def write_openmetrics(self, path: str) -> None:
+        """Write the OpenMetrics text to PATH."""
+        with open(path, "w") as f:
+            f.write(self.openmetrics())
+
+
+_profiler: Optional[Profiler] = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Return the active profiler, or None if profiling is disabled."""
+    return _profiler
+
+
+def enable() -> Profiler:
+    """Start profiling with a fresh Profiler and return it."""
+    global _profiler
+    _profiler = Profiler()
+    return _profiler
+
+
+def disable() -> Optional[Profiler]:
+    """
+    Stop profiling.
+
+    Returns:
+        The profiler that was active, if any
+    """
+    global _profiler
+    profiler = _profiler
+    _profiler = None
+    return profiler
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block of code as phase NAME when profiling is enabled."""
+    profiler = _profiler
+    if profiler is None:
+        yield
+    else:
+        with profiler.phase(name):
+            yield
+
+
+def profiled(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator that times every call of a function as phase NAME."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = _profiler
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def sleep(seconds: float) -> None:
+    """time.sleep() that is accounted for when profiling is enabled."""
+    profiler = _profiler
+    if profiler is None:
+        time.sleep(seconds)
+        return
+    start = time.perf_counter()
+    time.sleep(seconds)
+    profiler.record_sleep(start, time.perf_counter() - start)
+
+
+class InstrumentedBus:
+    """Bus wrapper that records every transaction with the active profiler."""
+
+    def __init__(self, bus: Any, bus_num: int, profiler: Profiler):
+        self._bus = bus
+        self._bus_num = bus_num
+        self._profiler = profiler
+
+    def __enter__(self) -> "InstrumentedBus":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._bus.close()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._bus, name)
+        if name not in _TRANSFER_SIZES:
+            return attr
+
+        @functools.wraps(attr)
+        def transaction(*args: Any) -> Any:
+            sizes = _TRANSFER_SIZES[name](*args)
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = attr(*args)
+                failed = False
+                return result
+            finally:
+                self._profiler.record_transaction(
+                    self._bus_num,
+                    name,
+                    sizes,
+                    start,
+                    time.perf_counter() - start,
+                    failed,
+                )
+
+        return transaction
+
+
+def instrument_bus(bus: Any, bus_num: int) -> Any:
+    """
+    Wrap an open bus for transaction accounting when profiling is enabled.
+
+    Args:
+        bus: SMBus-compatible bus object
+        bus_num: I2C bus number
+
+    Returns:
+        The bus itself, or an InstrumentedBus wrapper
+    """
+    profiler = _profiler
+    if profiler is None:
+        return bus
+    return InstrumentedBus(bus, bus_num, profiler)
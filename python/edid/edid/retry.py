@@ -0,0 +1,191 @@
+"""Per-transaction retry with exponential backoff for flaky DDC buses.
+
+Long HDMI cables, KVMs and docks regularly NACK a single transfer. Instead
+of failing the whole read or write, i2c.py sends each 32-byte chunk or page
+through the active RetryPolicy, which repeats only that transaction.
+"""
+
+import errno
+import random
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .locking import lock_stats
+from .profiling import sleep
+
+# Errors that indicate a transient bus condition (NACK, arbitration loss,
+# timeout) rather than a missing device or permission problem. ENXIO is left
+# out: it means no device answered at the address (no display attached), so
+# retrying only delays probes of empty ports. Adapters that report a NACK as
+# ENXIO can opt in through RetryPolicy(retry_errnos=...).
+TRANSIENT_ERRNOS = frozenset(
+    {errno.EREMOTEIO, errno.EIO, errno.ETIMEDOUT, errno.EAGAIN}
+)
+
+# Per-bus statistics, keyed by bus number
+_bus_stats: Dict[int, Dict[str, Any]] = {}
+
+
+class RetryPolicy:
+    """
+    Retry policy for single bus transactions.
+
+    The delay before retry n (1-based) is
+    ``min(max_delay, base_delay * multiplier ** (n - 1))``, scaled by a random
+    factor in ``[1 - jitter, 1 + jitter]``.
+
+    Args:
+        attempts: Total attempts per transaction (1 disables retries)
+        base_delay: Delay before the first retry, in seconds
+        multiplier: Backoff growth factor
+        max_delay: Upper bound for a single delay, in seconds
+        jitter: Relative jitter (0 to 1)
+        retry_errnos: errno values that are retried
+        seed: Random seed for the jitter
+    """
+
+    def __init__(
+        self,
+        attempts: int = 4,
+        base_delay: float = 0.002,
+        multiplier: float = 2.0,
+        max_delay: float = 0.1,
+        jitter: float = 0.5,
+        retry_errnos: Iterable[int] = TRANSIENT_ERRNOS,
+        seed: Optional[int] = None,
+    ):
+        if attempts < 1:
+            raise ValueError(f"Retry attempts must be at least 1 (got {attempts})")
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_errnos = frozenset(retry_errnos)
+        self._random = random.Random(seed)
+
+    def delay(self, retry: int) -> float:
+        """
+        Backoff delay before a retry.
+
+        Args:
+            retry: Retry number (1 for the first retry)
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (retry - 1))
+        if self.jitter:
+            delay *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        return delay
+
+    def is_transient(self, error: OSError) -> bool:
+        """Check whether an error should be retried."""
+        return error.errno in self.retry_errnos
+
+    def call(self, bus_num: int, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run one bus transaction, retrying transient failures.
+
+        Args:
+            bus_num: I2C bus number (for statistics)
+            func: Bus method, e.g. bus.read_i2c_block_data
+            args: Arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            OSError: The last error, if all attempts fail or the error is
+                not transient
+        """
+        stats = bus_stats(bus_num)
+        stats["transactions"] += 1
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return func(*args)
+            except OSError as e:
+                stats["errors"] += 1
+                stats["errnos"][e.errno] = stats["errnos"].get(e.errno, 0) + 1
+                if attempt == self.attempts or not self.is_transient(e):
+                    stats["failures"] += 1
+                    raise
+                stats["retries"] += 1
+                sleep(self.delay(attempt))
+
+
+_policy = RetryPolicy()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Return the active retry policy."""
+    return _policy
+
+
+def set_retry_policy(policy: RetryPolicy) -> RetryPolicy:
+    """
+    Replace the active retry policy.
+
+    Args:
+        policy: New policy
+
+    Returns:
+        The previously active policy
+    """
+    global _policy
+    previous = _policy
+    _policy = policy
+    return previous
+
+
+def bus_stats(bus_num: int) -> Dict[str, Any]:
+    """
+    Error statistics for a bus (created on first use).
+
+    Returns:
+        Dictionary with transactions, retries, errors, failures and an
+        errno -> count map
+    """
+    stats = _bus_stats.get(bus_num)
+    if stats is None:
+        stats = _bus_stats[bus_num] = {
+            "transactions": 0,
+            "retries": 0,
+            "errors": 0,
+            "failures": 0,
+            "errnos": {},
+        }
+    return stats
+
+
+def format_bus_stats(bus_num: int) -> str:
+    """
+    Format a one-line error summary for a bus.
+
+    Time spent waiting for the bus lock is appended when another process or
+    thread held it.
+
+    Args:
+        bus_num: I2C bus number
+
+    Returns:
+        Summary such as "Bus 5: 12 transaction(s), 2 retried, 0 failed
+        (EREMOTEIO x2), lock waited 1/3 time(s), 0.42s total"
+    """
+    stats = bus_stats(bus_num)
+    line = (
+        f"Bus {bus_num}: {stats['transactions']} transaction(s), "
+        f"{stats['retries']} retried, {stats['failures']} failed"
+    )
+    if stats["errnos"]:
+        errors = ", ".join(
+            f"{errno.errorcode.get(code, code)} x{count}"
+            for code, count in sorted(stats["errnos"].items(), key=lambda i: str(i[0]))
+        )
+        line += f" ({errors})"
+    lock = lock_stats().get(bus_num)
+    if lock and lock["contended"]:
+        line += (
+            f", lock waited {lock['contended']}/{lock['acquisitions']} time(s), "
+            f"{lock['wait_time']:.2f}s total"
+        )
+    return line
@@ -0,0 +1,374 @@
+"""In-memory EDID EEPROM simulator.
+
+Models a DDC EEPROM closely enough to exercise read_edid, write_edid and
+test_writable without hardware: 8-bit word addresses that wrap within a
+256-byte segment, an E-DDC segment pointer at 0x30, page writes that roll
+over within a page, a write cycle during which the device NACKs, a
+write-protect pin, and injected NACKs. Buses can be placed behind
+simulated PCA954x-style mux channels to exercise topology discovery.
+"""
+
+import errno
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .backend import BusBackend
+
+
+EEPROM_ADDRESS = 0x50
+SEGMENT_POINTER_ADDRESS = 0x30
+SEGMENT_SIZE = 256
+
+# PCA954x muxes default to address 0x70
+MUX_ADDRESS = 0x70
+
+# SMBus block transfers are limited to 32 bytes
+SMBUS_BLOCK_MAX = 32
+
+# i2c_msg flag for read messages
+I2C_M_RD = 0x0001
+
+
+def _nack(message: str) -> OSError:
+    return OSError(errno.EREMOTEIO, f"Remote I/O error ({message})")
+
+
+class SimulatedEEPROM:
+    """
+    Simulated EDID EEPROM.
+
+    Args:
+        data: Initial contents (padded with 0xFF to the device size)
+        segments: Number of 256-byte E-DDC segments
+        page_size: Page size in bytes; writes wrap within a page
+        write_cycle_time: Seconds the device NACKs after each write
+        write_protect: Ignore writes (they are still acknowledged)
+        nack_rate: Probability of a NACK on any transaction
+        nack_on: Bus transaction numbers (1-based) that NACK; a combined
+            i2c_rdwr transfer counts once, however many messages it has
+        seed: Random seed for nack_rate
+        max_read: Longest read the (simulated) adapter accepts; longer
+            reads fail with EINVAL
+    """
+
+    def __init__(
+        self,
+        data: bytes = b"",
+        segments: int = 2,
+        page_size: int = 16,
+        write_cycle_time: float = 0.005,
+        write_protect: bool = False,
+        nack_rate: float = 0.0,
+        nack_on: Optional[Iterable[int]] = None,
+        seed: Optional[int] = None,
+        max_read: Optional[int] = None,
+    ):
+        size = segments * SEGMENT_SIZE
+        if len(data) > size:
+            raise ValueError(
+                f"EEPROM data ({len(data)} bytes) exceeds {segments} segment(s)"
+            )
+
+        self.memory = bytearray(data) + b"\xff" * (size - len(data))
+        self.segments = segments
+        self.page_size = page_size
+        self.write_cycle_time = write_cycle_time
+        self.write_protect = write_protect
+        self.nack_rate = nack_rate
+        self.nack_on: Set[int] = set(nack_on or ())
+        self._random = random.Random(seed)
+        self.max_read = max_read
+
+        self.segment = 0
+        self.busy_until = 0.0
+        # Between START and STOP; later messages of a combined transfer
+        # belong to the same transaction
+        self._in_transaction = False
+
+        # Statistics
+        self.transactions = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.nacks = 0
+
+    def _begin(self) -> None:
+        if self._in_transaction:
+            return
+        self._in_transaction = True
+        self.transactions += 1
+        reason = None
+        if time.monotonic() < self.busy_until:
+            reason = "write cycle in progress"
+        elif self.transactions in self.nack_on:
+            reason = "injected"
+        elif self.nack_rate and self._random.random() < self.nack_rate:
+            reason = "injected"
+        if reason:
+            self.nacks += 1
+            raise _nack(reason)
+
+    def _address(self, offset: int) -> int:
+        return self.segment * SEGMENT_SIZE + (offset % SEGMENT_SIZE)
+
+    def set_segment(self, segment: int) -> None:
+        """Write the E-DDC segment pointer."""
+        self._begin()
+        if segment >= self.segments:
+            self.nacks += 1
+            raise _nack(f"segment {segment} not present")
+        self.segment = segment
+
+    def read(self, offset: int, length: int) -> List[int]:
+        """Sequential read; the address counter wraps within the segment."""
+        if self.max_read is not None and length > self.max_read:
+            raise OSError(errno.EINVAL, "Invalid argument")
+        self._begin()
+        base = self.segment * SEGMENT_SIZE
+        data = [self.memory[base + (offset + i) % SEGMENT_SIZE] for i in range(length)]
+        self.bytes_read += length
+        return data
+
+    def write(self, offset: int, data: List[int]) -> None:
+        """Page write; the address counter wraps within the page."""
+        self._begin()
+        if not self.write_protect:
+            start = self._address(offset)
+            page_base = start - start % self.page_size
+            for i, value in enumerate(data):
+                address = page_base + (start % self.page_size + i) % self.page_size
+                self.memory[address] = value & 0xFF
+        self.bytes_written += len(data)
+        self.busy_until = time.monotonic() + self.write_cycle_time
+
+    def end_transaction(self) -> None:
+        """STOP condition: the segment pointer resets to 0."""
+        self.segment = 0
+        self._in_transaction = False
+
+
+class SimulatedBus:
+    """
+    SMBus-compatible bus with a simulated EEPROM at 0x50 / 0x30.
+
+    A bus without an EEPROM (a mux parent) NACKs every address. On a mux
+    channel, select is called before every transaction to switch the mux.
+    """
+
+    def __init__(
+        self,
+        bus_num: int,
+        eeprom: Optional[SimulatedEEPROM],
+        select: Optional[Callable[[], None]] = None,
+    ):
+        self.bus_num = bus_num
+        self.eeprom = eeprom
+        self.select = select
+
+    def __enter__(self) -> "SimulatedBus":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        pass
+
+    def _check_address(self, address: int) -> None:
+        if self.select is not None:
+            self.select()
+        if self.eeprom is None or address not in (
+            EEPROM_ADDRESS,
+            SEGMENT_POINTER_ADDRESS,
+        ):
+            raise OSError(errno.ENXIO, "No such device or address")
+
+    def read_byte_data(self, i2c_addr: int, register: int) -> int:
+        self._check_address(i2c_addr)
+        try:
+            return self.eeprom.read(register, 1)[0]
+        finally:
+            self.eeprom.end_transaction()
+
+    def write_byte_data(self, i2c_addr: int, register: int, value: int) -> None:
+        self._check_address(i2c_addr)
+        try:
+            self.eeprom.write(register, [value])
+        finally:
+            self.eeprom.end_transaction()
+
+    def write_byte(self, i2c_addr: int, value: int) -> None:
+        self._check_address(i2c_addr)
+        try:
+            if i2c_addr == SEGMENT_POINTER_ADDRESS:
+                # A lone segment write is followed by STOP, which resets it
+                self.eeprom.set_segment(value)
+            else:
+                self.eeprom.read(value, 0)
+        finally:
+            self.eeprom.end_transaction()
+
+    def read_i2c_block_data(
+        self, i2c_addr: int, register: int, length: int
+    ) -> List[int]:
+        self._check_address(i2c_addr)
+        if length > SMBUS_BLOCK_MAX:
+            raise ValueError(f"Desired block length over {SMBUS_BLOCK_MAX} bytes")
+        try:
+            return self.eeprom.read(register, length)
+        finally:
+            self.eeprom.end_transaction()
+
+    def write_i2c_block_data(
+        self, i2c_addr: int, register: int, data: List[int]
+    ) -> None:
+        self._check_address(i2c_addr)
+        if len(data) > SMBUS_BLOCK_MAX:
+            raise ValueError(f"Data length cannot exceed {SMBUS_BLOCK_MAX} bytes")
+        try:
+            self.eeprom.write(register, list(data))
+        finally:
+            self.eeprom.end_transaction()
+
+    def i2c_rdwr(self, *messages: Any) -> None:
+        """
+        Combined transaction (repeated START between messages).
+
+        Supports the E-DDC sequence: optional segment write to 0x30, word
+        offset write to 0x50, then a read of any length. Messages follow the
+        smbus2 i2c_msg interface (addr, flags, len, buf).
+        """
+        offset = 0
+        try:
+            for message in messages:
+                self._check_address(message.addr)
+                if message.flags & I2C_M_RD:
+                    data = self.eeprom.read(offset, message.len)
+                    for i, value in enumerate(data):
+                        message.buf[i] = value
+                    offset += message.len
+                elif message.addr == SEGMENT_POINTER_ADDRESS:
+                    self.eeprom.set_segment(message.buf[0])
+                else:
+                    payload = [message.buf[i] for i in range(message.len)]
+                    if len(payload) == 1:
+                        offset = payload[0]
+                    else:
+                        self.eeprom.write(payload[0], payload[1:])
+        finally:
+            self.eeprom.end_transaction()
+
+
+class SimulatorBackend(BusBackend):
+    """
+    Backend serving simulated EEPROMs.
+
+    Args:
+        eeproms: Mapping of bus number to simulated EEPROM
+        muxes: Mapping of child bus number to (parent bus, channel); parent
+            buses without an EEPROM are created empty
+
+    Attributes:
+        mux_switches: Number of times a simulated mux changed channel
+    """
+
+    name = "simulator"
+
+    def __init__(
+        self,
+        eeproms: Dict[int, SimulatedEEPROM],
+        muxes: Optional[Dict[int, Tuple[int, int]]] = None,
+    ):
+        self.eeproms = eeproms
+        self.muxes = muxes or {}
+        self.mux_switches = 0
+        # Selected channel of each mux, keyed by parent bus
+        self._selected: Dict[int, int] = {}
+
+    def list_buses(self) -> List[int]:
+        buses = set(self.eeproms) | set(self.muxes)
+        buses.update(parent for parent, _ in self.muxes.values())
+        return sorted(buses)
+
+    def adapter_name(self, bus_num: int) -> str:
+        return f"simulator-{bus_num}"
+
+    def adapter_parent(self, bus_num: int) -> Optional[Dict[str, Any]]:
+        if bus_num not in self.muxes:
+            return None
+        parent, channel = self.muxes[bus_num]
+        return {
+            "parent": parent,
+            "mux": f"{parent}-{MUX_ADDRESS:04x}",
+            "channel": channel,
+        }
+
+    def _select(self, bus_num: int) -> None:
+        # Like the kernel's mux core, select every mux on the path to the
+        # root for each transfer; a mux already on the right channel is not
+        # written
+        while bus_num in self.muxes:
+            parent, channel = self.muxes[bus_num]
+            if self._selected.get(parent) != channel:
+                self._selected[parent] = channel
+                self.mux_switches += 1
+            bus_num = parent
+
+    def open(self, bus_num: int) -> SimulatedBus:
+        if bus_num not in self.list_buses():
+            raise OSError(
+                errno.ENOENT, f"No such file or directory: '/dev/i2c-{bus_num}'"
+            )
+        select = None
+        if bus_num in self.muxes:
+            select = lambda: self._select(bus_num)  # noqa: E731
+        return SimulatedBus(bus_num, self.eeproms.get(bus_num), select)
+
+
+def parse_simulator_spec(
+    spec: str, **eeprom_options: Any
+) -> Dict[int, SimulatedEEPROM]:
+    """
+    Build a simulated EEPROM from a BUS=FILE specification.
+
+    Args:
+        spec: Bus number and EDID file, e.g. "5=display.bin"
+        eeprom_options: Extra SimulatedEEPROM arguments
+
+    Returns:
+        Single-entry mapping of bus number to EEPROM
+
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    bus, sep, file_name = spec.partition("=")
+    if not sep or not bus.strip().isdigit():
+        raise ValueError(f"Invalid simulator spec '{spec}' (expected BUS=FILE)")
+
+    data = Path(file_name).read_bytes()
+    segments = max(1, (len(data) + SEGMENT_SIZE - 1) // SEGMENT_SIZE)
+    return {int(bus): SimulatedEEPROM(data, segments=segments, **eeprom_options)}
+
+
+def parse_mux_spec(spec: str) -> Dict[int, Tuple[int, int]]:
+    """
+    Place a simulated bus behind a mux channel from a CHILD=PARENT:CHANNEL
+    specification.
+
+    Args:
+        spec: Child bus, parent bus and channel, e.g. "12=3:0"
+
+    Returns:
+        Single-entry mapping of child bus number to (parent, channel)
+
+    Raises:
+        ValueError: If the specification is malformed
+    """
+    child, sep, position = spec.partition("=")
+    parent, colon, channel = position.partition(":")
+    if not (sep and colon and child.isdigit() and parent.isdigit()):
+        raise ValueError(f"Invalid mux spec '{spec}' (expected CHILD=PARENT:CHANNEL)")
+    if not channel.isdigit():
+        raise ValueError(f"Invalid mux channel in '{spec}'")
+    return {int(child): (int(parent), int(channel))}
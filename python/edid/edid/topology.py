@@ -0,0 +1,228 @@
+"""I2C mux topology discovery.
+
+Displays on test rigs often sit behind PCA954x muxes. The kernel exposes
+each mux channel as a child adapter of the bus the mux is on; the backend
+reports that position (from /sys/bus/i2c/devices for real hardware), and
+the adapters are arranged into a tree of root adapters and their channels.
+
+Discovery probes each root adapter's tree depth-first, in channel order,
+from one worker: every channel is selected once and the root bus is probed
+before any channel is switched in. Probing two channels of the same mux
+concurrently would only make the mux switch back and forth, since they
+share the parent bus; different root adapters are independent buses and
+are probed in parallel.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .backend import get_backend
+from .i2c import check_smbus_available, probe_bus
+from .profiling import profiled
+
+
+def build_topology(bus_nums: Optional[List[int]] = None) -> Dict[str, Any]:
+    """
+    Arrange buses into a tree of root adapters and mux channels.
+
+    Args:
+        bus_nums: Buses to include (default: all buses of the backend)
+
+    Returns:
+        Dictionary with nodes (bus number -> node) and roots (bus numbers
+        of adapters without a known parent). Nodes have bus, adapter,
+        parent, mux, channel and children (bus numbers, in channel order)
+    """
+    backend = get_backend()
+    if bus_nums is None:
+        bus_nums = backend.list_buses()
+
+    nodes: Dict[int, Dict[str, Any]] = {}
+    for bus_num in bus_nums:
+        node = {
+            "bus": bus_num,
+            "adapter": backend.adapter_name(bus_num),
+            "parent": None,
+            "mux": None,
+            "channel": None,
+            "children": [],
+        }
+        node.update(backend.adapter_parent(bus_num) or {})
+        nodes[bus_num] = node
+
+    roots = []
+    for bus_num, node in nodes.items():
+        if node["parent"] in nodes:
+            nodes[node["parent"]]["children"].append(bus_num)
+        else:
+            roots.append(bus_num)
+
+    for node in nodes.values():
+        node["children"].sort(key=lambda child: _channel_key(nodes[child]))
+
+    return {"nodes": nodes, "roots": sorted(roots)}
+
+
+def _channel_key(node: Dict[str, Any]) -> tuple:
+    channel = node["channel"]
+    return (node["mux"] or "", channel if channel is not None else -1, node["bus"])
+
+
+def traversal_order(topology: Dict[str, Any], root: int) -> List[int]:
+    """
+    Depth-first probe order of a root adapter's tree.
+
+    Args:
+        topology: Result of build_topology
+        root: Root bus number
+
+    Returns:
+        Bus numbers: the root first, then each channel followed by the
+        channels below it
+    """
+    nodes = topology["nodes"]
+    order = []
+    pending = [root]
+    while pending:
+        bus_num = pending.pop()
+        order.append(bus_num)
+        pending.extend(reversed(nodes[bus_num]["children"]))
+    return order
+
+
+def mux_selections(topology: Dict[str, Any], order: List[int]) -> int:
+    """
+    Count the mux channel changes needed to visit buses in an order.
+
+    Args:
+        topology: Result of build_topology
+        order: Bus numbers in visiting order
+
+    Returns:
+        Number of times a mux has to switch to another channel
+    """
+    nodes = topology["nodes"]
+    selected: Dict[str, Any] = {}
+    switches = 0
+    for bus_num in order:
+        node = nodes[bus_num]
+        # Visiting a bus selects every mux on its path to the root
+        while node["mux"] is not None:
+            if selected.get(node["mux"]) != node["channel"]:
+                selected[node["mux"]] = node["channel"]
+                switches += 1
+            if node["parent"] not in nodes:
+                break
+            node = nodes[node["parent"]]
+    return switches
+
+
+def _probe_tree(topology: Dict[str, Any], root: int, verbose: bool) -> None:
+    nodes = topology["nodes"]
+    for bus_num in traversal_order(topology, root):
+        node = nodes[bus_num]
+        try:
+            node["edid"] = probe_bus(bus_num)
+            node["error"] = None
+        except OSError as e:
+            node["edid"] = None
+            node["error"] = str(e)
+        if verbose:
+            status = _status(node)
+            print(f"  Bus {bus_num}: {status}")
+
+
+@profiled("topology.discover")
+def discover_topology(
+    workers: Optional[int] = None, verbose: bool = False
+) -> Dict[str, Any]:
+    """
+    Build the mux tree and probe every bus for an EDID.
+
+    Each root adapter's tree is probed by one worker thread; different
+    roots are probed concurrently.
+
+    Args:
+        workers: Maximum worker threads (default: one per root adapter)
+        verbose: Print each probe result
+
+    Returns:
+        build_topology() result whose nodes also have edid (True, False,
+        or None if the bus was not accessible) and error, plus stats with
+        roots, buses, workers, mux_selections and seconds
+    """
+    check_smbus_available()
+    topology = build_topology()
+    roots = topology["roots"]
+    workers = max(1, min(workers or len(roots), len(roots)))
+
+    if verbose:
+        print(
+            f"Scanning {len(topology['nodes'])} I2C device(s) under "
+            f"{len(roots)} root adapter(s) with {workers} worker(s)..."
+        )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_probe_tree, topology, root, verbose) for root in roots
+        ]
+        for future in futures:
+            future.result()
+
+    topology["stats"] = {
+        "roots": len(roots),
+        "buses": len(topology["nodes"]),
+        "workers": workers,
+        "mux_selections": sum(
+            mux_selections(topology, traversal_order(topology, root)) for root in roots
+        ),
+        "seconds": time.perf_counter() - start,
+    }
+    return topology
+
+
+def _status(node: Dict[str, Any]) -> str:
+    if node.get("edid"):
+        return "✓ EDID detected"
+    if node.get("error"):
+        return f"Not accessible ({node['error']})"
+    return "  No EDID"
+
+
+def format_tree(topology: Dict[str, Any], show_adapters: bool = False) -> List[str]:
+    """
+    Render a probed topology as a tree.
+
+    Args:
+        topology: Result of discover_topology
+        show_adapters: Append adapter names
+
+    Returns:
+        Lines without newlines
+    """
+    nodes = topology["nodes"]
+    lines: List[str] = []
+
+    def describe(node: Dict[str, Any]) -> str:
+        text = f"Bus {node['bus']}"
+        if node["mux"] is not None:
+            channel = "?" if node["channel"] is None else node["channel"]
+            text += f" (mux {node['mux']} channel {channel})"
+        text += f": {_status(node).strip()}"
+        if show_adapters:
+            text += f" [{node['adapter']}]"
+        return text
+
+    def walk(bus_num: int, prefix: str, last: bool, root: bool) -> None:
+        connector = "" if root else ("└── " if last else "├── ")
+        lines.append(f"{prefix}{connector}{describe(nodes[bus_num])}")
+        child_prefix = prefix if root else prefix + ("    " if last else "│   ")
+        children = nodes[bus_num]["children"]
+        for index, child in enumerate(children):
+            walk(child, child_prefix, index == len(children) - 1, False)
+
+    for root in topology["roots"]:
+        walk(root, "  ", True, True)
+    return lines
@@ -0,0 +1,723 @@
+"""Bus transaction traces: recording and timed replay.
+
+TracingBackend wraps the active backend and appends every transaction (open,
+SMBus byte and block transfers, i2c_rdwr) to a binary trace with its
+address, register, length, data, latency and errno. ReplayBackend serves a
+trace back without hardware, sleeping for each recorded latency (optionally
+scaled), so a slow or flaky station's bus behaviour can be reproduced and
+read_edid/write_edid strategies tuned offline.
+
+Layout (little-endian)::
+
+    header      magic "EDIDTRACE", version, reserved, wall-clock start time
+    records     fixed-size record (op, bus, address, register, length,
+                errno, start and latency in microseconds, payload size)
+                followed by its payload
+
+Payloads hold the data read (read ops, nothing on error) or written (write
+ops); i2c_rdwr payloads hold every message as address, flags, length and
+data; metadata records (bus list, adapter names and mux parents) hold JSON.
+
+Replay matches transactions per bus by operation, address, register and
+length (plus the word offset for write_byte and i2c_rdwr writes); payloads
+of block and byte writes are not compared. Matching records are served in
+recorded order and the last one repeats once they run out, so a replay may
+poll or retry more often than the recording did. A transaction that was
+never recorded raises TraceMismatch.
+"""
+
+import errno
+import json
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .backend import I2C_M_RD, BusBackend
+
+MAGIC = b"EDIDTRACE"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<9sBHd")
+RECORD = struct.Struct("<BHBHHHQII")
+MESSAGE = struct.Struct("<BHH")
+
+OP_OPEN = 0
+OP_READ_BYTE_DATA = 1
+OP_WRITE_BYTE_DATA = 2
+OP_WRITE_BYTE = 3
+OP_READ_BLOCK = 4
+OP_WRITE_BLOCK = 5
+OP_RDWR = 6
+OP_META = 7
+
+OP_NAMES = {
+    OP_OPEN: "open",
+    OP_READ_BYTE_DATA: "read_byte_data",
+    OP_WRITE_BYTE_DATA: "write_byte_data",
+    OP_WRITE_BYTE: "write_byte",
+    OP_READ_BLOCK: "read_i2c_block_data",
+    OP_WRITE_BLOCK: "write_i2c_block_data",
+    OP_RDWR: "i2c_rdwr",
+    OP_META: "meta",
+}
+
+# Register field of records without a register
+NO_REGISTER = 0xFFFF
+
+
+class TraceMismatch(RuntimeError):
+    """A replayed transaction has no counterpart in the trace."""
+
+
+class TraceWriter:
+    """
+    Append-only trace file, safe to share between threads.
+
+    Args:
+        path: Trace file (overwritten)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.origin = time.perf_counter()
+        # Bus transactions written (metadata records not included)
+        self.transactions = 0
+        self._lock = threading.Lock()
+        self._file = open(self.path, "wb")
+        self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, time.time()))
+
+    def record(
+        self,
+        op: int,
+        bus_num: int,
+        address: int = 0,
+        register: int = NO_REGISTER,
+        length: int = 0,
+        error: Optional[OSError] = None,
+        start: Optional[float] = None,
+        latency: float = 0.0,
+        payload: bytes = b"",
+    ) -> None:
+        """
+        Append one record.
+
+        Args:
+            op: OP_* code
+            bus_num: I2C bus number
+            address: Device address
+            register: Register or word offset (NO_REGISTER if none)
+            length: Transfer length (message count for i2c_rdwr)
+            error: Error the transaction raised, if any
+            start: perf_counter() value when the transaction started
+            latency: Transaction duration in seconds
+            payload: Data (see module docstring)
+        """
+        code = 0
+        if error is not None:
+            code = error.errno or errno.EIO
+        if start is None:
+            start = time.perf_counter()
+        header = RECORD.pack(
+            op,
+            bus_num,
+            address,
+            register,
+            length,
+            code,
+            max(0, round((start - self.origin) * 1e6)),
+            round(latency * 1e6),
+            len(payload),
+        )
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(header)
+            self._file.write(payload)
+            if op != OP_META:
+                self.transactions += 1
+
+    def record_meta(self, call: str, bus_num: Optional[int], result: Any) -> None:
+        """Append a metadata record (backend query and its result)."""
+        payload = json.dumps({"call": call, "bus": bus_num, "result": result})
+        self.record(OP_META, 0, payload=payload.encode())
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def _encode_messages(messages: Tuple[Any, ...], read_data: bool) -> bytes:
+    """Pack i2c_rdwr messages; read buffers only if the transfer succeeded."""
+    payload = bytearray()
+    for message in messages:
+        is_read = message.flags & I2C_M_RD
+        payload += MESSAGE.pack(message.addr, message.flags, message.len)
+        if not is_read or read_data:
+            payload += bytes(message.buf[i] for i in range(message.len))
+    return bytes(payload)
+
+
+def _decode_messages(payload: bytes, count: int, failed: bool) -> List[Dict[str, Any]]:
+    messages = []
+    offset = 0
+    for _ in range(count):
+        address, flags, length = MESSAGE.unpack_from(payload, offset)
+        offset += MESSAGE.size
+        data = b""
+        if not (flags & I2C_M_RD and failed):
+            data = payload[offset : offset + length]
+            offset += length
+        messages.append(
+            {"address": address, "flags": flags, "length": length, "data": data}
+        )
+    return messages
+
+
+class TracingBus:
+    """SMBus-compatible bus wrapper that records every transaction."""
+
+    def __init__(self, bus: Any, bus_num: int, writer: TraceWriter):
+        self._bus = bus
+        self._bus_num = bus_num
+        self._writer = writer
+
+    def __enter__(self) -> "TracingBus":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._bus.close()
+
+    def _traced(
+        self,
+        op: int,
+        address: int,
+        register: int,
+        length: int,
+        func: Any,
+        args: Tuple[Any, ...],
+        written: bytes = b"",
+        encode_result: Any = None,
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            result = func(*args)
+        except OSError as e:
+            self._record(
+                op, address, register, length, e, start, written, encode_result
+            )
+            raise
+        self._record(
+            op, address, register, length, None, start, written, encode_result, result
+        )
+        return result
+
+    def _record(
+        self,
+        op: int,
+        address: int,
+        register: int,
+        length: int,
+        error: Optional[OSError],
+        start: float,
+        written: bytes,
+        encode_result: Any,
+        result: Any = None,
+    ) -> None:
+        latency = time.perf_counter() - start
+        payload = written
+        if encode_result is not None:
+            payload = encode_result(result, error is None)
+        self._writer.record(
+            op, self._bus_num, address, register, length, error, start, latency, payload
+        )
+
+    def read_byte_data(self, i2c_addr: int, register: int) -> int:
+        return self._traced(
+            OP_READ_BYTE_DATA,
+            i2c_addr,
+            register,
+            1,
+            self._bus.read_byte_data,
+            (i2c_addr, register),
+            encode_result=lambda value, ok: bytes([value]) if ok else b"",
+        )
+
+    def write_byte_data(self, i2c_addr: int, register: int, value: int) -> None:
+        self._traced(
+            OP_WRITE_BYTE_DATA,
+            i2c_addr,
+            register,
+            1,
+            self._bus.write_byte_data,
+            (i2c_addr, register, value),
+            bytes([value]),
+        )
+
+    def write_byte(self, i2c_addr: int, value: int) -> None:
+        self._traced(
+            OP_WRITE_BYTE,
+            i2c_addr,
+            value,
+            1,
+            self._bus.write_byte,
+            (i2c_addr, value),
+            bytes([value]),
+        )
+
+    def read_i2c_block_data(
+        self, i2c_addr: int, register: int, length: int
+    ) -> List[int]:
+        return self._traced(
+            OP_READ_BLOCK,
+            i2c_addr,
+            register,
+            length,
+            self._bus.read_i2c_block_data,
+            (i2c_addr, register, length),
+            encode_result=lambda data, ok: bytes(data) if ok else b"",
+        )
+
+    def write_i2c_block_data(
+        self, i2c_addr: int, register: int, data: List[int]
+    ) -> None:
+        self._traced(
+            OP_WRITE_BLOCK,
+            i2c_addr,
+            register,
+            len(data),
+            self._bus.write_i2c_block_data,
+            (i2c_addr, register, data),
+            bytes(data),
+        )
+
+    def i2c_rdwr(self, *messages: Any) -> None:
+        self._traced(
+            OP_RDWR,
+            messages[0].addr if messages else 0,
+            NO_REGISTER,
+            len(messages),
+            self._bus.i2c_rdwr,
+            messages,
+            encode_result=lambda _, ok: _encode_messages(messages, ok),
+        )
+
+
+class TracingBackend(BusBackend):
+    """
+    Backend that records the transactions of another backend.
+
+    Args:
+        backend: Backend doing the actual bus access
+        writer: Trace to append to
+    """
+
+    name = "trace"
+
+    def __init__(self, backend: BusBackend, writer: TraceWriter):
+        self.backend = backend
+        self.writer = writer
+
+    def check_available(self) -> None:
+        self.backend.check_available()
+
+    def list_buses(self) -> List[int]:
+        buses = self.backend.list_buses()
+        self.writer.record_meta("list_buses", None, buses)
+        return buses
+
+    def adapter_name(self, bus_num: int) -> str:
+        name = self.backend.adapter_name(bus_num)
+        self.writer.record_meta("adapter_name", bus_num, name)
+        return name
+
+    def adapter_parent(self, bus_num: int) -> Optional[Dict[str, Any]]:
+        parent = self.backend.adapter_parent(bus_num)
+        self.writer.record_meta("adapter_parent", bus_num, parent)
+        return parent
+
+    def read_messages(
+        self, address: int, segment: int, offset: int, length: int
+    ) -> List[Any]:
+        return self.backend.read_messages(address, segment, offset, length)
+
+    def write_messages(
+        self, address: int, segment: int, offset: int, data: List[int]
+    ) -> List[Any]:
+        return self.backend.write_messages(address, segment, offset, data)
+
+    def open(self, bus_num: int) -> TracingBus:
+        start = time.perf_counter()
+        try:
+            bus = self.backend.open(bus_num)
+        except OSError as e:
+            self.writer.record(
+                OP_OPEN,
+                bus_num,
+                error=e,
+                start=start,
+                latency=time.perf_counter() - start,
+            )
+            raise
+        self.writer.record(
+            OP_OPEN, bus_num, start=start, latency=time.perf_counter() - start
+        )
+        return TracingBus(bus, bus_num, self.writer)
+
+
+def iter_trace(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Read the records of a trace.
+
+    Args:
+        path: Trace file
+
+    Yields:
+        Dictionaries with op (name), bus, address, register (None if
+        none), length, errno (0 on success), start and latency (seconds)
+        and data (bytes; for i2c_rdwr, messages: address, flags, length
+        and data per message; for metadata, call, bus and result)
+
+    Raises:
+        ValueError: If the file is not a trace or is truncated
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+        if len(header) != HEADER.size or header[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a bus trace: {path}")
+        _, version, _, _ = HEADER.unpack(header)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported trace version {version}")
+
+        while True:
+            raw = f.read(RECORD.size)
+            if not raw:
+                return
+            if len(raw) != RECORD.size:
+                raise ValueError(f"Truncated trace: {path}")
+            op, bus_num, address, register, length, code, start, latency, size = (
+                RECORD.unpack(raw)
+            )
+            payload = f.read(size)
+            if len(payload) != size or op not in OP_NAMES:
+                raise ValueError(f"Corrupt trace record in {path}")
+
+            if op == OP_META:
+                yield {"op": OP_NAMES[op], **json.loads(payload)}
+                continue
+            entry = {
+                "op": OP_NAMES[op],
+                "bus": bus_num,
+                "address": address,
+                "register": None if register == NO_REGISTER else register,
+                "length": length,
+                "errno": code,
+                "start": start / 1e6,
+                "latency": latency / 1e6,
+                "data": payload,
+            }
+            if op == OP_RDWR:
+                entry["messages"] = _decode_messages(payload, length, code != 0)
+            yield entry
+
+
+def transaction_key(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Key that matches a replayed transaction to recorded ones.
+
+    Args:
+        entry: Record from iter_trace (or a transaction in the same form)
+
+    Returns:
+        (op, address, register, length) plus, for i2c_rdwr, the address,
+        flags, length and write payload of every message
+    """
+    key = (entry["op"], entry["address"], entry["register"], entry["length"])
+    if entry["op"] == "i2c_rdwr":
+        key += tuple(
+            (
+                message["address"],
+                message["flags"],
+                message["length"],
+                b"" if message["flags"] & I2C_M_RD else message["data"],
+            )
+            for message in entry["messages"]
+        )
+    return key
+
+
+class ReplayBus:
+    """SMBus-compatible bus serving recorded transactions."""
+
+    def __init__(self, backend: "ReplayBackend", bus_num: int):
+        self._backend = backend
+        self._bus_num = bus_num
+
+    def __enter__(self) -> "ReplayBus":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        pass
+
+    def _serve(
+        self, op: str, address: int, register: Optional[int], length: int
+    ) -> Dict[str, Any]:
+        return self._backend.serve(
+            self._bus_num,
+            {"op": op, "address": address, "register": register, "length": length},
+        )
+
+    def read_byte_data(self, i2c_addr: int, register: int) -> int:
+        return self._serve("read_byte_data", i2c_addr, register, 1)["data"][0]
+
+    def write_byte_data(self, i2c_addr: int, register: int, value: int) -> None:
+        self._serve("write_byte_data", i2c_addr, register, 1)
+
+    def write_byte(self, i2c_addr: int, value: int) -> None:
+        self._serve("write_byte", i2c_addr, value, 1)
+
+    def read_i2c_block_data(
+        self, i2c_addr: int, register: int, length: int
+    ) -> List[int]:
+        return list(
+            self._serve("read_i2c_block_data", i2c_addr, register, length)["data"]
+        )
+
+    def write_i2c_block_data(
+        self, i2c_addr: int, register: int, data: List[int]
+    ) -> None:
+        self._serve("write_i2c_block_data", i2c_addr, register, len(data))
+
+    def i2c_rdwr(self, *messages: Any) -> None:
+        request = {
+            "op": "i2c_rdwr",
+            "address": messages[0].addr if messages else 0,
+            "register": None,
+            "length": len(messages),
+            "messages": [
+                {
+                    "address": message.addr,
+                    "flags": message.flags,
+                    "length": message.len,
+                    "data": bytes(message.buf[i] for i in range(message.len)),
+                }
+                for message in messages
+            ],
+        }
+        recorded = self._backend.serve(self._bus_num, request)
+        for message, served in zip(messages, recorded["messages"]):
+            if message.flags & I2C_M_RD:
+                for i, value in enumerate(served["data"]):
+                    message.buf[i] = value
+
+
+class ReplayBackend(BusBackend):
+    """
+    Backend serving a recorded trace with its original timing.
+
+    Args:
+        path: Trace file written by TracingBackend
+        time_scale: Factor applied to recorded latencies (0 replays
+            without sleeping)
+
+    Attributes:
+        served: Number of transactions served
+    """
+
+    name = "replay"
+
+    def __init__(self, path: Path, time_scale: float = 1.0):
+        self.path = Path(path)
+        self.time_scale = time_scale
+        self.served = 0
+        self._meta: Dict[Tuple[str, Optional[int]], Any] = {}
+        # Per bus and key: recorded transactions and the next one to serve
+        self._records: Dict[int, Dict[Tuple[Any, ...], List[Dict[str, Any]]]] = {}
+        self._next: Dict[Tuple[int, Tuple[Any, ...]], int] = {}
+        self._lock = threading.Lock()
+
+        for entry in iter_trace(self.path):
+            if entry["op"] == "meta":
+                self._meta[(entry["call"], entry["bus"])] = entry["result"]
+                continue
+            keys = self._records.setdefault(entry["bus"], {})
+            keys.setdefault(transaction_key(entry), []).append(entry)
+
+    def list_buses(self) -> List[int]:
+        if ("list_buses", None) in self._meta:
+            return self._meta[("list_buses", None)]
+        return sorted(self._records)
+
+    def adapter_name(self, bus_num: int) -> str:
+        return self._meta.get(("adapter_name", bus_num)) or super().adapter_name(
+            bus_num
+        )
+
+    def adapter_parent(self, bus_num: int) -> Optional[Dict[str, Any]]:
+        return self._meta.get(("adapter_parent", bus_num))
+
+    def serve(self, bus_num: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replay the recorded counterpart of a transaction.
+
+        Sleeps for the recorded latency (times time_scale), then raises the
+        recorded error or returns the record.
+
+        Args:
+            bus_num: I2C bus number
+            request: Transaction in the form of an iter_trace record (op,
+                address, register, length, messages for i2c_rdwr)
+
+        Returns:
+            The recorded transaction
+
+        Raises:
+            OSError: If the recorded transaction failed
+            TraceMismatch: If no such transaction was recorded
+        """
+        key = transaction_key(request)
+        candidates = self._records.get(bus_num, {}).get(key)
+        if not candidates:
+            raise TraceMismatch(
+                f"{self.path}: no {request['op']} on bus {bus_num} to address "
+                f"0x{request['address']:02x}"
+                + (
+                    f" register 0x{request['register']:02x}"
+                    if request["register"] is not None
+                    else ""
+                )
+                + f" (length {request['length']}) was recorded"
+            )
+        with self._lock:
+            index = self._next.get((bus_num, key), 0)
+            self._next[(bus_num, key)] = index + 1
+            self.served += 1
+        recorded = candidates[min(index, len(candidates) - 1)]
+
+        if self.time_scale > 0 and recorded["latency"] > 0:
+            time.sleep(recorded["latency"] * self.time_scale)
+        if recorded["errno"]:
+            code = recorded["errno"]
+            raise OSError(code, os.strerror(code))
+        return recorded
+
+    def open(self, bus_num: int) -> ReplayBus:
+        if bus_num not in self._records:
+            raise OSError(
+                errno.ENOENT, f"No such file or directory: '/dev/i2c-{bus_num}'"
+            )
+        if (OP_NAMES[OP_OPEN], 0, None, 0) in self._records[bus_num]:
+            self.serve(
+                bus_num, {"op": "open", "address": 0, "register": None, "length": 0}
+            )
+        return ReplayBus(self, bus_num)
+
+
+def summarize_trace(path: Path) -> Dict[str, Any]:
+    """
+    Per-bus, per-operation statistics of a trace.
+
+    Args:
+        path: Trace file
+
+    Returns:
+        Dictionary with records, duration (seconds from the first to the
+        end of the last transaction) and buses: bus -> op -> count,
+        errors (errno name -> count), bytes, latency total/min/max
+    """
+    buses: Dict[int, Dict[str, Dict[str, Any]]] = {}
+    records = 0
+    duration = 0.0
+    for entry in iter_trace(path):
+        if entry["op"] == "meta":
+            continue
+        records += 1
+        duration = max(duration, entry["start"] + entry["latency"])
+        stats = buses.setdefault(entry["bus"], {}).setdefault(
+            entry["op"],
+            {
+                "count": 0,
+                "errors": {},
+                "bytes": 0,
+                "latency_total": 0.0,
+                "latency_min": None,
+                "latency_max": 0.0,
+            },
+        )
+        stats["count"] += 1
+        if entry["errno"]:
+            name = errno.errorcode.get(entry["errno"], str(entry["errno"]))
+            stats["errors"][name] = stats["errors"].get(name, 0) + 1
+        if entry["op"] == "i2c_rdwr":
+            stats["bytes"] += sum(len(m["data"]) for m in entry["messages"])
+        else:
+            stats["bytes"] += len(entry["data"])
+        latency = entry["latency"]
+        stats["latency_total"] += latency
+        if stats["latency_min"] is None or latency < stats["latency_min"]:
+            stats["latency_min"] = latency
+        stats["latency_max"] = max(stats["latency_max"], latency)
+    return {"records": records, "duration": duration, "buses": buses}
+
+
+def format_trace_summary(summary: Dict[str, Any]) -> List[str]:
+    """
+    Format a trace summary as text lines.
+
+    Args:
+        summary: Result of summarize_trace
+
+    Returns:
+        A header line, then a line per bus and operation
+    """
+    lines = [f"{summary['records']} transaction(s) over {summary['duration']:.3f}s"]
+    for bus_num in sorted(summary["buses"]):
+        lines.append(f"Bus {bus_num}:")
+        for op, stats in summary["buses"][bus_num].items():
+            mean = stats["latency_total"] / stats["count"]
+            errors = ", ".join(
+                f"{name} x{count}" for name, count in stats["errors"].items()
+            )
+            lines.append(
+                f"  {op:<21} {stats['count']:6d}  {stats['bytes']:7d} B  "
+                f"latency avg {mean * 1e3:.3f} / min "
+                f"{(stats['latency_min'] or 0) * 1e3:.3f} / max "
+                f"{stats['latency_max'] * 1e3:.3f} ms"
+                + (f"  errors: {errors}" if errors else "")
+            )
+    return lines
+
+
+def format_record(entry: Dict[str, Any]) -> str:
+    """
+    Format one trace record as a line.
+
+    Args:
+        entry: Record from iter_trace
+
+    Returns:
+        "start  bus  op  address[/register]  length  latency  result" line
+    """
+    if entry["op"] == "meta":
+        return f"{'':>12}  meta {entry['call']}({entry['bus']}) = {entry['result']}"
+    target = f"0x{entry['address']:02x}"
+    if entry["register"] is not None:
+        target += f"/0x{entry['register']:02x}"
+    if entry["errno"]:
+        result = errno.errorcode.get(entry["errno"], str(entry["errno"]))
+    elif entry["op"] == "i2c_rdwr":
+        result = " | ".join(m["data"].hex() for m in entry["messages"])
+    else:
+        result = entry["data"].hex()
+    return (
+        f"{entry['start']:12.6f}  bus {entry['bus']:<3} {entry['op']:<21} "
+        f"{target:<10} len {entry['length']:<4} {entry['latency'] * 1e3:8.3f} ms  "
+        f"{result}"
+    ).rstrip()
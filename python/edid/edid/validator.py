@@ -2,6 +2,8 @@
 
 from typing import Optional, Tuple
 
+from .profiling import profiled
+
 
 # EDID header magic bytes
 EDID_HEADER = bytes([0x00, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x00])
@@ -59,6 +61,7 @@ def validate_header(edid_data: bytes) -> bool:
     return edid_data[:8] == EDID_HEADER
 
 
+@profiled("validator.validate_structure")
 def validate_structure(edid_data: bytes) -> Tuple[bool, str]:
     """
     Validate overall EDID structure.
@@ -152,6 +155,7 @@ def find_safe_test_byte(edid_data: bytes) -> Optional[int]:
     return None
 
 
+@profiled("validator.recalculate_checksums")
 def recalculate_checksums(edid_data: bytearray) -> None:
     """
     Recalculate and update checksums for all EDID blocks.
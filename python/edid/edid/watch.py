@@ -0,0 +1,195 @@
+"""Watch buses for display changes with minimal bus traffic.
+
+Each poll reads only the identity bytes of the base block: the 8-byte
+header and vendor/product/serial/date (bytes 0-17) in one block read, plus
+the base block checksum (byte 127). Together they change whenever a
+different display (or a rewritten EDID) is attached. The complete EDID is
+read only when that signature changes: 19 bytes per poll instead of 128 or
+more for a full read.
+"""
+
+import hashlib
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from .i2c import EDID_ADDRESS, check_smbus_available, open_bus, read_edid, transfer
+from .locking import bus_lock
+from .parser import (
+    DESCRIPTOR_OFFSETS,
+    DESCRIPTOR_SIZE,
+    decode_descriptor_name,
+    decode_product_info,
+)
+
+# Identity bytes polled: header, vendor, product, serial, week, year
+IDENTITY_LENGTH = 18
+CHECKSUM_OFFSET = 127
+SIGNATURE_SIZE = IDENTITY_LENGTH + 1
+
+# Event types
+ATTACHED = "attached"
+DETACHED = "detached"
+CHANGED = "changed"
+
+
+def read_signature(bus: Any, bus_num: int) -> Optional[bytes]:
+    """
+    Read the identity signature of the display on a bus.
+
+    Args:
+        bus: Open bus object
+        bus_num: I2C bus number
+
+    Returns:
+        19 signature bytes, or None if no display answers
+    """
+    try:
+        with bus_lock(bus_num):
+            identity = transfer(
+                bus_num, bus.read_i2c_block_data, EDID_ADDRESS, 0, IDENTITY_LENGTH
+            )
+            checksum = transfer(
+                bus_num, bus.read_byte_data, EDID_ADDRESS, CHECKSUM_OFFSET
+            )
+    except OSError:
+        return None
+    return bytes(identity) + bytes([checksum])
+
+
+def describe_edid(edid_data: bytes) -> Dict[str, Any]:
+    """
+    Summarize an EDID for watch events.
+
+    Args:
+        edid_data: Complete EDID data
+
+    Returns:
+        Dictionary with manufacturer, product_code, serial_number, name,
+        size and sha256
+    """
+    product = decode_product_info(edid_data)
+    name = ""
+    for desc_offset in DESCRIPTOR_OFFSETS:
+        name = decode_descriptor_name(
+            edid_data[desc_offset : desc_offset + DESCRIPTOR_SIZE]
+        )
+        if name:
+            break
+
+    return {
+        "manufacturer": product.get("manufacturer"),
+        "product_code": product.get("product_code"),
+        "serial_number": product.get("serial_number"),
+        "name": name or None,
+        "size": len(edid_data),
+        "sha256": hashlib.sha256(edid_data).hexdigest(),
+    }
+
+
+def _event(event_type: str, bus_num: int, **fields: Any) -> Dict[str, Any]:
+    return {
+        "time": datetime.now().isoformat(timespec="milliseconds"),
+        "event": event_type,
+        "bus": bus_num,
+        **fields,
+    }
+
+
+def watch_buses(
+    bus_nums: List[int],
+    interval: float = 1.0,
+    max_polls: Optional[int] = None,
+    stats: Optional[Dict[str, int]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Poll buses and yield an event whenever a display changes.
+
+    The first poll reports every display already present as attached.
+
+    Args:
+        bus_nums: Buses to watch
+        interval: Seconds between polls
+        max_polls: Stop after this many polls (None runs until interrupted)
+        stats: Optional dictionary updated with polls, poll_bytes,
+            full_reads and full_read_bytes
+
+    Yields:
+        Event dictionaries with time, event (attached, detached, changed),
+        bus and, for attached/changed, the describe_edid() fields; failed
+        full reads yield an event with an "error" message instead
+    """
+    check_smbus_available()
+    if stats is None:
+        stats = {}
+    for key in ("polls", "poll_bytes", "full_reads", "full_read_bytes"):
+        stats.setdefault(key, 0)
+
+    signatures: Dict[int, Optional[bytes]] = {}
+
+    with ExitStack() as stack:
+        buses = {
+            bus_num: stack.enter_context(open_bus(bus_num)) for bus_num in bus_nums
+        }
+
+        poll = 0
+        while max_polls is None or poll < max_polls:
+            if poll:
+                time.sleep(interval)
+            poll += 1
+
+            for bus_num, bus in buses.items():
+                signature = read_signature(bus, bus_num)
+                stats["polls"] += 1
+                stats["poll_bytes"] += SIGNATURE_SIZE
+
+                known = bus_num in signatures
+                previous = signatures.get(bus_num)
+                if known and signature == previous:
+                    continue
+
+                if signature is None:
+                    signatures[bus_num] = None
+                    if previous is not None:
+                        yield _event(DETACHED, bus_num)
+                    continue
+
+                event_type = ATTACHED if previous is None else CHANGED
+                try:
+                    edid_data = read_edid(bus_num)
+                except (OSError, ValueError) as e:
+                    # Leave the signature unknown so the next poll retries
+                    signatures.pop(bus_num, None)
+                    yield _event(event_type, bus_num, error=str(e))
+                    continue
+
+                stats["full_reads"] += 1
+                stats["full_read_bytes"] += len(edid_data)
+                signatures[bus_num] = edid_data[:IDENTITY_LENGTH] + bytes(
+                    [edid_data[CHECKSUM_OFFSET]]
+                )
+                yield _event(event_type, bus_num, **describe_edid(edid_data))
+
+
+def format_event(event: Dict[str, Any]) -> str:
+    """
+    Format a watch event as one line of text.
+
+    Args:
+        event: Event from watch_buses
+
+    Returns:
+        Human-readable line
+    """
+    line = f"{event['time']}  bus {event['bus']}: {event['event']}"
+    if "error" in event:
+        return f"{line} (read failed: {event['error']})"
+    if "sha256" in event:
+        name = f" \"{event['name']}\"" if event["name"] else ""
+        line += (
+            f" {event['manufacturer']} 0x{event['product_code']:04X}{name} "
+            f"serial {event['serial_number']}, {event['size']} bytes, "
+            f"sha256 {event['sha256'][:12]}"
+        )
+    return line
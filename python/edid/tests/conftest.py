@@ -0,0 +1,119 @@
+"""Shared fixtures: an isolated home directory and the EEPROM simulator."""
+
+import struct
+import tempfile
+
+import pytest
+
+from benchmarks.corpus import base_block, make_edid
+from edid.displayid import PRODUCT_ID, TIMING_DESCRIPTOR
+from edid.backend import set_backend
+from edid.simulator import SimulatedEEPROM, SimulatorBackend
+from edid.validator import recalculate_checksums
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Keep backups, journals, caches and lock files inside tmp_path."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(home / ".cache"))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return home
+
+
+@pytest.fixture
+def use_backend():
+    """Install bus backends for the test; the original one is restored."""
+    previous = []
+
+    def install(backend):
+        previous.append(set_backend(backend))
+        return backend
+
+    yield install
+    if previous:
+        set_backend(previous[0])
+
+
+@pytest.fixture
+def simulate(use_backend):
+    """
+    Install a simulator backend for the test.
+
+    Returns:
+        Function taking a bus -> SimulatedEEPROM mapping (and optional
+        muxes) and returning the installed SimulatorBackend
+    """
+
+    def install(eeproms, muxes=None):
+        return use_backend(SimulatorBackend(eeproms, muxes))
+
+    return install
+
+
+@pytest.fixture
+def eeprom():
+    """Factory for a SimulatedEEPROM holding an EDID, sized to fit it."""
+
+    def create(edid_data, **options):
+        options.setdefault("segments", max(1, len(edid_data) // 256))
+        options.setdefault("write_cycle_time", 0.001)
+        return SimulatedEEPROM(edid_data, **options)
+
+    return create
+
+
+@pytest.fixture
+def edid128():
+    return make_edid(128)
+
+
+@pytest.fixture
+def edid256():
+    return make_edid(256)
+
+
+@pytest.fixture
+def edid512():
+    return make_edid(512)
+
+
+@pytest.fixture
+def displayid_edid():
+    """
+    Factory for a 256-byte EDID with a DisplayID 1.2 extension.
+
+    The extension holds a product identification block (with the given
+    serial number) and a Type I timing for 3840x2160@60.
+    """
+
+    def create(serial=1):
+        name = b"TILE"
+        product = PRODUCT_ID.pack(b"DEL", 0x4321, serial, 10, 20, len(name)) + name
+        # Clock in 10 kHz units, flags (preferred, 16:9), then active,
+        # blank, sync offset and width (all stored as value - 1)
+        timing = TIMING_DESCRIPTOR.pack(
+            53325 - 1, 0, 0x84, 3839, 159, 47, 31, 2159, 61, 2, 4
+        )
+        data_blocks = (
+            bytes([0x00, 0x00, len(product)])
+            + product
+            + bytes([0x03, 0x00, len(timing)])
+            + timing
+        )
+
+        extension = bytearray(128)
+        extension[0] = 0x70
+        extension[1:5] = bytes([0x12, len(data_blocks), 0x00, 0x00])
+        extension[5 : 5 + len(data_blocks)] = data_blocks
+        section_end = 5 + len(data_blocks)
+        extension[section_end] = -sum(extension[1:section_end]) & 0xFF
+
+        edid_data = base_block(1) + extension
+        struct.pack_into("<I", edid_data, 12, serial)
+        recalculate_checksums(edid_data)
+        return bytes(edid_data)
+
+    return create
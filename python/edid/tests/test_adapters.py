@@ -0,0 +1,134 @@
+"""Adaptive read chunk sizes and adapter profiles."""
+
+import pytest
+from click.testing import CliRunner
+
+from edid.adapters import (
+    CHUNK_SIZES,
+    SHRINK_AFTER_FAILURES,
+    chunk_size_for,
+    get_profile,
+    reset_profiles,
+    save_chunk_size,
+    smaller_chunk_size,
+)
+from edid.cli import cli
+from edid.i2c import read_edid
+from edid.simulator import SimulatedEEPROM
+
+BUS = 1
+ADAPTER = f"simulator-{BUS}"
+
+
+def test_chunk_sizes():
+    assert chunk_size_for(None) == CHUNK_SIZES[0]
+    assert chunk_size_for({"chunk_size": 32}) == 32
+    # Sizes that are no longer tried fall back to the largest
+    assert chunk_size_for({"chunk_size": 48}) == CHUNK_SIZES[0]
+    assert smaller_chunk_size(256) == 128
+    assert smaller_chunk_size(CHUNK_SIZES[-1]) is None
+
+
+def test_profiles_are_kept_per_adapter():
+    save_chunk_size("adapter-a", 64)
+    save_chunk_size("adapter-b", 16)
+    assert get_profile("adapter-a")["chunk_size"] == 64
+    assert get_profile("adapter-b")["chunk_size"] == 16
+    assert get_profile("adapter-c") is None
+
+
+def test_whole_segments_for_capable_adapters(simulate, eeprom, edid512):
+    device = eeprom(edid512)
+    simulate({BUS: device})
+
+    assert read_edid(BUS) == edid512
+    assert get_profile(ADAPTER)["chunk_size"] == 256
+    # Base block, then each 256-byte segment in one transaction
+    assert device.transactions == 3
+
+
+def test_read_edid_with_short_adapter_reads(simulate, eeprom, edid512):
+    # Chunks shrink to 32 bytes, which must still set the segment pointer
+    # beyond offset 256. The base block and the extensions are read as two
+    # ranges that each fall back, so the smaller size is stored on the
+    # second EDID read.
+    simulate({BUS: eeprom(edid512, max_read=32)})
+    assert read_edid(BUS) == edid512
+    assert get_profile(ADAPTER)["chunk_size"] == 256
+    assert read_edid(BUS) == edid512
+    assert get_profile(ADAPTER)["chunk_size"] == 32
+    assert get_profile(ADAPTER)["failures"] == 0
+
+
+def test_repeated_fallbacks_store_smaller_size(simulate, eeprom, edid128):
+    simulate({BUS: eeprom(edid128, max_read=32)})
+    for failures in range(1, SHRINK_AFTER_FAILURES):
+        assert read_edid(BUS) == edid128
+        assert get_profile(ADAPTER)["chunk_size"] == 256
+        assert get_profile(ADAPTER)["failures"] == failures
+
+    assert read_edid(BUS) == edid128
+    assert get_profile(ADAPTER)["chunk_size"] == 32
+    assert get_profile(ADAPTER)["failures"] == 0
+    assert get_profile(ADAPTER)["shrinks"] == 1
+
+
+def test_glitch_does_not_downgrade_adapter(simulate, eeprom, edid128):
+    # The base block NACKs on every attempt, so the read falls back once
+    simulate({BUS: eeprom(edid128, nack_on={1, 2, 3, 4})})
+    assert read_edid(BUS) == edid128
+    assert get_profile(ADAPTER)["chunk_size"] == 256
+    assert get_profile(ADAPTER)["failures"] == 1
+
+    # A clean read at the stored size clears the count
+    assert read_edid(BUS) == edid128
+    assert get_profile(ADAPTER)["chunk_size"] == 256
+    assert get_profile(ADAPTER)["failures"] == 0
+    assert get_profile(ADAPTER)["shrinks"] == 0
+
+
+def test_programming_errors_are_not_adapter_limits(
+    simulate, eeprom, edid128, monkeypatch
+):
+    simulate({BUS: eeprom(edid128)})
+
+    def broken(self, offset, length):
+        raise ValueError("bug")
+
+    monkeypatch.setattr(SimulatedEEPROM, "read", broken)
+    with pytest.raises(ValueError, match="bug"):
+        read_edid(BUS)
+    assert get_profile(ADAPTER) is None
+
+
+def test_reset_profiles():
+    for adapter in ("adapter-a", "adapter-b", "adapter-c"):
+        save_chunk_size(adapter, 32)
+
+    assert reset_profiles(["adapter-a", "unknown"]) == 1
+    assert get_profile("adapter-a") is None
+    assert reset_profiles() == 2
+    assert get_profile("adapter-b") is None
+
+
+def test_relearn_command(simulate, eeprom, edid128):
+    simulate({BUS: eeprom(edid128)})
+    save_chunk_size(ADAPTER, 16)
+    save_chunk_size("other", 16)
+
+    result = CliRunner().invoke(cli, ["relearn", str(BUS)])
+
+    assert result.exit_code == 0
+    assert "Forgot the read chunk size of 1 adapter(s)" in result.output
+    assert get_profile(ADAPTER) is None
+    assert get_profile("other")["chunk_size"] == 16
+
+
+def test_learned_size_is_used_next_time(simulate, eeprom, edid256):
+    save_chunk_size(ADAPTER, 32)
+    device = eeprom(edid256)
+    simulate({BUS: device})
+
+    assert read_edid(BUS) == edid256
+    assert device.nacks == 0
+    assert device.transactions == 256 // 32
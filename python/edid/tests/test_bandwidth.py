@@ -0,0 +1,108 @@
+"""Link bandwidth feasibility."""
+
+import pytest
+
+from benchmarks.corpus import make_corpus
+from edid.bandwidth import (
+    FAMILY_DP,
+    FAMILY_FRL,
+    FAMILY_TMDS,
+    BandwidthAnalyzer,
+    analyze_corpus,
+    bits_per_pixel,
+    clock_limits,
+    find_links,
+    parse_format,
+    summarize_corpus,
+)
+
+HDMI_14 = "HDMI 1.4 (340 MHz)"
+HDMI_20 = "HDMI 2.0 (600 MHz)"
+
+
+def test_parse_format():
+    assert parse_format("RGB-10") == ("rgb", 10)
+    assert parse_format("444-8") == ("rgb", 8)
+    for spec in ("rgb", "422-9", "yuv-8"):
+        with pytest.raises(ValueError, match="Invalid format"):
+            parse_format(spec)
+
+
+def test_bits_per_pixel():
+    assert bits_per_pixel("rgb", 10) == 30
+    assert bits_per_pixel("420", 10) == 15
+    assert bits_per_pixel("422", 12) == 24
+    # TMDS uses a 24-bit container for 4:2:2 at any depth
+    assert bits_per_pixel("422", 8, FAMILY_TMDS) == 24
+
+
+def test_clock_limits():
+    links = find_links(["hdmi 1.4", "hbr2 x4", "frl 4x12g"])
+    limits = clock_limits(["rgb-8", "rgb-10"], links)
+
+    assert limits["rgb-8"][HDMI_14] == pytest.approx(340e6)
+    assert limits["rgb-10"][HDMI_14] == pytest.approx(272e6)
+    # 4 lanes x 5.4 Gbit/s with 8b/10b coding
+    assert limits["rgb-8"]["HBR2 x4"] == pytest.approx(720e6)
+    # 4 lanes x 12 Gbit/s with 16b/18b coding
+    assert limits["rgb-10"]["FRL 4x12G"] == pytest.approx(4 * 12e9 * 16 / 18 / 30)
+
+
+def test_find_links_rejects_unknown_names():
+    with pytest.raises(ValueError, match="Unknown link 'thunderbolt'"):
+        find_links(["thunderbolt"])
+
+
+@pytest.mark.parametrize(
+    "spec, pixel_clock_hz, family, link",
+    [
+        ("rgb-8", 148_500_000, FAMILY_TMDS, "HDMI 1.0 (165 MHz)"),
+        # Equal capacities are ordered by name
+        ("rgb-8", 148_500_000, FAMILY_DP, "HBR x2"),
+        ("rgb-8", 594_000_000, FAMILY_TMDS, HDMI_20),
+        ("rgb-10", 594_000_000, FAMILY_TMDS, None),
+        ("rgb-10", 594_000_000, FAMILY_FRL, "FRL 4x6G"),
+        ("420-8", 594_000_000, FAMILY_TMDS, HDMI_14),
+        ("rgb-8", 340_000_000, FAMILY_TMDS, HDMI_14),
+        ("rgb-8", 340_000_001, FAMILY_TMDS, HDMI_20),
+    ],
+)
+def test_resolve_min_links(spec, pixel_clock_hz, family, link):
+    need = BandwidthAnalyzer([spec]).resolve(pixel_clock_hz)[spec]
+    assert need["min_links"][family] == link
+
+
+def test_resolve_fits_and_payload():
+    analyzer = BandwidthAnalyzer(["rgb-10"], find_links(["HDMI", "FRL"]))
+    need = analyzer.resolve(594_000_000)["rgb-10"]
+
+    assert need["gbps"] == pytest.approx(17.82)
+    assert need["fits"][HDMI_20] is False
+    assert need["fits"]["FRL 3x6G"] is False
+    assert need["fits"]["FRL 4x6G"] is True
+    # Only the selected links are considered
+    assert set(need["min_links"]) == {FAMILY_TMDS, FAMILY_FRL}
+    assert analyzer.resolve(594_000_000) is analyzer.resolve(594_000_000)
+
+
+def test_analyze_modes_skips_modes_without_clock():
+    analyzer = BandwidthAnalyzer(["rgb-8"])
+    modes = [{"pixel_clock_hz": 0}, {"pixel_clock_hz": 25_175_000}]
+    (analyzed,) = analyzer.analyze_modes(modes)
+    assert analyzed["formats"]["rgb-8"]["min_links"][FAMILY_TMDS] == (
+        "HDMI 1.0 (165 MHz)"
+    )
+
+
+def test_corpus_is_analyzed_per_model():
+    corpus = [(f"unit{i}", edid) for i, edid in enumerate(make_corpus(3))]
+    results = list(analyze_corpus(corpus, BandwidthAnalyzer(["rgb-8"])))
+
+    assert [label for label, _ in results] == ["unit0", "unit1", "unit2"]
+    # Units of one model share one analyzed mode list
+    assert results[0][1] is results[2][1]
+
+    summary = summarize_corpus(results, ["rgb-8"])
+    assert summary["edids"] == 3
+    # The CEA-861 extension lists 3840x2160@60 (VIC 97, 594 MHz)
+    assert summary["links"]["rgb-8"][FAMILY_TMDS] == {HDMI_20: 3}
@@ -0,0 +1,90 @@
+"""Decode cache tiers."""
+
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks.corpus import make_edid
+from edid.cache import (
+    DISK_TRIM_RATIO,
+    DecodeCache,
+    default_disk_dir,
+    get_decode_cache,
+    set_decode_cache,
+)
+from edid.cli import cli
+
+
+@pytest.fixture
+def decode_file(tmp_path):
+    """Run edid decode on an EDID file; the active cache is restored after."""
+    path = tmp_path / "display.bin"
+    path.write_bytes(make_edid(128))
+    previous = get_decode_cache()
+
+    def run(*options):
+        return CliRunner().invoke(cli, [*options, "decode", str(path)])
+
+    yield run
+    set_decode_cache(previous)
+
+
+def test_memory_tier_is_lru():
+    cache = DecodeCache(maxsize=2)
+    for key in "abc":
+        cache.put(key, key.upper())
+    assert cache.get("a") is None
+    assert cache.get("c") == "C"
+    assert cache.stats() == {"entries": 2, "hits": 1, "disk_hits": 0, "misses": 1}
+
+
+def test_key_covers_decoder_and_options():
+    cache = DecodeCache()
+    keys = {
+        cache.key(b"edid", "decode_basic"),
+        cache.key(b"edid", "decode_deep"),
+        cache.key(b"edid", "decode_basic", "verbose=True"),
+        cache.key(b"other", "decode_basic"),
+    }
+    assert len(keys) == 4
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    DecodeCache(disk_dir=tmp_path).put("abcd", "text")
+    cache = DecodeCache(disk_dir=tmp_path)
+    assert cache.get("abcd") == "text"
+    assert cache.disk_hits == 1
+
+
+def test_disk_tier_is_capped(tmp_path):
+    cache = DecodeCache(maxsize=0, disk_dir=tmp_path, max_disk_entries=10)
+    for i in range(10):
+        cache.put(f"{i:04x}", str(i))
+        # Oldest first, whatever the file system's timestamp granularity
+        path = tmp_path / f"{i:04x}"[:2] / f"{i:04x}.txt"
+        os.utime(path, ns=(i * 10**9, i * 10**9))
+    # Reading an entry marks it as recently used
+    assert cache.get("0000") == "0"
+
+    cache.put("ffff", "last")
+
+    remaining = sorted(path.stem for path in tmp_path.glob("*/*.txt"))
+    assert len(remaining) == int(10 * DISK_TRIM_RATIO)
+    assert "0000" in remaining and "ffff" in remaining
+    assert "0001" not in remaining
+
+
+def test_cli_caches_in_memory_by_default(decode_file):
+    assert decode_file().exit_code == 0
+    assert get_decode_cache().disk_dir is None
+    assert not default_disk_dir().exists()
+
+
+def test_cli_persistent_cache_is_opt_in(decode_file):
+    assert decode_file("--persistent-decode-cache").exit_code == 0
+    assert len(list(default_disk_dir().glob("*/*.txt"))) == 1
+
+    result = decode_file("--persistent-decode-cache", "--no-decode-cache")
+    assert result.exit_code != 0
+    assert "cannot be combined with --no-decode-cache" in result.output
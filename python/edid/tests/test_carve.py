@@ -0,0 +1,68 @@
+"""Carving EDIDs out of binary dumps and logs."""
+
+from benchmarks.corpus import make_edid
+from edid.carve import FORM_BINARY, FORM_HEX, carve_file, carve_files, carve_name
+
+
+def kernel_log(edid_data):
+    """EDID hex dump as printed by the kernel: 16 bytes per prefixed line."""
+    lines = ["[    1.234] i915: found monitor"]
+    for offset in range(0, len(edid_data), 16):
+        row = " ".join(f"{b:02x}" for b in edid_data[offset : offset + 16])
+        lines.append(f"[    1.235] i915 0000:00:02.0: \t{row}")
+    return "\n".join(lines) + "\n"
+
+
+def test_binary_dump(tmp_path):
+    edid_data = make_edid(256)
+    dump = tmp_path / "firmware.img"
+    dump.write_bytes(b"\x00" * 1000 + edid_data + b"\xff" * 500)
+
+    (candidate,) = carve_file(dump)
+    assert candidate == {"offset": 1000, "form": FORM_BINARY, "edid": edid_data}
+    assert carve_name(dump, candidate) == "firmware_000003e8.bin"
+
+
+def test_hex_log(tmp_path):
+    edid_data = make_edid(128)
+    log = tmp_path / "dmesg.txt"
+    log.write_text(kernel_log(edid_data))
+
+    (candidate,) = carve_file(log)
+    assert candidate["form"] == FORM_HEX
+    assert candidate["edid"] == edid_data
+
+
+def test_corrupt_candidate(tmp_path):
+    edid_data = bytearray(make_edid(128))
+    edid_data[60] ^= 0xFF
+    dump = tmp_path / "dump.bin"
+    dump.write_bytes(bytes(edid_data))
+
+    (candidate,) = carve_file(dump)
+    assert candidate["edid"] is None
+
+
+def test_truncated_extension(tmp_path):
+    dump = tmp_path / "dump.bin"
+    dump.write_bytes(make_edid(256)[:200])
+    assert [candidate["edid"] for candidate in carve_file(dump)] == [None]
+
+
+def test_empty_file(tmp_path):
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert carve_file(empty) == []
+
+
+def test_carve_files_unique(tmp_path):
+    edid_data = make_edid(128)
+    paths = []
+    for name in ("a.bin", "b.bin"):
+        path = tmp_path / name
+        path.write_bytes(edid_data * 2)
+        paths.append(path)
+
+    assert len(list(carve_files(paths))) == 4
+    ((path, candidate),) = carve_files(paths, unique=True)
+    assert (path, candidate["offset"]) == (paths[0], 0)
@@ -0,0 +1,85 @@
+"""CEA-861 data block decoders."""
+
+from benchmarks.corpus import cea_block
+from edid.cea861 import decode_data_block, decode_svds
+from edid.parser import decode_cea861_block
+
+
+def test_svd_native_flag():
+    # Bit 7 marks a native VIC only for VICs 1-64
+    native, plain, high = decode_svds(bytes([0x90, 0x10, 0xC1]))
+    assert (native["vic"], native["native"]) == (16, True)
+    assert (plain["vic"], plain["native"]) == (16, False)
+    assert (high["vic"], high["native"]) == (193, False)
+    assert (native["h_active"], native["v_active"], native["refresh_hz"]) == (
+        1920,
+        1080,
+        60,
+    )
+
+
+def test_svd_interlaced_vic():
+    (svd,) = decode_svds(bytes([5]))
+    assert (svd["h_active"], svd["v_active"], svd["interlaced"]) == (1920, 1080, True)
+
+
+def test_audio_block():
+    block = decode_data_block(1, bytes([0x09, 0x07, 0x07, 0x3D, 0x07, 0x50]))
+    lpcm, ac3 = block["sads"]
+    assert lpcm["format"] == "LPCM"
+    assert lpcm["max_channels"] == 2
+    assert lpcm["sample_rates_khz"] == [32, 44.1, 48]
+    assert lpcm["bit_depths"] == [16, 20, 24]
+    assert ac3["format_code"] == 7
+    assert ac3["max_channels"] == 6
+    assert ac3["max_bitrate_kbps"] == 640
+
+
+def test_hdmi_vendor_block():
+    block = decode_data_block(3, bytes([0x03, 0x0C, 0x00, 0x21, 0x00, 0x38, 0x3C]))
+    assert block["vendor"] == "HDMI"
+    assert block["physical_address"] == "2.1.0.0"
+    assert block["deep_color"] == [30, 36]
+    assert block["deep_color_y444"]
+    assert block["max_tmds_clock_mhz"] == 300
+
+
+def test_short_vendor_block():
+    assert decode_data_block(3, b"\x03") == {"type": "Vendor Specific"}
+
+
+def test_extended_blocks():
+    hdr = decode_data_block(7, bytes([0x06, 0x09, 0x01]))
+    assert hdr["type"] == "HDR Static Metadata"
+    assert hdr["eotfs"] == ["SDR", "HLG"]
+    assert hdr["static_metadata_type1"]
+
+    capability = decode_data_block(7, bytes([0x0F, 0x05]))
+    assert capability["svd_indices"] == [0, 2]
+
+    unknown = decode_data_block(7, bytes([0x42]))
+    assert unknown["type"] == "Unknown Extended (0x42)"
+    assert decode_data_block(7, b"")["type"] == "Extended (empty)"
+
+
+def test_unknown_tag():
+    assert decode_data_block(6, b"\x00") == {"type": "Unknown (0x06)"}
+
+
+def test_cea861_block():
+    info = decode_cea861_block(bytes(cea_block()))
+    assert info["revision"] == 3
+    assert info["basic_audio_support"]
+    assert [block["type"] for block in info["data_blocks"]] == [
+        "Video",
+        "Audio",
+        "Speaker Allocation",
+        "Vendor Specific",
+        "Vendor Specific",
+        "Colorimetry",
+        "HDR Static Metadata",
+    ]
+    assert [block["offset"] for block in info["data_blocks"]][:3] == [4, 10, 14]
+    assert [
+        (timing["h_active"], timing["v_active"]) for timing in info["detailed_timings"]
+    ] == [(1920, 1080), (1280, 720)]
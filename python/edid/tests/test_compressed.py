@@ -0,0 +1,83 @@
+"""Dictionary-compressed archives."""
+
+import pytest
+
+from benchmarks.corpus import make_corpus, make_edid
+from edid.archive import iter_edid_files
+from edid.compressed import (
+    ZSTD_AVAILABLE,
+    CompressedArchive,
+    is_compressed_archive,
+    write_compressed_archive,
+)
+
+CODECS = [
+    "zlib",
+    pytest.param(
+        "zstd",
+        marks=pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard missing"),
+    ),
+]
+
+
+def corpus_entries():
+    units = make_corpus(50) + [make_edid(128)]
+    entries = [(f"backups/unit{i}.bin", edid) for i, edid in enumerate(units)]
+    # A repeated backup of the same display is stored once
+    return entries + [("backups/again.bin", units[0])]
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_round_trip(tmp_path, codec):
+    path = tmp_path / "fleet.edidz"
+    entries = corpus_entries()
+
+    stats = write_compressed_archive(path, entries, codec=codec)
+
+    assert (stats["entries"], stats["unique"]) == (52, 51)
+    assert stats["raw_bytes"] == 50 * 256 + 128 + 256
+    assert stats["archive_bytes"] == path.stat().st_size
+    assert is_compressed_archive(path)
+    with CompressedArchive(path) as archive:
+        assert archive.codec == codec
+        assert len(archive) == len(entries)
+        assert list(archive) == entries
+        assert archive.read(50) == make_edid(128)
+
+
+def test_entries_cost_their_differences(tmp_path):
+    path = tmp_path / "fleet.edidz"
+    stats = write_compressed_archive(path, corpus_entries())
+    payload_bytes = stats["archive_bytes"] - stats["dictionary_bytes"]
+    # Units differ only in serial number and checksum
+    assert payload_bytes < stats["raw_bytes"] / 10
+
+
+def test_archive_files_are_iterated(tmp_path):
+    path = tmp_path / "fleet.edidz"
+    entries = corpus_entries()[:3]
+    write_compressed_archive(path, entries)
+    assert [edid for _, edid in iter_edid_files([tmp_path])] == [
+        edid for _, edid in entries
+    ]
+
+
+def test_truncated_archive(tmp_path):
+    path = tmp_path / "fleet.edidz"
+    write_compressed_archive(path, corpus_entries())
+    path.write_bytes(path.read_bytes()[:40])
+    with pytest.raises(ValueError, match="Truncated"):
+        CompressedArchive(path)
+
+
+def test_not_an_archive(tmp_path):
+    path = tmp_path / "edid.bin"
+    path.write_bytes(make_edid(128))
+    assert not is_compressed_archive(path)
+    with pytest.raises(ValueError, match="Not a compressed EDID archive"):
+        CompressedArchive(path)
+
+
+def test_unknown_codec(tmp_path):
+    with pytest.raises(ValueError):
+        write_compressed_archive(tmp_path / "x.edidz", [], codec="lzma")
@@ -0,0 +1,78 @@
+"""Field-level EDID differences."""
+
+from click.testing import CliRunner
+
+from benchmarks.corpus import make_edid
+from edid.cli import cli
+from edid.diff import diff_against, diff_edids, format_change, summarize_changes
+from edid.patch import patch_edids
+from edid.validator import recalculate_checksums
+
+
+def test_identical():
+    edid_data = make_edid(256)
+    assert diff_edids(edid_data, edid_data) == []
+    assert summarize_changes([]) == "identical"
+
+
+def test_per_unit_changes():
+    reference = make_edid(256)
+    unit = bytes(patch_edids(reference, [{"serial": 9, "name": "OTHER"}]))
+    changes = diff_edids(reference, unit)
+
+    assert [change["field"] for change in changes] == [
+        "serial number",
+        "display name",
+        "checksum",
+    ]
+    serial = changes[0]
+    assert (serial["start"], serial["end"]) == (12, 16)
+    assert (serial["old"], serial["new"]) == ("1234567", "9")
+    assert format_change(changes[1]) == (
+        'display name [0x05A-0x06B]: "BENCH PANEL" -> "OTHER"'
+    )
+    # The checksum follows from the other changes
+    assert summarize_changes(changes) == "serial number changed, display name changed"
+
+
+def test_cea_data_block_change():
+    reference = make_edid(256)
+    changed = bytearray(reference)
+    changed[128 + 5] = 0x10  # First SVD no longer native
+    recalculate_checksums(changed)
+
+    changes = diff_edids(reference, bytes(changed))
+    assert changes[0]["field"] == "extension 1 CEA Video block"
+    assert changes[0]["start"] == 128 + 4
+    assert summarize_changes(changes) == "extension 1 CEA Video block changed"
+
+
+def test_removed_extension():
+    changes = diff_edids(make_edid(256), make_edid(128))
+    assert summarize_changes(changes) == "extension count changed, extension 1 removed"
+    removed = changes[-1]
+    assert removed["new"] is None
+    assert format_change(removed).endswith("-> (none)")
+
+
+def test_diff_against():
+    reference = make_edid(128)
+    units = [
+        (str(serial), bytes(patch_edids(reference, [{"serial": serial}])))
+        for serial in (1234567, 1)
+    ]
+    results = dict(diff_against(reference, units))
+    assert results["1234567"] == []
+    assert summarize_changes(results["1"]) == "serial number changed"
+
+
+def test_validate_summarizes_changed_fields(simulate, eeprom, edid128, tmp_path):
+    simulate({1: eeprom(edid128)})
+    path = tmp_path / "unit.bin"
+    path.write_bytes(bytes(patch_edids(edid128, [{"serial": 9}])))
+
+    result = CliRunner(mix_stderr=False).invoke(cli, ["validate", "1", str(path), "-v"])
+
+    assert result.exit_code == 1
+    assert "Changed fields: serial number changed" in result.output
+    assert "byte(s) differ" in result.stderr
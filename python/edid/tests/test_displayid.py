@@ -0,0 +1,67 @@
+"""DisplayID extension decoders."""
+
+from edid.displayid import (
+    TILED_TOPOLOGY,
+    decode_displayid_block,
+    displayid_timings,
+)
+
+
+def test_displayid_block(displayid_edid):
+    info = decode_displayid_block(displayid_edid(serial=77)[128:])
+    assert info["version"] == "1.2"
+    product, timing_block = info["data_blocks"]
+
+    assert product["type"] == "Product Identification"
+    assert product["vendor"] == "DEL"
+    assert product["product_code"] == 0x4321
+    assert product["serial_number"] == 77
+    assert product["manufacture_year"] == 2020
+    assert product["product_name"] == "TILE"
+
+    assert timing_block["type"] == "Type I Timing"
+    assert timing_block["offset"] == 5 + 3 + product["length"]
+
+
+def test_type1_timing(displayid_edid):
+    (timing,) = displayid_timings(decode_displayid_block(displayid_edid()[128:]))
+    assert timing["pixel_clock_hz"] == 533_250_000
+    assert (timing["h_active"], timing["v_active"]) == (3840, 2160)
+    assert (timing["h_total"], timing["v_total"]) == (4000, 2222)
+    assert (timing["h_front_porch"], timing["h_sync_width"]) == (48, 32)
+    assert timing["preferred"]
+    assert not timing["interlaced"]
+    assert timing["aspect"] == "16:9"
+
+
+def test_tiled_topology():
+    payload = TILED_TOPOLOGY.pack(
+        0x80, 0x10, 0x10, 0x00, 1919, 2159, 0, 1, 2, 3, 4, b"DEL", 0x1234, 99
+    )
+    extension = bytearray(128)
+    extension[0] = 0x70
+    extension[1:5] = bytes([0x12, 3 + len(payload), 0, 0])
+    extension[5:8] = bytes([0x12, 0x00, len(payload)])
+    extension[8 : 8 + len(payload)] = payload
+
+    (block,) = decode_displayid_block(bytes(extension))["data_blocks"]
+    assert block["single_enclosure"]
+    assert (block["h_tiles"], block["v_tiles"]) == (2, 1)
+    assert (block["h_location"], block["v_location"]) == (1, 0)
+    assert (block["tile_width"], block["tile_height"]) == (1920, 2160)
+    assert block["bezels"] == (1, 2, 3, 4)
+    assert block["tile_serial"] == 99
+
+
+def test_truncated_data_block_is_dropped():
+    extension = bytearray(128)
+    extension[0] = 0x70
+    extension[1:5] = bytes([0x12, 10, 0, 0])
+    # Claims 20 payload bytes but the section only holds 10
+    extension[5:8] = bytes([0x03, 0x00, 20])
+    assert decode_displayid_block(bytes(extension))["data_blocks"] == []
+
+
+def test_not_displayid():
+    assert decode_displayid_block(bytes(128)) == {}
+    assert decode_displayid_block(b"\x70" * 64) == {}
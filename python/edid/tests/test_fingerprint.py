@@ -0,0 +1,52 @@
+"""Model fingerprints and fleet clustering."""
+
+from benchmarks.corpus import make_corpus, make_edid
+from edid.fingerprint import cluster_edids, describe_model, fingerprint, masked_edid
+from edid.patch import patch_edids
+
+
+def test_units_share_fingerprint():
+    first, second = make_corpus(2)
+    assert first != second
+    assert fingerprint(first) == fingerprint(second)
+
+
+def test_serial_string_and_date_are_masked():
+    template = make_edid(128)
+    unit = bytearray(template)
+    unit[16:18] = bytes([12, 33])  # Manufacture week and year
+    unit[72 + 5 : 72 + 11] = b"SN9999"  # Serial string descriptor
+    assert fingerprint(bytes(unit)) == fingerprint(template)
+    assert masked_edid(bytes(unit))[12:18] == bytes(6)
+
+
+def test_model_changes_fingerprint():
+    template = make_edid(128)
+    renamed = bytes(patch_edids(template, [{"name": "OTHER"}]))
+    assert fingerprint(renamed) != fingerprint(template)
+
+
+def test_displayid_serial_is_masked(displayid_edid):
+    assert fingerprint(displayid_edid(serial=1)) == fingerprint(displayid_edid(2))
+
+
+def test_describe_model():
+    assert describe_model(make_edid(128)) == {
+        "manufacturer": "DEL",
+        "product_code": 0xA0C1,
+        "name": "BENCH PANEL",
+    }
+
+
+def test_cluster_edids():
+    corpus = make_corpus(3)
+    other = bytes(patch_edids(make_edid(256), [{"name": "OTHER"}]))
+    entries = [(f"unit{i}", edid) for i, edid in enumerate(corpus)]
+    entries += [("other", other), ("repeat", corpus[0])]
+
+    largest, smallest = cluster_edids(entries, keep_labels=True)
+    assert (largest["count"], largest["unique"]) == (4, 3)
+    assert largest["example"] == "unit0"
+    assert largest["labels"] == ["unit0", "unit1", "unit2", "repeat"]
+    assert (largest["first_year"], largest["last_year"]) == (2019, 2019)
+    assert (smallest["count"], smallest["name"]) == (1, "OTHER")
@@ -0,0 +1,78 @@
+"""Streaming hex dumps and hex diffs."""
+
+import io
+
+from benchmarks.corpus import make_edid
+from edid.hexdump import (
+    format_row,
+    iter_archive_dump,
+    iter_hex_diff,
+    iter_hex_dump,
+    write_lines,
+)
+
+
+def test_format_row():
+    assert format_row(0x10, b"AB\x00\xff") == "0010: 41 42 00 FF" + " " * 37 + "  AB.."
+    # Full rows line up with short ones
+    full = format_row(0, bytes(range(0x40, 0x50)))
+    assert full == "0000: " + " ".join(f"{b:02X}" for b in range(0x40, 0x50)) + (
+        "   @ABCDEFGHIJKLMNO"
+    )
+
+
+def test_hex_dump_blocks():
+    edid_data = make_edid(256)
+    lines = list(iter_hex_dump(edid_data + b"\x00" * 5))
+
+    assert lines[1] == "EDID HEX DUMP"
+    assert "\nBase Block (128 bytes):" in lines
+    assert "\nExtension Block 1 (128 bytes):" in lines
+    rows = [line for line in lines if line[:4].isalnum() and line[4:6] == ": "]
+    # Trailing bytes beyond the last full block are left out
+    assert len(rows) == 16
+    assert rows[0].startswith("0000: 00 FF FF FF FF FF FF 00")
+    assert rows[-1].startswith("00F0: ")
+
+
+def test_hex_diff():
+    a = make_edid(128)
+    b = bytearray(a)
+    b[0x13] ^= 1
+    b[0x7F] ^= 1
+    lines = list(iter_hex_diff(a, bytes(b)))
+
+    changed = [line for line in lines if line.startswith("* ")]
+    assert [line[2:6] for line in changed] == ["0010", "0070"]
+    marker = lines[lines.index(changed[0]) + 1]
+    # The marker sits under the fourth byte of the second EDID's row
+    assert marker.index("^^") == lines[lines.index(changed[0])].index(" | ") + 3 + 9
+    assert lines[-1] == "2 byte(s) differ in 2 row(s)"
+    assert list(iter_hex_diff(a, a))[-1] == "Identical"
+
+
+def test_hex_diff_of_different_sizes():
+    lines = list(iter_hex_diff(make_edid(128), make_edid(256)))
+    # The extension block, plus extension count and checksum of the base block
+    assert lines[-1] == "130 byte(s) differ in 9 row(s)"
+    assert sum(line.startswith("-- Extension Block 1") for line in lines) == 1
+
+
+def test_archive_dump_streams_entries():
+    consumed = []
+
+    def entries():
+        for label in ("a", "b"):
+            consumed.append(label)
+            yield label, make_edid(128)
+
+    lines = iter_archive_dump(entries())
+    assert next(lines) == "# a (128 bytes)"
+    assert consumed == ["a"]
+
+    out = io.StringIO()
+    count = write_lines(lines, out)
+    assert consumed == ["a", "b"]
+    # Everything after the label line that was already taken
+    assert count == 2 * len(list(iter_archive_dump([("a", make_edid(128))]))) - 1
+    assert "# b (128 bytes)" in out.getvalue().splitlines()
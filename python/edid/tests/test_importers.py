@@ -0,0 +1,77 @@
+"""Importing EDIDs from xrandr, edid-decode and hex dump text."""
+
+import io
+
+import pytest
+
+from benchmarks.corpus import make_edid
+from edid.importers import is_text_file, iter_text_edids, load_edid
+
+
+def hex_rows(edid_data, width, separator="", indent=""):
+    return [
+        indent + separator.join(f"{b:02x}" for b in edid_data[i : i + width])
+        for i in range(0, len(edid_data), width)
+    ]
+
+
+def xrandr_output(outputs):
+    lines = ["Screen 0: minimum 8 x 8, current 4480 x 1440"]
+    for name, edid_data in outputs:
+        lines.append(f"{name} connected 2560x1440+0+0 597mm x 336mm")
+        lines.append("\tEDID: ")
+        lines += hex_rows(edid_data, 16, indent="\t\t")
+        lines.append("\tBroadcast RGB: Automatic")
+        lines.append("  2560x1440 (0x44) 241.500MHz +HSync -VSync *current")
+    return "\n".join(lines) + "\n"
+
+
+def parse(text, errors=None):
+    return list(iter_text_edids(io.StringIO(text), "in", errors))
+
+
+def test_xrandr():
+    first, second = make_edid(256), make_edid(128)
+    edids = parse(xrandr_output([("DP-1", first), ("HDMI-1", second)]))
+    assert edids == [("in:4:DP-1", first), ("in:24:HDMI-1", second)]
+
+
+def test_edid_decode():
+    edid_data = make_edid(256)
+    rows = hex_rows(edid_data, 16, separator=" ")
+    text = "edid-decode (hex):\n\n" + "\n".join(rows[:8] + [""] + rows[8:]) + "\n\n"
+    text += "----------------\n\nBlock 0, Base EDID:\n"
+    assert parse(text) == [("in:3", edid_data)]
+
+
+def test_hex_dump_with_several_edids():
+    first, second = make_edid(128), make_edid(256)
+    text = "\n".join(hex_rows(first + second, 30)) + "\n"
+    assert parse(text) == [("in:1", first), ("in:1#1", second)]
+
+
+def test_truncated_edid():
+    text = xrandr_output([("DP-1", make_edid(256)[:192])])
+    with pytest.raises(ValueError, match="ends after 192 of 256 bytes"):
+        parse(text)
+
+    errors = []
+    assert parse(text, errors) == []
+    assert errors == ["in:4:DP-1: xrandr EDID ends after 192 of 256 bytes"]
+
+
+def test_load_edid(tmp_path):
+    edid_data = make_edid(128)
+    binary = tmp_path / "edid.bin"
+    binary.write_bytes(edid_data)
+    text = tmp_path / "edid.txt"
+    text.write_text("\n".join(hex_rows(edid_data, 16)) + "\n")
+    empty = tmp_path / "empty.txt"
+    empty.write_text("no EDID here\n")
+
+    assert not is_text_file(binary)
+    assert is_text_file(text)
+    assert load_edid(binary) == edid_data
+    assert load_edid(text) == edid_data
+    with pytest.raises(ValueError, match="No EDID found"):
+        load_edid(empty)
@@ -0,0 +1,113 @@
+"""Reading EDID collections and indexing them."""
+
+import struct
+
+import pytest
+
+from benchmarks.corpus import make_corpus, make_edid
+from edid.archive import iter_edid_files
+from edid.index import ingest, open_index, query_index
+from edid.patch import patch_edids
+from edid.validator import recalculate_checksums
+
+
+@pytest.fixture
+def collection(tmp_path):
+    """Directory with two good EDIDs, a truncated one and a corrupt one."""
+    directory = tmp_path / "fleet"
+    directory.mkdir()
+    first, second = make_corpus(2)
+    (directory / "a.bin").write_bytes(first)
+    (directory / "b.bin").write_bytes(first[:100])
+    corrupt = bytearray(second)
+    corrupt[20] ^= 0xFF
+    (directory / "c.bin").write_bytes(bytes(corrupt))
+    (directory / "d.bin").write_bytes(second)
+    (directory / "e.txt").write_text("00ffffffffffff00\n")
+    return directory
+
+
+def test_iter_edid_files_continues_past_bad_files(collection, capsys):
+    errors = []
+    labels = [label for label, _ in iter_edid_files([collection], errors)]
+
+    assert [label.rsplit("/", 1)[1] for label in labels] == ["a.bin", "c.bin", "d.bin"]
+    assert errors == [
+        f"{collection / 'b.bin'}: Truncated archive: 100 trailing byte(s) at offset 0x0"
+    ]
+    # Incomplete EDIDs in text captures are only warned about
+    assert "e.txt:1: hex EDID ends after 8 of 128 bytes" in capsys.readouterr().err
+
+
+def test_iter_edid_files_raises_without_error_list(collection):
+    with pytest.raises(ValueError, match="Truncated archive"):
+        list(iter_edid_files([collection]))
+
+
+def test_ingest(tmp_path, collection):
+    conn = open_index(tmp_path / "index.db")
+    edids = list(iter_edid_files([collection], []))
+    edids += [("short", make_edid(128)[:64]), ("again", edids[0][1])]
+
+    result = ingest(conn, edids)
+
+    assert {key: result[key] for key in ("added", "known", "too_short", "invalid")} == {
+        "added": 2,
+        "known": 1,
+        "too_short": 1,
+        "invalid": 1,
+    }
+    assert result["problems"][0].endswith("c.bin: Invalid base block checksum")
+    assert result["problems"][1] == "short: too short (64 bytes)"
+
+    rows = query_index(conn, manufacturer="DEL")
+    assert len(rows) == 2
+    assert sum(len(row["sources"]) for row in rows) == 3
+
+    # Known EDIDs are not decoded again
+    assert ingest(conn, edids[:1])["known"] == 1
+
+
+@pytest.fixture
+def fleet_index(tmp_path):
+    """Index holding an SDR 128-byte EDID and an HDR 256-byte one."""
+    conn = open_index(tmp_path / "index.db")
+    sdr = bytes(patch_edids(make_edid(128), [{"name": "OFFICE"}]))
+    hdr = bytearray(patch_edids(make_edid(256), [{"name": "STUDIO"}]))
+    struct.pack_into("<H", hdr, 10, 7)
+    recalculate_checksums(hdr)
+    ingest(conn, [("sdr.bin", sdr), ("hdr.bin", bytes(hdr))])
+    return conn
+
+
+@pytest.mark.parametrize(
+    "filters, names",
+    [
+        ({}, ["STUDIO", "OFFICE"]),
+        ({"manufacturer": "del"}, ["STUDIO", "OFFICE"]),
+        ({"manufacturer": "SAM"}, []),
+        ({"product_code": 7}, ["STUDIO"]),
+        ({"year": 2019}, ["STUDIO", "OFFICE"]),
+        ({"year": 2020}, []),
+        ({"hdr": True}, ["STUDIO"]),
+        ({"hdr": False}, ["OFFICE"]),
+        ({"name": "stud"}, ["STUDIO"]),
+        ({"mode": (2560, 1440, None, False)}, ["STUDIO", "OFFICE"]),
+        ({"mode": (2560, 1440, 60, False)}, ["STUDIO", "OFFICE"]),
+        ({"mode": (2560, 1440, 60, True)}, []),
+        ({"mode": (2560, 1440, 144, False)}, []),
+        # Only the CEA-861 extension lists 720p
+        ({"mode": (1280, 720, 60, False)}, ["STUDIO"]),
+        ({"hdr": True, "mode": (1280, 720, None, False), "name": "OFFICE"}, []),
+    ],
+)
+def test_query_index(fleet_index, filters, names):
+    rows = query_index(fleet_index, **filters)
+    assert [row["name"] for row in rows] == names
+
+
+def test_query_index_rows(fleet_index):
+    (row,) = query_index(fleet_index, name="OFFICE")
+    assert row["sources"] == ["sdr.bin"]
+    assert (row["manufacturer"], row["product_code"]) == ("DEL", 0xA0C1)
+    assert "data" not in row
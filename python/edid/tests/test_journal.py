@@ -0,0 +1,112 @@
+"""Resuming interrupted writes from the write journal."""
+
+import pytest
+
+from edid.i2c import ResumeRefused, write_edid
+from edid.journal import journal_path, load_journal, start_journal
+from edid.patch import patch_edids
+
+BUS = 1
+
+
+def unit(template, serial):
+    """Copy of an EDID with another serial number (and fixed checksum)."""
+    return bytes(patch_edids(template, [{"serial": serial}]))
+
+
+def interrupted_write(home, bus_num, original, target, page_size, pages_done):
+    """Journal an interrupted write of target over original."""
+    backup_path = home / "original.bin"
+    backup_path.write_bytes(original)
+    journal = start_journal(bus_num, target, original, page_size, backup_path)
+    for page_num in pages_done:
+        journal.record_page(page_num)
+    return backup_path
+
+
+def backups(home):
+    return sorted((home / ".edid-backups").glob("*.bin"))
+
+
+def test_completed_write_removes_journal(simulate, eeprom, edid256):
+    simulate({BUS: eeprom(edid256)})
+    write_edid(BUS, unit(edid256, 42))
+    assert not journal_path(BUS).exists()
+
+
+def test_failed_write_keeps_journal(simulate, eeprom, edid128):
+    simulate({BUS: eeprom(edid128, write_protect=True)})
+    with pytest.raises(IOError, match="verification failed"):
+        write_edid(BUS, unit(edid128, 42))
+    assert journal_path(BUS).exists()
+
+
+def test_resume_writes_remaining_pages(simulate, eeprom, isolated_home, edid256):
+    target = unit(edid256, 42)
+    device = eeprom(edid256)
+    # The first four pages were written before the interruption
+    device.memory[:64] = target[:64]
+    backup_path = interrupted_write(
+        isolated_home, BUS, edid256, target, 16, {0, 1, 2, 3}
+    )
+    simulate({BUS: device})
+
+    write_edid(BUS, target)
+
+    assert bytes(device.memory[:256]) == target
+    # The serial number was in the pages already written; of the others,
+    # only the page holding the checksum differs from the target
+    assert device.bytes_written == 16
+    assert backup_path.read_bytes() == edid256
+    assert backups(isolated_home) == []
+    assert load_journal(BUS) is None
+
+
+def test_resume_refused_for_other_display(simulate, eeprom, isolated_home, edid256):
+    target = unit(edid256, 42)
+    other = unit(edid256, 7)
+    interrupted_write(isolated_home, BUS, edid256, target, 16, {0})
+    device = eeprom(other)
+    simulate({BUS: device})
+
+    with pytest.raises(ResumeRefused, match="--no-resume"):
+        write_edid(BUS, target)
+    assert bytes(device.memory[:256]) == other
+
+
+def test_resume_without_completed_pages_backs_up_again(
+    simulate, eeprom, isolated_home, edid256
+):
+    # Interrupted before any page was written, then the display was swapped
+    target = unit(edid256, 42)
+    other = unit(edid256, 7)
+    old_backup = interrupted_write(isolated_home, BUS, edid256, target, 16, ())
+    device = eeprom(other)
+    simulate({BUS: device})
+
+    write_edid(BUS, target)
+
+    assert bytes(device.memory[:256]) == target
+    assert [path.read_bytes() for path in backups(isolated_home)] == [other]
+    assert old_backup.read_bytes() == edid256
+
+
+def test_no_resume_starts_over(simulate, eeprom, isolated_home, edid256):
+    target = unit(edid256, 42)
+    interrupted_write(isolated_home, BUS, edid256, target, 16, {0, 1, 2, 3})
+    device = eeprom(edid256)
+    simulate({BUS: device})
+
+    write_edid(BUS, target, resume=False)
+
+    assert bytes(device.memory[:256]) == target
+    assert device.bytes_written == 256
+
+
+def test_resume_with_other_page_size(simulate, eeprom, isolated_home, edid256):
+    target = unit(edid256, 42)
+    interrupted_write(isolated_home, BUS, edid256, target, 16, {0})
+    simulate({BUS: eeprom(edid256)})
+
+    with pytest.raises(ValueError, match="--page-size 16"):
+        write_edid(BUS, target, page_size=32)
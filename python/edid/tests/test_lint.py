@@ -0,0 +1,106 @@
+"""Lint rules and the lint engine."""
+
+import pytest
+
+from benchmarks.corpus import base_block, make_edid
+from edid.lint import ERROR, count_findings, lint_corpus, lint_edid
+from edid.validator import recalculate_checksums
+
+# 1920x1080i DTD (CEA VIC 5): vertical values per field
+DTD_1080I = bytes.fromhex("011D8018711C1620582C2500C48E2100009E")
+
+# Maximum vertical rate byte of the range limits descriptor in base_block
+MAX_V_HZ_OFFSET = 108 + 6
+
+
+def rules(findings, severity=None):
+    return [f["rule"] for f in findings if severity in (None, f["severity"])]
+
+
+def with_checksums(edid_data):
+    edid_data = bytearray(edid_data)
+    recalculate_checksums(edid_data)
+    return bytes(edid_data)
+
+
+def test_clean_edid():
+    counts = count_findings(lint_edid(make_edid(256)))
+    assert counts["error"] == 0
+    assert counts["warning"] == 0
+
+
+def test_short_edid():
+    findings = lint_edid(make_edid(128)[:100])
+    assert rules(findings) == ["structure.size"]
+
+
+def test_bad_checksum():
+    edid_data = bytearray(make_edid(256))
+    edid_data[200] ^= 0xFF
+    (finding,) = [f for f in lint_edid(bytes(edid_data)) if f["severity"] == ERROR]
+    assert finding["rule"] == "structure.checksum"
+    assert finding["offset"] == 255
+
+
+def test_interlaced_timing_within_range_limits():
+    # 1080i has a 60 Hz field rate; range limits are given in field rates
+    edid_data = base_block()
+    edid_data[54:72] = DTD_1080I
+    edid_data[MAX_V_HZ_OFFSET] = 75
+    assert "range.timings" not in rules(lint_edid(with_checksums(edid_data)))
+
+
+def test_timing_outside_range_limits():
+    edid_data = base_block()
+    edid_data[54:72] = DTD_1080I
+    edid_data[MAX_V_HZ_OFFSET] = 50
+    (finding,) = [
+        f for f in lint_edid(with_checksums(edid_data)) if f["rule"] == "range.timings"
+    ]
+    assert finding["offset"] == 54
+    assert finding["message"].startswith("1920x1080i at 60.05 Hz")
+
+
+@pytest.mark.parametrize(
+    "dtd_offset, message",
+    [
+        (200, "past the checksum"),
+        (2, "points into the header"),
+        (20, "runs past the DTD offset 20"),
+    ],
+)
+def test_cea_bounds(dtd_offset, message):
+    edid_data = bytearray(make_edid(256))
+    edid_data[128 + 2] = dtd_offset
+    findings = lint_edid(with_checksums(edid_data))
+    bounds = [
+        f for f in findings if f["rule"] == "cea.bounds" and f["severity"] == ERROR
+    ]
+    assert len(bounds) == 1
+    assert message in bounds[0]["message"]
+    assert "Rule failed" not in " ".join(f["message"] for f in findings)
+
+
+def test_lint_corpus_consumes_entries_lazily(monkeypatch):
+    monkeypatch.setattr("edid.lint.CORPUS_CHUNK_SIZE", 2)
+    consumed = []
+
+    def entries():
+        for i in range(20):
+            consumed.append(i)
+            yield f"unit{i}", make_edid(128)
+
+    results = lint_corpus(entries(), workers=2)
+    assert next(results)[0] == "unit0"
+    # Two chunks submitted up front, one more once the first completed
+    assert len(consumed) == 6
+
+    assert [label for label, _ in results] == [f"unit{i}" for i in range(1, 20)]
+    assert len(consumed) == 20
+
+
+def test_lint_corpus_keeps_order():
+    entries = [("a", make_edid(128)), ("b", make_edid(128)[:64])]
+    results = list(lint_corpus(entries, workers=1))
+    assert [label for label, _ in results] == ["a", "b"]
+    assert rules(results[1][1]) == ["structure.size"]
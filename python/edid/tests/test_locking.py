@@ -0,0 +1,84 @@
+"""Per-bus advisory locks and their contention statistics."""
+
+import fcntl
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from edid.locking import bus_lock, get_bus_lock
+from edid.retry import format_bus_stats
+
+# Statistics are kept per process, so every test uses its own bus
+
+
+@contextmanager
+def other_process_lock(bus_num, operation):
+    """
+    Hold the lock file of a bus as another process would.
+
+    flock treats a separate open file description like another process.
+    """
+    path = get_bus_lock(bus_num).path
+    path.parent.mkdir(exist_ok=True)
+    fd = os.open(str(path), os.O_RDONLY | os.O_CREAT)
+    try:
+        fcntl.flock(fd, operation)
+        yield
+    finally:
+        os.close(fd)
+
+
+def test_lock_waits_are_reported():
+    held = threading.Event()
+
+    def writer():
+        with bus_lock(35, exclusive=True):
+            held.set()
+            time.sleep(0.1)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    held.wait()
+    with bus_lock(35):
+        pass
+    thread.join()
+
+    assert re.search(
+        r", lock waited 1/2 time\(s\), 0\.1\ds total$", format_bus_stats(35)
+    )
+
+
+def test_uncontended_locks_are_not_reported():
+    with bus_lock(36):
+        pass
+    assert format_bus_stats(36) == "Bus 36: 0 transaction(s), 0 retried, 0 failed"
+
+
+def test_readers_share_the_bus():
+    with other_process_lock(37, fcntl.LOCK_SH):
+        with bus_lock(37, timeout=0.1):
+            pass
+
+
+def test_writer_waits_for_readers():
+    with other_process_lock(38, fcntl.LOCK_SH):
+        with pytest.raises(TimeoutError, match="another process"):
+            with bus_lock(38, exclusive=True, timeout=0.05):
+                pass
+    # Released again after the timeout
+    with other_process_lock(38, fcntl.LOCK_EX | fcntl.LOCK_NB):
+        pass
+
+
+def test_lock_is_reentrant():
+    with bus_lock(39, exclusive=True):
+        with bus_lock(39):
+            pass
+        # The inner shared lock does not downgrade the exclusive one
+        with pytest.raises(BlockingIOError):
+            with other_process_lock(39, fcntl.LOCK_SH | fcntl.LOCK_NB):
+                pass
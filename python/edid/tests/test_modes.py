@@ -0,0 +1,134 @@
+"""Mode listing, standard timings and pixel clock lookup."""
+
+import pytest
+
+from benchmarks.corpus import base_block, make_edid
+from edid.modes import (
+    cvt_rb_pixel_clock,
+    decode_standard_timing,
+    find_edids_with_mode,
+    list_modes,
+    lookup_pixel_clock,
+    parse_mode_spec,
+    supports_mode,
+)
+from edid.validator import recalculate_checksums
+
+# 1920x1080i DTD (CEA VIC 5): vertical values per field
+DTD_1080I = bytes.fromhex("011D8018711C1620582C2500C48E2100009E")
+
+
+def modes_by_source(edid_data, source):
+    return [
+        (mode["width"], mode["height"], mode["refresh_hz"])
+        for mode in list_modes(edid_data)
+        if mode["source"] == source
+    ]
+
+
+def test_list_modes():
+    modes = list_modes(make_edid(256))
+    preferred = modes[0]
+    assert (preferred["width"], preferred["height"]) == (2560, 1440)
+    assert preferred["source"] == "detailed"
+    assert preferred["refresh_hz"] == pytest.approx(59.95, abs=0.01)
+
+    assert modes_by_source(make_edid(256), "established") == [
+        (640, 480, 60),
+        (800, 600, 60),
+        (1024, 768, 60),
+    ]
+    assert (1920, 1080, 60) in modes_by_source(make_edid(256), "standard")
+    assert (3840, 2160, 60) in modes_by_source(make_edid(256), "cea-vic")
+
+
+def test_list_modes_reports_each_mode_once():
+    modes = list_modes(make_edid(256))
+    keys = [(m["width"], m["height"], round(m["refresh_hz"])) for m in modes]
+    assert len(keys) == len(set(keys))
+    # 1920x1080@60 is a standard timing, an SVD and a CEA DTD
+    assert keys.count((1920, 1080, 60)) == 1
+
+
+def edid_1080i():
+    """Base block whose only 1920x1080 mode is the 1080i preferred DTD."""
+    edid_data = base_block()
+    edid_data[54:72] = DTD_1080I
+    edid_data[38:54] = b"\x01" * 16  # No standard timings
+    recalculate_checksums(edid_data)
+    return bytes(edid_data)
+
+
+def test_interlaced_dtd_reports_frame_height():
+    mode = list_modes(edid_1080i())[0]
+    assert (mode["width"], mode["height"]) == (1920, 1080)
+    assert mode["interlaced"]
+    # Interlaced DTDs give the field rate
+    assert mode["refresh_hz"] == pytest.approx(60, abs=0.1)
+
+
+def test_dtd_without_totals_is_skipped():
+    edid_data = base_block()
+    # A pixel clock, but no active or blanking sizes
+    edid_data[54:72] = b"\x01\x1d" + bytes(16)
+    recalculate_checksums(edid_data)
+
+    modes = list_modes(bytes(edid_data))
+    assert modes and all(mode["source"] != "detailed" for mode in modes)
+
+
+def test_displayid_modes(displayid_edid):
+    assert modes_by_source(displayid_edid(), "displayid") == [(3840, 2160, 60.0)]
+
+
+def test_standard_timing():
+    # 1920 = (0xD1 + 31) * 8, 16:9 (code 3), 60 Hz
+    assert decode_standard_timing(0xD1, 0xC0, 4) == (1920, 1080, 60)
+    # Aspect code 0 is 16:10 from EDID 1.3 on, 1:1 before
+    assert decode_standard_timing(0x81, 0x00, 3) == (1280, 800, 60)
+    assert decode_standard_timing(0x81, 0x00, 2) == (1280, 1280, 60)
+    assert decode_standard_timing(0x01, 0x01, 4) is None
+
+
+@pytest.mark.parametrize(
+    "width, height, clock_hz",
+    [
+        (1920, 1200, 154_000_000),  # 16:10
+        (1280, 768, 68_250_000),  # 5:3
+        (2560, 1440, 241_500_000),  # 16:9
+        (1400, 1050, 101_000_000),  # 4:3
+    ],
+)
+def test_cvt_reduced_blanking(width, height, clock_hz):
+    assert cvt_rb_pixel_clock(width, height, 60) == clock_hz
+
+
+def test_lookup_prefers_dmt():
+    assert lookup_pixel_clock(1024, 768, 60) == 65_000_000
+
+
+def test_parse_mode_spec():
+    assert parse_mode_spec("2560x1440@144") == (2560, 1440, 144.0, False)
+    assert parse_mode_spec(" 1920X1080i ") == (1920, 1080, None, True)
+    with pytest.raises(ValueError):
+        parse_mode_spec("1920-1080")
+
+
+def test_supports_mode():
+    modes = list_modes(make_edid(128))
+    assert supports_mode(modes, 2560, 1440)
+    assert supports_mode(modes, 2560, 1440, 60)
+    assert not supports_mode(modes, 2560, 1440, 144)
+
+
+def test_supports_mode_distinguishes_interlaced():
+    modes = list_modes(edid_1080i())
+    assert supports_mode(modes, 1920, 1080, 60, interlaced=True)
+    assert not supports_mode(modes, 1920, 1080, 60)
+    assert not supports_mode(modes, 2560, 1440, interlaced=True)
+
+    corpus = [("1080i", edid_1080i()), ("1080p", make_edid(128))]
+    assert list(find_edids_with_mode(corpus, 1920, 1080, 60)) == ["1080p"]
+    assert list(find_edids_with_mode(corpus, *parse_mode_spec("1920x1080@60i"))) == [
+        "1080i"
+    ]
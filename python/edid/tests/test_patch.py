@@ -0,0 +1,117 @@
+"""Bulk EDID patching."""
+
+import json
+
+import pytest
+
+from click.testing import CliRunner
+
+from benchmarks.corpus import make_edid
+from edid.cli import cli
+from edid.parser import decode_product_info
+from edid.patch import (
+    encode_display_name,
+    load_patch_records,
+    output_name,
+    output_names,
+    patch_edids,
+)
+from edid.validator import validate_structure
+
+
+def write_jsonl(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return path
+
+
+def test_load_csv(tmp_path):
+    path = tmp_path / "units.csv"
+    path.write_text("serial,name,h_active,file\n0x10,PANEL A,,a.bin\n7,,1920,\n")
+    assert load_patch_records(path) == [
+        {"serial": 16, "name": "PANEL A", "file": "a.bin"},
+        {"serial": 7, "h_active": 1920},
+    ]
+
+
+def test_load_jsonl(tmp_path):
+    path = write_jsonl(tmp_path / "units.jsonl", [{"serial": 5, "name": "X"}])
+    assert load_patch_records(path) == [{"serial": 5, "name": "X"}]
+
+
+@pytest.mark.parametrize("serial", ["twelve", 1.5, True])
+def test_load_rejects_non_integers(tmp_path, serial):
+    path = write_jsonl(tmp_path / "units.jsonl", [{"serial": 1}, {"serial": serial}])
+    with pytest.raises(ValueError, match="Record 2: invalid integer for 'serial'"):
+        load_patch_records(path)
+
+
+@pytest.mark.parametrize("name", ["../x.bin", "/etc/x.bin", "sub/x.bin", ".."])
+def test_load_rejects_paths(tmp_path, name):
+    path = write_jsonl(tmp_path / "units.jsonl", [{"file": name}])
+    with pytest.raises(ValueError, match="plain file name"):
+        load_patch_records(path)
+
+
+def test_output_name():
+    assert output_name({"file": "panel.bin", "serial": 3}, 0) == "panel.bin"
+    assert output_name({"serial": 3}, 0) == "edid_3.bin"
+    assert output_name({}, 4) == "edid_00005.bin"
+    with pytest.raises(ValueError, match="plain file name"):
+        output_name({"file": "../panel.bin"}, 0)
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        [{"serial": 3}, {"serial": 3}],
+        [{"file": "a.bin"}, {"file": "A.BIN"}],
+        [{"serial": 3}, {"file": "edid_3.bin"}],
+    ],
+)
+def test_output_names_rejects_duplicates(records):
+    with pytest.raises(ValueError, match="Records 1 and 2 would both be written"):
+        output_names(records)
+
+
+def test_patch_command_writes_nothing_on_duplicate_names(tmp_path):
+    template = tmp_path / "template.bin"
+    template.write_bytes(make_edid(128))
+    values = write_jsonl(
+        tmp_path / "units.jsonl", [{"serial": 1}, {"serial": 2}, {"serial": 1}]
+    )
+    out_dir = tmp_path / "out"
+
+    result = CliRunner().invoke(
+        cli, ["patch", str(template), str(values), str(out_dir)]
+    )
+
+    assert result.exit_code == 1
+    assert "Records 1 and 3" in result.output
+    assert not out_dir.exists()
+
+
+def test_patch_edids():
+    template = make_edid(256)
+    records = [{"serial": 1, "name": "UNIT ONE"}, {"h_active": 1920}]
+
+    packed = patch_edids(template, records)
+
+    assert len(packed) == 2 * 256
+    first, second = bytes(packed[:256]), bytes(packed[256:])
+    for unit in (first, second):
+        assert validate_structure(unit)[0]
+    assert decode_product_info(first)["serial_number"] == 1
+    assert encode_display_name("UNIT ONE") in first
+    assert second[54 + 2] == 1920 & 0xFF
+    # Extension blocks are copied unchanged
+    assert first[128:] == second[128:] == template[128:]
+
+
+def test_patch_edids_errors():
+    template = make_edid(128)
+    with pytest.raises(ValueError, match="Record 1: serial out of range"):
+        patch_edids(template, [{"serial": -1}])
+    with pytest.raises(ValueError, match="too long"):
+        patch_edids(template, [{"name": "A NAME THAT IS TOO LONG"}])
+    with pytest.raises(ValueError, match="Invalid template"):
+        patch_edids(template[:100], [{"serial": 1}])
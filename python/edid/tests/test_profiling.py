@@ -0,0 +1,81 @@
+"""Hot-path instrumentation and profile reports."""
+
+import time
+
+import pytest
+
+from edid import profiling
+from edid.i2c import read_edid, write_edid
+from edid.patch import patch_edids
+
+BUS = 1
+
+
+@pytest.fixture
+def profiler():
+    """Profiler enabled for the test."""
+    yield profiling.enable()
+    profiling.disable()
+
+
+def test_disabled_by_default():
+    assert profiling.get_profiler() is None
+    with profiling.phase("unused"):
+        pass
+    assert profiling.profiled("unused")(lambda: 42)() == 42
+
+
+def test_nested_phases(profiler):
+    @profiling.profiled("outer")
+    def outer():
+        with profiling.phase("inner"):
+            time.sleep(0.02)
+
+    outer()
+    outer()
+
+    assert profiler.phases["outer"]["calls"] == 2
+    assert profiler.phases["inner"]["calls"] == 2
+    # Time in the inner phase is not the outer phase's own time
+    assert profiler.phases["outer"]["self"] < profiler.phases["inner"]["total"]
+    assert profiler.phases["outer"]["total"] >= profiler.phases["inner"]["total"]
+
+
+def test_read_transactions(profiler, simulate, eeprom, edid512):
+    simulate({BUS: eeprom(edid512)})
+    read_edid(BUS)
+
+    stats = profiler.buses[BUS]
+    assert stats["bytes_read"] == 512
+    assert stats["errors"] == 0
+    assert profiler.phases["i2c.read"]["calls"] == 1
+    report = profiler.format_report()
+    assert "i2c.read" in report
+    assert f"Bus {BUS}: {sum(stats['transactions'].values())} transaction(s)" in report
+
+
+def test_write_pages_and_sleep(profiler, simulate, eeprom, edid128):
+    simulate({BUS: eeprom(edid128)})
+    write_edid(BUS, bytes(patch_edids(edid128, [{"serial": 42}])))
+
+    # Page data, plus word offsets written before reads
+    assert profiler.buses[BUS]["bytes_written"] >= 128
+    assert profiler.sleep_count > 0
+    assert profiler.phases["i2c.verify"]["calls"] == 1
+
+
+def test_exports(profiler, simulate, eeprom, edid128, tmp_path):
+    simulate({BUS: eeprom(edid128)})
+    read_edid(BUS)
+
+    trace = profiler.chrome_trace()
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+    assert {"phase", "bus"} <= {event["cat"] for event in trace["traceEvents"]}
+
+    metrics = profiler.openmetrics()
+    assert metrics.endswith("# EOF\n")
+    assert f'edid_bus_bytes_total{{bus="{BUS}",direction="read"}} 128' in metrics
+    assert 'edid_phase_calls_total{phase="i2c.read"} 1' in metrics
+
+    profiler.write_openmetrics(str(tmp_path / "metrics.txt"))
+    assert (tmp_path / "metrics.txt").read_text() == profiler.openmetrics()
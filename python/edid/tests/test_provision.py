@@ -0,0 +1,71 @@
+"""Interleaved page writes across devices."""
+
+import pytest
+
+from edid.i2c import WAIT_POLL, write_edid, write_edids
+from edid.journal import journal_path
+from edid.patch import patch_edids
+
+BUS = 1
+
+
+def unit(template, serial):
+    """Copy of an EDID with another serial number (and fixed checksum)."""
+    return bytes(patch_edids(template, [{"serial": serial}]))
+
+
+@pytest.mark.parametrize("wait_strategy", ["fixed", WAIT_POLL])
+def test_write_edid_wait_strategies(simulate, eeprom, edid256, wait_strategy):
+    target = unit(edid256, 42)
+    device = eeprom(edid256)
+    simulate({BUS: device})
+
+    write_edid(BUS, target, wait_strategy=wait_strategy)
+
+    assert bytes(device.memory[:256]) == target
+
+
+def test_write_edid_second_segment(simulate, eeprom, edid512):
+    target = unit(edid512, 42)
+    device = eeprom(edid512)
+    simulate({BUS: device})
+
+    write_edid(BUS, target)
+
+    assert bytes(device.memory) == target
+
+
+def test_write_edids_behind_mux(simulate, eeprom, edid256):
+    buses = [11, 12, 13]
+    devices = {bus: eeprom(edid256) for bus in buses}
+    backend = simulate(
+        devices, {bus: (3, channel) for channel, bus in enumerate(buses)}
+    )
+    targets = [(bus, unit(edid256, bus)) for bus in buses]
+
+    results = write_edids(targets, wait_strategy=WAIT_POLL)
+
+    assert [result["verified"] for result in results] == [True] * 3
+    assert all(result["error"] is None for result in results)
+    assert all(result["pages"] == 16 for result in results)
+    for bus, target in targets:
+        assert bytes(devices[bus].memory[:256]) == target
+    assert backend.mux_switches > len(buses)
+
+
+def test_write_edids_continues_past_failing_device(simulate, eeprom, edid256):
+    simulate({1: eeprom(edid256), 2: eeprom(edid256, write_protect=True)})
+    targets = [(1, unit(edid256, 1)), (2, unit(edid256, 2))]
+
+    first, second = write_edids(targets)
+
+    assert first["verified"] and first["error"] is None
+    assert not second["verified"]
+    assert "verification failed" in second["error"]
+    assert journal_path(2).exists()
+
+
+def test_write_edids_rejects_duplicate_bus(simulate, eeprom, edid128):
+    simulate({BUS: eeprom(edid128)})
+    with pytest.raises(ValueError, match="once"):
+        write_edids([(BUS, edid128), (BUS, edid128)])
@@ -0,0 +1,81 @@
+"""Transaction retries and per-bus statistics."""
+
+import errno
+
+import pytest
+
+from edid.i2c import read_edid
+from edid.retry import RetryPolicy, format_bus_stats
+
+# Statistics are kept per process, so every test uses its own bus
+
+
+def nack():
+    return OSError(errno.EREMOTEIO, "Remote I/O error")
+
+
+def flaky(failures):
+    """Bus method failing with a NACK the first `failures` times."""
+    calls = []
+
+    def method():
+        calls.append(None)
+        if len(calls) <= failures:
+            raise nack()
+        return "ok"
+
+    return method
+
+
+def test_retry_succeeds():
+    policy = RetryPolicy(attempts=3, base_delay=0)
+    assert policy.call(31, flaky(2)) == "ok"
+    assert format_bus_stats(31) == (
+        "Bus 31: 1 transaction(s), 2 retried, 0 failed (EREMOTEIO x2)"
+    )
+
+
+def test_retry_gives_up():
+    policy = RetryPolicy(attempts=2, base_delay=0)
+    with pytest.raises(OSError):
+        policy.call(32, flaky(5))
+    assert format_bus_stats(32).startswith(
+        "Bus 32: 1 transaction(s), 1 retried, 1 failed"
+    )
+
+
+def test_permanent_errors_are_not_retried():
+    def missing():
+        raise OSError(errno.ENOENT, "No such device")
+
+    with pytest.raises(OSError):
+        RetryPolicy(base_delay=0).call(33, missing)
+    assert format_bus_stats(33).startswith("Bus 33: 1 transaction(s), 0 retried")
+
+
+def test_missing_device_is_not_retried():
+    def absent():
+        raise OSError(errno.ENXIO, "No such device or address")
+
+    with pytest.raises(OSError):
+        RetryPolicy(base_delay=0).call(40, absent)
+    assert format_bus_stats(40).startswith("Bus 40: 1 transaction(s), 0 retried")
+
+    # Adapters that report NACKs as ENXIO can opt in
+    policy = RetryPolicy(
+        attempts=2, base_delay=0, retry_errnos={errno.EREMOTEIO, errno.ENXIO}
+    )
+    with pytest.raises(OSError):
+        policy.call(41, absent)
+    assert format_bus_stats(41).startswith("Bus 41: 1 transaction(s), 1 retried")
+
+
+def test_backoff():
+    policy = RetryPolicy(base_delay=0.01, multiplier=2, max_delay=0.03, jitter=0)
+    assert [policy.delay(n) for n in (1, 2, 3)] == [0.01, 0.02, 0.03]
+
+
+def test_read_retries_injected_nacks(simulate, eeprom, edid256):
+    simulate({34: eeprom(edid256, nack_on={2})})
+    assert read_edid(34) == edid256
+    assert "1 retried, 0 failed" in format_bus_stats(34)
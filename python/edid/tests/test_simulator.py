@@ -0,0 +1,82 @@
+"""Reading and writing EDIDs through the EEPROM simulator."""
+
+import pytest
+
+from benchmarks.corpus import make_edid
+from edid.i2c import read_edid, write_edid
+from edid.patch import patch_edids
+from edid.simulator import EEPROM_ADDRESS, SimulatedEEPROM, SimulatorBackend
+
+BUS = 1
+
+
+def test_page_writes_wrap_within_page():
+    device = SimulatedEEPROM(b"\x00" * 256, segments=1, write_cycle_time=0)
+    device.write(14, [1, 2, 3, 4])
+    device.end_transaction()
+    assert list(device.memory[14:16]) == [1, 2]
+    assert list(device.memory[0:2]) == [3, 4]
+
+
+def test_segment_pointer_resets_at_stop():
+    device = SimulatedEEPROM(bytes(range(256)) * 2, segments=2)
+    device.set_segment(1)
+    assert device.read(0, 1) == [0]
+    device.end_transaction()
+    assert device.segment == 0
+
+    with pytest.raises(OSError):
+        device.set_segment(2)
+
+
+def test_combined_transfer_is_one_transaction():
+    device = SimulatedEEPROM(make_edid(512), nack_on={2})
+    backend = SimulatorBackend({BUS: device})
+    bus = backend.open(BUS)
+
+    bus.i2c_rdwr(*backend.read_messages(EEPROM_ADDRESS, 1, 0, 16))
+    assert device.transactions == 1
+    # The second transaction is the injected NACK, however many messages
+    # the first one had
+    with pytest.raises(OSError):
+        bus.i2c_rdwr(*backend.read_messages(EEPROM_ADDRESS, 1, 0, 16))
+    assert (device.transactions, device.nacks) == (2, 1)
+
+
+@pytest.mark.parametrize("size", [128, 256, 512])
+def test_read_edid(simulate, eeprom, size):
+    edid_data = make_edid(size)
+    simulate({BUS: eeprom(edid_data)})
+    assert read_edid(BUS) == edid_data
+
+
+def test_read_edid_missing_bus(simulate, eeprom, edid128):
+    simulate({BUS: eeprom(edid128)})
+    with pytest.raises(OSError, match="not found"):
+        read_edid(BUS + 1)
+
+
+def test_write_edid(simulate, eeprom, isolated_home, edid256):
+    target = bytes(patch_edids(edid256, [{"serial": 42}]))
+    device = eeprom(edid256)
+    simulate({BUS: device})
+
+    write_edid(BUS, target)
+
+    assert bytes(device.memory[:256]) == target
+    backups = sorted((isolated_home / ".edid-backups").glob("*.bin"))
+    assert [path.read_bytes() for path in backups] == [edid256]
+
+
+def test_write_edid_rejects_partial_blocks(simulate, eeprom, edid128):
+    simulate({BUS: eeprom(edid128)})
+    with pytest.raises(ValueError, match="multiple of 128"):
+        write_edid(BUS, edid128[:100])
+
+
+def test_write_protected_edid_fails_verification(simulate, eeprom, edid128):
+    device = eeprom(edid128, write_protect=True)
+    simulate({BUS: device})
+    with pytest.raises(IOError, match="verification failed"):
+        write_edid(BUS, bytes(patch_edids(edid128, [{"serial": 42}])))
+    assert bytes(device.memory[:128]) == edid128
@@ -0,0 +1,79 @@
+"""Mux-aware topology discovery."""
+
+import pytest
+
+from edid.topology import (
+    build_topology,
+    discover_topology,
+    format_tree,
+    mux_selections,
+    traversal_order,
+)
+
+# Bus 3 carries a mux with channels 11-13; channel 12 carries a second mux
+# with channels 20 and 21. Bus 5 is a separate adapter.
+MUXES = {11: (3, 0), 12: (3, 1), 13: (3, 2), 20: (12, 0), 21: (12, 1)}
+
+
+@pytest.fixture
+def rig(simulate, eeprom, edid128):
+    displays = (5, 11, 13, 20, 21)
+    return simulate({bus: eeprom(edid128) for bus in displays}, MUXES)
+
+
+def test_build_topology(rig):
+    topology = build_topology()
+    nodes = topology["nodes"]
+
+    assert topology["roots"] == [3, 5]
+    assert nodes[3]["children"] == [11, 12, 13]
+    assert nodes[12]["children"] == [20, 21]
+    assert (nodes[20]["parent"], nodes[20]["mux"], nodes[20]["channel"]) == (
+        12,
+        "12-0070",
+        0,
+    )
+    assert nodes[5]["mux"] is None
+
+
+def test_traversal_order(rig):
+    topology = build_topology()
+    assert traversal_order(topology, 3) == [3, 11, 12, 20, 21, 13]
+    assert traversal_order(topology, 5) == [5]
+
+
+def test_depth_first_order_selects_each_channel_once(rig):
+    topology = build_topology()
+    order = traversal_order(topology, 3)
+
+    assert mux_selections(topology, order) == len(MUXES)
+    # Going back and forth between the muxes' channels costs extra switches
+    assert mux_selections(topology, [11, 20, 13, 21, 12]) == 6
+
+
+def test_discover_topology(rig):
+    topology = discover_topology()
+    nodes = topology["nodes"]
+
+    detected = [bus for bus, node in sorted(nodes.items()) if node["edid"]]
+    assert detected == [5, 11, 13, 20, 21]
+    # Nothing answers at 0x50 on the mux parents
+    assert nodes[3]["edid"] is None and "No such device" in nodes[3]["error"]
+    assert nodes[12]["edid"] is None
+    stats = topology["stats"]
+    assert (stats["roots"], stats["buses"], stats["workers"]) == (2, 7, 2)
+    # The simulated muxes switched exactly as often as predicted
+    assert rig.mux_switches == stats["mux_selections"] == len(MUXES)
+
+
+def test_format_tree(rig):
+    lines = format_tree(discover_topology(), show_adapters=True)
+
+    assert lines[0].startswith("  Bus 3: Not accessible (")
+    assert lines[0].endswith(") [simulator-3]")
+    assert lines[1] == (
+        "  ├── Bus 11 (mux 3-0070 channel 0): ✓ EDID detected [simulator-11]"
+    )
+    assert lines[3].startswith("  │   ├── Bus 20 (mux 12-0070 channel 0)")
+    assert lines[5].startswith("  └── Bus 13 ")
+    assert lines[6].startswith("  Bus 5: ✓ EDID detected")
@@ -0,0 +1,56 @@
+"""Recording and replaying bus transactions."""
+
+import pytest
+
+from edid.i2c import EDID_ADDRESS, read_edid
+from edid.simulator import SimulatorBackend
+from edid.trace import (
+    ReplayBackend,
+    TraceMismatch,
+    TraceWriter,
+    TracingBackend,
+    iter_trace,
+    summarize_trace,
+)
+
+BUS = 1
+
+
+@pytest.fixture
+def recorded(use_backend, eeprom, edid512, tmp_path):
+    """Trace of reading a 512-byte EDID (and the writer that recorded it)."""
+    path = tmp_path / "read.trace"
+    writer = TraceWriter(path)
+    use_backend(TracingBackend(SimulatorBackend({BUS: eeprom(edid512)}), writer))
+    read_edid(BUS)
+    writer.close()
+    return path, writer
+
+
+def test_record(recorded):
+    path, writer = recorded
+    entries = list(iter_trace(path))
+    transactions = [entry for entry in entries if entry["op"] != "meta"]
+
+    assert any(entry["op"] == "meta" for entry in entries)
+    assert writer.transactions == len(transactions)
+    assert summarize_trace(path)["records"] == len(transactions)
+    assert [entry["op"] for entry in transactions] == ["open"] + ["i2c_rdwr"] * 3
+    # The second segment is read behind a segment pointer write
+    assert transactions[-1]["messages"][0]["data"] == b"\x01"
+
+
+def test_replay(recorded, use_backend, edid512):
+    path, _ = recorded
+    backend = use_backend(ReplayBackend(path, time_scale=0))
+
+    assert read_edid(BUS) == edid512
+    assert backend.served == 4
+
+
+def test_replay_mismatch(recorded):
+    path, _ = recorded
+    backend = ReplayBackend(path, time_scale=0)
+    with backend.open(BUS) as bus:
+        with pytest.raises(TraceMismatch):
+            bus.read_byte_data(EDID_ADDRESS, 0)
@@ -0,0 +1,72 @@
+"""Watching buses for display changes."""
+
+from edid.patch import patch_edids
+from edid.watch import (
+    ATTACHED,
+    CHANGED,
+    DETACHED,
+    SIGNATURE_SIZE,
+    format_event,
+    watch_buses,
+)
+
+
+def test_polls_read_only_the_signature(simulate, eeprom, edid256):
+    device = eeprom(edid256)
+    simulate({1: device})
+    stats = {}
+
+    events = list(watch_buses([1], interval=0, max_polls=5, stats=stats))
+
+    assert [event["event"] for event in events] == [ATTACHED]
+    assert stats == {
+        "polls": 5,
+        "poll_bytes": 5 * SIGNATURE_SIZE,
+        "full_reads": 1,
+        "full_read_bytes": 256,
+    }
+    assert device.bytes_read == 5 * SIGNATURE_SIZE + 256
+
+
+def test_swap_and_detach(simulate, eeprom, edid256):
+    first, second = eeprom(edid256), eeprom(edid256)
+    simulate({1: first, 2: second})
+    events = watch_buses([1, 2], interval=0)
+
+    attached = [next(events), next(events)]
+    assert [(event["bus"], event["event"]) for event in attached] == [
+        (1, ATTACHED),
+        (2, ATTACHED),
+    ]
+    assert attached[0]["manufacturer"] == "DEL"
+    assert attached[0]["name"] == "BENCH PANEL"
+
+    # Another unit of the same model is plugged into bus 2
+    second.memory[:256] = patch_edids(edid256, [{"serial": 7}])
+    swapped = next(events)
+    assert (swapped["bus"], swapped["event"]) == (2, CHANGED)
+    assert swapped["serial_number"] == 7
+    assert swapped["sha256"] != attached[1]["sha256"]
+
+    # The display on bus 1 stops answering
+    first.nack_rate = 1.0
+    detached = next(events)
+    assert (detached["bus"], detached["event"]) == (1, DETACHED)
+    assert format_event(detached).endswith("bus 1: detached")
+    events.close()
+
+
+def test_absent_display_is_not_reported(simulate, eeprom, edid128):
+    device = eeprom(edid128, nack_rate=1.0)
+    simulate({1: device})
+
+    assert list(watch_buses([1], interval=0, max_polls=2)) == []
+
+
+def test_format_event(simulate, eeprom, edid128):
+    simulate({1: eeprom(edid128)})
+    (event,) = watch_buses([1], interval=0, max_polls=1)
+
+    line = format_event(event)
+    assert "bus 1: attached DEL 0xA0C1" in line
+    assert '"BENCH PANEL" serial 1234567, 128 bytes' in line